@@ -19,17 +19,40 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = "sqlite+pysqlite:///./civicquant_dev.db"
+    async_database_url: str | None = None
+    async_db_pool_size: int = 20
+    async_db_max_overflow: int = 40
 
     # Digest / publishing
     vip_digest_hours: int = 4
     tg_bot_token: str | None = None
     tg_vip_chat_id: str | None = None
+    telegram_chat_messages_per_minute: float = 20.0
+    telegram_chat_burst: int = 3
+    telegram_max_rate_limit_retries: int = 3
+    telegram_outbox_enabled: bool = False
+    telegram_outbox_poll_seconds: float = 5.0
+    telegram_outbox_batch_size: int = 20
+    delivery_claim_lease_seconds: float = 300.0
     digest_llm_enabled: bool = False
     digest_openai_model: str | None = None
     digest_openai_timeout_seconds: float = 30.0
     digest_openai_max_retries: int = 2
     digest_top_developments_limit: int = 3
     digest_section_bullet_limit: int = 6
+    digest_synthesis_cache_size: int = 128
+    digest_rolling_retention_hours: int = 24
+    digest_preview_cache_ttl_seconds: float = 60.0
+    digest_preview_cache_size: int = 64
+    digest_publish_timeout_seconds: float = 20.0
+    digest_publish_max_retries: int = 1
+    digest_publish_retry_backoff_seconds: float = 1.0
+
+    # Feed API
+    feed_page_cache_size: int = 64
+    feed_stream_queue_size: int = 256
+    feed_stream_heartbeat_seconds: float = 15.0
+    feed_stream_replay_limit: int = 100
 
     # Opportunity memo (on-demand)
     opportunity_memo_topic_score_threshold: float = 0.58
@@ -40,6 +63,12 @@ class Settings(BaseSettings):
     opportunity_memo_writer_model: str | None = None
     opportunity_memo_openai_timeout_seconds: float = 45.0
     opportunity_memo_openai_max_retries: int = 2
+    opportunity_memo_research_cache_ttl_seconds: int = 21600
+    opportunity_memo_research_max_concurrency: int = 4
+    opportunity_memo_research_deadline_seconds: float = 90.0
+    opportunity_memo_writer_max_concurrency: int = 4
+    opportunity_memo_batch_process_workers: int = 4
+    opportunity_memo_batch_llm_concurrency: int = 2
 
     # Phase 2 extraction
     phase2_extraction_enabled: bool = False
@@ -50,6 +79,10 @@ class Settings(BaseSettings):
     phase2_force_reprocess: bool = False
     phase2_content_reuse_enabled: bool = True
     phase2_content_reuse_window_hours: int = 6
+    phase2_queue_enabled: bool = False
+    phase2_queue_max_size: int = 10000
+    phase2_queue_idle_wait_seconds: float = 1.0
+    phase2_queue_fallback_scan_seconds: int = 60
     deep_enrichment_enabled: bool = True
     deep_enrichment_batch_size: int = 50
 
@@ -9,7 +9,10 @@ from sqlalchemy.orm import Session
 from ...models import Event, EventMessage, Extraction
 from ...schemas import ExtractionJson
 from ..extraction.canonicalization import derive_action_class, event_time_bucket
+from ..feed.read_model import sync_feed_event
 from .event_windows import get_event_time_window
+from .similarity_index import sync_event_similarity
+from .topic_rollups import apply_event_rollup, event_rollup_contribution
 from ..extraction.extraction_payload_utils import (
     entity_signature_from_payload,
     keywords_from_payload,
@@ -19,6 +22,8 @@ from ..extraction.extraction_payload_utils import (
 
 logger = logging.getLogger("civicquant.events")
 
+_FEED_FIELDS = frozenset({"summary_1_sentence", "impact_score", "topic", "event_time"})
+
 
 @dataclass(frozen=True)
 class EventUpsertResult:
@@ -297,6 +302,9 @@ def upsert_event(
         )
         db.add(event)
         db.flush()
+        sync_feed_event(db, event)
+        apply_event_rollup(db, before=None, after=event_rollup_contribution(event))
+        sync_event_similarity(db, event)
         _ensure_event_message_link(db, event_id=event.id, raw_message_id=raw_message_id)
         logger.info(
             "event_create raw_message_id=%s event_id=%s fingerprint=%s claim_hash=%s",
@@ -347,6 +355,7 @@ def upsert_event(
                 material_update=False,
             )
 
+    rollup_before = event_rollup_contribution(candidate)
     changes = update_event_from_extraction(
         candidate,
         extraction,
@@ -356,6 +365,11 @@ def upsert_event(
         action_class=action_class,
         time_bucket=time_bucket,
     )
+    if changes.keys() & _FEED_FIELDS:
+        sync_feed_event(db, candidate)
+    apply_event_rollup(db, before=rollup_before, after=event_rollup_contribution(candidate))
+    if "summary_1_sentence" in changes:
+        sync_event_similarity(db, candidate)
     logger.info(
         "event_update raw_message_id=%s event_id=%s fingerprint=%s claim_hash=%s changes=%s",
         raw_message_id,
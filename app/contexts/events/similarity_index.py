@@ -0,0 +1,134 @@
+"""MinHash signatures over event summaries for duplicate-candidate search.
+
+`upsert_event` stores each event's signature and its LSH band keys whenever
+the summary changes, so duplicate search is an indexed `band_key` lookup
+bounded by event time instead of a scan of the most recent events.
+Similarity is the Jaccard estimate between two stored signatures (word-bigram
+shingles of the summary). `rebuild_similarity_index` recomputes everything from
+`events` (backfill / repair).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import random
+import re
+from collections.abc import Iterable, Sequence
+from datetime import datetime
+
+from sqlalchemy.orm import Session
+
+from ...models import Event, EventSimilarityBand, EventSimilaritySignature
+
+
+logger = logging.getLogger("civicquant.events")
+
+NUM_PERMUTATIONS = 64
+BAND_COUNT = 16
+ROWS_PER_BAND = NUM_PERMUTATIONS // BAND_COUNT
+
+_MERSENNE_PRIME = (1 << 61) - 1
+# Fixed seed: signatures are stored, so the permutations must never change.
+_rng = random.Random(0x5EED_CAFE)
+_PERMUTATIONS = tuple(
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME)) for _ in range(NUM_PERMUTATIONS)
+)
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def summary_shingles(summary: str | None) -> frozenset[str]:
+    """Word bigrams of the lowercased summary (single tokens when it has one word)."""
+
+    tokens = _TOKEN_RE.findall((summary or "").lower())
+    if len(tokens) < 2:
+        return frozenset(tokens)
+    return frozenset(f"{left} {right}" for left, right in zip(tokens, tokens[1:]))
+
+
+def _stable_hash(value: str, *, signed: bool = False) -> int:
+    digest = hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=signed)
+
+
+def minhash_signature(shingles: Iterable[str]) -> tuple[int, ...] | None:
+    hashes = [_stable_hash(shingle) for shingle in shingles]
+    if not hashes:
+        return None
+    return tuple(min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in _PERMUTATIONS)
+
+
+def band_keys(signature: Sequence[int]) -> list[int]:
+    """One signed 64-bit key per band; the band index is part of the key."""
+
+    keys: list[int] = []
+    for band in range(BAND_COUNT):
+        rows = signature[band * ROWS_PER_BAND : (band + 1) * ROWS_PER_BAND]
+        keys.append(_stable_hash(f"{band}:{','.join(str(value) for value in rows)}", signed=True))
+    return keys
+
+
+def estimate_jaccard(left: Sequence[int] | None, right: Sequence[int] | None) -> float:
+    if not left or not right or len(left) != len(right):
+        return 0.0
+    return sum(1 for a, b in zip(left, right) if a == b) / len(left)
+
+
+def _add_signature_rows(db: Session, *, event_id: int, shingles: frozenset[str], now: datetime) -> bool:
+    signature = minhash_signature(shingles)
+    if signature is None:
+        return False
+    db.add(
+        EventSimilaritySignature(
+            event_id=event_id,
+            shingle_count=len(shingles),
+            minhash_json=list(signature),
+            updated_at=now,
+        )
+    )
+    for band_index, band_key in enumerate(band_keys(signature)):
+        db.add(EventSimilarityBand(event_id=event_id, band_index=band_index, band_key=band_key))
+    return True
+
+
+def sync_event_similarity(db: Session, event: Event) -> None:
+    """Replace `event`'s stored signature and band keys from its current summary."""
+
+    db.query(EventSimilarityBand).filter(EventSimilarityBand.event_id == event.id).delete(synchronize_session=False)
+    db.query(EventSimilaritySignature).filter(EventSimilaritySignature.event_id == event.id).delete(
+        synchronize_session=False
+    )
+    _add_signature_rows(
+        db,
+        event_id=event.id,
+        shingles=summary_shingles(event.summary_1_sentence),
+        now=datetime.utcnow(),
+    )
+    db.flush()
+
+
+def rebuild_similarity_index(db: Session, *, batch_size: int = 1000) -> int:
+    """Recompute all signatures and band keys from `events`. Caller commits. Returns signature count."""
+
+    db.query(EventSimilarityBand).delete(synchronize_session=False)
+    db.query(EventSimilaritySignature).delete(synchronize_session=False)
+    now = datetime.utcnow()
+    stored = 0
+    last_id = 0
+    while True:
+        rows = (
+            db.query(Event.id, Event.summary_1_sentence)
+            .filter(Event.id > last_id)
+            .order_by(Event.id.asc())
+            .limit(batch_size)
+            .all()
+        )
+        if not rows:
+            break
+        for event_id, summary in rows:
+            stored += int(_add_signature_rows(db, event_id=event_id, shingles=summary_shingles(summary), now=now))
+        db.flush()
+        last_id = rows[-1][0]
+
+    logger.info("event_similarity_index_rebuilt signatures=%s", stored)
+    return stored
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from sqlalchemy.orm import Session
 
-from ...models import EventRelation, EventTag
+from ...models import Event, EventRelation, EventTag
 from ...schemas import ExtractionJson
 
 
@@ -18,6 +18,7 @@ def _dedupe_tag_rows(extraction: ExtractionJson) -> list[EventTag]:
             EventTag(
                 tag_type=tag.tag_type,
                 tag_value=tag.tag_value,
+                tag_value_norm=tag.tag_value.lower(),
                 tag_source=tag.tag_source,
                 confidence=tag.confidence,
             )
@@ -46,9 +47,11 @@ def _dedupe_relation_rows(extraction: ExtractionJson) -> list[EventRelation]:
             EventRelation(
                 subject_type=relation.subject_type,
                 subject_value=relation.subject_value,
+                subject_value_norm=relation.subject_value.lower(),
                 relation_type=relation.relation_type,
                 object_type=relation.object_type,
                 object_value=relation.object_value,
+                object_value_norm=relation.object_value.lower(),
                 relation_source=relation.relation_source,
                 inference_level=inference_level,
                 confidence=relation.confidence,
@@ -63,14 +66,21 @@ def sync_event_tags_and_relations(
     event_id: int,
     extraction: ExtractionJson,
 ) -> None:
-    """Replace an event's normalized tag/relation rows from canonical extraction output."""
+    """Replace an event's normalized tag/relation rows from canonical extraction output.
+
+    Rows also carry the event's current `event_time`/`impact_score` so the
+    structured queries can be answered from the tag/relation indexes alone.
+    """
+    # `db.get` returns the in-session event, including not-yet-flushed upsert changes.
+    event = db.get(Event, event_id)
+    event_time = event.event_time if event is not None else None
+    impact_score = event.impact_score if event is not None else None
     db.query(EventTag).filter(EventTag.event_id == event_id).delete(synchronize_session=False)
     db.query(EventRelation).filter(EventRelation.event_id == event_id).delete(synchronize_session=False)
 
-    for row in _dedupe_tag_rows(extraction):
-        row.event_id = event_id
-        db.add(row)
-    for row in _dedupe_relation_rows(extraction):
+    for row in [*_dedupe_tag_rows(extraction), *_dedupe_relation_rows(extraction)]:
         row.event_id = event_id
+        row.event_time = event_time
+        row.impact_score = impact_score
         db.add(row)
     db.flush()
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
 
-from sqlalchemy import func
-from sqlalchemy.orm import Session, aliased
+from sqlalchemy import select
+from sqlalchemy.orm import Query, Session, aliased
 
 from ...models import EnrichmentCandidate, Event, EventRelation, EventTag
 from ...structured_contracts import (
@@ -16,28 +16,35 @@ from ...structured_contracts import (
 )
 
 
-def _normalize_time(value: datetime) -> datetime:
-    return value.replace(tzinfo=None) if value.tzinfo is not None else value
+def normalize_time(value: datetime) -> datetime:
+    """Naive UTC, matching the stored event/rollup columns; naive input is taken as UTC."""
 
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
 
-def _event_base_query(
-    db: Session,
+
+LookupModel = type[EventTag] | type[EventRelation]
+
+
+def _apply_window(
+    query: Query,
+    model: LookupModel,
     *,
     start_time: datetime,
     end_time: datetime,
     min_impact: float | None,
-) -> object:
-    query = db.query(Event).filter(
-        Event.event_time.is_not(None),
-        Event.event_time >= _normalize_time(start_time),
-        Event.event_time <= _normalize_time(end_time),
+) -> Query:
+    query = query.filter(
+        model.event_time >= normalize_time(start_time),
+        model.event_time <= normalize_time(end_time),
     )
     if min_impact is not None:
-        query = query.filter(Event.impact_score.is_not(None), Event.impact_score >= float(min_impact))
+        query = query.filter(model.impact_score >= float(min_impact))
     return query
 
 
-def _apply_directionality_filter(query: object, *, directionality: str | None) -> object:
+def _apply_directionality_filter(query: Query, model: LookupModel, *, directionality: str | None) -> Query:
     if directionality is None:
         return query
     normalized = normalize_directionality(directionality)
@@ -45,16 +52,39 @@ def _apply_directionality_filter(query: object, *, directionality: str | None) -
         raise ValueError("invalid directionality")
 
     directionality_tag = aliased(EventTag)
-    return query.join(
-        directionality_tag,
-        directionality_tag.event_id == Event.id,
-    ).filter(
-        directionality_tag.tag_type == "directionality",
-        func.lower(directionality_tag.tag_value) == normalized.lower(),
+    return query.filter(
+        model.event_id.in_(
+            select(directionality_tag.event_id).where(
+                directionality_tag.tag_type == "directionality",
+                directionality_tag.tag_value_norm == normalized.lower(),
+            )
+        )
     )
 
 
-def query_events_by_tag(
+def _ranked(query: Query, model: LookupModel, *, limit: int) -> Query:
+    return (
+        query.distinct()
+        .order_by(
+            model.impact_score.desc().nullslast(),
+            model.event_time.desc().nullslast(),
+            model.event_id.desc(),
+        )
+        .limit(limit)
+    )
+
+
+def _load_ranked_events(db: Session, ranked: Query) -> list[Event]:
+    """Load the events for ranked (event_id, impact_score, event_time) rows, keeping rank order."""
+
+    ranked_ids = [event_id for event_id, _, _ in ranked.all()]
+    if not ranked_ids:
+        return []
+    events_by_id = {event.id: event for event in db.query(Event).filter(Event.id.in_(ranked_ids)).all()}
+    return [events_by_id[event_id] for event_id in ranked_ids if event_id in events_by_id]
+
+
+def tag_lookup_query(
     db: Session,
     *,
     tag_type: str,
@@ -64,35 +94,49 @@ def query_events_by_tag(
     min_impact: float | None = None,
     directionality: str | None = None,
     limit: int = 100,
-) -> list[Event]:
+) -> Query:
+    """Ranked (event_id, impact_score, event_time) rows for a tag lookup; never touches `events`."""
+
     normalized_tag_type = normalize_tag_family(tag_type)
     normalized_tag_value = normalize_tag_value(tag_value)
     if normalized_tag_type is None or normalized_tag_value is None:
         raise ValueError("invalid tag filter")
 
-    query = _event_base_query(
+    # Served by ix_event_tags_lookup_cover (tag_type, tag_value_norm, event_time, impact_score, event_id).
+    query = db.query(EventTag.event_id, EventTag.impact_score, EventTag.event_time).filter(
+        EventTag.tag_type == normalized_tag_type,
+        EventTag.tag_value_norm == normalized_tag_value.lower(),
+    )
+    query = _apply_window(query, EventTag, start_time=start_time, end_time=end_time, min_impact=min_impact)
+    query = _apply_directionality_filter(query, EventTag, directionality=directionality)
+    return _ranked(query, EventTag, limit=limit)
+
+
+def query_events_by_tag(
+    db: Session,
+    *,
+    tag_type: str,
+    tag_value: str,
+    start_time: datetime,
+    end_time: datetime,
+    min_impact: float | None = None,
+    directionality: str | None = None,
+    limit: int = 100,
+) -> list[Event]:
+    ranked = tag_lookup_query(
         db,
+        tag_type=tag_type,
+        tag_value=tag_value,
         start_time=start_time,
         end_time=end_time,
         min_impact=min_impact,
-    ).join(EventTag, EventTag.event_id == Event.id).filter(
-        EventTag.tag_type == normalized_tag_type,
-        func.lower(EventTag.tag_value) == normalized_tag_value.lower(),
-    )
-    query = _apply_directionality_filter(query, directionality=directionality)
-    return (
-        query.distinct()
-        .order_by(
-            Event.impact_score.desc().nullslast(),
-            Event.event_time.desc().nullslast(),
-            Event.id.desc(),
-        )
-        .limit(limit)
-        .all()
+        directionality=directionality,
+        limit=limit,
     )
+    return _load_ranked_events(db, ranked)
 
 
-def query_events_by_relation(
+def relation_lookup_query(
     db: Session,
     *,
     relation_type: str,
@@ -105,17 +149,15 @@ def query_events_by_relation(
     object_type: str | None = None,
     object_value: str | None = None,
     limit: int = 100,
-) -> list[Event]:
+) -> Query:
+    """Ranked (event_id, impact_score, event_time) rows for a relation lookup; never touches `events`."""
+
     normalized_relation_type = normalize_relation_type(relation_type)
     if normalized_relation_type is None:
         raise ValueError("invalid relation_type")
 
-    query = _event_base_query(
-        db,
-        start_time=start_time,
-        end_time=end_time,
-        min_impact=min_impact,
-    ).join(EventRelation, EventRelation.event_id == Event.id).filter(
+    # Served by the ix_event_relations_*_cover indexes, all led by relation_type.
+    query = db.query(EventRelation.event_id, EventRelation.impact_score, EventRelation.event_time).filter(
         EventRelation.relation_type == normalized_relation_type,
     )
 
@@ -128,7 +170,7 @@ def query_events_by_relation(
         normalized_subject_value = normalize_relation_value(subject_value)
         if normalized_subject_value is None:
             raise ValueError("invalid subject_value")
-        query = query.filter(func.lower(EventRelation.subject_value) == normalized_subject_value.lower())
+        query = query.filter(EventRelation.subject_value_norm == normalized_subject_value.lower())
     if object_type is not None:
         normalized_object_type = normalize_relation_entity_type(object_type)
         if normalized_object_type is None:
@@ -138,19 +180,41 @@ def query_events_by_relation(
         normalized_object_value = normalize_relation_value(object_value)
         if normalized_object_value is None:
             raise ValueError("invalid object_value")
-        query = query.filter(func.lower(EventRelation.object_value) == normalized_object_value.lower())
+        query = query.filter(EventRelation.object_value_norm == normalized_object_value.lower())
 
-    query = _apply_directionality_filter(query, directionality=directionality)
-    return (
-        query.distinct()
-        .order_by(
-            Event.impact_score.desc().nullslast(),
-            Event.event_time.desc().nullslast(),
-            Event.id.desc(),
-        )
-        .limit(limit)
-        .all()
+    query = _apply_window(query, EventRelation, start_time=start_time, end_time=end_time, min_impact=min_impact)
+    query = _apply_directionality_filter(query, EventRelation, directionality=directionality)
+    return _ranked(query, EventRelation, limit=limit)
+
+
+def query_events_by_relation(
+    db: Session,
+    *,
+    relation_type: str,
+    start_time: datetime,
+    end_time: datetime,
+    min_impact: float | None = None,
+    directionality: str | None = None,
+    subject_type: str | None = None,
+    subject_value: str | None = None,
+    object_type: str | None = None,
+    object_value: str | None = None,
+    limit: int = 100,
+) -> list[Event]:
+    ranked = relation_lookup_query(
+        db,
+        relation_type=relation_type,
+        start_time=start_time,
+        end_time=end_time,
+        min_impact=min_impact,
+        directionality=directionality,
+        subject_type=subject_type,
+        subject_value=subject_value,
+        object_type=object_type,
+        object_value=object_value,
+        limit=limit,
     )
+    return _load_ranked_events(db, ranked)
 
 
 def serialize_query_results(db: Session, *, events: list[Event]) -> list[dict[str, object]]:
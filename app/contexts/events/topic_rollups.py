@@ -0,0 +1,258 @@
+"""Hourly topic rollups over `events`.
+
+`upsert_event` moves each event's contribution between `topic_hourly_rollups`
+buckets as it is created or updated, so analytics over long windows read
+O(hours) rollup rows instead of scanning events. `rebuild_topic_rollups`
+recomputes everything from `events` (backfill / repair).
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Literal
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from ...models import Event, TopicHourlyRollup
+from ..triage.triage_engine import impact_band
+from .structured_query import normalize_time
+
+
+logger = logging.getLogger("civicquant.events")
+
+SCORE_BANDS = ("low", "medium", "high", "critical")
+RollupBucket = Literal["hour", "day"]
+
+
+@dataclass(frozen=True)
+class RollupContribution:
+    topic: str
+    hour_start_utc: datetime
+    impact: float
+    is_breaking: bool
+
+
+def hour_start(value: datetime) -> datetime:
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+def event_rollup_contribution(event: Event) -> RollupContribution | None:
+    if event.event_time is None or not event.topic:
+        return None
+    return RollupContribution(
+        topic=event.topic,
+        hour_start_utc=hour_start(event.event_time),
+        impact=float(event.impact_score or 0.0),
+        is_breaking=bool(event.is_breaking),
+    )
+
+
+def _band_column(impact: float) -> str:
+    return f"band_{impact_band(impact)}_count"
+
+
+def _recompute_impact_max(db: Session, row: TopicHourlyRollup) -> float | None:
+    db.flush()
+    return (
+        db.query(func.max(Event.impact_score))
+        .filter(
+            Event.topic == row.topic,
+            Event.event_time >= row.hour_start_utc,
+            Event.event_time < row.hour_start_utc + timedelta(hours=1),
+        )
+        .scalar()
+    )
+
+
+def _adjust(db: Session, contribution: RollupContribution, *, sign: int) -> None:
+    row = (
+        db.query(TopicHourlyRollup)
+        .filter(
+            TopicHourlyRollup.topic == contribution.topic,
+            TopicHourlyRollup.hour_start_utc == contribution.hour_start_utc,
+        )
+        .one_or_none()
+    )
+    if row is None:
+        if sign < 0:
+            logger.warning(
+                "topic_rollup_missing_bucket topic=%s hour_start_utc=%s",
+                contribution.topic,
+                contribution.hour_start_utc.isoformat(),
+            )
+            return
+        row = TopicHourlyRollup(
+            topic=contribution.topic,
+            hour_start_utc=contribution.hour_start_utc,
+            event_count=0,
+            impact_sum=0.0,
+            impact_max=None,
+            breaking_count=0,
+            band_low_count=0,
+            band_medium_count=0,
+            band_high_count=0,
+            band_critical_count=0,
+        )
+        db.add(row)
+
+    band_column = _band_column(contribution.impact)
+    row.event_count += sign
+    row.impact_sum += sign * contribution.impact
+    row.breaking_count += sign * int(contribution.is_breaking)
+    setattr(row, band_column, getattr(row, band_column) + sign)
+    if sign > 0:
+        row.impact_max = contribution.impact if row.impact_max is None else max(row.impact_max, contribution.impact)
+    elif row.event_count <= 0:
+        row.event_count = 0
+        row.impact_sum = 0.0
+        row.impact_max = None
+    elif row.impact_max is None or contribution.impact >= row.impact_max:
+        row.impact_max = _recompute_impact_max(db, row)
+    row.updated_at = datetime.utcnow()
+    # Flush so the next adjustment in a non-autoflush session finds this row.
+    db.flush()
+
+
+def apply_event_rollup(
+    db: Session,
+    *,
+    before: RollupContribution | None,
+    after: RollupContribution | None,
+) -> None:
+    """Move an event's contribution from `before` to `after` (either may be None)."""
+
+    if before == after:
+        return
+    if before is not None:
+        _adjust(db, before, sign=-1)
+    if after is not None:
+        _adjust(db, after, sign=1)
+
+
+def rebuild_topic_rollups(db: Session, *, batch_size: int = 1000) -> int:
+    """Recompute all rollup rows from `events`. Caller commits. Returns bucket count."""
+
+    buckets: dict[tuple[str, datetime], dict[str, Any]] = {}
+    last_id = 0
+    while True:
+        events = (
+            db.query(Event)
+            .filter(Event.id > last_id)
+            .order_by(Event.id.asc())
+            .limit(batch_size)
+            .all()
+        )
+        if not events:
+            break
+        for event in events:
+            contribution = event_rollup_contribution(event)
+            if contribution is None:
+                continue
+            bucket = buckets.setdefault(
+                (contribution.topic, contribution.hour_start_utc),
+                {
+                    "event_count": 0,
+                    "impact_sum": 0.0,
+                    "impact_max": None,
+                    "breaking_count": 0,
+                    **{f"band_{band}_count": 0 for band in SCORE_BANDS},
+                },
+            )
+            bucket["event_count"] += 1
+            bucket["impact_sum"] += contribution.impact
+            bucket["impact_max"] = (
+                contribution.impact if bucket["impact_max"] is None else max(bucket["impact_max"], contribution.impact)
+            )
+            bucket["breaking_count"] += int(contribution.is_breaking)
+            bucket[_band_column(contribution.impact)] += 1
+        last_id = events[-1].id
+
+    db.query(TopicHourlyRollup).delete(synchronize_session=False)
+    now = datetime.utcnow()
+    for (topic, hour), values in buckets.items():
+        db.add(TopicHourlyRollup(topic=topic, hour_start_utc=hour, updated_at=now, **values))
+    db.flush()
+    logger.info("topic_rollups_rebuilt buckets=%s", len(buckets))
+    return len(buckets)
+
+
+def _empty_totals() -> dict[str, Any]:
+    return {
+        "event_count": 0,
+        "impact_sum": 0.0,
+        "impact_max": None,
+        "breaking_count": 0,
+        "score_bands": {band: 0 for band in SCORE_BANDS},
+    }
+
+
+def _accumulate(totals: dict[str, Any], row: TopicHourlyRollup) -> None:
+    totals["event_count"] += row.event_count
+    totals["impact_sum"] += row.impact_sum
+    if row.impact_max is not None:
+        totals["impact_max"] = row.impact_max if totals["impact_max"] is None else max(totals["impact_max"], row.impact_max)
+    totals["breaking_count"] += row.breaking_count
+    for band in SCORE_BANDS:
+        totals["score_bands"][band] += getattr(row, f"band_{band}_count")
+
+
+def _finish(totals: dict[str, Any]) -> dict[str, Any]:
+    count = totals["event_count"]
+    totals["impact_avg"] = round(totals["impact_sum"] / count, 4) if count else None
+    totals["impact_sum"] = round(totals["impact_sum"], 4)
+    return totals
+
+
+def query_topic_rollups(
+    db: Session,
+    *,
+    start_time: datetime,
+    end_time: datetime,
+    topic: str | None = None,
+    bucket: RollupBucket = "hour",
+) -> dict[str, Any]:
+    """Per-topic totals and a bucketed series for [start_time, end_time), at hour granularity.
+
+    Offset-aware bounds are converted to naive UTC; naive bounds are taken as UTC.
+    """
+
+    start_time = normalize_time(start_time)
+    end_time = normalize_time(end_time)
+    if start_time >= end_time:
+        raise ValueError("start_time must be earlier than end_time")
+    query = db.query(TopicHourlyRollup).filter(
+        TopicHourlyRollup.hour_start_utc >= hour_start(start_time),
+        TopicHourlyRollup.hour_start_utc < end_time,
+        TopicHourlyRollup.event_count > 0,
+    )
+    if topic is not None:
+        query = query.filter(TopicHourlyRollup.topic == topic)
+    rows = query.order_by(TopicHourlyRollup.hour_start_utc.asc(), TopicHourlyRollup.topic.asc()).all()
+
+    totals: dict[str, dict[str, Any]] = defaultdict(_empty_totals)
+    series: dict[str, dict[datetime, dict[str, Any]]] = defaultdict(dict)
+    for row in rows:
+        key = row.hour_start_utc if bucket == "hour" else row.hour_start_utc.replace(hour=0)
+        _accumulate(totals[row.topic], row)
+        _accumulate(series[row.topic].setdefault(key, _empty_totals()), row)
+
+    topics = []
+    for name in sorted(totals):
+        topic_totals = _finish(totals[name])
+        topic_totals["topic"] = name
+        topic_totals["series"] = [
+            {"bucket_start_utc": key.isoformat(), **_finish(values)} for key, values in sorted(series[name].items())
+        ]
+        topics.append(topic_totals)
+
+    return {
+        "start_time": start_time.isoformat(),
+        "end_time": end_time.isoformat(),
+        "bucket": bucket,
+        "rollup_rows": len(rows),
+        "topics": topics,
+    }
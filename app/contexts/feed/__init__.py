@@ -0,0 +1,3 @@
+# Importing the stream module registers the after-commit hook that publishes
+# feed read-model changes to live subscribers.
+from . import stream  # noqa: F401
@@ -0,0 +1,87 @@
+"""Conditional requests and first-page caching for `/api/feed/events`.
+
+Every feed response carries a strong ETag derived from the `feed_state`
+version plus the request's cursor, topic and limit. The version is bumped in
+the same transaction as any `feed_events` change, so:
+- a matching `If-None-Match` is answered with 304 after one primary-key lookup,
+- rendered first pages (no cursor) are cached in-process under the version;
+  a write moves the version forward and the next request re-renders.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Hashable
+
+from ...config import Settings, get_settings
+
+
+def feed_etag(*, version: str, limit: int, cursor: str | None, topic: str | None) -> str:
+    source = f"v={version}|limit={limit}|cursor={cursor or ''}|topic={topic or ''}"
+    return '"' + hashlib.sha256(source.encode("utf-8")).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {value.strip() for value in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+class FeedPageCache:
+    """LRU of rendered first pages keyed by (version, topic, limit).
+
+    Storing a page under a different version drops every entry from the old one.
+    """
+
+    def __init__(self, *, max_entries: int = 64) -> None:
+        self._max_entries = max(0, max_entries)
+        self._version: str | None = None
+        self._entries: OrderedDict[Hashable, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, *, version: str, topic: str | None, limit: int) -> bytes | None:
+        key = (topic, limit)
+        with self._lock:
+            if self._version != version:
+                return None
+            body = self._entries.get(key)
+            if body is not None:
+                self._entries.move_to_end(key)
+            return body
+
+    def put(self, *, version: str, topic: str | None, limit: int, body: bytes) -> None:
+        if self._max_entries == 0:
+            return
+        with self._lock:
+            if self._version != version:
+                self._entries.clear()
+                self._version = version
+            self._entries[(topic, limit)] = body
+            self._entries.move_to_end((topic, limit))
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._version = None
+
+
+_default_cache: FeedPageCache | None = None
+_default_cache_lock = threading.Lock()
+
+
+def get_feed_page_cache(settings: Settings | None = None) -> FeedPageCache:
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            current = settings or get_settings()
+            _default_cache = FeedPageCache(max_entries=current.feed_page_cache_size)
+        return _default_cache
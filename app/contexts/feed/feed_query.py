@@ -3,15 +3,13 @@ from __future__ import annotations
 import base64
 import json
 from datetime import datetime, timezone
-from typing import get_args
 
-from sqlalchemy import and_, func, or_
+from sqlalchemy import tuple_
 from sqlalchemy.orm import Session
 
-from ...models import Event
+from ...models import FeedEvent
 from ...schemas import FeedEventItem, FeedEventsResponse, Topic
 
-TOPIC_VALUES = tuple(get_args(Topic))
 _CURSOR_VERSION = 1
 
 
@@ -30,7 +28,7 @@ def _format_event_time(value: datetime) -> str:
     return utc_value.isoformat(timespec="milliseconds").replace("+00:00", "Z")
 
 
-def _encode_cursor(*, event_time: datetime, event_id: int) -> str:
+def encode_feed_cursor(*, event_time: datetime, event_id: int) -> str:
     payload = {
         "v": _CURSOR_VERSION,
         "event_time": _format_event_time(event_time),
@@ -40,7 +38,7 @@ def _encode_cursor(*, event_time: datetime, event_id: int) -> str:
     return base64.urlsafe_b64encode(raw).decode("utf-8").rstrip("=")
 
 
-def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+def decode_feed_cursor(cursor: str) -> tuple[datetime, int]:
     try:
         padded = cursor + ("=" * (-len(cursor) % 4))
         payload = json.loads(base64.urlsafe_b64decode(padded.encode("utf-8")).decode("utf-8"))
@@ -65,6 +63,26 @@ def _decode_cursor(cursor: str) -> tuple[datetime, int]:
     return _to_utc_naive(parsed), event_id
 
 
+def feed_item(*, event_id: int, topic: str, event_time: datetime, summary: str, impact_score: int) -> FeedEventItem:
+    return FeedEventItem(
+        id=event_id,
+        summary=summary,
+        topic=topic,
+        event_time=_format_event_time(event_time),
+        impact_score=impact_score,
+    )
+
+
+def _item_from_row(row: FeedEvent) -> FeedEventItem:
+    return feed_item(
+        event_id=row.event_id,
+        topic=row.topic,
+        event_time=row.event_time,
+        summary=row.summary,
+        impact_score=row.impact_score,
+    )
+
+
 def list_feed_events(
     db: Session,
     *,
@@ -72,27 +90,22 @@ def list_feed_events(
     cursor: str | None,
     topic: Topic | None,
 ) -> FeedEventsResponse:
-    query = db.query(Event).filter(
-        Event.event_time.isnot(None),
-        Event.topic.in_(TOPIC_VALUES),
-        Event.summary_1_sentence.isnot(None),
-        func.length(func.trim(Event.summary_1_sentence)) > 0,
-    )
+    # Eligibility is precomputed in `feed_events`, so every page is a range scan
+    # over (topic, event_time DESC, event_id DESC) or (event_time DESC, event_id DESC).
+    query = db.query(FeedEvent)
 
     if topic is not None:
-        query = query.filter(Event.topic == topic)
+        query = query.filter(FeedEvent.topic == topic)
 
     if cursor is not None:
-        cursor_event_time, cursor_event_id = _decode_cursor(cursor)
+        cursor_event_time, cursor_event_id = decode_feed_cursor(cursor)
+        # Row-value comparison keeps the keyset predicate sargable on both indexes.
         query = query.filter(
-            or_(
-                Event.event_time < cursor_event_time,
-                and_(Event.event_time == cursor_event_time, Event.id < cursor_event_id),
-            )
+            tuple_(FeedEvent.event_time, FeedEvent.event_id) < tuple_(cursor_event_time, cursor_event_id)
         )
 
     rows = (
-        query.order_by(Event.event_time.desc(), Event.id.desc())
+        query.order_by(FeedEvent.event_time.desc(), FeedEvent.event_id.desc())
         .limit(limit + 1)
         .all()
     )
@@ -100,22 +113,33 @@ def list_feed_events(
     page_rows = rows[:limit]
     has_more = len(rows) > limit
 
-    items = [
-        FeedEventItem(
-            id=row.id,
-            summary=(row.summary_1_sentence or "").strip(),
-            topic=row.topic,
-            event_time=_format_event_time(row.event_time),
-            impact_score=int(round(float(row.impact_score or 0.0))),
-        )
-        for row in page_rows
-    ]
+    items = [_item_from_row(row) for row in page_rows]
 
     next_cursor = None
     if has_more and page_rows:
         last_row = page_rows[-1]
-        next_cursor = _encode_cursor(event_time=last_row.event_time, event_id=last_row.id)
+        next_cursor = encode_feed_cursor(event_time=last_row.event_time, event_id=last_row.event_id)
 
     return FeedEventsResponse(items=items, next_cursor=next_cursor)
 
 
+def list_feed_events_after(
+    db: Session,
+    *,
+    cursor: str,
+    topic: Topic | None,
+    limit: int,
+) -> list[tuple[FeedEventItem, str]]:
+    """Items newer than `cursor`, oldest first, each with its own cursor (stream resume)."""
+
+    cursor_event_time, cursor_event_id = decode_feed_cursor(cursor)
+    query = db.query(FeedEvent).filter(
+        tuple_(FeedEvent.event_time, FeedEvent.event_id) > tuple_(cursor_event_time, cursor_event_id)
+    )
+    if topic is not None:
+        query = query.filter(FeedEvent.topic == topic)
+    rows = query.order_by(FeedEvent.event_time.asc(), FeedEvent.event_id.asc()).limit(limit).all()
+    return [
+        (_item_from_row(row), encode_feed_cursor(event_time=row.event_time, event_id=row.event_id))
+        for row in rows
+    ]
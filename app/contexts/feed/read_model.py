@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from typing import get_args
+
+from sqlalchemy.orm import Session
+
+from ...models import Event, FeedEvent, FeedState
+from ...schemas import Topic
+
+TOPIC_VALUES = tuple(get_args(Topic))
+
+logger = logging.getLogger("civicquant.feed")
+
+FEED_STATE_ID = 1
+# Session.info key: feed rows changed in the current transaction, published to
+# live stream subscribers after commit (see `feed/stream.py`).
+PENDING_FEED_UPDATES_KEY = "civicquant_feed_pending_updates"
+
+
+def feed_row_values(event: Event) -> dict[str, object] | None:
+    """Return the `feed_events` column values for `event`, or None when it is not feed-eligible."""
+
+    summary = (event.summary_1_sentence or "").strip()
+    if event.event_time is None or event.topic not in TOPIC_VALUES or not summary:
+        return None
+    return {
+        "topic": event.topic,
+        "event_time": event.event_time,
+        "summary": summary,
+        "impact_score": int(round(float(event.impact_score or 0.0))),
+    }
+
+
+def get_feed_version(db: Session) -> str:
+    """Opaque feed version token: the counter plus its bump time, so a reset database never reuses a token."""
+
+    row = db.query(FeedState.version, FeedState.updated_at).filter(FeedState.id == FEED_STATE_ID).one_or_none()
+    if row is None:
+        return "0"
+    version, updated_at = row
+    return f"{version}.{updated_at.strftime('%Y%m%d%H%M%S%f')}"
+
+
+def bump_feed_version(db: Session) -> None:
+    """Advance the feed version; committed together with the caller's feed change."""
+
+    now = datetime.utcnow()
+    updated = (
+        db.query(FeedState)
+        .filter(FeedState.id == FEED_STATE_ID)
+        .update({FeedState.version: FeedState.version + 1, FeedState.updated_at: now}, synchronize_session=False)
+    )
+    if not updated:
+        db.add(FeedState(id=FEED_STATE_ID, version=1, updated_at=now))
+        db.flush()
+
+
+def _queue_feed_update(db: Session, event_id: int, values: dict[str, object]) -> None:
+    db.info.setdefault(PENDING_FEED_UPDATES_KEY, {})[event_id] = {"event_id": event_id, **values}
+
+
+def sync_feed_event(db: Session, event: Event) -> bool:
+    """Upsert or drop the feed row for a flushed `event`. Returns whether it is in the feed.
+
+    Inserts and deletes are flushed immediately so a later sync for the same
+    event in a non-autoflush session sees them.
+    """
+
+    values = feed_row_values(event)
+    row = db.get(FeedEvent, event.id)
+    if values is None:
+        if row is not None:
+            db.delete(row)
+            db.flush()
+            bump_feed_version(db)
+        return False
+    if row is None:
+        db.add(FeedEvent(event_id=event.id, updated_at=datetime.utcnow(), **values))
+        db.flush()
+        bump_feed_version(db)
+        _queue_feed_update(db, event.id, values)
+        return True
+    if any(getattr(row, name) != value for name, value in values.items()):
+        for name, value in values.items():
+            setattr(row, name, value)
+        row.updated_at = datetime.utcnow()
+        bump_feed_version(db)
+        _queue_feed_update(db, event.id, values)
+    return True
+
+
+def remove_feed_event(db: Session, event_id: int) -> bool:
+    """Drop the feed row of an event that is being deleted. Returns whether a row was removed."""
+
+    removed = db.query(FeedEvent).filter(FeedEvent.event_id == event_id).delete(synchronize_session=False)
+    if removed:
+        bump_feed_version(db)
+    return bool(removed)
+
+
+def rebuild_feed_events(db: Session, *, batch_size: int = 1000) -> int:
+    """Rebuild `feed_events` from `events` (backfill / repair). Caller commits."""
+
+    db.query(FeedEvent).delete(synchronize_session=False)
+    inserted = 0
+    last_id = 0
+    while True:
+        events = (
+            db.query(Event)
+            .filter(Event.id > last_id)
+            .order_by(Event.id.asc())
+            .limit(batch_size)
+            .all()
+        )
+        if not events:
+            break
+        for event in events:
+            values = feed_row_values(event)
+            if values is not None:
+                db.add(FeedEvent(event_id=event.id, updated_at=datetime.utcnow(), **values))
+                inserted += 1
+        last_id = events[-1].id
+        db.flush()
+    bump_feed_version(db)
+    logger.info("feed_read_model_rebuilt rows=%s", inserted)
+    return inserted
@@ -0,0 +1,206 @@
+"""Live feed stream: in-process pub/sub behind `/api/feed/stream`.
+
+`sync_feed_event` records each changed feed row on the session; once that
+session commits, the rows are published to `FeedHub`, which fans them out to
+every subscriber for the row's topic (and to unfiltered subscribers). Rolled
+back changes are never published. Subscribers cost one bounded queue each, so
+hundreds of open streams share the single event write path instead of polling.
+
+Each SSE message id is the item's feed cursor (`encode_feed_cursor`), so a
+client resumes with `Last-Event-ID` (or `?cursor=`) and first receives the
+items newer than that cursor. Items that leave the feed are not streamed.
+A subscriber that falls `feed_stream_queue_size` items behind, or whose resume
+cursor is more than `feed_stream_replay_limit` items old, receives a `reset`
+event and is disconnected; it should re-read the paginated feed.
+
+Only commits made in this process reach the hub: phase2 extraction must run
+in the API process (the `PHASE2_QUEUE_ENABLED` consumer, or the
+`/admin/process/phase2-extractions` trigger) for events to stream.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+
+from sqlalchemy import event as sa_event
+from sqlalchemy.orm import Session
+
+from ...config import Settings, get_settings
+from ...schemas import FeedEventItem
+from .feed_query import encode_feed_cursor, feed_item
+from .read_model import PENDING_FEED_UPDATES_KEY
+
+
+logger = logging.getLogger("civicquant.feed")
+
+_LAGGED = object()
+
+
+class FeedSubscription:
+    def __init__(self, hub: "FeedHub", *, topic: str | None, queue_size: int) -> None:
+        self.topic = topic
+        self._hub = hub
+        self._loop = asyncio.get_running_loop()
+        self._queue: asyncio.Queue[object] = asyncio.Queue(maxsize=max(1, queue_size) + 1)
+        self._capacity = max(1, queue_size)
+        self.lagged = False
+
+    def _deliver(self, message: tuple[FeedEventItem, str]) -> None:
+        # Runs on the subscriber's loop.
+        if self.lagged:
+            return
+        if self._queue.qsize() >= self._capacity:
+            self.lagged = True
+            self._queue.put_nowait(_LAGGED)
+            return
+        self._queue.put_nowait(message)
+
+    def deliver_threadsafe(self, message: tuple[FeedEventItem, str]) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self._deliver, message)
+        except RuntimeError:
+            # Loop already closed; the stream is gone.
+            self.close()
+
+    def backlog(self) -> int:
+        """Messages queued and not yet read (call on the subscriber's loop)."""
+
+        return self._queue.qsize()
+
+    async def get(self) -> tuple[FeedEventItem, str] | None:
+        """Next (item, cursor); None once the subscriber has lagged."""
+
+        message = await self._queue.get()
+        if message is _LAGGED:
+            return None
+        return message  # type: ignore[return-value]
+
+    def close(self) -> None:
+        self._hub.unsubscribe(self)
+
+
+class FeedHub:
+    def __init__(self, *, queue_size: int = 256) -> None:
+        self._queue_size = queue_size
+        self._subscribers: dict[str | None, set[FeedSubscription]] = {}
+        self._lock = threading.Lock()
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+    def subscribe(self, *, topic: str | None = None) -> FeedSubscription:
+        """Register a subscriber on the running event loop."""
+
+        subscription = FeedSubscription(self, topic=topic, queue_size=self._queue_size)
+        with self._lock:
+            self._subscribers.setdefault(topic, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: FeedSubscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.topic)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.topic]
+
+    def publish(self, messages: Iterable[tuple[FeedEventItem, str]]) -> int:
+        """Fan (item, cursor) messages out to matching subscribers; safe to call from any thread."""
+
+        delivered = 0
+        for message in messages:
+            item = message[0]
+            with self._lock:
+                targets = list(self._subscribers.get(item.topic, ())) + list(self._subscribers.get(None, ()))
+            for subscription in targets:
+                subscription.deliver_threadsafe(message)
+            delivered += len(targets)
+        return delivered
+
+
+def format_sse(item: FeedEventItem, cursor: str) -> str:
+    return f"id: {cursor}\nevent: feed_event\ndata: {json.dumps(item.model_dump(), separators=(',', ':'))}\n\n"
+
+
+async def feed_event_stream(
+    subscription: FeedSubscription,
+    *,
+    replay: list[tuple[FeedEventItem, str]],
+    replay_backlog: int,
+    heartbeat_seconds: float,
+    is_disconnected: Callable[[], Awaitable[bool]],
+    replay_truncated: bool = False,
+) -> AsyncIterator[str]:
+    """SSE text for `replay`, then live items, with keep-alive comments when idle.
+
+    The subscription is opened before the replay is read, so its first
+    `replay_backlog` messages (queued by the time the replay finished) may
+    repeat a replayed item; those are dropped when identical. Later messages
+    are always sent, even for a replayed cursor. A `replay_truncated` replay
+    cannot catch the client up, so it gets `reset` instead.
+    """
+
+    replayed = {cursor: item for item, cursor in replay}
+    remaining_backlog = replay_backlog
+    try:
+        if replay_truncated:
+            logger.info("feed_stream_replay_truncated topic=%s", subscription.topic)
+            yield "event: reset\ndata: {}\n\n"
+            return
+        for item, cursor in replay:
+            yield format_sse(item, cursor)
+        while not await is_disconnected():
+            try:
+                message = await asyncio.wait_for(subscription.get(), timeout=heartbeat_seconds)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            if message is None:
+                logger.warning("feed_stream_lagged topic=%s", subscription.topic)
+                yield "event: reset\ndata: {}\n\n"
+                break
+            item, cursor = message
+            if remaining_backlog > 0:
+                remaining_backlog -= 1
+                if replayed.get(cursor) == item:
+                    continue
+            yield format_sse(item, cursor)
+    finally:
+        subscription.close()
+
+
+_default_hub: FeedHub | None = None
+_default_hub_lock = threading.Lock()
+
+
+def get_feed_hub(settings: Settings | None = None) -> FeedHub:
+    global _default_hub
+    with _default_hub_lock:
+        if _default_hub is None:
+            current = settings or get_settings()
+            _default_hub = FeedHub(queue_size=current.feed_stream_queue_size)
+        return _default_hub
+
+
+@sa_event.listens_for(Session, "after_commit")
+def _publish_committed_feed_updates(session: Session) -> None:
+    pending = session.info.pop(PENDING_FEED_UPDATES_KEY, None)
+    if not pending:
+        return
+    try:
+        get_feed_hub().publish(
+            (feed_item(**values), encode_feed_cursor(event_time=values["event_time"], event_id=values["event_id"]))
+            for values in pending.values()
+        )
+    except Exception as exc:  # noqa: BLE001
+        logger.exception("feed_stream_publish_failed reason=%s", type(exc).__name__)
+
+
+@sa_event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_feed_updates(session: Session) -> None:
+    session.info.pop(PENDING_FEED_UPDATES_KEY, None)
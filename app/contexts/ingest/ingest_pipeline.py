@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from ...models import EventMessage, MessageProcessingState, RawMessage
@@ -105,3 +106,31 @@ def process_source_ingest_payload(
     envelope = envelope_from_source_payload(payload)
     return process_ingest_message(db=db, payload=envelope, normalized_text=normalized_text)
 
+
+
+async def process_ingest_message_async(
+    db: AsyncSession,
+    payload: SourceMessageEnvelope,
+    normalized_text: str,
+) -> dict[str, object]:
+    # run_sync drives the same ORM code over the async driver, so duplicate
+    # handling (pre-check plus IntegrityError fallback) stays identical.
+    return await db.run_sync(process_ingest_message, payload, normalized_text)
+
+
+async def process_ingest_payload_async(
+    db: AsyncSession,
+    payload: TelegramIngestPayload,
+    normalized_text: str,
+) -> dict[str, object]:
+    envelope = envelope_from_telegram_payload(payload)
+    return await process_ingest_message_async(db=db, payload=envelope, normalized_text=normalized_text)
+
+
+async def process_source_ingest_payload_async(
+    db: AsyncSession,
+    payload: SourceIngestPayload,
+    normalized_text: str,
+) -> dict[str, object]:
+    envelope = envelope_from_source_payload(payload)
+    return await process_ingest_message_async(db=db, payload=envelope, normalized_text=normalized_text)
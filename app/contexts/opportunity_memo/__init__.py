@@ -8,7 +8,17 @@ from .contracts import (
     RankedTopicOpportunity,
 )
 from .hashing import canonical_hash_for_opportunity_memo, input_hash_for_opportunity_memo
-from .input_builder import build_opportunity_memo_input_pack, load_event_snapshots, rank_topic_candidates, topic_timeline
+from .input_builder import (
+    MemoSelection,
+    MemoWorkingSet,
+    build_opportunity_memo_input_pack,
+    load_event_snapshots,
+    load_memo_working_set,
+    load_memo_working_sets,
+    rank_topic_candidates,
+    select_memo_topic,
+    topic_timeline,
+)
 from .research import (
     OpenAiOpportunityResearchProvider,
     OpportunityResearchError,
@@ -29,9 +39,14 @@ __all__ = [
     "RankedTopicOpportunity",
     "canonical_hash_for_opportunity_memo",
     "input_hash_for_opportunity_memo",
+    "MemoSelection",
+    "MemoWorkingSet",
     "build_opportunity_memo_input_pack",
     "load_event_snapshots",
+    "load_memo_working_set",
+    "load_memo_working_sets",
     "rank_topic_candidates",
+    "select_memo_topic",
     "topic_timeline",
     "OpenAiOpportunityResearchProvider",
     "OpportunityResearchError",
@@ -188,3 +188,4 @@ class OpportunityMemoRunResult(BaseModel):
     delivery_status: str | None = None
     validation_errors: list[dict[str, str]] = Field(default_factory=list)
     message: str | None = None
+    reused_artifact: bool = False
@@ -189,10 +189,9 @@ def select_primary_driver(
 
     candidates: list[DriverCandidate] = []
     for driver_key in DRIVER_KEYS:
-        supporting_event_ids = sorted(driver_to_event_ids.get(driver_key, set()))
-        supporting_events = [
-            event for event in topic_events if int(event.get("id") or 0) in set(supporting_event_ids)
-        ]
+        supporting_id_set = driver_to_event_ids.get(driver_key, set())
+        supporting_event_ids = sorted(supporting_id_set)
+        supporting_events = [event for event in topic_events if int(event.get("id") or 0) in supporting_id_set]
 
         supporting_event_weight = _driver_component_supporting_event_weight(topic_events, supporting_event_ids)
         temporal_density = _driver_component_temporal_density(
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+import time
 from collections import Counter
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
 from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session
 
-from ...models import Event, EventRelation, EventTag, Extraction
+from ...models import Event, EventOpportunityTopic
 from .contracts import (
     MemoEventTimelineItem,
     MemoSelectionDiagnostics,
@@ -17,7 +19,8 @@ from .contracts import (
 )
 from .driver_selection import select_primary_driver
 from .ranking import previous_equivalent_window, rank_topic_opportunities
-from .topic_mapping import map_event_to_topic
+from .topic_mapping import TOPIC_MAPPING_VERSION, map_event_to_topic
+from .topic_store import load_mapping_inputs
 
 
 def _normalize_utc_naive(value: datetime) -> datetime:
@@ -29,75 +32,61 @@ def load_event_snapshots(
     *,
     start_time: datetime,
     end_time: datetime,
+    topic: str | None = None,
 ) -> list[dict[str, Any]]:
+    """Mapped snapshots of the events in the window, newest first.
+
+    Current persisted mappings (`event_opportunity_topics`) are reused; events
+    without one are mapped here. With `topic`, only events mapped to it are
+    returned and the persisted topic narrows the SQL scan.
+    """
+
     start = _normalize_utc_naive(start_time)
     end = _normalize_utc_naive(end_time)
 
-    events = (
-        db.query(Event)
+    fresh_mapping = and_(
+        EventOpportunityTopic.event_id == Event.id,
+        EventOpportunityTopic.mapping_version == TOPIC_MAPPING_VERSION,
+    )
+    query = (
+        db.query(Event, EventOpportunityTopic)
+        .outerjoin(EventOpportunityTopic, fresh_mapping)
         .filter(
             or_(
                 and_(Event.event_time.is_not(None), Event.event_time >= start, Event.event_time < end),
                 and_(Event.event_time.is_(None), Event.last_updated_at >= start, Event.last_updated_at < end),
             )
         )
-        .order_by(Event.event_time.desc().nullslast(), Event.last_updated_at.desc(), Event.id.desc())
-        .all()
     )
+    if topic is not None:
+        query = query.filter(or_(EventOpportunityTopic.event_id.is_(None), EventOpportunityTopic.topic == topic))
+    rows = query.order_by(Event.event_time.desc().nullslast(), Event.last_updated_at.desc(), Event.id.desc()).all()
 
-    if not events:
+    if not rows:
         return []
 
-    event_ids = [event.id for event in events]
-    extraction_ids = [event.latest_extraction_id for event in events if event.latest_extraction_id is not None]
-
-    extraction_by_id: dict[int, Extraction] = {}
-    if extraction_ids:
-        extraction_rows = db.query(Extraction).filter(Extraction.id.in_(extraction_ids)).all()
-        extraction_by_id = {row.id: row for row in extraction_rows}
-
-    tags_by_event: dict[int, list[dict[str, Any]]] = {event_id: [] for event_id in event_ids}
-    for row in db.query(EventTag).filter(EventTag.event_id.in_(event_ids)).all():
-        tags_by_event.setdefault(row.event_id, []).append(
-            {
-                "tag_type": row.tag_type,
-                "tag_value": row.tag_value,
-                "tag_source": row.tag_source,
-                "confidence": row.confidence,
-            }
-        )
-
-    relations_by_event: dict[int, list[dict[str, Any]]] = {event_id: [] for event_id in event_ids}
-    for row in db.query(EventRelation).filter(EventRelation.event_id.in_(event_ids)).all():
-        relations_by_event.setdefault(row.event_id, []).append(
-            {
-                "subject_type": row.subject_type,
-                "subject_value": row.subject_value,
-                "relation_type": row.relation_type,
-                "object_type": row.object_type,
-                "object_value": row.object_value,
-                "relation_source": row.relation_source,
-                "inference_level": row.inference_level,
-                "confidence": row.confidence,
-            }
-        )
+    events = [event for event, _mapping in rows]
+    tags_by_event, relations_by_event, payload_by_event = load_mapping_inputs(db, events)
 
     snapshots: list[dict[str, Any]] = []
-    for event in events:
-        extraction_payload: dict[str, Any] = {}
-        if event.latest_extraction_id is not None:
-            extraction_row = extraction_by_id.get(event.latest_extraction_id)
-            if extraction_row is not None:
-                payload_candidate = extraction_row.canonical_payload_json or extraction_row.payload_json or {}
-                if isinstance(payload_candidate, dict):
-                    extraction_payload = payload_candidate
-
-        mapping = map_event_to_topic(
-            event_id=event.id,
-            tags=tags_by_event.get(event.id, []),
-            relations=relations_by_event.get(event.id, []),
-            latest_extraction_payload=extraction_payload,
-        )
+    for event, stored in rows:
+        tags = tags_by_event.get(event.id, [])
+        relations = relations_by_event.get(event.id, [])
+        extraction_payload = payload_by_event.get(event.id, {})
+        if stored is not None:
+            mapped_topic = stored.topic
+            mapping_diagnostics = dict(stored.diagnostics_json or {})
+        else:
+            mapping = map_event_to_topic(
+                event_id=event.id,
+                tags=tags,
+                relations=relations,
+                latest_extraction_payload=extraction_payload,
+            )
+            mapped_topic = mapping.topic
+            mapping_diagnostics = mapping.diagnostics.model_dump(mode="json")
+        if topic is not None and mapped_topic != topic:
+            continue
 
         snapshots.append(
             {
@@ -108,17 +97,115 @@ def load_event_snapshots(
                 "impact_score": float(event.impact_score or 0.0),
                 "event_identity_fingerprint_v2": event.event_identity_fingerprint_v2,
                 "claim_hash": event.claim_hash,
-                "tags": tags_by_event.get(event.id, []),
-                "relations": relations_by_event.get(event.id, []),
+                "tags": tags,
+                "relations": relations,
                 "latest_extraction_payload": extraction_payload,
-                "mapped_topic": mapping.topic,
-                "mapping_diagnostics": mapping.diagnostics.model_dump(mode="json"),
+                "mapped_topic": mapped_topic,
+                "mapping_diagnostics": mapping_diagnostics,
             }
         )
 
     return snapshots
 
 
+def _snapshot_time(row: dict[str, Any]) -> datetime | None:
+    value = row.get("event_time") or row.get("last_updated_at")
+    return value if isinstance(value, datetime) else None
+
+
+@dataclass
+class MemoWorkingSet:
+    """Mapped event snapshots for a memo window and its prior equivalent window.
+
+    Loaded with one pass over `events` (and one topic mapping per event), then
+    shared by topic ranking, the input pack, the timeline and driver selection.
+    """
+
+    start_time: datetime
+    end_time: datetime
+    current_events: list[dict[str, Any]]
+    prior_events: list[dict[str, Any]]
+    _topic_events: dict[str, list[dict[str, Any]]] = field(default_factory=dict, repr=False)
+
+    def covers(self, *, start_time: datetime, end_time: datetime) -> bool:
+        return (
+            self.start_time == _normalize_utc_naive(start_time)
+            and self.end_time == _normalize_utc_naive(end_time)
+        )
+
+    def topic_events(self, topic: str) -> list[dict[str, Any]]:
+        """Current-window snapshots mapped to `topic` (a fresh list; rows are shared)."""
+
+        if topic not in self._topic_events:
+            self._topic_events[topic] = [row for row in self.current_events if row.get("mapped_topic") == topic]
+        return list(self._topic_events[topic])
+
+
+def load_memo_working_sets(
+    db: Session,
+    *,
+    windows: list[tuple[datetime, datetime]],
+) -> list[MemoWorkingSet]:
+    """Working sets for several memo windows from one snapshot load.
+
+    One pass covers the earliest prior window through the latest window end;
+    each working set then takes its current and prior rows from that load, so
+    overlapping windows share snapshots (and topic mappings).
+    """
+
+    bounds: list[tuple[datetime, datetime, datetime]] = []
+    for start_time, end_time in windows:
+        start = _normalize_utc_naive(start_time)
+        end = _normalize_utc_naive(end_time)
+        prior_start, _prior_end = previous_equivalent_window(start_time=start, end_time=end)
+        bounds.append((prior_start, start, end))
+    if not bounds:
+        return []
+
+    snapshots = load_event_snapshots(
+        db,
+        start_time=min(prior_start for prior_start, _start, _end in bounds),
+        end_time=max(end for _prior_start, _start, end in bounds),
+    )
+    timed = [(row, _snapshot_time(row)) for row in snapshots]
+
+    working_sets: list[MemoWorkingSet] = []
+    for prior_start, start, end in bounds:
+        # The prior window ends where the current one starts.
+        current_events: list[dict[str, Any]] = []
+        prior_events: list[dict[str, Any]] = []
+        for row, ts in timed:
+            if ts is None or ts < prior_start or ts >= end:
+                continue
+            if ts >= start:
+                current_events.append(row)
+            else:
+                prior_events.append(row)
+        working_sets.append(
+            MemoWorkingSet(
+                start_time=start,
+                end_time=end,
+                current_events=current_events,
+                prior_events=prior_events,
+            )
+        )
+    return working_sets
+
+
+def load_memo_working_set(
+    db: Session,
+    *,
+    start_time: datetime,
+    end_time: datetime,
+) -> MemoWorkingSet:
+    return load_memo_working_sets(db, windows=[(start_time, end_time)])[0]
+
+
+def _require_window(working_set: MemoWorkingSet, *, start_time: datetime, end_time: datetime) -> None:
+    if not working_set.covers(start_time=start_time, end_time=end_time):
+        raise ValueError("working set window does not match the requested memo window")
+
+
 def rank_topic_candidates(
     db: Session,
     *,
@@ -127,14 +214,16 @@ def rank_topic_candidates(
     topic_universe: list[str],
     limit: int,
     recent_memo_topics: set[str] | None = None,
+    working_set: MemoWorkingSet | None = None,
 ) -> list[RankedTopicOpportunity]:
-    current_events = load_event_snapshots(db, start_time=start_time, end_time=end_time)
-    prior_start, prior_end = previous_equivalent_window(start_time=start_time, end_time=end_time)
-    prior_events = load_event_snapshots(db, start_time=prior_start, end_time=prior_end)
+    if working_set is None:
+        working_set = load_memo_working_set(db, start_time=start_time, end_time=end_time)
+    else:
+        _require_window(working_set, start_time=start_time, end_time=end_time)
 
     return rank_topic_opportunities(
-        current_events=current_events,
-        prior_events=prior_events,
+        current_events=working_set.current_events,
+        prior_events=working_set.prior_events,
         start_time=start_time,
         end_time=end_time,
         topic_universe=topic_universe,
@@ -331,9 +420,38 @@ def build_opportunity_memo_input_pack(
     topic_score: float,
     selection_reason: str,
     topic_breakdown: dict[str, float],
+    working_set: MemoWorkingSet | None = None,
 ) -> tuple[OpportunityMemoInputPack, list[dict[str, Any]]]:
-    snapshots = load_event_snapshots(db, start_time=start_time, end_time=end_time)
-    topic_events = [row for row in snapshots if row.get("mapped_topic") == topic]
+    if working_set is None:
+        topic_events = load_event_snapshots(db, start_time=start_time, end_time=end_time, topic=topic)
+    else:
+        _require_window(working_set, start_time=start_time, end_time=end_time)
+        topic_events = working_set.topic_events(topic)
+    pack = _input_pack_from_topic_events(
+        topic_events,
+        start_time=start_time,
+        end_time=end_time,
+        topic=topic,
+        topic_score=topic_score,
+        selection_reason=selection_reason,
+        topic_breakdown=topic_breakdown,
+    )
+    return pack, topic_events
+
+
+def _input_pack_from_topic_events(
+    topic_events: list[dict[str, Any]],
+    *,
+    start_time: datetime,
+    end_time: datetime,
+    topic: str,
+    topic_score: float,
+    selection_reason: str,
+    topic_breakdown: dict[str, float],
+) -> OpportunityMemoInputPack:
+    """Build the pack from the topic's snapshots; sorts `topic_events` in place (impact first)."""
+
+    timeline = topic_timeline(snapshots=topic_events, topic=topic, limit=50)
 
     topic_events.sort(
         key=lambda row: (
@@ -354,7 +472,7 @@ def build_opportunity_memo_input_pack(
         topic=topic,
         window=MemoWindow(start_time=start_time, end_time=end_time),
         selected_event_ids=selected_event_ids,
-        event_timeline=topic_timeline(snapshots=snapshots, topic=topic, limit=50),
+        event_timeline=timeline,
         candidate_driver_groups=candidate_drivers,
         selected_primary_driver=selected_driver,
         supporting_entities=_supporting_entities(topic_events),
@@ -370,4 +488,94 @@ def build_opportunity_memo_input_pack(
             topic_breakdown=topic_breakdown,
         ),
     )
-    return pack, topic_events
+    return pack
+
+
+@dataclass
+class MemoSelection:
+    """Topic choice and input pack for one memo window (no DB or LLM access).
+
+    `input_pack` is None when no topic passed the threshold in auto mode.
+    """
+
+    start_time: datetime
+    end_time: datetime
+    requested_topic: str | None
+    ranked_topics: list[RankedTopicOpportunity]
+    selected_topic: str | None
+    topic_score: float
+    selection_reason: str
+    topic_breakdown: dict[str, float]
+    input_pack: OpportunityMemoInputPack | None
+    topic_events: list[dict[str, Any]]
+    timings_ms: dict[str, int]
+
+
+def select_memo_topic(
+    working_set: MemoWorkingSet,
+    *,
+    topic: str | None,
+    topic_universe: list[str],
+    recent_memo_topics: set[str],
+    topic_score_threshold: float,
+) -> MemoSelection:
+    """Rank topics and build the input pack for the chosen one.
+
+    Pure over the working set, so batch runs can evaluate many windows/topics
+    in worker processes.
+    """
+
+    started = time.perf_counter()
+    universe = [topic] if topic is not None else list(topic_universe)
+    ranked_topics = rank_topic_opportunities(
+        current_events=working_set.current_events,
+        prior_events=working_set.prior_events,
+        start_time=working_set.start_time,
+        end_time=working_set.end_time,
+        topic_universe=universe,
+        limit=max(1, len(universe)),
+        recent_memo_topics=recent_memo_topics,
+    )
+    timings_ms = {"topic_selection": int((time.perf_counter() - started) * 1000)}
+
+    selection = MemoSelection(
+        start_time=working_set.start_time,
+        end_time=working_set.end_time,
+        requested_topic=topic,
+        ranked_topics=ranked_topics,
+        selected_topic=topic,
+        topic_score=0.0,
+        selection_reason="manual_topic_override" if topic is not None else "auto_selection_threshold_passed",
+        topic_breakdown={
+            "normalized_event_count": 0.0,
+            "normalized_weighted_impact": 0.0,
+            "normalized_novelty": 0.0,
+            "normalized_coherence": 0.0,
+            "normalized_actionability": 0.0,
+        },
+        input_pack=None,
+        topic_events=[],
+        timings_ms=timings_ms,
+    )
+    if topic is None:
+        if not ranked_topics or ranked_topics[0].topic_score < topic_score_threshold:
+            selection.selected_topic = None
+            return selection
+        selection.selected_topic = ranked_topics[0].topic
+    if ranked_topics:
+        selection.topic_score = ranked_topics[0].topic_score
+        selection.topic_breakdown = ranked_topics[0].breakdown.model_dump(mode="json")
+
+    started = time.perf_counter()
+    selection.topic_events = working_set.topic_events(selection.selected_topic)
+    selection.input_pack = _input_pack_from_topic_events(
+        selection.topic_events,
+        start_time=working_set.start_time,
+        end_time=working_set.end_time,
+        topic=selection.selected_topic,
+        topic_score=selection.topic_score,
+        selection_reason=selection.selection_reason,
+        topic_breakdown=selection.topic_breakdown,
+    )
+    timings_ms["input_pack"] = int((time.perf_counter() - started) * 1000)
+    return selection
@@ -0,0 +1,101 @@
+"""Precompiled phrase matchers shared by the memo writer guards and the validator.
+
+Both passes test the same memo sections against fixed token lists. Each list
+is compiled once into a single alternation, so a check is one regex scan
+instead of a Python loop of substring tests, and text normalization is cached
+because the validator re-reads the sections the guard pass just produced.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from functools import lru_cache
+
+from .constants import OPPORTUNITY_TOPICS, TOPIC_KEYWORDS
+
+
+@lru_cache(maxsize=2048)
+def normalize_memo_text(value: str) -> str:
+    return " ".join(value.strip().lower().split())
+
+
+def word_count(normalized: str) -> int:
+    return len(normalized.split())
+
+
+class PhraseMatcher:
+    """Substring test for any of `phrases` (same result as `any(p in text for p in phrases)`)."""
+
+    __slots__ = ("phrases", "_pattern")
+
+    def __init__(self, phrases: Iterable[str]) -> None:
+        self.phrases = tuple(phrases)
+        self._pattern = re.compile("|".join(re.escape(phrase) for phrase in self.phrases))
+
+    def found_in(self, text: str) -> bool:
+        return bool(self.phrases) and self._pattern.search(text) is not None
+
+
+def _keyword_pattern(keyword: str) -> re.Pattern[str]:
+    return re.compile(rf"(?<!\w){re.escape(keyword.lower())}(?!\w)")
+
+
+# Per-topic whole-word keyword patterns (topic drift counts distinct keyword hits).
+TOPIC_KEYWORD_PATTERNS: dict[str, tuple[re.Pattern[str], ...]] = {
+    topic: tuple(_keyword_pattern(keyword) for keyword in TOPIC_KEYWORDS[topic]) for topic in OPPORTUNITY_TOPICS
+}
+
+
+def topic_keyword_hits(topic: str, text: str) -> int:
+    return sum(1 for pattern in TOPIC_KEYWORD_PATTERNS.get(topic, ()) if pattern.search(text))
+
+
+TRADE_EXPRESSION_ROUTES = PhraseMatcher(
+    (
+        "futures",
+        "options",
+        "spread",
+        "basis",
+        "curve",
+        "pair trade",
+        "overweight",
+        "underweight",
+        "long",
+        "short",
+        "hedge",
+        "exposure",
+        "freight",
+        "benchmark",
+        "volatility",
+    )
+)
+
+OPPORTUNITY_LOGIC = PhraseMatcher(
+    (
+        "mispriced",
+        "underappreciated",
+        "repricing",
+        "risk premium",
+        "spread",
+        "transmission",
+        "valuation",
+        "margin",
+        "earnings",
+        "cash flow",
+        "asymmetry",
+        "discount",
+        "financially",
+    )
+)
+
+_FILLER_PHRASES = (
+    "monitor developments",
+    "stay informed",
+    "various factors",
+    "market uncertainty",
+    "dynamic environment",
+)
+FILLER_PHRASES = PhraseMatcher(_FILLER_PHRASES)
+# The writer also drops the stock filler seen in generic drafts.
+FILLER_LIST_ITEM_PHRASES = PhraseMatcher(_FILLER_PHRASES + ("this seems meaningful", "it could matter"))
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 import json
+import logging
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Protocol
@@ -18,6 +22,9 @@ from .contracts import (
 )
 
 
+logger = logging.getLogger("civicquant.opportunity_memo")
+
+
 class OpportunityResearchError(RuntimeError):
     pass
 
@@ -42,9 +49,55 @@ class OpenAiResearchResponse:
     latency_ms: int
     retries: int
     raw_text: str
+    tool_type: str
+
+
+@dataclass(frozen=True)
+class ResearchQueryOutcome:
+    query: str
+    status: str  # ok | failed | timed_out
+    sources: list[ExternalEvidenceSource]
+    response: OpenAiResearchResponse | None = None
+    error: str | None = None
+
+
+_SEARCH_TOOL_TYPES = ("web_search_preview", "web_search")
+
+
+def _source_dedupe_key(source: ExternalEvidenceSource) -> str:
+    if source.url is not None:
+        url = str(source.url).strip().lower().rstrip("/")
+        if url:
+            return f"url:{url}"
+    return f"title:{' '.join(source.title.lower().split())}"
+
+
+def merge_research_sources(outcomes: list[ResearchQueryOutcome]) -> list[ExternalEvidenceSource]:
+    """Sources of all successful queries in plan order, deduped by URL (else title), with fresh `src_NN` ids."""
+
+    merged: list[ExternalEvidenceSource] = []
+    seen: set[str] = set()
+    for outcome in outcomes:
+        for source in outcome.sources:
+            key = _source_dedupe_key(source)
+            if key in seen:
+                continue
+            seen.add(key)
+            merged.append(source.model_copy(update={"source_id": f"src_{len(merged) + 1:02d}"}))
+    return merged
 
 
 class OpenAiOpportunityResearchProvider:
+    """Web-search research over the plan: one request per query, run concurrently.
+
+    All queries share one deadline. Queries still running (or not started) when
+    it passes are reported as `timed_out` and the sources gathered so far are
+    returned; the run fails only when no query produced a usable answer. Like
+    the digest publish stage, the deadline cannot interrupt an in-flight call;
+    the HTTP timeout bounds it and its worker finishes in the background. The
+    shared HTTP client is closed once the last such call returns.
+    """
+
     name = "openai_web_research_v1"
 
     def __init__(
@@ -53,10 +106,21 @@ class OpenAiOpportunityResearchProvider:
         timeout_seconds: float,
         max_retries: int,
         endpoint: str = "https://api.openai.com/v1/responses",
+        max_concurrency: int = 4,
+        deadline_seconds: float | None = None,
+        transport: httpx.BaseTransport | None = None,
     ) -> None:
         self.timeout_seconds = timeout_seconds
         self.max_retries = max_retries
         self.endpoint = endpoint
+        self.max_concurrency = max(1, max_concurrency)
+        self.deadline_seconds = (
+            deadline_seconds if deadline_seconds is not None else timeout_seconds * (max_retries + 1)
+        )
+        self._transport = transport
+        # Tool variant that last succeeded; tried first by later requests. Shared by the worker threads.
+        self._preferred_tool_type = _SEARCH_TOOL_TYPES[0]
+        self._tool_type_lock = threading.Lock()
 
     def retrieve(
         self,
@@ -73,7 +137,8 @@ class OpenAiOpportunityResearchProvider:
         if not model_name:
             raise OpportunityResearchError("No model configured for opportunity memo research retrieval")
 
-        prompt_payload = {
+        queries = list(plan.queries) or [f"{input_pack.topic} market data latest"]
+        base_prompt = {
             "topic": input_pack.topic,
             "window": {
                 "start_time": input_pack.window.start_time.isoformat(),
@@ -84,7 +149,6 @@ class OpenAiOpportunityResearchProvider:
                 if input_pack.selected_primary_driver is not None
                 else None
             ),
-            "queries": plan.queries,
             "needs": [need.model_dump(mode="json") for need in plan.needs],
             "selected_event_ids": input_pack.selected_event_ids,
             "event_summaries": [
@@ -97,36 +161,129 @@ class OpenAiOpportunityResearchProvider:
             ],
         }
 
-        response = self._call_openai(
+        started = time.monotonic()
+        outcomes = self._fan_out(
             api_key=api_key,
             model_name=model_name,
-            prompt_payload=prompt_payload,
-        )
-
-        retrieved_at = datetime.utcnow()
-        normalized_sources = _normalize_sources(
-            raw_text=response.raw_text,
-            retrieved_at=retrieved_at,
-            fallback_queries=plan.queries,
+            queries=queries,
+            base_prompt=base_prompt,
         )
+        wall_ms = int((time.monotonic() - started) * 1000)
+
+        answered = [outcome for outcome in outcomes if outcome.status == "ok"]
+        if not answered:
+            detail = "; ".join(f"{outcome.status}: {outcome.error}" for outcome in outcomes if outcome.error)
+            raise OpportunityResearchError(f"openai research retrieval failed for every query; {detail}"[:1200])
+
+        normalized_sources = merge_research_sources(outcomes)
+        timed_out = [outcome.query for outcome in outcomes if outcome.status == "timed_out"]
+        failed = [outcome.query for outcome in outcomes if outcome.status == "failed"]
+        if timed_out or failed:
+            logger.warning(
+                "opportunity_research_partial topic=%s answered=%s timed_out=%s failed=%s",
+                input_pack.topic,
+                len(answered),
+                len(timed_out),
+                len(failed),
+            )
 
         return ExternalEvidencePack(
             topic=input_pack.topic,
             provider_name=self.name,
             sources=normalized_sources,
             retrieval_diagnostics={
-                "model_name": response.model_name,
-                "response_id": response.response_id,
-                "latency_ms": response.latency_ms,
-                "retries": response.retries,
-                "query_count": len(plan.queries),
+                "model_name": answered[0].response.model_name if answered[0].response else model_name,
+                "response_ids": [outcome.response.response_id for outcome in answered if outcome.response],
+                "latency_ms": wall_ms,
+                "retries": sum(outcome.response.retries for outcome in answered if outcome.response),
+                "query_count": len(queries),
+                "answered_query_count": len(answered),
+                "timed_out_queries": timed_out,
+                "failed_queries": failed,
+                "deadline_seconds": self.deadline_seconds,
                 "source_count": len(normalized_sources),
+                "queries": [
+                    {
+                        "query": outcome.query,
+                        "status": outcome.status,
+                        "source_count": len(outcome.sources),
+                        "latency_ms": outcome.response.latency_ms if outcome.response else None,
+                        "tool_type": outcome.response.tool_type if outcome.response else None,
+                        "error": outcome.error,
+                    }
+                    for outcome in outcomes
+                ],
             },
         )
 
+    def _fan_out(
+        self,
+        *,
+        api_key: str,
+        model_name: str,
+        queries: list[str],
+        base_prompt: dict[str, object],
+    ) -> list[ResearchQueryOutcome]:
+        """Run one research request per query; outcomes are returned in query order."""
+
+        client = httpx.Client(timeout=self.timeout_seconds, transport=self._transport)
+        executor = ThreadPoolExecutor(
+            max_workers=min(len(queries), self.max_concurrency),
+            thread_name_prefix="memo-research",
+        )
+        deadline = time.monotonic() + self.deadline_seconds
+        futures: list[Future[OpenAiResearchResponse]] = []
+        try:
+            futures = [
+                executor.submit(
+                    self._call_openai,
+                    client=client,
+                    api_key=api_key,
+                    model_name=model_name,
+                    prompt_payload={**base_prompt, "queries": [query]},
+                )
+                for query in queries
+            ]
+            outcomes: list[ResearchQueryOutcome] = []
+            for query, future in zip(queries, futures):
+                try:
+                    response = future.result(timeout=max(0.0, deadline - time.monotonic()))
+                except FutureTimeoutError:
+                    future.cancel()
+                    outcomes.append(
+                        ResearchQueryOutcome(
+                            query=query,
+                            status="timed_out",
+                            sources=[],
+                            error=f"no answer within {self.deadline_seconds:.1f}s",
+                        )
+                    )
+                    continue
+                except Exception as exc:  # noqa: BLE001
+                    outcomes.append(ResearchQueryOutcome(query=query, status="failed", sources=[], error=str(exc)[:800]))
+                    continue
+                try:
+                    sources = _normalize_sources(
+                        raw_text=response.raw_text,
+                        retrieved_at=datetime.utcnow(),
+                        fallback_queries=[query],
+                    )
+                except OpportunityResearchError as exc:
+                    outcomes.append(
+                        ResearchQueryOutcome(query=query, status="failed", sources=[], response=response, error=str(exc))
+                    )
+                    continue
+                outcomes.append(ResearchQueryOutcome(query=query, status="ok", sources=sources, response=response))
+            return outcomes
+        finally:
+            # Do not block on a slow query; its outcome is already recorded.
+            executor.shutdown(wait=False, cancel_futures=True)
+            _close_when_done(client, futures)
+
     def _call_openai(
         self,
         *,
+        client: httpx.Client,
         api_key: str,
         model_name: str,
         prompt_payload: dict[str, object],
@@ -157,19 +314,18 @@ class OpenAiOpportunityResearchProvider:
                 },
             ],
         }
-        payload_candidates = [
-            {**base_payload, "tools": [{"type": "web_search_preview"}]},
-            {**base_payload, "tools": [{"type": "web_search"}]},
-        ]
+        with self._tool_type_lock:
+            preferred = self._preferred_tool_type
+        tool_types = [preferred] + [tool_type for tool_type in _SEARCH_TOOL_TYPES if tool_type != preferred]
 
         last_error: Exception | None = None
         last_http_detail = ""
         for attempt in range(self.max_retries + 1):
-            for request_payload in payload_candidates:
+            for tool_type in tool_types:
+                request_payload = {**base_payload, "tools": [{"type": tool_type}]}
                 started_at = time.perf_counter()
                 try:
-                    with httpx.Client(timeout=self.timeout_seconds) as client:
-                        http_response = client.post(self.endpoint, headers=headers, json=request_payload)
+                    http_response = client.post(self.endpoint, headers=headers, json=request_payload)
                     if http_response.status_code >= 400:
                         body_text = (http_response.text or "").strip()
                         last_http_detail = body_text[:800]
@@ -177,12 +333,15 @@ class OpenAiOpportunityResearchProvider:
                     body = http_response.json()
                     raw_text = _extract_output_text(body)
                     latency_ms = int((time.perf_counter() - started_at) * 1000)
+                    with self._tool_type_lock:
+                        self._preferred_tool_type = tool_type
                     return OpenAiResearchResponse(
                         model_name=str(body.get("model") or model_name),
                         response_id=body.get("id"),
                         latency_ms=latency_ms,
                         retries=attempt,
                         raw_text=raw_text,
+                        tool_type=tool_type,
                     )
                 except (httpx.HTTPError, ValueError, KeyError, IndexError, json.JSONDecodeError) as exc:
                     last_error = exc
@@ -196,6 +355,27 @@ class OpenAiOpportunityResearchProvider:
         )
 
 
+def _close_when_done(client: httpx.Client, futures: list[Future[OpenAiResearchResponse]]) -> None:
+    """Close `client` now, or once the calls abandoned at the deadline have finished with it."""
+
+    running = [future for future in futures if not future.done()]
+    if not running:
+        client.close()
+        return
+    lock = threading.Lock()
+    remaining = [len(running)]
+
+    def _release(_future: Future[OpenAiResearchResponse]) -> None:
+        with lock:
+            remaining[0] -= 1
+            last = remaining[0] == 0
+        if last:
+            client.close()
+
+    for future in running:
+        future.add_done_callback(_release)
+
+
 def _extract_output_text(body: dict) -> str:
     output = body.get("output", [])
     if isinstance(output, list):
@@ -0,0 +1,153 @@
+"""Content-addressed cache for external research results.
+
+Research is keyed by the provider, the research model and the research plan
+(topic, primary driver, queries, needs), so a re-run whose plan is unchanged
+reuses the normalized sources instead of repeating the web-search call. Entries
+expire after `opportunity_memo_research_cache_ttl_seconds`. Packs with timed-out
+or failed queries are not stored, so the next run retries the missing queries.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm import Session
+
+from ...models import OpportunityResearchCacheEntry, OpportunityResearchCacheSource
+from .contracts import ExternalEvidencePack, ExternalEvidenceSource, OpportunityResearchPlan
+
+
+logger = logging.getLogger("civicquant.opportunity_memo")
+
+
+def research_cache_key(*, plan: OpportunityResearchPlan, provider_name: str, model_name: str | None) -> str:
+    payload = {
+        "provider": provider_name,
+        "model": model_name,
+        "topic": plan.topic,
+        "primary_driver_key": plan.primary_driver_key,
+        "queries": list(plan.queries),
+        "needs": [need.model_dump(mode="json") for need in plan.needs],
+    }
+    canonical_json = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+    return hashlib.sha256(canonical_json.encode("utf-8")).hexdigest()
+
+
+def research_is_partial(pack: ExternalEvidencePack) -> bool:
+    """True when some planned queries timed out or failed (see the provider's diagnostics)."""
+
+    diagnostics = pack.retrieval_diagnostics or {}
+    return bool(diagnostics.get("timed_out_queries") or diagnostics.get("failed_queries"))
+
+
+def load_cached_research(
+    db: Session,
+    *,
+    cache_key: str,
+    now: datetime | None = None,
+) -> ExternalEvidencePack | None:
+    """The cached pack for `cache_key`, or None when missing or expired."""
+
+    current = now or datetime.utcnow()
+    entry = (
+        db.query(OpportunityResearchCacheEntry)
+        .filter(
+            OpportunityResearchCacheEntry.cache_key == cache_key,
+            OpportunityResearchCacheEntry.expires_at > current,
+        )
+        .one_or_none()
+    )
+    if entry is None:
+        return None
+
+    diagnostics = dict(entry.retrieval_diagnostics_json or {})
+    diagnostics["research_cache"] = {
+        "status": "hit",
+        "cache_key": cache_key,
+        "cached_at": entry.created_at.isoformat(),
+        "expires_at": entry.expires_at.isoformat(),
+    }
+    return ExternalEvidencePack(
+        topic=entry.topic,
+        provider_name=entry.provider_name,
+        sources=[
+            ExternalEvidenceSource(
+                source_id=row.source_id,
+                source_type=row.source_type,
+                title=row.title,
+                publisher=row.publisher,
+                retrieved_at=row.retrieved_at,
+                query=row.query,
+                summary=row.summary,
+                claim_support_tags=list(row.claim_support_tags or []),
+                url=row.url,
+            )
+            for row in entry.sources
+        ],
+        retrieval_diagnostics=diagnostics,
+    )
+
+
+def store_research(
+    db: Session,
+    *,
+    cache_key: str,
+    plan: OpportunityResearchPlan,
+    pack: ExternalEvidencePack,
+    model_name: str | None,
+    ttl_seconds: int,
+    now: datetime | None = None,
+) -> None:
+    """Store `pack` under `cache_key`, replacing any previous entry and dropping expired ones."""
+
+    current = now or datetime.utcnow()
+    stale_entries = (
+        db.query(OpportunityResearchCacheEntry)
+        .filter(
+            (OpportunityResearchCacheEntry.cache_key == cache_key)
+            | (OpportunityResearchCacheEntry.expires_at <= current)
+        )
+        .all()
+    )
+    for stale in stale_entries:
+        db.delete(stale)
+    if stale_entries:
+        db.flush()
+
+    entry = OpportunityResearchCacheEntry(
+        cache_key=cache_key,
+        provider_name=pack.provider_name,
+        model_name=model_name,
+        topic=plan.topic,
+        primary_driver_key=plan.primary_driver_key,
+        retrieval_diagnostics_json=pack.retrieval_diagnostics,
+        created_at=current,
+        expires_at=current + timedelta(seconds=max(0, ttl_seconds)),
+        sources=[
+            OpportunityResearchCacheSource(
+                position_index=index,
+                source_id=source.source_id,
+                source_type=source.source_type,
+                title=source.title,
+                publisher=source.publisher,
+                retrieved_at=source.retrieved_at,
+                query=source.query,
+                summary=source.summary,
+                claim_support_tags=list(source.claim_support_tags),
+                url=str(source.url) if source.url is not None else None,
+            )
+            for index, source in enumerate(pack.sources)
+        ],
+    )
+    db.add(entry)
+    db.flush()
+    logger.info(
+        "opportunity_research_cached cache_key=%s topic=%s sources=%s evicted=%s",
+        cache_key,
+        plan.topic,
+        len(pack.sources),
+        len(stale_entries),
+    )
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import hashlib
+import json
 from collections import defaultdict
 from collections.abc import Iterable
 from typing import Any
@@ -8,6 +10,29 @@ from .constants import OPPORTUNITY_TOPICS, TOPIC_KEYWORDS, TOPIC_KEYWORD_ORDER
 from .contracts import TopicMappingDiagnostics, TopicMappingResult
 
 
+# Bump when the precedence rules below change; keyword and topic edits change
+# `TOPIC_MAPPING_VERSION` on their own.
+TOPIC_MAPPING_RULES_REVISION = 1
+
+
+def _topic_mapping_version() -> str:
+    source = json.dumps(
+        {
+            "rules": TOPIC_MAPPING_RULES_REVISION,
+            "topics": list(OPPORTUNITY_TOPICS),
+            "keywords": {topic: list(TOPIC_KEYWORDS[topic]) for topic in OPPORTUNITY_TOPICS},
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return f"r{TOPIC_MAPPING_RULES_REVISION}-{hashlib.sha256(source.encode('utf-8')).hexdigest()[:12]}"
+
+
+# Stored with each persisted mapping (`event_opportunity_topics`); rows with
+# another version are recomputed on read and by the adoption job.
+TOPIC_MAPPING_VERSION = _topic_mapping_version()
+
+
 def _normalize(value: str | None) -> str:
     if not isinstance(value, str):
         return ""
@@ -0,0 +1,169 @@
+"""Persisted event → opportunity-topic mappings (`event_opportunity_topics`).
+
+Phase2 stores each event's `map_event_to_topic` result when it syncs the
+event's tags and relations, so memo and MCP reads reuse it instead of
+re-scanning tags, relations and payloads. Rows carry `TOPIC_MAPPING_VERSION`;
+a keyword or rule change makes them stale, readers fall back to computing the
+mapping, and `refresh_event_opportunity_topics` recomputes them in bulk.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from ...models import Event, EventOpportunityTopic, EventRelation, EventTag, Extraction
+from .contracts import TopicMappingResult
+from .topic_mapping import TOPIC_MAPPING_VERSION, map_event_to_topic
+
+
+logger = logging.getLogger("civicquant.opportunity_memo")
+
+
+def load_mapping_inputs(
+    db: Session,
+    events: Sequence[Event],
+) -> tuple[dict[int, list[dict[str, Any]]], dict[int, list[dict[str, Any]]], dict[int, dict[str, Any]]]:
+    """Tags, relations and latest extraction payload per event id, as `map_event_to_topic` takes them."""
+
+    event_ids = [event.id for event in events]
+    tags_by_event: dict[int, list[dict[str, Any]]] = {event_id: [] for event_id in event_ids}
+    relations_by_event: dict[int, list[dict[str, Any]]] = {event_id: [] for event_id in event_ids}
+    payload_by_event: dict[int, dict[str, Any]] = {event_id: {} for event_id in event_ids}
+    if not event_ids:
+        return tags_by_event, relations_by_event, payload_by_event
+
+    extraction_ids = [event.latest_extraction_id for event in events if event.latest_extraction_id is not None]
+    extraction_by_id: dict[int, Extraction] = {}
+    if extraction_ids:
+        extraction_rows = db.query(Extraction).filter(Extraction.id.in_(extraction_ids)).all()
+        extraction_by_id = {row.id: row for row in extraction_rows}
+
+    for row in db.query(EventTag).filter(EventTag.event_id.in_(event_ids)).all():
+        tags_by_event.setdefault(row.event_id, []).append(
+            {
+                "tag_type": row.tag_type,
+                "tag_value": row.tag_value,
+                "tag_source": row.tag_source,
+                "confidence": row.confidence,
+            }
+        )
+
+    for row in db.query(EventRelation).filter(EventRelation.event_id.in_(event_ids)).all():
+        relations_by_event.setdefault(row.event_id, []).append(
+            {
+                "subject_type": row.subject_type,
+                "subject_value": row.subject_value,
+                "relation_type": row.relation_type,
+                "object_type": row.object_type,
+                "object_value": row.object_value,
+                "relation_source": row.relation_source,
+                "inference_level": row.inference_level,
+                "confidence": row.confidence,
+            }
+        )
+
+    for event in events:
+        if event.latest_extraction_id is None:
+            continue
+        extraction_row = extraction_by_id.get(event.latest_extraction_id)
+        if extraction_row is None:
+            continue
+        payload_candidate = extraction_row.canonical_payload_json or extraction_row.payload_json or {}
+        if isinstance(payload_candidate, dict):
+            payload_by_event[event.id] = payload_candidate
+
+    return tags_by_event, relations_by_event, payload_by_event
+
+
+def _map_events(db: Session, events: Sequence[Event]) -> list[TopicMappingResult]:
+    tags_by_event, relations_by_event, payload_by_event = load_mapping_inputs(db, events)
+    return [
+        map_event_to_topic(
+            event_id=event.id,
+            tags=tags_by_event.get(event.id, []),
+            relations=relations_by_event.get(event.id, []),
+            latest_extraction_payload=payload_by_event.get(event.id, {}),
+        )
+        for event in events
+    ]
+
+
+def _store_mapping(db: Session, mapping: TopicMappingResult) -> bool:
+    diagnostics = mapping.diagnostics.model_dump(mode="json")
+    row = db.get(EventOpportunityTopic, mapping.event_id)
+    if row is None:
+        db.add(
+            EventOpportunityTopic(
+                event_id=mapping.event_id,
+                topic=mapping.topic,
+                mapping_version=TOPIC_MAPPING_VERSION,
+                diagnostics_json=diagnostics,
+                updated_at=datetime.utcnow(),
+            )
+        )
+        return True
+    if (
+        row.topic == mapping.topic
+        and row.mapping_version == TOPIC_MAPPING_VERSION
+        and row.diagnostics_json == diagnostics
+    ):
+        return False
+    row.topic = mapping.topic
+    row.mapping_version = TOPIC_MAPPING_VERSION
+    row.diagnostics_json = diagnostics
+    row.updated_at = datetime.utcnow()
+    return True
+
+
+def sync_event_opportunity_topic(db: Session, *, event_id: int) -> str | None:
+    """Recompute and store the mapping for one event from its current tags/relations/payload."""
+
+    event = db.get(Event, event_id)
+    if event is None:
+        return None
+    db.flush()
+    mapping = _map_events(db, [event])[0]
+    _store_mapping(db, mapping)
+    db.flush()
+    return mapping.topic
+
+
+def refresh_event_opportunity_topics(db: Session, *, batch_size: int = 500, force: bool = False) -> int:
+    """Recompute missing or stale mappings (all of them with `force`). Caller commits. Returns rows written."""
+
+    written = 0
+    last_id = 0
+    while True:
+        query = (
+            db.query(Event)
+            .outerjoin(EventOpportunityTopic, EventOpportunityTopic.event_id == Event.id)
+            .filter(Event.id > last_id)
+        )
+        if not force:
+            query = query.filter(
+                or_(
+                    EventOpportunityTopic.event_id.is_(None),
+                    EventOpportunityTopic.mapping_version != TOPIC_MAPPING_VERSION,
+                )
+            )
+        events = query.order_by(Event.id.asc()).limit(batch_size).all()
+        if not events:
+            break
+        for mapping in _map_events(db, events):
+            written += int(_store_mapping(db, mapping))
+        db.flush()
+        last_id = events[-1].id
+
+    logger.info(
+        "opportunity_topics_refreshed rows=%s mapping_version=%s force=%s",
+        written,
+        TOPIC_MAPPING_VERSION,
+        force,
+    )
+    return written
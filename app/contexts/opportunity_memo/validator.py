@@ -15,6 +15,15 @@ from .contracts import (
     OpportunityMemoInputPack,
     OpportunityMemoStructuredArtifact,
 )
+from .phrase_matchers import (
+    FILLER_PHRASES,
+    OPPORTUNITY_LOGIC,
+    TRADE_EXPRESSION_ROUTES,
+    PhraseMatcher,
+    normalize_memo_text,
+    topic_keyword_hits,
+    word_count,
+)
 
 
 _NUMERIC_PATTERN = re.compile(r"\b\d+(?:\.\d+)?\b")
@@ -26,108 +35,78 @@ _GENERIC_TARGET_PHRASES = {
     "energy sector",
     "global markets",
 }
-_TARGET_SPECIFICITY_TOKENS = (
-    "spread",
-    "basis",
-    "curve",
-    "corridor",
-    "route",
-    "benchmark",
-    "ttf",
-    "henry hub",
-    "brent",
-    "wti",
-    "freight",
-    "producer",
-    "import",
-    "export",
-    "class",
-    "bucket",
-    "equities",
-    "futures",
-    "options",
-    "volatility",
-)
-_THESIS_DIRECTION_TOKENS = (
-    "repricing",
-    "tightening",
-    "widening",
-    "upside",
-    "downside",
-    "overweight",
-    "underweight",
-    "long",
-    "short",
-    "premium",
-    "discount",
-    "bullish",
-    "bearish",
-)
-_THESIS_REASON_TOKENS = (
-    "driven by",
-    "because",
-    "as",
-    "due to",
-    "from",
-    "on",
-)
-_TIMING_TOKENS = (
-    "now",
-    "recent",
-    "within",
-    "window",
-    "this week",
-    "last",
-    "currently",
-    "immediate",
-    "accelerat",
-)
-_TRADE_EXPRESSION_TOKENS = (
-    "futures",
-    "options",
-    "spread",
-    "basis",
-    "curve",
-    "pair trade",
-    "overweight",
-    "underweight",
-    "long",
-    "short",
-    "hedge",
-    "exposure",
-    "freight",
-    "benchmark",
-    "volatility",
+_GENERIC_TARGET = PhraseMatcher(sorted(_GENERIC_TARGET_PHRASES))
+_TARGET_SPECIFICITY = PhraseMatcher(
+    (
+        "spread",
+        "basis",
+        "curve",
+        "corridor",
+        "route",
+        "benchmark",
+        "ttf",
+        "henry hub",
+        "brent",
+        "wti",
+        "freight",
+        "producer",
+        "import",
+        "export",
+        "class",
+        "bucket",
+        "equities",
+        "futures",
+        "options",
+        "volatility",
+    )
 )
-_VAGUE_TRADE_PHRASES = (
-    "monitor developments",
-    "consider diversifying",
-    "proactive approach",
-    "investors may benefit",
-    "keep watching",
+_THESIS_DIRECTION = PhraseMatcher(
+    (
+        "repricing",
+        "tightening",
+        "widening",
+        "upside",
+        "downside",
+        "overweight",
+        "underweight",
+        "long",
+        "short",
+        "premium",
+        "discount",
+        "bullish",
+        "bearish",
+    )
 )
-_OPPORTUNITY_LOGIC_TOKENS = (
-    "mispriced",
-    "underappreciated",
-    "repricing",
-    "risk premium",
-    "spread",
-    "transmission",
-    "valuation",
-    "margin",
-    "earnings",
-    "cash flow",
-    "asymmetry",
-    "discount",
-    "financially",
+_THESIS_REASON = PhraseMatcher(("driven by", "because", "as", "due to", "from", "on"))
+_TIMING = PhraseMatcher(
+    (
+        "now",
+        "recent",
+        "within",
+        "window",
+        "this week",
+        "last",
+        "currently",
+        "immediate",
+        "accelerat",
+    )
 )
-_FILLER_LIST_PHRASES = (
-    "monitor developments",
-    "stay informed",
-    "various factors",
-    "market uncertainty",
-    "dynamic environment",
+_VAGUE_TRADE = PhraseMatcher(
+    (
+        "monitor developments",
+        "consider diversifying",
+        "proactive approach",
+        "investors may benefit",
+        "keep watching",
+    )
 )
+# Substring topic anchors (target/thesis checks), as opposed to whole-word drift hits.
+_TOPIC_ANCHORS = {topic: PhraseMatcher(keywords) for topic, keywords in TOPIC_KEYWORDS.items()}
+
+
+def _topic_anchor_present(topic: str, normalized: str) -> bool:
+    matcher = _TOPIC_ANCHORS.get(topic)
+    return matcher is not None and matcher.found_in(normalized)
 
 
 def _is_non_empty_text(value: str | None) -> bool:
@@ -135,17 +114,11 @@ def _is_non_empty_text(value: str | None) -> bool:
 
 
 def _word_count(text: str) -> int:
-    return len([token for token in text.strip().split() if token.strip()])
+    return word_count(text)
 
 
 def _normalize(text: str) -> str:
-    return " ".join(text.strip().lower().split())
-
-
-def _keyword_present(*, text: str, keyword: str) -> bool:
-    escaped = re.escape(keyword.lower())
-    pattern = rf"(?<!\w){escaped}(?!\w)"
-    return re.search(pattern, text) is not None
+    return normalize_memo_text(text)
 
 
 def _traceability_map(memo: OpportunityMemoStructuredArtifact) -> dict[str, tuple[list[int], list[str]]]:
@@ -190,17 +163,15 @@ def _topic_drift_detected(*, topic: str, memo: OpportunityMemoStructuredArtifact
     if not all_text:
         return False
 
-    selected_topic_hits = sum(
-        1 for keyword in TOPIC_KEYWORDS.get(topic, ()) if _keyword_present(text=all_text, keyword=keyword)
-    )
+    selected_topic_hits = topic_keyword_hits(topic, all_text)
     strongest_other_hits = 0
     total_other_hits = 0
     other_topics_nonzero = 0
     other_topics_ge2 = 0
-    for other_topic, keywords in TOPIC_KEYWORDS.items():
+    for other_topic in TOPIC_KEYWORDS:
         if other_topic == topic:
             continue
-        hit_count = sum(1 for keyword in keywords if _keyword_present(text=all_text, keyword=keyword))
+        hit_count = topic_keyword_hits(other_topic, all_text)
         if hit_count > 0:
             other_topics_nonzero += 1
         if hit_count >= 2:
@@ -227,12 +198,10 @@ def _target_is_too_generic(*, opportunity_target: str, topic: str) -> bool:
         return True
     if normalized in _GENERIC_TARGET_PHRASES:
         return True
-    if any(phrase in normalized for phrase in _GENERIC_TARGET_PHRASES):
-        if not any(token in normalized for token in _TARGET_SPECIFICITY_TOKENS):
-            return True
-    topic_tokens = TOPIC_KEYWORDS.get(topic, ())
-    has_topic_specificity = any(token in normalized for token in topic_tokens)
-    has_specificity_token = any(token in normalized for token in _TARGET_SPECIFICITY_TOKENS) or has_topic_specificity
+    has_target_specificity = _TARGET_SPECIFICITY.found_in(normalized)
+    if _GENERIC_TARGET.found_in(normalized) and not has_target_specificity:
+        return True
+    has_specificity_token = has_target_specificity or _topic_anchor_present(topic, normalized)
     has_numeric_anchor = bool(_NUMERIC_PATTERN.search(normalized))
     if not has_specificity_token and not has_numeric_anchor:
         return True
@@ -243,10 +212,9 @@ def _thesis_is_weak(*, thesis: str, input_pack: OpportunityMemoInputPack) -> boo
     normalized = _normalize(thesis)
     if _word_count(normalized) < 12:
         return True
-    has_direction = any(token in normalized for token in _THESIS_DIRECTION_TOKENS)
-    has_reason = any(token in normalized for token in _THESIS_REASON_TOKENS)
-    topic_tokens = TOPIC_KEYWORDS.get(input_pack.topic, ())
-    has_topic_anchor = any(token in normalized for token in topic_tokens)
+    has_direction = _THESIS_DIRECTION.found_in(normalized)
+    has_reason = _THESIS_REASON.found_in(normalized)
+    has_topic_anchor = _topic_anchor_present(input_pack.topic, normalized)
     driver_key = (
         input_pack.selected_primary_driver.driver_key.replace("_", " ")
         if input_pack.selected_primary_driver is not None
@@ -260,7 +228,7 @@ def _why_now_is_generic(why_now: str) -> bool:
     normalized = _normalize(why_now)
     if _word_count(normalized) < 12:
         return True
-    has_timing_token = any(token in normalized for token in _TIMING_TOKENS) or bool(_NUMERIC_PATTERN.search(normalized))
+    has_timing_token = _TIMING.found_in(normalized) or bool(_NUMERIC_PATTERN.search(normalized))
     return not has_timing_token
 
 
@@ -268,18 +236,16 @@ def _trade_expression_is_vague(trade_expression: str) -> bool:
     normalized = _normalize(trade_expression)
     if _word_count(normalized) < 12:
         return True
-    if any(phrase in normalized for phrase in _VAGUE_TRADE_PHRASES):
+    if _VAGUE_TRADE.found_in(normalized):
         return True
-    has_expression_route = any(token in normalized for token in _TRADE_EXPRESSION_TOKENS)
-    return not has_expression_route
+    return not TRADE_EXPRESSION_ROUTES.found_in(normalized)
 
 
 def _opportunity_framing_is_generic(why_opportunity: str) -> bool:
     normalized = _normalize(why_opportunity)
     if _word_count(normalized) < 14:
         return True
-    has_financial_logic = any(token in normalized for token in _OPPORTUNITY_LOGIC_TOKENS)
-    return not has_financial_logic
+    return not OPPORTUNITY_LOGIC.found_in(normalized)
 
 
 def _count_quantitative_points(points: list[str]) -> int:
@@ -296,7 +262,7 @@ def _list_section_has_filler(values: list[str]) -> bool:
         normalized = _normalize(row)
         if _word_count(normalized) < 5:
             return True
-        if any(phrase in normalized for phrase in _FILLER_LIST_PHRASES):
+        if FILLER_PHRASES.found_in(normalized):
             return True
     return False
 
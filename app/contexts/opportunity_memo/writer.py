@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
@@ -16,6 +17,15 @@ from .contracts import (
     OpportunityMemoStructuredArtifact,
     ParagraphSourceMap,
 )
+from .phrase_matchers import (
+    FILLER_LIST_ITEM_PHRASES,
+    FILLER_PHRASES,
+    OPPORTUNITY_LOGIC,
+    TRADE_EXPRESSION_ROUTES,
+    PhraseMatcher,
+    normalize_memo_text,
+    word_count,
+)
 
 
 class OpportunityMemoWriterError(RuntimeError):
@@ -45,6 +55,13 @@ class OpenAiWriterResponse:
 
 
 class OpenAiOpportunityMemoWriter:
+    """Structured memo writer: initial draft, one schema repair, then missing-field completion.
+
+    Fields still missing after the repair draft are requested concurrently, split
+    into at most `max_concurrency` completion requests, and every request of a
+    `write()` call shares one HTTP client.
+    """
+
     name = "openai_opportunity_memo_writer_v1"
 
     def __init__(
@@ -53,10 +70,14 @@ class OpenAiOpportunityMemoWriter:
         timeout_seconds: float,
         max_retries: int,
         endpoint: str = "https://api.openai.com/v1/responses",
+        max_concurrency: int = 4,
+        transport: httpx.BaseTransport | None = None,
     ) -> None:
         self.timeout_seconds = timeout_seconds
         self.max_retries = max_retries
         self.endpoint = endpoint
+        self.max_concurrency = max(1, max_concurrency)
+        self._transport = transport
 
     def write(
         self,
@@ -183,6 +204,26 @@ class OpenAiOpportunityMemoWriter:
             ],
         }
 
+        with httpx.Client(timeout=self.timeout_seconds, transport=self._transport) as client:
+            return self._write_with_repairs(
+                client=client,
+                api_key=api_key,
+                model_name=model_name,
+                prompt_payload=prompt_payload,
+                input_pack=input_pack,
+                external_evidence=external_evidence,
+            )
+
+    def _write_with_repairs(
+        self,
+        *,
+        client: httpx.Client,
+        api_key: str,
+        model_name: str,
+        prompt_payload: dict[str, Any],
+        input_pack: OpportunityMemoInputPack,
+        external_evidence: ExternalEvidencePack,
+    ) -> OpportunityMemoStructuredArtifact:
         schema_attempts = 2
         previous_payload: dict[str, Any] | None = None
         previous_error_text: str | None = None
@@ -199,6 +240,7 @@ class OpenAiOpportunityMemoWriter:
 
             try:
                 response = self._call_openai(
+                    client=client,
                     api_key=api_key,
                     model_name=model_name,
                     prompt_payload=attempt_payload,
@@ -233,6 +275,7 @@ class OpenAiOpportunityMemoWriter:
             coerced = _coerce_writer_payload(payload)
             if schema_attempt == (schema_attempts - 1):
                 coerced = self._complete_missing_fields(
+                    client=client,
                     api_key=api_key,
                     model_name=model_name,
                     base_payload=prompt_payload,
@@ -257,6 +300,7 @@ class OpenAiOpportunityMemoWriter:
     def _complete_missing_fields(
         self,
         *,
+        client: httpx.Client,
         api_key: str,
         model_name: str,
         base_payload: dict[str, Any],
@@ -266,46 +310,65 @@ class OpenAiOpportunityMemoWriter:
         if not missing_fields:
             return draft_payload
 
-        completion_payload = {
-            "writer_mode": "missing_field_completion",
-            "missing_fields": missing_fields,
-            "draft_payload": draft_payload,
-            "evidence_context": {
-                "topic": base_payload.get("topic"),
-                "window": base_payload.get("window"),
-                "selected_event_ids": base_payload.get("selected_event_ids"),
-                "event_timeline": base_payload.get("event_timeline"),
-                "selected_primary_driver": base_payload.get("selected_primary_driver"),
-                "supporting_fact_candidates": base_payload.get("supporting_fact_candidates"),
-                "external_sources": base_payload.get("external_sources"),
-            },
-            "requirements": {
-                "all_required_fields_non_empty": True,
-                "minimum_list_lengths": base_payload.get("minimum_list_lengths"),
-                "traceability_required": True,
-            },
+        group_count = min(self.max_concurrency, len(missing_fields))
+        field_groups = [missing_fields[index::group_count] for index in range(group_count)]
+        evidence_context = {
+            "topic": base_payload.get("topic"),
+            "window": base_payload.get("window"),
+            "selected_event_ids": base_payload.get("selected_event_ids"),
+            "event_timeline": base_payload.get("event_timeline"),
+            "selected_primary_driver": base_payload.get("selected_primary_driver"),
+            "supporting_fact_candidates": base_payload.get("supporting_fact_candidates"),
+            "external_sources": base_payload.get("external_sources"),
+        }
+        requirements = {
+            "all_required_fields_non_empty": True,
+            "minimum_list_lengths": base_payload.get("minimum_list_lengths"),
+            "traceability_required": True,
         }
 
-        try:
-            response = self._call_openai(
-                api_key=api_key,
-                model_name=model_name,
-                prompt_payload=completion_payload,
-            )
-        except OpportunityMemoWriterError:
-            return draft_payload
-        try:
-            payload = json.loads(response.raw_text)
-        except json.JSONDecodeError:
-            return draft_payload
-        if not isinstance(payload, dict):
-            return draft_payload
-        repaired = _coerce_writer_payload(payload)
-        return _merge_artifact_payload(draft_payload, repaired)
+        def _complete(fields: list[str]) -> dict[str, Any] | None:
+            completion_payload = {
+                "writer_mode": "missing_field_completion",
+                "missing_fields": fields,
+                "draft_payload": draft_payload,
+                "evidence_context": evidence_context,
+                "requirements": requirements,
+            }
+            try:
+                response = self._call_openai(
+                    client=client,
+                    api_key=api_key,
+                    model_name=model_name,
+                    prompt_payload=completion_payload,
+                )
+                payload = json.loads(response.raw_text)
+            except (OpportunityMemoWriterError, json.JSONDecodeError):
+                return None
+            if not isinstance(payload, dict):
+                return None
+            return _coerce_writer_payload(payload)
+
+        if group_count == 1:
+            completions = [_complete(field_groups[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=group_count, thread_name_prefix="memo-writer") as executor:
+                completions = list(executor.map(_complete, field_groups))
+
+        merged = draft_payload
+        for fields, repaired in zip(field_groups, completions):
+            if repaired is None:
+                continue
+            # Each request owns its fields; the others echo the draft and are ignored.
+            overlay = {key: value for key, value in repaired.items() if key in fields}
+            merged = _merge_artifact_payload(merged, overlay)
+            merged = _union_traceability(merged, repaired)
+        return merged
 
     def _call_openai(
         self,
         *,
+        client: httpx.Client,
         api_key: str,
         model_name: str,
         prompt_payload: dict[str, object],
@@ -348,8 +411,7 @@ class OpenAiOpportunityMemoWriter:
         for attempt in range(self.max_retries + 1):
             started_at = time.perf_counter()
             try:
-                with httpx.Client(timeout=self.timeout_seconds) as client:
-                    http_response = client.post(self.endpoint, headers=headers, json=request_payload)
+                http_response = client.post(self.endpoint, headers=headers, json=request_payload)
                 if http_response.status_code >= 400:
                     body_text = (http_response.text or "").strip()
                     last_http_detail = body_text[:800]
@@ -703,8 +765,40 @@ def _merge_artifact_payload(base: dict[str, Any], overlay: dict[str, Any]) -> di
     return merged
 
 
+def _union_traceability(base: dict[str, Any], overlay: dict[str, Any]) -> dict[str, Any]:
+    """Add overlay traceability rows whose paragraph_key `base` does not map yet."""
+
+    base_trace = base.get("traceability") if isinstance(base.get("traceability"), dict) else {}
+    overlay_trace = overlay.get("traceability") if isinstance(overlay.get("traceability"), dict) else {}
+    rows = [row for row in (base_trace.get("paragraph_sources") or []) if isinstance(row, dict)]
+    known_keys = {row.get("paragraph_key") for row in rows}
+    for row in overlay_trace.get("paragraph_sources") or []:
+        if isinstance(row, dict) and row.get("paragraph_key") not in known_keys:
+            rows.append(row)
+            known_keys.add(row.get("paragraph_key"))
+    merged = dict(base)
+    merged["traceability"] = {"paragraph_sources": rows}
+    return merged
+
+
+_THESIS_DIRECTION = PhraseMatcher(
+    ("upside", "downside", "repricing", "long", "short", "overweight", "underweight", "widening", "tightening")
+)
+_THESIS_REASON = PhraseMatcher(("because", "driven by", "due to", "as"))
+_WHY_NOW_TIMING = PhraseMatcher(("now", "recent", "window", "this week", "last", "currently", "immediate"))
+_VAGUE_TRADE = PhraseMatcher(
+    (
+        "monitor developments",
+        "consider diversifying",
+        "proactive approach",
+        "investors may benefit",
+        "stay informed",
+    )
+)
+
+
 def _normalize_text(value: str) -> str:
-    return " ".join(value.strip().lower().split())
+    return normalize_memo_text(value)
 
 
 def _has_numeric(value: str) -> bool:
@@ -716,13 +810,11 @@ def _has_numeric(value: str) -> bool:
 
 def _is_weak_thesis(value: str, *, topic: str, driver_key: str | None) -> bool:
     normalized = _normalize_text(value)
-    if len(normalized.split()) < 12:
+    if word_count(normalized) < 12:
         return True
-    direction_tokens = ("upside", "downside", "repricing", "long", "short", "overweight", "underweight", "widening", "tightening")
-    reason_tokens = ("because", "driven by", "due to", "as")
     topic_tokens = tuple(token for token in topic.replace("_", " ").split() if token)
-    has_direction = any(token in normalized for token in direction_tokens)
-    has_reason = any(token in normalized for token in reason_tokens)
+    has_direction = _THESIS_DIRECTION.found_in(normalized)
+    has_reason = _THESIS_REASON.found_in(normalized)
     has_topic = any(token in normalized for token in topic_tokens)
     has_driver = bool(driver_key and driver_key.replace("_", " ") in normalized)
     return not (has_direction and has_reason and (has_topic or has_driver))
@@ -730,96 +822,39 @@ def _is_weak_thesis(value: str, *, topic: str, driver_key: str | None) -> bool:
 
 def _is_generic_why_now(value: str) -> bool:
     normalized = _normalize_text(value)
-    if len(normalized.split()) < 12:
+    if word_count(normalized) < 12:
         return True
-    timing_tokens = ("now", "recent", "window", "this week", "last", "currently", "immediate")
-    has_timing = any(token in normalized for token in timing_tokens)
-    return not (has_timing and _has_numeric(normalized))
+    return not (_WHY_NOW_TIMING.found_in(normalized) and _has_numeric(normalized))
 
 
 def _is_vague_trade_expression(value: str) -> bool:
     normalized = _normalize_text(value)
-    if len(normalized.split()) < 12:
+    if word_count(normalized) < 12:
         return True
-    vague_phrases = (
-        "monitor developments",
-        "consider diversifying",
-        "proactive approach",
-        "investors may benefit",
-        "stay informed",
-    )
-    if any(phrase in normalized for phrase in vague_phrases):
+    if _VAGUE_TRADE.found_in(normalized):
         return True
-    route_tokens = (
-        "futures",
-        "options",
-        "spread",
-        "basis",
-        "curve",
-        "pair trade",
-        "overweight",
-        "underweight",
-        "long",
-        "short",
-        "hedge",
-        "exposure",
-        "benchmark",
-        "volatility",
-        "freight",
-    )
-    return not any(token in normalized for token in route_tokens)
+    return not TRADE_EXPRESSION_ROUTES.found_in(normalized)
 
 
 def _is_generic_opportunity_framing(value: str) -> bool:
     normalized = _normalize_text(value)
-    if len(normalized.split()) < 14:
+    if word_count(normalized) < 14:
         return True
-    logic_tokens = (
-        "mispriced",
-        "underappreciated",
-        "repricing",
-        "risk premium",
-        "spread",
-        "transmission",
-        "valuation",
-        "margin",
-        "earnings",
-        "cash flow",
-        "asymmetry",
-        "discount",
-        "financially",
-    )
-    return not any(token in normalized for token in logic_tokens)
+    return not OPPORTUNITY_LOGIC.found_in(normalized)
 
 
 def _is_filler_watchpoint(value: str) -> bool:
     normalized = _normalize_text(value)
-    if len(normalized.split()) < 5:
+    if word_count(normalized) < 5:
         return True
-    filler_phrases = (
-        "monitor developments",
-        "stay informed",
-        "various factors",
-        "market uncertainty",
-        "dynamic environment",
-    )
-    return any(phrase in normalized for phrase in filler_phrases)
+    return FILLER_PHRASES.found_in(normalized)
 
 
 def _is_filler_list_item(value: str) -> bool:
     normalized = _normalize_text(value)
-    if len(normalized.split()) < 5:
+    if word_count(normalized) < 5:
         return True
-    filler_phrases = (
-        "monitor developments",
-        "stay informed",
-        "various factors",
-        "market uncertainty",
-        "dynamic environment",
-        "this seems meaningful",
-        "it could matter",
-    )
-    return any(phrase in normalized for phrase in filler_phrases)
+    return FILLER_LIST_ITEM_PHRASES.found_in(normalized)
 
 
 def _required_traceability_keys(payload: dict[str, Any]) -> list[str]:
@@ -1,4 +1,6 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
 from dotenv import load_dotenv
 
@@ -13,12 +15,24 @@ SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, futu
 
 Base = declarative_base()
 
+_ASYNC_DRIVERNAMES = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+}
+
+_async_engine: AsyncEngine | None = None
+_async_session_local: async_sessionmaker[AsyncSession] | None = None
+
 
 def init_db() -> None:
     # Import models so that they are registered with Base before create_all
     from . import models  # noqa: F401
+    from .schema_capabilities import invalidate_schema_capabilities
 
     Base.metadata.create_all(bind=engine)
+    invalidate_schema_capabilities(engine)
 
 def get_db() -> Session:
     """
@@ -33,3 +47,60 @@ def get_db() -> Session:
     finally:
         db.close()
 
+
+def to_async_database_url(database_url: str) -> str:
+    """Map a sync SQLAlchemy URL onto its async driver (asyncpg / aiosqlite)."""
+    url = make_url(database_url)
+    async_drivername = _ASYNC_DRIVERNAMES.get(url.drivername)
+    if async_drivername is None:
+        return database_url
+    return url.set(drivername=async_drivername).render_as_string(hide_password=False)
+
+
+def get_async_engine() -> AsyncEngine:
+    """
+    Lazily build the process-wide async engine.
+
+    Created on first use so jobs that only need the sync engine do not import
+    the async drivers.
+    """
+    global _async_engine
+    if _async_engine is None:
+        current = get_settings()
+        url = current.async_database_url or to_async_database_url(current.database_url)
+        kwargs: dict[str, object] = {"future": True}
+        if make_url(url).get_backend_name() != "sqlite":
+            kwargs["pool_size"] = current.async_db_pool_size
+            kwargs["max_overflow"] = current.async_db_max_overflow
+        _async_engine = create_async_engine(url, **kwargs)
+    return _async_engine
+
+
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    global _async_session_local
+    if _async_session_local is None:
+        _async_session_local = async_sessionmaker(
+            bind=get_async_engine(),
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    return _async_session_local
+
+
+async def get_async_db():
+    """
+    FastAPI dependency that yields an AsyncSession.
+
+    Usage:
+      async def route(db: AsyncSession = Depends(get_async_db)): ...
+    """
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+
+async def dispose_async_engine() -> None:
+    global _async_engine, _async_session_local
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    _async_engine = None
+    _async_session_local = None
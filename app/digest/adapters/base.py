@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from typing import Protocol
 
 from ..types import CanonicalDigest
@@ -8,16 +9,47 @@ from ..types import CanonicalDigest
 
 @dataclass(frozen=True)
 class PublishResult:
-    status: str  # published|failed|deferred
+    status: str  # published|failed|deferred|queued|unknown
     external_ref: str | None = None
     error: str | None = None
 
 
+class PublishNotDelivered(RuntimeError):
+    """The destination provably did not accept the payload.
+
+    Anything else an adapter raises means delivery is unknown: such a call is
+    never retried and its row is recorded as `unknown`. `retryable` marks
+    transient causes (connection refused, 429, 5xx) worth another attempt.
+    """
+
+    def __init__(self, message: str, *, retryable: bool = False) -> None:
+        super().__init__(message)
+        self.retryable = retryable
+
+
+@dataclass
+class PublishProgress:
+    """Parts of a multi-part send (e.g. Telegram chunks) the destination already accepted.
+
+    Senders skip the first `len(sent_refs)` parts and `record` each newly
+    accepted one; `on_record` persists the list as it grows, so a retry, the
+    outbox or a later run resumes from the first unsent part.
+    """
+
+    sent_refs: list[str] = field(default_factory=list)
+    on_record: Callable[[list[str]], None] | None = None
+
+    def record(self, ref: str) -> None:
+        self.sent_refs.append(ref)
+        if self.on_record is not None:
+            self.on_record(list(self.sent_refs))
+
+
 class DigestAdapter(Protocol):
     destination: str
 
     def render_payload(self, digest: CanonicalDigest, canonical_text: str) -> str:
         ...
 
-    def publish(self, payload: str) -> PublishResult:
+    def publish(self, payload: str, *, progress: PublishProgress | None = None) -> PublishResult:
         ...
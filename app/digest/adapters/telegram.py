@@ -7,17 +7,16 @@ provided by `CanonicalDigest` and must not be recomputed here.
 from __future__ import annotations
 
 import html
-import logging
 import re
-
-import httpx
+import time
 
 from ...config import Settings, get_settings
 from ..types import CanonicalDigest
-from .base import PublishResult
+from .base import PublishNotDelivered, PublishProgress, PublishResult
+from .telegram_transport import get_telegram_delivery_service
 
 
-logger = logging.getLogger("civicquant.publisher.telegram")
+OUTBOX_STATUS_QUEUED = "queued"
 
 
 _WS_RE = re.compile(r"\s+")
@@ -68,39 +67,31 @@ def render_telegram_payload(digest: CanonicalDigest) -> str:
     return "\n".join(lines).strip()
 
 
-def send_telegram_text(text: str, settings: Settings | None = None) -> str | None:
+def send_telegram_text(
+    text: str,
+    settings: Settings | None = None,
+    *,
+    progress: PublishProgress | None = None,
+    deadline: float | None = None,
+) -> str | None:
+    """Send to the VIP chat; long payloads are split. Returns the first message id.
+
+    `progress` resumes a send after the chunks it already holds (see
+    `TelegramDeliveryService.send_text`).
+    """
+
     cfg = settings or get_settings()
     if not cfg.tg_bot_token or not cfg.tg_vip_chat_id:
-        raise RuntimeError("TG_BOT_TOKEN and TG_VIP_CHAT_ID must be configured to publish digests")
-
-    url = f"https://api.telegram.org/bot{cfg.tg_bot_token}/sendMessage"
-    payload = {
-        "chat_id": cfg.tg_vip_chat_id,
-        "text": text,
-        "disable_web_page_preview": True,
-        "parse_mode": "HTML",
-    }
-
-    with httpx.Client(timeout=20.0) as client:
-        response = client.post(url, json=payload)
-        if response.status_code >= 400:
-            logger.error(
-                "telegram_publish_failed status=%s body=%s",
-                response.status_code,
-                response.text[:500],
-            )
-            response.raise_for_status()
-        logger.info("telegram_publish_ok status=%s", response.status_code)
-        try:
-            body = response.json()
-        except ValueError:
-            return None
-        result = body.get("result") if isinstance(body, dict) else None
-        if isinstance(result, dict):
-            message_id = result.get("message_id")
-            if message_id is not None:
-                return str(message_id)
-        return None
+        raise PublishNotDelivered("TG_BOT_TOKEN and TG_VIP_CHAT_ID must be configured to publish digests")
+
+    message_ids = get_telegram_delivery_service(cfg).send_text(
+        text,
+        chat_id=cfg.tg_vip_chat_id,
+        bot_token=cfg.tg_bot_token,
+        progress=progress,
+        deadline=deadline,
+    )
+    return message_ids[0] if message_ids else None
 
 
 class TelegramDigestAdapter:
@@ -115,6 +106,15 @@ class TelegramDigestAdapter:
     def render_payload(self, digest: CanonicalDigest, canonical_text: str) -> str:  # noqa: ARG002
         return render_telegram_payload(digest)
 
-    def publish(self, payload: str) -> PublishResult:
-        external_ref = send_telegram_text(payload, settings=self._settings)
+    def publish(self, payload: str, *, progress: PublishProgress | None = None) -> PublishResult:
+        if self._settings.telegram_outbox_enabled:
+            # Row stays `queued`; `drain_telegram_outbox` sends it and marks events published.
+            return PublishResult(status=OUTBOX_STATUS_QUEUED)
+        # Bound rate-limit waits by the attempt budget so they cannot outlive the publish deadline.
+        external_ref = send_telegram_text(
+            payload,
+            settings=self._settings,
+            progress=progress,
+            deadline=time.monotonic() + self._settings.digest_publish_timeout_seconds,
+        )
         return PublishResult(status="published", external_ref=external_ref)
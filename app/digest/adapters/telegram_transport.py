@@ -0,0 +1,351 @@
+"""Telegram Bot API transport shared by digest and opportunity-memo delivery.
+
+- one pooled `httpx.Client` per process instead of a client per send,
+- payloads longer than Telegram's 4096-character limit are split on line,
+  then word boundaries; HTML tags open at a split are closed at the end of
+  the chunk and reopened at the start of the next, and entities are never cut,
+- a token bucket per chat keeps sends under Telegram's per-chat rate limit,
+- HTTP 429 responses are retried after `parameters.retry_after` (or the
+  `Retry-After` header), up to `telegram_max_rate_limit_retries` times,
+- with a `deadline`, neither the bucket wait nor a 429 backoff sleeps past it,
+- with a `PublishProgress`, chunks already accepted are skipped and each new
+  message id is recorded as soon as Telegram returns it.
+
+Failures that prove Telegram did not take the message (connect errors, 429,
+5xx, other 4xx, missing config) raise `PublishNotDelivered`; read timeouts
+and other errors after the request was written propagate unchanged, since
+Telegram may already have posted it.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import time
+from collections.abc import Callable
+
+import httpx
+
+from ...config import Settings, get_settings
+from .base import PublishNotDelivered, PublishProgress
+
+
+logger = logging.getLogger("civicquant.publisher.telegram")
+
+TELEGRAM_MESSAGE_LIMIT = 4096
+
+_HTML_TAG_RE = re.compile(
+    r"</?(?P<name>b|strong|i|em|u|ins|s|strike|del|code|pre|a|span|tg-spoiler|blockquote)\b[^>]*>",
+    flags=re.IGNORECASE,
+)
+_ENTITY_RE = re.compile(r"&(?:#\d+|#x[0-9a-fA-F]+|\w+);")
+# Raised before the request is written, so Telegram cannot have the message.
+_NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+def _open_tags_after(text: str, stack: list[tuple[str, str]]) -> list[tuple[str, str]]:
+    """Replay tags in `text` on top of `stack` ([(name, opening_tag), ...])."""
+
+    out = list(stack)
+    for match in _HTML_TAG_RE.finditer(text):
+        name = match.group("name").lower()
+        if match.group(0).startswith("</"):
+            for index in range(len(out) - 1, -1, -1):
+                if out[index][0] == name:
+                    del out[index]
+                    break
+        else:
+            out.append((name, match.group(0)))
+    return out
+
+
+def _closers(stack: list[tuple[str, str]]) -> str:
+    return "".join(f"</{name}>" for name, _ in reversed(stack))
+
+
+def _openers(stack: list[tuple[str, str]]) -> str:
+    return "".join(tag for _, tag in stack)
+
+
+def _hard_split(unit: str, size: int) -> list[str]:
+    """Cut an unbreakable unit into `size` pieces without splitting tags or entities."""
+
+    protected = [(m.start(), m.end()) for m in _HTML_TAG_RE.finditer(unit)]
+    protected += [(m.start(), m.end()) for m in _ENTITY_RE.finditer(unit)]
+    pieces: list[str] = []
+    start = 0
+    while len(unit) - start > size:
+        cut = start + size
+        for span_start, span_end in protected:
+            if span_start < cut < span_end:
+                cut = span_start if span_start > start else span_end
+                break
+        pieces.append(unit[start:cut])
+        start = cut
+    pieces.append(unit[start:])
+    return pieces
+
+
+def _units(text: str, size: int) -> list[str]:
+    """Lines (with their newline), then words, then hard cuts — each at most `size` chars."""
+
+    units: list[str] = []
+    for line in text.splitlines(keepends=True):
+        if len(line) <= size:
+            units.append(line)
+            continue
+        for word in re.findall(r"\S+\s*|\s+", line):
+            units.extend([word] if len(word) <= size else _hard_split(word, size))
+    return units
+
+
+def split_telegram_message(text: str, limit: int = TELEGRAM_MESSAGE_LIMIT) -> list[str]:
+    """Split `text` into chunks of at most `limit` characters on safe boundaries."""
+
+    if len(text) <= limit:
+        return [text]
+
+    # Leave room for the closing/reopening tags a chunk may need.
+    reserve = 64
+    size = max(1, limit - 2 * reserve)
+    chunks: list[str] = []
+    current = ""
+    current_stack: list[tuple[str, str]] = []
+
+    for unit in _units(text, size):
+        candidate_stack = _open_tags_after(unit, current_stack)
+        if current and len(current) + len(unit) + len(_closers(candidate_stack)) > limit:
+            chunks.append((current + _closers(current_stack)).strip())
+            current = _openers(current_stack)
+        current += unit
+        current_stack = candidate_stack
+
+    if current.strip():
+        chunks.append((current + _closers(current_stack)).strip())
+    return [chunk for chunk in chunks if chunk]
+
+
+class TokenBucket:
+    """Blocking token bucket: `rate` tokens per second, up to `capacity` banked."""
+
+    def __init__(
+        self,
+        *,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._rate = rate
+        self._capacity = max(1.0, capacity)
+        self._tokens = self._capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take one token; return how long the caller must wait before using it."""
+
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+            self._updated_at = now
+            self._tokens -= 1.0
+            if self._tokens >= 0 or self._rate <= 0:
+                return 0.0
+            return -self._tokens / self._rate
+
+    def _refund(self) -> None:
+        with self._lock:
+            self._tokens = min(self._capacity, self._tokens + 1.0)
+
+    def acquire(self, *, deadline: float | None = None) -> float | None:
+        """Wait for a token. Returns the wait, or None (token handed back) if it would end after `deadline`."""
+
+        wait = self._reserve()
+        if wait > 0 and deadline is not None and self._clock() + wait > deadline:
+            self._refund()
+            return None
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+
+class TelegramRateLimited(PublishNotDelivered):
+    def __init__(self, retry_after: float) -> None:
+        super().__init__(f"telegram rate limited; retry_after={retry_after}", retryable=True)
+        self.retry_after = retry_after
+
+
+def _retry_after_seconds(response: httpx.Response) -> float:
+    try:
+        body = response.json()
+    except ValueError:
+        body = None
+    if isinstance(body, dict):
+        parameters = body.get("parameters")
+        if isinstance(parameters, dict) and parameters.get("retry_after") is not None:
+            return float(parameters["retry_after"])
+    header = response.headers.get("Retry-After")
+    try:
+        return float(header) if header is not None else 1.0
+    except ValueError:
+        return 1.0
+
+
+def _message_id(response: httpx.Response) -> str | None:
+    try:
+        body = response.json()
+    except ValueError:
+        return None
+    result = body.get("result") if isinstance(body, dict) else None
+    if isinstance(result, dict) and result.get("message_id") is not None:
+        return str(result["message_id"])
+    return None
+
+
+class TelegramDeliveryService:
+    def __init__(
+        self,
+        settings: Settings | None = None,
+        *,
+        client: httpx.Client | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._settings = settings or get_settings()
+        self._client = client
+        self._owns_client = client is None
+        self._sleep = sleep
+        self._clock = clock
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def _http(self) -> httpx.Client:
+        with self._lock:
+            if self._client is None:
+                self._client = httpx.Client(
+                    timeout=self._settings.digest_publish_timeout_seconds,
+                    limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+                )
+            return self._client
+
+    def _bucket(self, chat_id: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(chat_id)
+            if bucket is None:
+                bucket = TokenBucket(
+                    rate=self._settings.telegram_chat_messages_per_minute / 60.0,
+                    capacity=self._settings.telegram_chat_burst,
+                    clock=self._clock,
+                    sleep=self._sleep,
+                )
+                self._buckets[chat_id] = bucket
+            return bucket
+
+    def close(self) -> None:
+        with self._lock:
+            if self._client is not None and self._owns_client:
+                self._client.close()
+            self._client = None
+
+    def _post(self, url: str, payload: dict[str, object], *, deadline: float | None = None) -> httpx.Response:
+        attempts = 0
+        while True:
+            try:
+                response = self._http().post(url, json=payload)
+            except _NOT_SENT_ERRORS as exc:
+                raise PublishNotDelivered(f"telegram connect failed: {type(exc).__name__}", retryable=True) from exc
+            if response.status_code != 429:
+                return response
+            retry_after = _retry_after_seconds(response)
+            attempts += 1
+            if attempts > self._settings.telegram_max_rate_limit_retries:
+                raise TelegramRateLimited(retry_after)
+            if deadline is not None and self._clock() + retry_after > deadline:
+                raise TelegramRateLimited(retry_after)
+            logger.warning(
+                "telegram_rate_limited chat_id=%s retry_after=%s attempt=%s",
+                payload.get("chat_id"),
+                retry_after,
+                attempts,
+            )
+            self._sleep(retry_after)
+
+    def send_text(
+        self,
+        text: str,
+        *,
+        chat_id: str,
+        bot_token: str | None = None,
+        parse_mode: str | None = "HTML",
+        progress: PublishProgress | None = None,
+        deadline: float | None = None,
+    ) -> list[str]:
+        """Send `text` (split as needed); returns the Telegram message ids, in order.
+
+        With `progress`, the first `len(progress.sent_refs)` chunks are treated
+        as sent and a chunk that Telegram provably did not take stays
+        `PublishNotDelivered`, since a retry resumes after the recorded ones.
+        `deadline` is a `time.monotonic()`-style instant on this service's clock.
+        """
+
+        token = bot_token or self._settings.tg_bot_token
+        if not token:
+            raise PublishNotDelivered("TG_BOT_TOKEN must be configured to publish to Telegram")
+        url = f"https://api.telegram.org/bot{token}/sendMessage"
+        chunks = split_telegram_message(text)
+        resumable = progress is not None
+        progress = progress if progress is not None else PublishProgress()
+        first = len(progress.sent_refs)
+        for index in range(first + 1, len(chunks) + 1):
+            try:
+                if self._bucket(chat_id).acquire(deadline=deadline) is None:
+                    raise PublishNotDelivered("telegram chat rate limit wait would pass the deadline", retryable=True)
+                payload: dict[str, object] = {
+                    "chat_id": chat_id,
+                    "text": chunks[index - 1],
+                    "disable_web_page_preview": True,
+                }
+                if parse_mode:
+                    payload["parse_mode"] = parse_mode
+                response = self._post(url, payload, deadline=deadline)
+                if response.status_code >= 400:
+                    logger.error(
+                        "telegram_publish_failed status=%s chunk=%s/%s body=%s",
+                        response.status_code,
+                        index,
+                        len(chunks),
+                        response.text[:500],
+                    )
+                    raise PublishNotDelivered(
+                        f"telegram rejected chunk {index}/{len(chunks)} with HTTP {response.status_code}",
+                        retryable=response.status_code >= 500,
+                    )
+            except PublishNotDelivered as exc:
+                if progress.sent_refs and not resumable:
+                    # Earlier chunks are already posted and nobody can resume after them.
+                    raise RuntimeError(f"telegram send stopped after chunk {index - 1}/{len(chunks)}: {exc}") from exc
+                raise
+            progress.record(_message_id(response) or "")
+        logger.info(
+            "telegram_publish_ok chat_id=%s chunks=%s resumed_from=%s",
+            chat_id,
+            len(chunks),
+            first + 1 if first else None,
+        )
+        return [message_id for message_id in progress.sent_refs if message_id]
+
+
+_default_service: TelegramDeliveryService | None = None
+_default_service_lock = threading.Lock()
+
+
+def get_telegram_delivery_service(settings: Settings | None = None) -> TelegramDeliveryService:
+    global _default_service
+    with _default_service_lock:
+        if _default_service is None:
+            _default_service = TelegramDeliveryService(settings)
+        return _default_service
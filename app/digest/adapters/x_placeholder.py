@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from ..types import CanonicalDigest
-from .base import PublishResult
+from .base import PublishProgress, PublishResult
 
 
 class XPlaceholderDigestAdapter:
@@ -10,7 +10,7 @@ class XPlaceholderDigestAdapter:
     def render_payload(self, digest: CanonicalDigest, canonical_text: str) -> str:  # noqa: ARG002
         return canonical_text
 
-    def publish(self, payload: str) -> PublishResult:  # noqa: ARG002
+    def publish(self, payload: str, *, progress: PublishProgress | None = None) -> PublishResult:  # noqa: ARG002
         return PublishResult(
             status="deferred",
             error="X adapter is a placeholder only; publishing is deferred.",
@@ -2,19 +2,28 @@
 
 `input_hash_for_digest_inputs` creates a stable identity from deterministic
 source inputs so reruns can dedupe artifacts even when synthesized prose varies.
+`digest_json` persists the synthesized structure for that identity so reruns
+can reuse it without synthesis (see `synthesis_cache.py`).
 """
 
 from __future__ import annotations
 
 import hashlib
 import json
-from typing import Sequence
+from typing import Any, Sequence
 
-from sqlalchemy import inspect
 from sqlalchemy.orm import Session, load_only
 
 from ..models import DigestArtifact
-from .types import DigestWindow, SourceDigestEvent, SourceEventGroup
+from ..schema_capabilities import get_schema_capabilities
+from .types import (
+    CanonicalDigest,
+    DigestBullet,
+    DigestWindow,
+    SourceDigestEvent,
+    SourceEventGroup,
+    TopicSection,
+)
 
 
 def canonical_hash_for_text(text: str) -> str:
@@ -25,17 +34,17 @@ def _supports_input_hash(db: Session) -> bool:
     """Return whether the connected DB schema has `digest_artifacts.input_hash`.
 
     This keeps digest publishing compatible with pre-refactor databases that
-    have not yet added the new column.
+    have not yet added the new column. The probe is cached per engine.
     """
 
-    bind = db.get_bind()
-    inspector = inspect(bind)
-    columns = inspector.get_columns("digest_artifacts")
-    names = {str(column.get("name")) for column in columns}
-    return "input_hash" in names
+    return get_schema_capabilities(db.get_bind()).has_column("digest_artifacts", "input_hash")
 
 
-def _artifact_query(db: Session, *, include_input_hash: bool):
+def _supports_digest_json(db: Session) -> bool:
+    return get_schema_capabilities(db.get_bind()).has_column("digest_artifacts", "digest_json")
+
+
+def _artifact_query(db: Session, *, include_input_hash: bool, include_digest_json: bool = False):
     columns = [
         DigestArtifact.id,
         DigestArtifact.window_start_utc,
@@ -46,9 +55,73 @@ def _artifact_query(db: Session, *, include_input_hash: bool):
     ]
     if include_input_hash:
         columns.append(DigestArtifact.input_hash)
+    if include_digest_json:
+        columns.append(DigestArtifact.digest_json)
     return db.query(DigestArtifact).options(load_only(*columns))
 
 
+def _bullet_to_json(bullet: DigestBullet) -> dict[str, Any]:
+    return {
+        "text": bullet.text,
+        "topic_label": bullet.topic_label,
+        "source_event_ids": list(bullet.source_event_ids),
+    }
+
+
+def _bullet_from_json(payload: dict[str, Any]) -> DigestBullet:
+    return DigestBullet(
+        text=str(payload["text"]),
+        topic_label=payload.get("topic_label"),
+        source_event_ids=tuple(int(value) for value in payload["source_event_ids"]),
+    )
+
+
+def digest_structure_to_json(digest: CanonicalDigest) -> dict[str, Any]:
+    """Serialize the synthesized structure (window/source events are implied by input_hash)."""
+
+    return {
+        "top_developments": [_bullet_to_json(bullet) for bullet in digest.top_developments],
+        "sections": [
+            {
+                "topic_label": section.topic_label,
+                "bullets": [_bullet_to_json(bullet) for bullet in section.bullets],
+                "covered_event_ids": list(section.covered_event_ids),
+            }
+            for section in digest.sections
+        ],
+        "covered_event_ids": list(digest.covered_event_ids),
+    }
+
+
+def digest_from_structure_json(
+    payload: dict[str, Any],
+    *,
+    window: DigestWindow,
+    source_events: Sequence[SourceDigestEvent],
+) -> CanonicalDigest:
+    return CanonicalDigest(
+        window=window,
+        source_events=tuple(sorted(source_events, key=lambda row: row.event_id)),
+        top_developments=tuple(_bullet_from_json(row) for row in payload["top_developments"]),
+        sections=tuple(
+            TopicSection(
+                topic_label=str(row["topic_label"]),
+                bullets=tuple(_bullet_from_json(bullet) for bullet in row["bullets"]),
+                covered_event_ids=tuple(int(value) for value in row["covered_event_ids"]),
+            )
+            for row in payload["sections"]
+        ),
+        covered_event_ids=tuple(int(value) for value in payload["covered_event_ids"]),
+    )
+
+
+def find_artifact_by_input_hash(db: Session, *, input_hash: str) -> DigestArtifact | None:
+    if not _supports_input_hash(db):
+        return None
+    query = _artifact_query(db, include_input_hash=True, include_digest_json=_supports_digest_json(db))
+    return query.filter(DigestArtifact.input_hash == input_hash).one_or_none()
+
+
 def input_hash_for_digest_inputs(
     *,
     window: DigestWindow,
@@ -106,6 +179,7 @@ def get_or_create_artifact(
     window: DigestWindow,
     canonical_text: str,
     input_hash: str | None = None,
+    digest: CanonicalDigest | None = None,
 ) -> DigestArtifact:
     has_input_hash = _supports_input_hash(db)
     query = _artifact_query(db, include_input_hash=has_input_hash)
@@ -131,6 +205,8 @@ def get_or_create_artifact(
     }
     if has_input_hash and input_hash:
         artifact_kwargs["input_hash"] = input_hash
+        if digest is not None and _supports_digest_json(db):
+            artifact_kwargs["digest_json"] = digest_structure_to_json(digest)
 
     artifact = DigestArtifact(**artifact_kwargs)
     db.add(artifact)
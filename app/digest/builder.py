@@ -127,6 +127,24 @@ def _norm_token(value: str | None) -> str | None:
     return cleaned or None
 
 
+def event_identity_keys(event: SourceDigestEvent) -> tuple[str, ...]:
+    """Keys that put two events of the same topic into one pre-dedupe cluster."""
+
+    keys: list[str] = []
+    claim_hash = _norm_token(event.claim_hash)
+    if claim_hash:
+        keys.append(f"claim:{claim_hash}")
+    fingerprint = _norm_token(event.event_fingerprint)
+    if fingerprint:
+        keys.append(f"fingerprint:{fingerprint}")
+    normalized_summary = normalize_summary_for_compare(event.summary_1_sentence)
+    if normalized_summary:
+        keys.append(f"summary:{normalized_summary}")
+    if not keys:
+        keys.append(f"event:{event.event_id}")
+    return tuple(keys)
+
+
 def _cluster_topic_events(topic_events: Sequence[SourceDigestEvent]) -> list[list[SourceDigestEvent]]:
     if not topic_events:
         return []
@@ -155,20 +173,7 @@ def _cluster_topic_events(topic_events: Sequence[SourceDigestEvent]) -> list[lis
 
     key_to_index: dict[str, int] = {}
     for idx, event in enumerate(topic_events):
-        keys: list[str] = []
-        claim_hash = _norm_token(event.claim_hash)
-        if claim_hash:
-            keys.append(f"claim:{claim_hash}")
-        fingerprint = _norm_token(event.event_fingerprint)
-        if fingerprint:
-            keys.append(f"fingerprint:{fingerprint}")
-        normalized_summary = normalize_summary_for_compare(event.summary_1_sentence)
-        if normalized_summary:
-            keys.append(f"summary:{normalized_summary}")
-        if not keys:
-            keys.append(f"event:{event.event_id}")
-
-        for key in keys:
+        for key in event_identity_keys(event):
             existing = key_to_index.get(key)
             if existing is None:
                 key_to_index[key] = idx
@@ -188,7 +193,9 @@ def _cluster_topic_events(topic_events: Sequence[SourceDigestEvent]) -> list[lis
     return clusters
 
 
-def _merge_cluster(cluster: Sequence[SourceDigestEvent]) -> SourceEventGroup:
+def merge_event_cluster(cluster: Sequence[SourceDigestEvent]) -> SourceEventGroup:
+    """Collapse one pre-dedupe cluster into its `SourceEventGroup`."""
+
     representative = sorted(cluster, key=_event_order_key)[0]
     source_event_ids = tuple(sorted(row.event_id for row in cluster))
 
@@ -233,10 +240,13 @@ def pre_dedupe_source_events(
     for topic_label in sorted(grouped.keys(), key=lambda s: (s.lower(), s)):
         clusters = _cluster_topic_events(grouped[topic_label])
         for cluster in clusters:
-            merged_groups.append(_merge_cluster(cluster))
+            merged_groups.append(merge_event_cluster(cluster))
+
+    return sort_source_groups(merged_groups)
+
 
-    merged_groups.sort(key=_group_order_key)
-    return tuple(merged_groups)
+def sort_source_groups(groups: Sequence[SourceEventGroup]) -> tuple[SourceEventGroup, ...]:
+    return tuple(sorted(groups, key=_group_order_key))
 
 
 def build_deterministic_digest(
@@ -2,9 +2,19 @@
 
 from __future__ import annotations
 
+from datetime import datetime
+
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session
 
-from ..models import PublishedPost
+from ..models import DigestArtifact, Event, PublishedPost
+
+
+# A row in one of these states may already be (or is about to be) on the
+# destination: its events must not go into another artifact, and the row must
+# not be sent again by `run_digest` (except by resuming it, see
+# `resumable_publications`).
+RESERVING_PUBLISH_STATUSES = ("queued", "sending", "unknown", "partial")
 
 
 def get_destination_publication(
@@ -23,3 +33,66 @@ def get_destination_publication(
 def destination_already_published(db: Session, *, artifact_id: int, destination: str) -> bool:
     existing = get_destination_publication(db, artifact_id=artifact_id, destination=destination)
     return existing is not None and existing.status == "published"
+
+
+def covered_event_ids(digest_json: dict | None) -> list[int]:
+    return [int(event_id) for event_id in (digest_json or {}).get("covered_event_ids") or ()]
+
+
+def reserved_event_ids(db: Session, *, destination: str, since_utc: datetime) -> set[int]:
+    """Event ids covered by `destination` rows in a reserving state, for artifacts ending after `since_utc`."""
+
+    rows = (
+        db.query(DigestArtifact.digest_json)
+        .join(PublishedPost, PublishedPost.artifact_id == DigestArtifact.id)
+        .filter(
+            PublishedPost.destination == destination,
+            PublishedPost.status.in_(RESERVING_PUBLISH_STATUSES),
+            DigestArtifact.window_end_utc > since_utc,
+        )
+        .all()
+    )
+    reserved: set[int] = set()
+    for (digest_json,) in rows:
+        reserved.update(covered_event_ids(digest_json))
+    return reserved
+
+
+def resumable_publications(
+    db: Session, *, destination: str, since_utc: datetime, stale_before: datetime
+) -> list[tuple[PublishedPost, list[int]]]:
+    """Rows to resume for artifacts ending after `since_utc`, with their covered event ids.
+
+    That is `partial` rows (some chunks sent) and `sending` rows whose claim
+    was taken before `stale_before` (the sender died mid-send).
+    """
+
+    rows = (
+        db.query(PublishedPost, DigestArtifact.digest_json)
+        .join(DigestArtifact, PublishedPost.artifact_id == DigestArtifact.id)
+        .filter(
+            PublishedPost.destination == destination,
+            or_(
+                PublishedPost.status == "partial",
+                and_(
+                    PublishedPost.status == "sending",
+                    or_(PublishedPost.claimed_at.is_(None), PublishedPost.claimed_at < stale_before),
+                ),
+            ),
+            DigestArtifact.window_end_utc > since_utc,
+        )
+        .order_by(PublishedPost.id.asc())
+        .all()
+    )
+    return [(post, covered_event_ids(digest_json)) for post, digest_json in rows]
+
+
+def mark_events_published(db: Session, *, event_ids: list[int], destination: str) -> None:
+    if not event_ids:
+        return
+    events = db.query(Event).filter(Event.id.in_(event_ids)).all()
+    for event in events:
+        if destination == "vip_telegram":
+            event.is_published_telegram = True
+        elif destination == "x":
+            event.is_published_twitter = True
@@ -1,14 +1,38 @@
 """Digest orchestration entrypoint.
 
-`run_digest` executes the end-to-end digest pipeline per destination:
-1. query deterministic candidate events
+`run_digest` executes the end-to-end digest pipeline for each destination:
+1. query deterministic candidate events (one window query per run; each
+   destination's unpublished subset is filtered in memory)
 2. build source digest events
-3. run deterministic pre-dedupe/pre-group
-4. synthesize digest (LLM path or deterministic fallback)
+3. run deterministic pre-dedupe/pre-group (shared across destinations with
+   identical event sets, together with the input hash)
+4. synthesize digest (LLM path or deterministic fallback), unless a digest for
+   the same input hash is already cached in memory or on the artifact row
 5. render canonical text
 6. persist artifact (input-hash aware) and commit before publish
-7. render/publish destination payload
-8. mark all covered source event IDs as published on successful publish
+7. render destination payloads, commit their `published_posts` rows and claim
+   them (`sending`, stamped `claimed_at`)
+8. publish all destinations concurrently (`publish.py`), each with its own
+   timeout and retry budget
+9. per destination, record the outcome and mark all covered source event IDs
+   as published on success, in one commit
+
+Claims are conditional updates on the status (and `claimed_at`) the run read,
+and an outcome is only written while the run's claim still holds, so a run
+never overwrites a row the outbox drainer or another run has taken. `queued`
+and `sending` rows reserve their events like `unknown` and `partial` ones. A
+`sending` row whose claim is older than `delivery_claim_lease_seconds` (its
+sender died) is resumed like a `partial` one.
+
+A row whose delivery is unknown (ambiguous transport error, or still running
+at its deadline) is recorded as `unknown`: it is never resent automatically
+and its events are held back from later artifacts for that destination. A
+call that outlives its deadline reconciles the row from its eventual result.
+
+Multi-part sends record each accepted part on `published_posts.sent_chunk_refs`
+as it happens. A row that failed after some parts went out is `partial`: its
+events are held back too, and the next run resumes it from the first unsent
+part before building new artifacts.
 
 The orchestrator owns publication semantics and state transitions.
 Adapters are transport/presentation layers only.
@@ -18,27 +42,42 @@ from __future__ import annotations
 
 import hashlib
 import logging
+from concurrent.futures import Future
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Sequence
 
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.orm import Session
 
 from ..config import Settings, get_settings
-from ..models import Event, PublishedPost
-from .adapters.base import DigestAdapter
+from ..models import PublishedPost
+from .adapters.base import DigestAdapter, PublishNotDelivered, PublishProgress, PublishResult
 from .adapters.telegram import TelegramDigestAdapter
 from .artifact_store import canonical_hash_for_text, get_or_create_artifact, input_hash_for_digest_inputs
-from .builder import build_source_digest_events, pre_dedupe_source_events
-from .dedupe import destination_already_published, get_destination_publication
+from .builder import pre_dedupe_source_events
+from .dedupe import (
+    RESERVING_PUBLISH_STATUSES,
+    destination_already_published,
+    get_destination_publication,
+    mark_events_published,
+    reserved_event_ids,
+    resumable_publications,
+)
 from .prompt_templates import PROMPT_VERSION
-from .query import get_events_for_window
+from .publish import PublishJob, PublishOutcome, publish_concurrently
+from .query import select_digest_window
 from .renderer_text import render_canonical_text
+from .synthesis_cache import DigestSynthesisCache, get_digest_synthesis_cache
 from .synthesizer import DigestSynthesisClient, synthesize_digest
-from .types import DigestWindow
+from .types import DigestWindow, SourceEventGroup
 
 
 logger = logging.getLogger("civicquant.digest")
 DIGEST_MIN_IMPACT_EXCLUSIVE = 35.0
+PUBLISH_STATUS_UNKNOWN = "unknown"
+PUBLISH_STATUS_PARTIAL = "partial"
+PUBLISH_STATUS_SENDING = "sending"
 
 
 def _freeze_window(now_utc: datetime, window_hours: int) -> DigestWindow:
@@ -71,6 +110,9 @@ def _upsert_destination_row(
 ) -> PublishedPost:
     existing = get_destination_publication(db, artifact_id=artifact_id, destination=destination)
     if existing is not None:
+        if existing.content_hash != payload_hash:
+            # Chunk progress only holds for the content it was recorded against.
+            existing.sent_chunk_refs = None
         existing.content = payload
         existing.content_hash = payload_hash
         existing.last_attempted_at = datetime.utcnow()
@@ -93,15 +135,193 @@ def _upsert_destination_row(
     return row
 
 
-def _mark_events_published(db: Session, *, event_ids: list[int], destination: str) -> None:
-    if not event_ids:
+def _chunk_progress(bind: Engine | Connection, *, row_id: int, sent_refs: list[str] | None) -> PublishProgress:
+    """Progress for one row, persisted on its own session as each part is accepted (runs on the publish thread)."""
+
+    def persist(refs: list[str]) -> None:
+        with Session(bind=bind, autoflush=False) as db:
+            db.query(PublishedPost).filter(PublishedPost.id == row_id).update(
+                {PublishedPost.sent_chunk_refs: refs},
+                synchronize_session=False,
+            )
+            db.commit()
+
+    return PublishProgress(sent_refs=list(sent_refs or ()), on_record=persist)
+
+
+def _failed_status(progress: PublishProgress | None) -> str:
+    return PUBLISH_STATUS_PARTIAL if progress is not None and progress.sent_refs else "failed"
+
+
+def _claim_row(
+    db: Session,
+    *,
+    row_id: int,
+    expected_status: str,
+    expected_claimed_at: datetime | None,
+    claimed_at: datetime,
+) -> bool:
+    """Move the row from the state this run read to `sending`; False if it changed in between. Commits."""
+
+    current_claim = (
+        PublishedPost.claimed_at.is_(None)
+        if expected_claimed_at is None
+        else PublishedPost.claimed_at == expected_claimed_at
+    )
+    claimed = (
+        db.query(PublishedPost)
+        .filter(PublishedPost.id == row_id, PublishedPost.status == expected_status, current_claim)
+        .update(
+            {PublishedPost.status: PUBLISH_STATUS_SENDING, PublishedPost.claimed_at: claimed_at},
+            synchronize_session=False,
+        )
+    )
+    db.commit()
+    return claimed == 1
+
+
+@dataclass(frozen=True)
+class _PendingPublish:
+    job: PublishJob
+    row_id: int
+    artifact_id: int
+    event_ids: list[int]
+    result_index: int
+    claimed_at: datetime
+
+
+def _finish_claim(db: Session, *, item: _PendingPublish, values: dict) -> bool:
+    """Write `values` and release the claim, only if the row is still `sending` under this run's claim."""
+
+    updated = (
+        db.query(PublishedPost)
+        .filter(
+            PublishedPost.id == item.row_id,
+            PublishedPost.status == PUBLISH_STATUS_SENDING,
+            PublishedPost.claimed_at == item.claimed_at,
+        )
+        .update(
+            {**values, PublishedPost.claimed_at: None, PublishedPost.last_attempted_at: datetime.utcnow()},
+            synchronize_session=False,
+        )
+    )
+    return updated == 1
+
+
+def _record_publish_outcome(db: Session, *, item: _PendingPublish, outcome: PublishOutcome) -> str:
+    """Apply one destination's publish outcome and commit it on its own."""
+
+    destination = item.job.adapter.destination
+    if outcome.result is None and outcome.delivery_unknown:
+        status = PUBLISH_STATUS_UNKNOWN
+        error = (outcome.error or "delivery unknown")[:1000]
+        values = {PublishedPost.external_ref: None, PublishedPost.published_at: None}
+    elif outcome.result is not None:
+        result = outcome.result
+        status = result.status
+        error = result.error
+        values = {
+            PublishedPost.external_ref: result.external_ref,
+            PublishedPost.published_at: datetime.utcnow() if status == "published" else None,
+        }
+    else:
+        status = _failed_status(item.job.progress)
+        error = (outcome.error or "unknown error")[:1000]
+        values = {PublishedPost.external_ref: None, PublishedPost.published_at: None}
+
+    values.update({PublishedPost.status: status, PublishedPost.last_error: error})
+    if not _finish_claim(db, item=item, values=values):
+        db.rollback()
+        logger.warning(
+            "digest_publish_claim_lost artifact_id=%s destination=%s status=%s",
+            item.artifact_id,
+            destination,
+            status,
+        )
+        return "claim_lost"
+    if status == "published":
+        mark_events_published(db, event_ids=item.event_ids, destination=destination)
+    db.commit()
+
+    if status == PUBLISH_STATUS_UNKNOWN:
+        logger.warning(
+            "digest_publish_unknown artifact_id=%s destination=%s attempts=%s still_running=%s error=%s",
+            item.artifact_id,
+            destination,
+            outcome.attempts,
+            outcome.pending is not None,
+            error,
+        )
+        if outcome.pending is not None:
+            bind = db.get_bind()
+            outcome.pending.add_done_callback(lambda future: _reconcile_late_publish(bind, item=item, future=future))
+    elif outcome.result is not None:
+        logger.info(
+            "digest_publish_result artifact_id=%s destination=%s status=%s attempts=%s elapsed_ms=%s",
+            item.artifact_id,
+            destination,
+            status,
+            outcome.attempts,
+            outcome.elapsed_ms,
+        )
+    else:
+        logger.error(
+            "digest_publish_failed artifact_id=%s destination=%s status=%s attempts=%s error=%s",
+            item.artifact_id,
+            destination,
+            status,
+            outcome.attempts,
+            error,
+        )
+    return status
+
+
+def _reconcile_late_publish(bind: Engine | Connection, *, item: _PendingPublish, future: Future[tuple[PublishResult, int]]) -> None:
+    """Done-callback for a publish that outlived its deadline; runs on the publish thread.
+
+    Only a row still `unknown` is updated, on its own session. An ambiguous
+    error leaves it `unknown`.
+    """
+
+    destination = item.job.adapter.destination
+    try:
+        result, _ = future.result()
+        status, error, external_ref = result.status, result.error, result.external_ref
+    except PublishNotDelivered as exc:
+        status, error, external_ref = _failed_status(item.job.progress), str(exc), None
+    except Exception as exc:  # noqa: BLE001
+        logger.warning(
+            "digest_publish_late_unknown artifact_id=%s destination=%s error=%s",
+            item.artifact_id,
+            destination,
+            type(exc).__name__,
+        )
         return
-    events = db.query(Event).filter(Event.id.in_(event_ids)).all()
-    for event in events:
-        if destination == "vip_telegram":
-            event.is_published_telegram = True
-        elif destination == "x":
-            event.is_published_twitter = True
+
+    with Session(bind=bind, autoflush=False) as db:
+        updated = (
+            db.query(PublishedPost)
+            .filter(PublishedPost.id == item.row_id, PublishedPost.status == PUBLISH_STATUS_UNKNOWN)
+            .update(
+                {
+                    PublishedPost.status: status,
+                    PublishedPost.last_error: error[:1000] if error else None,
+                    PublishedPost.external_ref: external_ref,
+                    PublishedPost.published_at: datetime.utcnow() if status == "published" else None,
+                },
+                synchronize_session=False,
+            )
+        )
+        if updated and status == "published":
+            mark_events_published(db, event_ids=item.event_ids, destination=destination)
+        db.commit()
+    logger.info(
+        "digest_publish_reconciled artifact_id=%s destination=%s status=%s updated=%s",
+        item.artifact_id,
+        destination,
+        status,
+        bool(updated),
+    )
 
 
 def run_digest(
@@ -111,6 +331,7 @@ def run_digest(
     now_utc: datetime | None = None,
     adapters: Sequence[DigestAdapter] | None = None,
     digest_llm_client: DigestSynthesisClient | None = None,
+    synthesis_cache: DigestSynthesisCache | None = None,
 ) -> dict[str, object]:
     """Run digest orchestration for configured/ad-hoc destinations.
 
@@ -121,22 +342,80 @@ def run_digest(
     frozen_now = now_utc or datetime.utcnow()
     window = _freeze_window(frozen_now, window_hours)
     selected_adapters = list(adapters) if adapters is not None else _default_adapters(settings)
+    cache = (
+        synthesis_cache
+        if synthesis_cache is not None
+        else get_digest_synthesis_cache(settings.digest_synthesis_cache_size)
+    )
 
     publication_results: list[dict[str, object]] = []
     all_event_ids: list[int] = []
     last_canonical_hash: str | None = None
     last_artifact_id: int | None = None
 
+    selection = select_digest_window(
+        db,
+        window.start_utc,
+        window.end_utc,
+        min_impact_exclusive=DIGEST_MIN_IMPACT_EXCLUSIVE,
+    )
+    prepared_by_event_ids: dict[tuple[int, ...], tuple[tuple[SourceEventGroup, ...], str]] = {}
+    pending: list[_PendingPublish] = []
+
+    bind = db.get_bind()
+    stale_before = datetime.utcnow() - timedelta(seconds=settings.delivery_claim_lease_seconds)
     for adapter in selected_adapters:
         destination = adapter.destination
-        events = get_events_for_window(
-            db,
-            window.start_utc,
-            window.end_utc,
-            min_impact_exclusive=DIGEST_MIN_IMPACT_EXCLUSIVE,
-            destination=destination,
+        # Snapshot before claiming: each claim commits, which would reload the rows' current state.
+        resumable = [
+            (post.id, post.artifact_id, post.status, post.claimed_at, post.content, post.sent_chunk_refs, covered)
+            for post, covered in resumable_publications(
+                db, destination=destination, since_utc=window.start_utc, stale_before=stale_before
+            )
+        ]
+        for row_id, artifact_id, status, previous_claim, content, sent_refs, covered in resumable:
+            claimed_at = datetime.utcnow()
+            if not _claim_row(
+                db,
+                row_id=row_id,
+                expected_status=status,
+                expected_claimed_at=previous_claim,
+                claimed_at=claimed_at,
+            ):
+                logger.info("digest_resume_claimed_elsewhere artifact_id=%s destination=%s", artifact_id, destination)
+                continue
+            publication_results.append(
+                {"destination": destination, "status": "pending", "resumed_artifact_id": artifact_id}
+            )
+            pending.append(
+                _PendingPublish(
+                    job=PublishJob(
+                        adapter=adapter,
+                        payload=content,
+                        progress=_chunk_progress(bind, row_id=row_id, sent_refs=sent_refs),
+                    ),
+                    row_id=row_id,
+                    artifact_id=artifact_id,
+                    event_ids=covered,
+                    result_index=len(publication_results) - 1,
+                    claimed_at=claimed_at,
+                )
+            )
+            logger.info(
+                "digest_publish_resume artifact_id=%s destination=%s sent_chunks=%s",
+                artifact_id,
+                destination,
+                len(sent_refs or ()),
+            )
+        if resumable:
+            # Finish the interrupted digest first; new events go out with the next run, not interleaved with it.
+            continue
+
+        reserved = reserved_event_ids(db, destination=destination, since_utc=window.start_utc)
+        source_events = tuple(
+            event for event in selection.unpublished_for(destination) if event.event_id not in reserved
         )
-        if not events:
+        if not source_events:
             publication_results.append({"destination": destination, "status": "skipped_no_events"})
             logger.info(
                 "digest_skip_no_events destination=%s window_start=%s window_end=%s",
@@ -146,31 +425,44 @@ def run_digest(
             )
             continue
 
-        source_events = build_source_digest_events(events)
-        source_groups = pre_dedupe_source_events(source_events)
-        canonical_digest = synthesize_digest(
-            window=window,
-            source_events=source_events,
-            source_groups=source_groups,
-            settings=settings,
-            llm_client=digest_llm_client,
-        )
-
-        input_hash = input_hash_for_digest_inputs(
-            window=window,
-            source_events=source_events,
-            source_groups=source_groups,
-            top_developments_limit=settings.digest_top_developments_limit,
-            section_bullet_limit=settings.digest_section_bullet_limit,
-            prompt_version=PROMPT_VERSION,
-        )
-        canonical_text = render_canonical_text(canonical_digest)
+        event_ids_key = tuple(event.event_id for event in source_events)
+        prepared = prepared_by_event_ids.get(event_ids_key)
+        if prepared is None:
+            source_groups = pre_dedupe_source_events(source_events)
+            input_hash = input_hash_for_digest_inputs(
+                window=window,
+                source_events=source_events,
+                source_groups=source_groups,
+                top_developments_limit=settings.digest_top_developments_limit,
+                section_bullet_limit=settings.digest_section_bullet_limit,
+                prompt_version=PROMPT_VERSION,
+            )
+            prepared = (source_groups, input_hash)
+            prepared_by_event_ids[event_ids_key] = prepared
+        source_groups, input_hash = prepared
+
+        cached = cache.get(db, input_hash=input_hash, window=window, source_events=source_events)
+        if cached is not None:
+            canonical_digest = cached.digest
+            canonical_text = cached.canonical_text
+        else:
+            canonical_digest = synthesize_digest(
+                window=window,
+                source_events=source_events,
+                source_groups=source_groups,
+                settings=settings,
+                llm_client=digest_llm_client,
+            )
+            canonical_text = render_canonical_text(canonical_digest)
         artifact = get_or_create_artifact(
             db,
             window=window,
             canonical_text=canonical_text,
             input_hash=input_hash,
+            digest=canonical_digest,
         )
+        if cached is None and artifact.canonical_text == canonical_text:
+            cache.put(input_hash, canonical_digest, canonical_text)
 
         # Invariant: persist and commit the canonical artifact before any publish attempt.
         db.commit()
@@ -189,7 +481,18 @@ def run_digest(
             )
             publication_results.append({"destination": destination, "status": "skipped_published"})
             continue
+        existing = get_destination_publication(db, artifact_id=artifact.id, destination=destination)
+        if existing is not None and existing.status in RESERVING_PUBLISH_STATUSES:
+            logger.info(
+                "digest_skip_in_flight artifact_id=%s destination=%s status=%s",
+                artifact.id,
+                destination,
+                existing.status,
+            )
+            publication_results.append({"destination": destination, "status": f"skipped_{existing.status}"})
+            continue
 
+        expected_status = existing.status if existing is not None else "failed"
         row = _upsert_destination_row(
             db,
             artifact_id=artifact.id,
@@ -197,36 +500,40 @@ def run_digest(
             payload=payload,
             payload_hash=payload_hash,
         )
-
-        try:
-            result = adapter.publish(payload)
-            row.status = result.status
-            row.last_error = result.error
-            row.external_ref = result.external_ref
-            row.published_at = datetime.utcnow() if result.status == "published" else None
-            if result.status == "published":
-                _mark_events_published(db, event_ids=event_ids, destination=destination)
-            db.commit()
-            publication_results.append({"destination": destination, "status": result.status})
-            logger.info(
-                "digest_publish_result artifact_id=%s destination=%s status=%s",
-                artifact.id,
-                destination,
-                result.status,
-            )
-        except Exception as exc:  # noqa: BLE001
-            row.status = "failed"
-            row.last_error = str(exc)[:1000]
-            row.external_ref = None
-            row.published_at = None
-            db.commit()
-            publication_results.append({"destination": destination, "status": "failed"})
-            logger.error(
-                "digest_publish_failed artifact_id=%s destination=%s error=%s",
-                artifact.id,
-                destination,
-                row.last_error,
+        db.commit()
+        row_id, sent_refs = row.id, row.sent_chunk_refs
+        claimed_at = datetime.utcnow()
+        if not _claim_row(
+            db, row_id=row_id, expected_status=expected_status, expected_claimed_at=None, claimed_at=claimed_at
+        ):
+            logger.info("digest_skip_claimed_elsewhere artifact_id=%s destination=%s", artifact.id, destination)
+            publication_results.append({"destination": destination, "status": "skipped_in_flight"})
+            continue
+        publication_results.append({"destination": destination, "status": "pending"})
+        pending.append(
+            _PendingPublish(
+                job=PublishJob(
+                    adapter=adapter,
+                    payload=payload,
+                    progress=_chunk_progress(bind, row_id=row_id, sent_refs=sent_refs),
+                ),
+                row_id=row_id,
+                artifact_id=artifact.id,
+                event_ids=event_ids,
+                result_index=len(publication_results) - 1,
+                claimed_at=claimed_at,
             )
+        )
+
+    outcomes = publish_concurrently(
+        [item.job for item in pending],
+        timeout_seconds=settings.digest_publish_timeout_seconds,
+        max_retries=settings.digest_publish_max_retries,
+        retry_backoff_seconds=settings.digest_publish_retry_backoff_seconds,
+    )
+    for item, outcome in zip(pending, outcomes):
+        status = _record_publish_outcome(db, item=item, outcome=outcome)
+        publication_results[item.result_index] = {**publication_results[item.result_index], "status": status}
 
     return {
         "status": "completed",
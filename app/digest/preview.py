@@ -0,0 +1,208 @@
+"""Read-only digest preview.
+
+Builds what `run_digest` would publish with the deterministic builder, without
+persisting an artifact, calling the LLM, or touching publish state. Events and
+clusters come from `RollingDigestState`; results are memoized with a TTL under
+two keys:
+- the window (hours, destination, aligned start/end), so dashboard refreshes
+  inside the TTL skip the database entirely,
+- the digest `input_hash`, so a delta sync that changed nothing skips the
+  build and render.
+
+The window end is aligned down to the minute so consecutive refreshes share a
+window (and therefore an `input_hash`).
+
+The rolling state holds no published flags; they are read from the database
+for the selected events, since `run_digest` and the outbox drainer publish
+from other processes.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Hashable
+
+from sqlalchemy.orm import Session
+
+from ..config import Settings, get_settings
+from .artifact_store import digest_structure_to_json, input_hash_for_digest_inputs
+from .builder import build_deterministic_digest
+from .orchestrator import DIGEST_MIN_IMPACT_EXCLUSIVE
+from .prompt_templates import PROMPT_VERSION
+from .query import DigestWindowSelection, select_published_masks
+from .renderer_text import render_canonical_text
+from .rolling_state import RollingDigestState, get_rolling_digest_state
+from .types import CanonicalDigest, DigestWindow
+
+
+@dataclass(frozen=True)
+class DigestPreview:
+    window: DigestWindow
+    destination: str | None
+    input_hash: str
+    digest: CanonicalDigest
+    canonical_text: str
+    group_count: int
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "window_start_utc": self.window.start_utc.isoformat(),
+            "window_end_utc": self.window.end_utc.isoformat(),
+            "hours": self.window.hours,
+            "destination": self.destination,
+            "input_hash": self.input_hash,
+            "source_event_count": len(self.digest.source_events),
+            "group_count": self.group_count,
+            "covered_event_ids": list(self.digest.covered_event_ids),
+            "digest": digest_structure_to_json(self.digest),
+            "canonical_text": self.canonical_text,
+        }
+
+
+class DigestPreviewCache:
+    """Small TTL + LRU map; entries expire `ttl_seconds` after they were stored."""
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = 60.0,
+        max_entries: int = 64,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max(0, max_entries)
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, DigestPreview]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key: Hashable) -> DigestPreview | None:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            expires_at, preview = item
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return preview
+
+    def put(self, key: Hashable, preview: DigestPreview) -> None:
+        if self._max_entries == 0 or self._ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (self._clock() + self._ttl_seconds, preview)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def preview_window(now_utc: datetime, hours: int) -> DigestWindow:
+    end_utc = now_utc.replace(second=0, microsecond=0)
+    return DigestWindow(start_utc=end_utc - timedelta(hours=hours), end_utc=end_utc, hours=hours)
+
+
+def build_digest_preview(
+    db: Session,
+    *,
+    hours: int,
+    destination: str | None = None,
+    now_utc: datetime | None = None,
+    settings: Settings | None = None,
+    rolling_state: RollingDigestState | None = None,
+    preview_cache: DigestPreviewCache | None = None,
+) -> tuple[DigestPreview, bool]:
+    """Return `(preview, cached)` for the trailing `hours` window.
+
+    With `destination`, only that destination's unpublished events are used,
+    matching what `run_digest` would select for it.
+    """
+
+    current = settings or get_settings()
+    now = now_utc or datetime.utcnow()
+    window = preview_window(now, hours)
+    state = (
+        rolling_state
+        if rolling_state is not None
+        else get_rolling_digest_state(
+            retention_hours=current.digest_rolling_retention_hours,
+            min_impact_exclusive=DIGEST_MIN_IMPACT_EXCLUSIVE,
+        )
+    )
+    cache = preview_cache if preview_cache is not None else get_digest_preview_cache(current)
+
+    window_key = ("window", hours, destination, window.start_utc, window.end_utc)
+    cached = cache.get(window_key)
+    if cached is not None:
+        return cached, True
+
+    state.sync(db, now_utc=now)
+    source_events = state.window_events(window.start_utc, window.end_utc)
+    if destination is not None:
+        masks_by_id = select_published_masks(db, [event.event_id for event in source_events])
+        source_events = DigestWindowSelection(
+            source_events=source_events,
+            published_masks=tuple(masks_by_id.get(event.event_id, 0) for event in source_events),
+        ).unpublished_for(destination)
+    source_groups = state.source_groups(source_events)
+    input_hash = input_hash_for_digest_inputs(
+        window=window,
+        source_events=source_events,
+        source_groups=source_groups,
+        top_developments_limit=current.digest_top_developments_limit,
+        section_bullet_limit=current.digest_section_bullet_limit,
+        prompt_version=PROMPT_VERSION,
+    )
+    input_key = ("input", destination, input_hash)
+    cached = cache.get(input_key)
+    if cached is not None:
+        cache.put(window_key, cached)
+        return cached, True
+
+    digest = build_deterministic_digest(
+        window=window,
+        source_events=source_events,
+        source_groups=source_groups,
+        top_developments_limit=current.digest_top_developments_limit,
+        section_bullet_limit=current.digest_section_bullet_limit,
+    )
+    preview = DigestPreview(
+        window=window,
+        destination=destination,
+        input_hash=input_hash,
+        digest=digest,
+        canonical_text=render_canonical_text(digest),
+        group_count=len(source_groups),
+    )
+    cache.put(window_key, preview)
+    cache.put(input_key, preview)
+    return preview, False
+
+
+_default_cache: DigestPreviewCache | None = None
+_default_cache_lock = threading.Lock()
+
+
+def get_digest_preview_cache(settings: Settings | None = None) -> DigestPreviewCache:
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            current = settings or get_settings()
+            _default_cache = DigestPreviewCache(
+                ttl_seconds=current.digest_preview_cache_ttl_seconds,
+                max_entries=current.digest_preview_cache_size,
+            )
+        return _default_cache
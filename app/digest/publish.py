@@ -0,0 +1,185 @@
+"""Concurrent publish stage for `run_digest`.
+
+Runs after every destination's artifact and `published_posts` row have been
+committed. Each `adapter.publish` call runs on its own worker thread with a
+per-adapter retry budget and deadline, so one slow destination no longer
+delays the others. Recording results stays on the caller's thread because the
+SQLAlchemy session is not thread-safe.
+
+Adapters may override the defaults with `publish_timeout_seconds` and
+`publish_max_retries` attributes. A send is not idempotent, so only
+`PublishNotDelivered(retryable=True)` is retried; any other error may have
+come after the destination accepted the payload and ends the attempt with
+delivery unknown. The deadline cannot interrupt a running call either: the
+outcome is reported as unknown and carries the still-running future so the
+caller can reconcile from its eventual result. A job's `PublishProgress` is
+shared by its attempts, so a retry resumes after the parts already sent.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from typing import Sequence
+
+from .adapters.base import DigestAdapter, PublishNotDelivered, PublishProgress, PublishResult
+
+
+logger = logging.getLogger("civicquant.digest")
+
+
+@dataclass(frozen=True)
+class PublishJob:
+    adapter: DigestAdapter
+    payload: str
+    # Shared by every attempt of this job, so a retry resumes after the parts already sent.
+    progress: PublishProgress | None = None
+
+
+@dataclass(frozen=True)
+class PublishOutcome:
+    result: PublishResult | None
+    error: str | None
+    attempts: int
+    elapsed_ms: int
+    # True when `result` is None but the destination may still have the payload.
+    delivery_unknown: bool = False
+    # Set when the deadline passed with the call still running; resolves to `(result, attempts)`.
+    pending: Future[tuple[PublishResult, int]] | None = None
+
+
+@dataclass(frozen=True)
+class _Budget:
+    timeout_seconds: float
+    max_retries: int
+    retry_backoff_seconds: float
+
+    @property
+    def deadline_seconds(self) -> float:
+        attempts = self.max_retries + 1
+        return self.timeout_seconds * attempts + self.retry_backoff_seconds * self.max_retries
+
+
+def _budget_for(
+    adapter: DigestAdapter,
+    *,
+    timeout_seconds: float,
+    max_retries: int,
+    retry_backoff_seconds: float,
+) -> _Budget:
+    return _Budget(
+        timeout_seconds=float(getattr(adapter, "publish_timeout_seconds", None) or timeout_seconds),
+        max_retries=max(0, int(getattr(adapter, "publish_max_retries", max_retries))),
+        retry_backoff_seconds=retry_backoff_seconds,
+    )
+
+
+def _publish_with_retries(job: PublishJob, budget: _Budget) -> tuple[PublishResult, int]:
+    adapter = job.adapter
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            return adapter.publish(job.payload, progress=job.progress), attempt
+        except PublishNotDelivered as exc:
+            if not exc.retryable or attempt > budget.max_retries:
+                raise
+            logger.warning(
+                "digest_publish_retry destination=%s attempt=%s reason=%s",
+                adapter.destination,
+                attempt,
+                type(exc).__name__,
+            )
+            time.sleep(budget.retry_backoff_seconds * attempt)
+
+
+def publish_concurrently(
+    jobs: Sequence[PublishJob],
+    *,
+    timeout_seconds: float,
+    max_retries: int,
+    retry_backoff_seconds: float,
+) -> list[PublishOutcome]:
+    """Publish every job concurrently; outcomes are returned in job order."""
+
+    if not jobs:
+        return []
+
+    budgets = [
+        _budget_for(
+            job.adapter,
+            timeout_seconds=timeout_seconds,
+            max_retries=max_retries,
+            retry_backoff_seconds=retry_backoff_seconds,
+        )
+        for job in jobs
+    ]
+    executor = ThreadPoolExecutor(max_workers=len(jobs), thread_name_prefix="digest-publish")
+    started = time.monotonic()
+    try:
+        futures: list[Future[tuple[PublishResult, int]]] = [
+            executor.submit(_publish_with_retries, job, budget)
+            for job, budget in zip(jobs, budgets)
+        ]
+        outcomes: list[PublishOutcome] = []
+        for job, budget, future in zip(jobs, budgets, futures):
+            remaining = max(0.0, started + budget.deadline_seconds - time.monotonic())
+            try:
+                result, attempts = future.result(timeout=remaining)
+                outcomes.append(
+                    PublishOutcome(
+                        result=result,
+                        error=None,
+                        attempts=attempts,
+                        elapsed_ms=int((time.monotonic() - started) * 1000),
+                    )
+                )
+            except FutureTimeoutError:
+                if future.cancel():
+                    error = "publish was not started before its deadline"
+                    pending = None
+                else:
+                    error = f"publish still running after {budget.deadline_seconds:.1f}s; delivery unknown"
+                    pending = future
+                outcomes.append(
+                    PublishOutcome(
+                        result=None,
+                        error=error,
+                        attempts=budget.max_retries + 1,
+                        elapsed_ms=int((time.monotonic() - started) * 1000),
+                        delivery_unknown=pending is not None,
+                        pending=pending,
+                    )
+                )
+                logger.error(
+                    "digest_publish_timeout destination=%s deadline_seconds=%s still_running=%s",
+                    job.adapter.destination,
+                    budget.deadline_seconds,
+                    pending is not None,
+                )
+            except PublishNotDelivered as exc:
+                outcomes.append(
+                    PublishOutcome(
+                        result=None,
+                        error=str(exc),
+                        attempts=budget.max_retries + 1 if exc.retryable else 1,
+                        elapsed_ms=int((time.monotonic() - started) * 1000),
+                    )
+                )
+            except Exception as exc:  # noqa: BLE001
+                outcomes.append(
+                    PublishOutcome(
+                        result=None,
+                        error=f"{type(exc).__name__}: {exc}",
+                        attempts=1,
+                        elapsed_ms=int((time.monotonic() - started) * 1000),
+                        delivery_unknown=True,
+                    )
+                )
+        return outcomes
+    finally:
+        # Do not block on a hung adapter; the caller reconciles it through `PublishOutcome.pending`.
+        executor.shutdown(wait=False, cancel_futures=True)
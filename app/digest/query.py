@@ -2,12 +2,22 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 
 from sqlalchemy.orm import Session
 from sqlalchemy import or_
 
 from ..models import Event
+from .builder import build_source_digest_events
+from .types import SourceDigestEvent
+
+
+# Bit per destination in `DigestWindowSelection.published_masks`.
+DESTINATION_PUBLISHED_BITS: dict[str, int] = {
+    "vip_telegram": 0b01,
+    "x": 0b10,
+}
 
 
 def _destination_unpublished_filter(destination: str):
@@ -47,3 +57,95 @@ def get_events_for_digest_hours(
     end_utc = (now_utc or datetime.utcnow()).replace(microsecond=0)
     start_utc = end_utc - timedelta(hours=hours)
     return get_events_for_window(db, window_start_utc=start_utc, window_end_utc=end_utc)
+
+
+@dataclass(frozen=True)
+class DigestWindowSelection:
+    """All digest-eligible events in a window, loaded once per run.
+
+    `published_masks[i]` holds `DESTINATION_PUBLISHED_BITS` flags for
+    `source_events[i]`, so per-destination "unpublished" filtering happens in
+    memory instead of one query per adapter.
+    """
+
+    source_events: tuple[SourceDigestEvent, ...]
+    published_masks: tuple[int, ...]
+
+    def unpublished_for(self, destination: str) -> tuple[SourceDigestEvent, ...]:
+        bit = DESTINATION_PUBLISHED_BITS.get(destination)
+        if bit is None:
+            return self.source_events
+        return tuple(
+            event
+            for event, mask in zip(self.source_events, self.published_masks)
+            if not mask & bit
+        )
+
+
+def _window_columns() -> tuple:
+    return (
+        Event.id,
+        Event.topic,
+        Event.summary_1_sentence,
+        Event.impact_score,
+        Event.last_updated_at,
+        Event.event_fingerprint,
+        Event.claim_hash,
+        Event.is_published_telegram,
+        Event.is_published_twitter,
+    )
+
+
+def published_mask_for_row(row) -> int:
+    return (
+        (DESTINATION_PUBLISHED_BITS["vip_telegram"] if row.is_published_telegram else 0)
+        | (DESTINATION_PUBLISHED_BITS["x"] if row.is_published_twitter else 0)
+    )
+
+
+def select_digest_window(
+    db: Session,
+    window_start_utc: datetime,
+    window_end_utc: datetime,
+    *,
+    min_impact_exclusive: float | None = None,
+) -> DigestWindowSelection:
+    """Single column-only window query covering every destination."""
+
+    q = db.query(*_window_columns()).filter(
+        Event.last_updated_at >= window_start_utc,
+        Event.last_updated_at < window_end_utc,
+    )
+    if min_impact_exclusive is not None:
+        q = q.filter(Event.impact_score.isnot(None), Event.impact_score > min_impact_exclusive)
+
+    rows = q.all()
+    masks_by_id = {row.id: published_mask_for_row(row) for row in rows}
+    source_events = build_source_digest_events(rows)
+    return DigestWindowSelection(
+        source_events=source_events,
+        published_masks=tuple(masks_by_id[event.event_id] for event in source_events),
+    )
+
+
+def select_published_masks(db: Session, event_ids: list[int]) -> dict[int, int]:
+    """Current `DESTINATION_PUBLISHED_BITS` flags for `event_ids` (primary-key lookup)."""
+
+    if not event_ids:
+        return {}
+    rows = (
+        db.query(Event.id, Event.is_published_telegram, Event.is_published_twitter)
+        .filter(Event.id.in_(event_ids))
+        .all()
+    )
+    return {row.id: published_mask_for_row(row) for row in rows}
+
+
+def select_events_updated_since(db: Session, updated_since_utc: datetime) -> tuple[SourceDigestEvent, ...]:
+    """Delta read for incremental digest state: every event touched since a watermark.
+
+    No impact filter, so callers also see events that dropped below a threshold.
+    """
+
+    rows = db.query(*_window_columns()).filter(Event.last_updated_at >= updated_since_utc).all()
+    return build_source_digest_events(rows)
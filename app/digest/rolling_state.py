@@ -0,0 +1,273 @@
+"""Incrementally maintained digest window state.
+
+`pre_dedupe_source_events` re-derives identity keys (including the regex
+summary normalization) and rebuilds union-find clusters for the whole window
+on every call. `RollingDigestState` keeps the last `retention` hours of
+digest-eligible events in memory together with:
+- each event's identity keys (computed once per event version),
+- a `(topic_label, key) -> event ids` index,
+- the connected components ("clusters") over that index.
+
+Inserting an event merges the clusters it touches; removing or changing one
+re-splits only the cluster it belonged to. Grouping any subset of the state
+(a trailing N-hour window, one destination's unpublished events) restricts
+the maintained clusters to the subset and re-splits only the clusters that
+lost members, so the result is identical to `pre_dedupe_source_events` on
+that subset.
+
+The state is refreshed by `sync`, a delta read on `events.last_updated_at`:
+`upsert_event` stamps `last_updated_at` on every create and material update,
+so rows touched by phase2 in any process are picked up on the next sync.
+Publishing does not touch `last_updated_at` (it would move events into later
+windows), so the state holds no published flags; callers read them from the
+database for the events they select.
+
+Only a long-lived process gains from the incremental path, i.e. the API
+serving `/admin/digest/preview`. `run_digest` runs as a one-shot job and
+calls `pre_dedupe_source_events` directly.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Iterable, Sequence
+
+from sqlalchemy.orm import Session
+
+from .builder import event_identity_keys, merge_event_cluster, pre_dedupe_source_events, sort_source_groups
+from .query import select_events_updated_since
+from .types import SourceDigestEvent, SourceEventGroup
+
+
+logger = logging.getLogger("civicquant.digest")
+
+
+@dataclass(frozen=True)
+class _Entry:
+    event: SourceDigestEvent
+    keys: tuple[str, ...]
+
+
+class RollingDigestState:
+    def __init__(
+        self,
+        *,
+        retention: timedelta = timedelta(hours=24),
+        min_impact_exclusive: float | None = None,
+        sync_overlap: timedelta = timedelta(minutes=5),
+    ) -> None:
+        self._retention = retention
+        self._sync_overlap = sync_overlap
+        self._min_impact_exclusive = min_impact_exclusive
+        self._lock = threading.RLock()
+        self._entries: dict[int, _Entry] = {}
+        self._key_members: dict[tuple[str, str], set[int]] = {}
+        self._cluster_of: dict[int, int] = {}
+        self._clusters: dict[int, set[int]] = {}
+        self._cluster_ids = itertools.count()
+        self._watermark: datetime | None = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def watermark(self) -> datetime | None:
+        return self._watermark
+
+    def cluster_count(self) -> int:
+        with self._lock:
+            return len(self._clusters)
+
+    def _eligible(self, event: SourceDigestEvent) -> bool:
+        if self._min_impact_exclusive is None:
+            return True
+        return event.impact_score is not None and event.impact_score > self._min_impact_exclusive
+
+    def apply(self, event: SourceDigestEvent) -> bool:
+        """Insert or refresh one event. Returns True when the state changed."""
+
+        with self._lock:
+            if not self._eligible(event):
+                return self.discard(event.event_id)
+            current = self._entries.get(event.event_id)
+            if current is not None:
+                if current.event == event:
+                    return False
+                self.discard(event.event_id)
+            self._insert(_Entry(event, event_identity_keys(event)))
+            return True
+
+    def discard(self, event_id: int) -> bool:
+        with self._lock:
+            entry = self._entries.pop(event_id, None)
+            if entry is None:
+                return False
+            for key in entry.keys:
+                index_key = (entry.event.topic_label, key)
+                members = self._key_members.get(index_key)
+                if members is not None:
+                    members.discard(event_id)
+                    if not members:
+                        del self._key_members[index_key]
+            cluster_id = self._cluster_of.pop(event_id)
+            remaining = self._clusters.pop(cluster_id)
+            remaining.discard(event_id)
+            for component in self._components(remaining):
+                self._new_cluster(component)
+            return True
+
+    def expire(self, cutoff_utc: datetime) -> int:
+        """Drop events last updated before `cutoff_utc`."""
+
+        with self._lock:
+            expired = [
+                event_id
+                for event_id, entry in self._entries.items()
+                if entry.event.last_updated_at < cutoff_utc
+            ]
+            for event_id in expired:
+                self.discard(event_id)
+            return len(expired)
+
+    def sync(self, db: Session, *, now_utc: datetime | None = None) -> int:
+        """Expire old events and apply every event touched since the last sync."""
+
+        now = now_utc or datetime.utcnow()
+        cutoff = now - self._retention
+        with self._lock:
+            expired = self.expire(cutoff)
+            # Re-read an overlap behind the watermark: phase2 stamps last_updated_at
+            # before its batch commits, so rows can become visible "in the past".
+            since = cutoff if self._watermark is None else max(cutoff, self._watermark - self._sync_overlap)
+            source_events = select_events_updated_since(db, since)
+            changed = 0
+            for event in source_events:
+                if self.apply(event):
+                    changed += 1
+                if self._watermark is None or event.last_updated_at > self._watermark:
+                    self._watermark = event.last_updated_at
+            if self._watermark is None:
+                self._watermark = cutoff
+            logger.info(
+                "digest_rolling_sync read=%s changed=%s expired=%s size=%s clusters=%s",
+                len(source_events),
+                changed,
+                expired,
+                len(self._entries),
+                len(self._clusters),
+            )
+            return changed
+
+    def window_events(self, window_start_utc: datetime, window_end_utc: datetime) -> tuple[SourceDigestEvent, ...]:
+        """In-memory equivalent of `select_digest_window(...).source_events` over the retained events."""
+
+        with self._lock:
+            events = sorted(
+                (
+                    entry.event
+                    for entry in self._entries.values()
+                    if window_start_utc <= entry.event.last_updated_at < window_end_utc
+                ),
+                key=lambda event: (-event.last_updated_at.timestamp(), event.event_id),
+            )
+        return tuple(events)
+
+    def source_groups(self, source_events: Sequence[SourceDigestEvent]) -> tuple[SourceEventGroup, ...]:
+        """Same result as `pre_dedupe_source_events(source_events)`, from maintained clusters.
+
+        Events that are missing or older in the state are applied first, so
+        callers may pass rows read straight from the database. A passed row
+        older than the stored version (read before a later `sync`) does not
+        replace it.
+        """
+
+        with self._lock:
+            for event in source_events:
+                current = self._entries.get(event.event_id)
+                if current is None or (
+                    current.event != event and event.last_updated_at >= current.event.last_updated_at
+                ):
+                    self.apply(event)
+
+            if any(event.event_id not in self._entries for event in source_events):
+                # Below the state's impact threshold, so not indexed here.
+                return pre_dedupe_source_events(source_events)
+
+            subset_by_cluster: dict[int, set[int]] = {}
+            for event in source_events:
+                subset_by_cluster.setdefault(self._cluster_of[event.event_id], set()).add(event.event_id)
+
+            groups: list[SourceEventGroup] = []
+            for cluster_id, subset in subset_by_cluster.items():
+                if len(subset) == len(self._clusters[cluster_id]):
+                    components: Iterable[set[int]] = (subset,)
+                else:
+                    components = self._components(subset)
+                for component in components:
+                    # Members in event_id order, as `_cluster_topic_events` hands them over.
+                    members = [self._entries[event_id].event for event_id in sorted(component)]
+                    groups.append(merge_event_cluster(members))
+        return sort_source_groups(groups)
+
+    def _insert(self, entry: _Entry) -> None:
+        event_id = entry.event.event_id
+        self._entries[event_id] = entry
+        merged: set[int] = {event_id}
+        for key in entry.keys:
+            members = self._key_members.setdefault((entry.event.topic_label, key), set())
+            for member in members:
+                cluster_id = self._cluster_of.get(member)
+                if cluster_id is not None and cluster_id in self._clusters:
+                    merged |= self._clusters.pop(cluster_id)
+            members.add(event_id)
+        self._new_cluster(merged)
+
+    def _new_cluster(self, members: set[int]) -> None:
+        cluster_id = next(self._cluster_ids)
+        self._clusters[cluster_id] = members
+        for member in members:
+            self._cluster_of[member] = cluster_id
+
+    def _components(self, event_ids: set[int]) -> list[set[int]]:
+        """Connected components of `event_ids` through the shared-key index."""
+
+        components: list[set[int]] = []
+        unvisited = set(event_ids)
+        while unvisited:
+            start = unvisited.pop()
+            component = {start}
+            stack = [start]
+            while stack:
+                entry = self._entries[stack.pop()]
+                for key in entry.keys:
+                    for neighbour in self._key_members.get((entry.event.topic_label, key), ()):
+                        if neighbour in unvisited:
+                            unvisited.discard(neighbour)
+                            component.add(neighbour)
+                            stack.append(neighbour)
+            components.append(component)
+        return components
+
+
+_default_state: RollingDigestState | None = None
+_default_state_lock = threading.Lock()
+
+
+def get_rolling_digest_state(
+    *,
+    retention_hours: int,
+    min_impact_exclusive: float | None,
+) -> RollingDigestState:
+    global _default_state
+    with _default_state_lock:
+        if _default_state is None:
+            _default_state = RollingDigestState(
+                retention=timedelta(hours=retention_hours),
+                min_impact_exclusive=min_impact_exclusive,
+            )
+        return _default_state
@@ -0,0 +1,109 @@
+"""Synthesis result reuse keyed by digest `input_hash`.
+
+`input_hash` already identifies the deterministic digest inputs (window,
+selected source events, pre-dedupe groups, limits, prompt version). When a
+rerun or a second destination produces the same hash, the canonical digest is
+taken from:
+1. a process-local LRU, then
+2. `digest_artifacts.digest_json` for the persisted artifact with that hash,
+and both the deterministic build and the LLM call are skipped.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Sequence
+
+from sqlalchemy.orm import Session
+
+from .artifact_store import digest_from_structure_json, find_artifact_by_input_hash
+from .renderer_text import render_canonical_text
+from .types import CanonicalDigest, DigestWindow, SourceDigestEvent
+
+
+logger = logging.getLogger("civicquant.digest")
+
+
+@dataclass(frozen=True)
+class CachedDigest:
+    digest: CanonicalDigest
+    canonical_text: str
+
+
+class DigestSynthesisCache:
+    def __init__(self, max_entries: int = 128) -> None:
+        self._max_entries = max(0, max_entries)
+        self._entries: OrderedDict[str, CachedDigest] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def put(self, input_hash: str, digest: CanonicalDigest, canonical_text: str) -> None:
+        if self._max_entries == 0:
+            return
+        with self._lock:
+            self._entries[input_hash] = CachedDigest(digest=digest, canonical_text=canonical_text)
+            self._entries.move_to_end(input_hash)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def _get_local(self, input_hash: str) -> CachedDigest | None:
+        with self._lock:
+            cached = self._entries.get(input_hash)
+            if cached is not None:
+                self._entries.move_to_end(input_hash)
+            return cached
+
+    def get(
+        self,
+        db: Session,
+        *,
+        input_hash: str,
+        window: DigestWindow,
+        source_events: Sequence[SourceDigestEvent],
+    ) -> CachedDigest | None:
+        cached = self._get_local(input_hash)
+        if cached is not None:
+            logger.info("digest_synthesis_cache_hit source=memory input_hash=%s", input_hash)
+            return cached
+
+        artifact = find_artifact_by_input_hash(db, input_hash=input_hash)
+        payload = getattr(artifact, "digest_json", None) if artifact is not None else None
+        if not isinstance(payload, dict):
+            return None
+        try:
+            digest = digest_from_structure_json(payload, window=window, source_events=source_events)
+        except (KeyError, TypeError, ValueError) as exc:
+            logger.warning(
+                "digest_synthesis_cache_invalid artifact_id=%s reason=%s", artifact.id, type(exc).__name__
+            )
+            return None
+
+        canonical_text = render_canonical_text(digest)
+        if canonical_text != artifact.canonical_text:
+            # Stored structure no longer renders to the stored text (renderer change); resynthesize.
+            return None
+        logger.info("digest_synthesis_cache_hit source=artifact input_hash=%s artifact_id=%s", input_hash, artifact.id)
+        self.put(input_hash, digest, canonical_text)
+        return CachedDigest(digest=digest, canonical_text=canonical_text)
+
+
+_default_cache: DigestSynthesisCache | None = None
+_default_cache_lock = threading.Lock()
+
+
+def get_digest_synthesis_cache(max_entries: int) -> DigestSynthesisCache:
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = DigestSynthesisCache(max_entries=max_entries)
+        return _default_cache
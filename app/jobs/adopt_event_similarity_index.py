@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import logging
+
+from dotenv import load_dotenv
+
+from ..contexts.events.similarity_index import rebuild_similarity_index
+from ..db import SessionLocal, engine, init_db
+from ..schema_capabilities import get_schema_capabilities
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger("civicquant.similarity_index")
+
+
+def main() -> None:
+    load_dotenv()
+
+    init_db()
+    missing = get_schema_capabilities(engine).missing_tables(
+        ("event_similarity_signatures", "event_similarity_bands")
+    )
+    if missing:
+        raise RuntimeError(f"event similarity index adoption incomplete; missing tables: {','.join(missing)}")
+    with SessionLocal() as db:
+        signatures = rebuild_similarity_index(db)
+        db.commit()
+    logger.info("event_similarity_index_adoption_complete signatures=%s", signatures)
+
+
+if __name__ == "__main__":
+    main()
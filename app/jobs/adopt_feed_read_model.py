@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import logging
+
+from dotenv import load_dotenv
+
+from ..contexts.feed.read_model import rebuild_feed_events
+from ..db import SessionLocal, engine, init_db
+from ..schema_capabilities import get_schema_capabilities
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger("civicquant.feed_read_model")
+
+
+def main() -> None:
+    load_dotenv()
+
+    init_db()
+    missing = get_schema_capabilities(engine).missing_tables(("feed_events",))
+    if missing:
+        raise RuntimeError("feed read model adoption incomplete; missing table: feed_events")
+    with SessionLocal() as db:
+        rows = rebuild_feed_events(db)
+        db.commit()
+    logger.info("feed_read_model_adoption_complete rows=%s", rows)
+
+
+if __name__ == "__main__":
+    main()
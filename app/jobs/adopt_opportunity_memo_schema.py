@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import argparse
 import logging
 
 from dotenv import load_dotenv
-from sqlalchemy import inspect
+from sqlalchemy import text
 
-from ..db import engine, init_db
+from ..contexts.opportunity_memo.topic_mapping import TOPIC_MAPPING_VERSION
+from ..contexts.opportunity_memo.topic_store import refresh_event_opportunity_topics
+from ..db import SessionLocal, engine, init_db
+from ..schema_capabilities import get_schema_capabilities, invalidate_schema_capabilities
 
 
 logging.basicConfig(level=logging.INFO)
@@ -18,21 +22,69 @@ EXPECTED_TABLES = (
     "opportunity_memo_input_events",
     "opportunity_memo_external_sources",
     "opportunity_memo_deliveries",
+    "event_opportunity_topics",
+    "opportunity_research_cache_entries",
+    "opportunity_research_cache_sources",
 )
 
 
-def main() -> None:
+def _ensure_stage_timings_column() -> None:
+    if get_schema_capabilities(engine).has_column("opportunity_memo_runs", "stage_timings_json"):
+        return
+    column_type = "JSONB" if engine.dialect.name == "postgresql" else "JSON"
+    with engine.begin() as conn:
+        conn.execute(text(f"ALTER TABLE opportunity_memo_runs ADD COLUMN stage_timings_json {column_type}"))
+    invalidate_schema_capabilities(engine)
+    logger.info("added opportunity_memo_runs.stage_timings_json")
+
+
+def _ensure_delivery_run_column() -> None:
+    if get_schema_capabilities(engine).has_column("opportunity_memo_deliveries", "run_id"):
+        return
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "ALTER TABLE opportunity_memo_deliveries ADD COLUMN run_id INTEGER "
+                "REFERENCES opportunity_memo_runs(id) ON DELETE SET NULL"
+            )
+        )
+        conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_opportunity_memo_deliveries_run_id "
+                "ON opportunity_memo_deliveries (run_id)"
+            )
+        )
+    invalidate_schema_capabilities(engine)
+    logger.info("added opportunity_memo_deliveries.run_id")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Adopt opportunity memo tables and refresh persisted topic mappings.")
+    parser.add_argument(
+        "--recompute-topics",
+        action="store_true",
+        help="Recompute every persisted event topic mapping, not only missing or stale ones.",
+    )
+    args = parser.parse_args(argv)
     load_dotenv()
 
     init_db()
-    inspector = inspect(engine)
-    existing = set(inspector.get_table_names())
-    missing = sorted(set(EXPECTED_TABLES) - existing)
+    _ensure_stage_timings_column()
+    _ensure_delivery_run_column()
+    missing = get_schema_capabilities(engine).missing_tables(EXPECTED_TABLES)
     if missing:
         raise RuntimeError(
             f"opportunity memo schema adoption incomplete; missing tables: {','.join(missing)}"
         )
-    logger.info("opportunity_memo_schema_adoption_complete tables=%s", ",".join(EXPECTED_TABLES))
+    with SessionLocal() as db:
+        refreshed = refresh_event_opportunity_topics(db, force=args.recompute_topics)
+        db.commit()
+    logger.info(
+        "opportunity_memo_schema_adoption_complete tables=%s mapping_version=%s mappings_refreshed=%s",
+        ",".join(EXPECTED_TABLES),
+        TOPIC_MAPPING_VERSION,
+        refreshed,
+    )
 
 
 if __name__ == "__main__":
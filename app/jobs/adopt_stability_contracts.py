@@ -5,18 +5,22 @@ import hashlib
 import logging
 
 from dotenv import load_dotenv
-from sqlalchemy import func, inspect, text
+from sqlalchemy import func, text
 
 from ..models import (
     EnrichmentCandidate,
     Event,
     EventMessage,
+    EventOpportunityTopic,
     Extraction,
     PublishedPost,
     RawMessage,
     RoutingDecision,
 )
 from ..db import SessionLocal, engine
+from ..schema_capabilities import get_schema_capabilities, invalidate_schema_capabilities
+from ..contexts.events.topic_rollups import apply_event_rollup, event_rollup_contribution
+from ..contexts.feed.read_model import remove_feed_event, sync_feed_event
 from ..contexts.extraction.canonicalization import (
     CANONICALIZER_VERSION,
     canonicalize_extraction,
@@ -57,14 +61,13 @@ def _build_replay_identity_key(
 
 
 def _ensure_columns(*, apply_changes: bool = True) -> bool:
-    insp = inspect(engine)
+    capabilities = get_schema_capabilities(engine)
     dialect = engine.dialect.name
     missing: list[str] = []
 
     def add_column_if_missing(table: str, column: str, spec: str) -> None:
         nonlocal missing
-        cols = {c["name"] for c in insp.get_columns(table)}
-        if column in cols:
+        if capabilities.has_column(table, column):
             return
         missing.append(f"{table}.{column}")
         if not apply_changes:
@@ -95,6 +98,10 @@ def _ensure_columns(*, apply_changes: bool = True) -> bool:
         add_column_if_missing("extractions", name, spec)
     for name, spec in event_cols.items():
         add_column_if_missing("events", name, spec)
+    if capabilities.has_table("digest_artifacts"):
+        add_column_if_missing("digest_artifacts", "digest_json", "JSON")
+    if missing and apply_changes:
+        invalidate_schema_capabilities(engine)
 
     # Index creation is non-destructive and idempotent.
     index_sql = [
@@ -281,8 +288,14 @@ def _merge_exact_duplicate_groups(exact_groups: list[list[Event]], *, commit: bo
 
                 db.query(PublishedPost).filter_by(event_id=duplicate.id).update({"event_id": survivor.id})
                 db.query(EnrichmentCandidate).filter_by(event_id=duplicate.id).delete()
+                remove_feed_event(db, duplicate.id)
+                db.query(EventOpportunityTopic).filter_by(event_id=duplicate.id).delete()
+                rollup_before = event_rollup_contribution(duplicate)
                 db.delete(duplicate)
+                apply_event_rollup(db, before=rollup_before, after=None)
 
+            db.flush()
+            sync_feed_event(db, survivor)
             merged_groups += 1
         if commit:
             db.commit()
@@ -3,9 +3,11 @@ from __future__ import annotations
 import logging
 
 from dotenv import load_dotenv
-from sqlalchemy import inspect, text
+from sqlalchemy import text
 
-from ..db import Base, engine
+from ..db import Base, SessionLocal, engine
+from ..models import Event, EventRelation, EventTag
+from ..schema_capabilities import get_schema_capabilities, invalidate_schema_capabilities
 
 
 logging.basicConfig(level=logging.INFO)
@@ -20,9 +22,7 @@ EXPECTED_TABLES = (
 
 
 def _ensure_enrichment_route_column() -> None:
-    inspector = inspect(engine)
-    columns = {column["name"] for column in inspector.get_columns("enrichment_candidates")}
-    if "enrichment_route" in columns:
+    if get_schema_capabilities(engine).has_column("enrichment_candidates", "enrichment_route"):
         return
     with engine.begin() as conn:
         conn.execute(
@@ -37,19 +37,96 @@ def _ensure_enrichment_route_column() -> None:
                 "ON enrichment_candidates(enrichment_route, selected, scored_at)"
             )
         )
+    invalidate_schema_capabilities(engine)
     logger.info("added enrichment_candidates.enrichment_route")
 
 
+_LOOKUP_COLUMNS = {
+    "event_tags": {
+        "tag_value_norm": "VARCHAR(255)",
+        "event_time": "TIMESTAMP",
+        "impact_score": "FLOAT",
+    },
+    "event_relations": {
+        "subject_value_norm": "VARCHAR(255)",
+        "object_value_norm": "VARCHAR(255)",
+        "event_time": "TIMESTAMP",
+        "impact_score": "FLOAT",
+    },
+}
+
+_LOOKUP_INDEX_SQL = (
+    "CREATE INDEX IF NOT EXISTS ix_event_tags_lookup_cover "
+    "ON event_tags(tag_type, tag_value_norm, event_time, impact_score, event_id)",
+    "CREATE INDEX IF NOT EXISTS ix_event_relations_type_time_cover "
+    "ON event_relations(relation_type, event_time, impact_score, event_id)",
+    "CREATE INDEX IF NOT EXISTS ix_event_relations_subject_norm_cover "
+    "ON event_relations(relation_type, subject_type, subject_value_norm, event_time, impact_score, event_id)",
+    "CREATE INDEX IF NOT EXISTS ix_event_relations_object_norm_cover "
+    "ON event_relations(relation_type, object_type, object_value_norm, event_time, impact_score, event_id)",
+)
+
+
+def _ensure_structured_lookup_columns() -> None:
+    capabilities = get_schema_capabilities(engine)
+    added: list[str] = []
+    with engine.begin() as conn:
+        for table, columns in _LOOKUP_COLUMNS.items():
+            for column, spec in columns.items():
+                if capabilities.has_column(table, column):
+                    continue
+                conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {spec}"))
+                added.append(f"{table}.{column}")
+    if added:
+        invalidate_schema_capabilities(engine)
+        logger.info("added structured lookup columns %s", ",".join(added))
+
+
+def _backfill_structured_lookup_columns(batch_size: int = 1000) -> int:
+    """Fill lowercase lookup values and event time/impact copies on rows written before adoption."""
+
+    updated = 0
+    with SessionLocal() as db:
+        for model in (EventTag, EventRelation):
+            norm_column = model.tag_value_norm if model is EventTag else model.subject_value_norm
+            while True:
+                rows = (
+                    db.query(model, Event.event_time, Event.impact_score)
+                    .outerjoin(Event, Event.id == model.event_id)
+                    .filter(norm_column.is_(None))
+                    .limit(batch_size)
+                    .all()
+                )
+                if not rows:
+                    break
+                for row, event_time, impact_score in rows:
+                    if model is EventTag:
+                        row.tag_value_norm = row.tag_value.lower()
+                    else:
+                        row.subject_value_norm = row.subject_value.lower()
+                        row.object_value_norm = row.object_value.lower()
+                    row.event_time = event_time
+                    row.impact_score = impact_score
+                db.commit()
+                updated += len(rows)
+    return updated
+
+
 def main() -> None:
     load_dotenv()
 
     # Non-destructive adoption of additive structured-event tables/indexes.
     Base.metadata.create_all(bind=engine)
+    invalidate_schema_capabilities(engine)
     _ensure_enrichment_route_column()
+    _ensure_structured_lookup_columns()
+    backfilled = _backfill_structured_lookup_columns()
+    with engine.begin() as conn:
+        for stmt in _LOOKUP_INDEX_SQL:
+            conn.execute(text(stmt))
+    logger.info("structured_lookup_backfill rows=%s", backfilled)
 
-    inspector = inspect(engine)
-    existing = set(inspector.get_table_names())
-    missing = sorted(set(EXPECTED_TABLES) - existing)
+    missing = get_schema_capabilities(engine).missing_tables(EXPECTED_TABLES)
     if missing:
         raise RuntimeError(
             f"structured event schema adoption incomplete; missing tables: {','.join(missing)}"
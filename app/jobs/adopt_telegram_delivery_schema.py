@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import logging
+
+from dotenv import load_dotenv
+from sqlalchemy import text
+
+from ..db import engine, init_db
+from ..schema_capabilities import get_schema_capabilities, invalidate_schema_capabilities
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger("civicquant.telegram_delivery_schema")
+
+
+DELIVERY_TABLES = ("published_posts", "opportunity_memo_deliveries")
+
+
+def _delivery_columns() -> dict[str, str]:
+    json_type = "JSONB" if engine.dialect.name == "postgresql" else "JSON"
+    return {"sent_chunk_refs": json_type, "claimed_at": "TIMESTAMP"}
+
+
+def _ensure_delivery_columns() -> list[str]:
+    capabilities = get_schema_capabilities(engine)
+    added: list[str] = []
+    for table in DELIVERY_TABLES:
+        if not capabilities.has_table(table):
+            continue
+        for column, spec in _delivery_columns().items():
+            if capabilities.has_column(table, column):
+                continue
+            with engine.begin() as conn:
+                conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {spec}"))
+            added.append(f"{table}.{column}")
+            logger.info("added column %s.%s", table, column)
+    if added:
+        invalidate_schema_capabilities(engine)
+    return added
+
+
+def main() -> None:
+    load_dotenv()
+    init_db()
+    added = _ensure_delivery_columns()
+    logger.info("telegram_delivery_schema_adoption_complete added=%s", ",".join(added) or "none")
+
+
+if __name__ == "__main__":
+    main()
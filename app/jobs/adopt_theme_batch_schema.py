@@ -3,9 +3,8 @@ from __future__ import annotations
 import logging
 
 from dotenv import load_dotenv
-from sqlalchemy import inspect
-
 from ..db import Base, engine
+from ..schema_capabilities import get_schema_capabilities, invalidate_schema_capabilities
 
 
 logging.basicConfig(level=logging.INFO)
@@ -26,9 +25,8 @@ def main() -> None:
 
     # Non-destructive schema adoption: creates missing additive theme tables/indexes.
     Base.metadata.create_all(bind=engine)
-    inspector = inspect(engine)
-    existing = set(inspector.get_table_names())
-    missing = sorted(set(EXPECTED_TABLES) - existing)
+    invalidate_schema_capabilities(engine)
+    missing = get_schema_capabilities(engine).missing_tables(EXPECTED_TABLES)
     if missing:
         raise RuntimeError(
             f"theme schema adoption incomplete; missing tables: {','.join(missing)}"
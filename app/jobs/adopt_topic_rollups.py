@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import logging
+
+from dotenv import load_dotenv
+
+from ..contexts.events.topic_rollups import rebuild_topic_rollups
+from ..db import SessionLocal, engine, init_db
+from ..schema_capabilities import get_schema_capabilities
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger("civicquant.topic_rollups")
+
+
+def main() -> None:
+    load_dotenv()
+
+    init_db()
+    missing = get_schema_capabilities(engine).missing_tables(("topic_hourly_rollups",))
+    if missing:
+        raise RuntimeError("topic rollup adoption incomplete; missing table: topic_hourly_rollups")
+    with SessionLocal() as db:
+        buckets = rebuild_topic_rollups(db)
+        db.commit()
+    logger.info("topic_rollups_adoption_complete buckets=%s", buckets)
+
+
+if __name__ == "__main__":
+    main()
@@ -12,7 +12,7 @@ from ..config import get_settings
 from ..db import SessionLocal, init_db
 from ..schemas import TelegramIngestPayload
 from ..contexts.ingest.ingest_pipeline import process_ingest_payload
-from ..contexts.ingest.normalization import normalize_message_text
+from ..contexts.ingest.normalization import NormalizationStats, normalize_many
 
 
 logging.basicConfig(level=logging.INFO)
@@ -55,9 +55,14 @@ async def _run_backfill(limit: int, source_channel: str, api_id: int, api_hash:
         created = 0
         duplicate = 0
         failed = 0
+        normalization_stats = NormalizationStats()
+        normalized_texts = normalize_many(
+            (message.message or "" for message in recent_ordered),
+            stats=normalization_stats,
+        )
 
         with SessionLocal() as db:
-            for message in recent_ordered:
+            for message, normalized in zip(recent_ordered, normalized_texts):
                 dt = message.date
                 if dt is None:
                     failed += 1
@@ -80,7 +85,6 @@ async def _run_backfill(limit: int, source_channel: str, api_id: int, api_hash:
                     raw_entities_if_available=None,
                     forwarded_from_if_available=forwarded_from,
                 )
-                normalized = normalize_message_text(payload.raw_text)
 
                 try:
                     result = process_ingest_payload(db=db, payload=payload, normalized_text=normalized)
@@ -112,6 +116,10 @@ async def _run_backfill(limit: int, source_channel: str, api_id: int, api_hash:
             duplicate,
             failed,
         )
+        logger.info(
+            "backfill_normalization %s",
+            " ".join(f"{key}={value}" for key, value in normalization_stats.as_log_fields().items()),
+        )
     finally:
         await client.disconnect()
 
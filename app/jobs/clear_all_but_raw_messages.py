@@ -20,6 +20,8 @@ TABLES_TO_CLEAR_IN_ORDER = [
     "opportunity_memo_input_events",
     "opportunity_memo_artifacts",
     "opportunity_memo_runs",
+    "opportunity_research_cache_sources",
+    "opportunity_research_cache_entries",
     "thesis_cards",
     "theme_opportunity_assessments",
     "theme_brief_artifacts",
@@ -27,6 +29,12 @@ TABLES_TO_CLEAR_IN_ORDER = [
     "theme_runs",
     "published_posts",
     "digest_artifacts",
+    "feed_events",
+    "feed_state",
+    "topic_hourly_rollups",
+    "event_similarity_bands",
+    "event_similarity_signatures",
+    "event_opportunity_topics",
     "events",
     "routing_decisions",
     "extractions",
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import logging
+
+from ..config import get_settings
+from ..db import SessionLocal, init_db
+from ..workflows.telegram_outbox import drain_telegram_outbox
+
+
+logging.basicConfig(level=logging.INFO)
+
+
+def main() -> None:
+    settings = get_settings()
+    init_db()
+    with SessionLocal() as db:
+        while drain_telegram_outbox(db, settings).processed:
+            pass
+
+
+if __name__ == "__main__":
+    main()
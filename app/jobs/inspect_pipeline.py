@@ -1,47 +1,13 @@
 from __future__ import annotations
 
 import argparse
-import json
-from datetime import datetime
-from typing import Any
 
 from dotenv import load_dotenv
 from sqlalchemy import select
 
 from ..db import SessionLocal, init_db
 from ..models import Event, EventMessage, Extraction, MessageProcessingState, RawMessage, RoutingDecision
-
-
-def _fmt(value: Any, max_len: int = 120) -> str:
-    if value is None:
-        return "-"
-    if isinstance(value, datetime):
-        return value.isoformat(timespec="seconds")
-    if isinstance(value, (list, dict)):
-        text = json.dumps(value, ensure_ascii=True)
-    else:
-        text = str(value)
-    if len(text) > max_len:
-        return f"{text[: max_len - 3]}..."
-    return text
-
-
-def _print_table(headers: list[str], rows: list[list[Any]]) -> None:
-    if not rows:
-        print("No rows found.")
-        return
-
-    widths = [len(h) for h in headers]
-    for row in rows:
-        for i, value in enumerate(row):
-            widths[i] = max(widths[i], len(_fmt(value)))
-
-    header_line = " | ".join(h.ljust(widths[i]) for i, h in enumerate(headers))
-    divider_line = "-+-".join("-" * widths[i] for i in range(len(headers)))
-    print(header_line)
-    print(divider_line)
-    for row in rows:
-        print(" | ".join(_fmt(value).ljust(widths[i]) for i, value in enumerate(row)))
+from .table_output import fmt, print_table
 
 
 def _recent_overview(limit: int) -> None:
@@ -91,7 +57,7 @@ def _recent_overview(limit: int) -> None:
             .limit(limit)
         )
         rows = [list(row) for row in db.execute(stmt).all()]
-        _print_table(headers, rows)
+        print_table(headers, rows)
 
 
 def _detail(raw_message_id: int) -> None:
@@ -182,47 +148,47 @@ def _detail(raw_message_id: int) -> None:
         ) = row
 
         print(f"raw_message_id: {rid}")
-        print(f"source_channel_id: {_fmt(source_channel_id)}")
-        print(f"source_channel_name: {_fmt(source_channel_name)}")
-        print(f"telegram_message_id: {_fmt(telegram_message_id)}")
-        print(f"message_timestamp_utc: {_fmt(message_timestamp_utc)}")
-        print(f"ingested_at: {_fmt(created_at)}")
+        print(f"source_channel_id: {fmt(source_channel_id)}")
+        print(f"source_channel_name: {fmt(source_channel_name)}")
+        print(f"telegram_message_id: {fmt(telegram_message_id)}")
+        print(f"message_timestamp_utc: {fmt(message_timestamp_utc)}")
+        print(f"ingested_at: {fmt(created_at)}")
         print()
         print("raw_text:")
-        print(_fmt(raw_text, max_len=10_000))
+        print(fmt(raw_text, max_len=10_000))
         print()
         print("normalized_text:")
-        print(_fmt(normalized_text, max_len=10_000))
+        print(fmt(normalized_text, max_len=10_000))
         print()
         print("processing_state:")
-        print(f"  status={_fmt(state)} attempt_count={_fmt(attempt_count)} last_error={_fmt(last_error, max_len=500)}")
+        print(f"  status={fmt(state)} attempt_count={fmt(attempt_count)} last_error={fmt(last_error, max_len=500)}")
         print()
         print("extraction:")
         print(
-            f"  topic={_fmt(topic)} impact={_fmt(impact_score)} confidence={_fmt(confidence)} "
-            f"breaking={_fmt(is_breaking)} window={_fmt(breaking_window)}"
+            f"  topic={fmt(topic)} impact={fmt(impact_score)} confidence={fmt(confidence)} "
+            f"breaking={fmt(is_breaking)} window={fmt(breaking_window)}"
         )
-        print(f"  extraction_event_fingerprint={_fmt(extraction_fingerprint, max_len=500)}")
-        print(f"  extraction_event_fingerprint_v2={_fmt(extraction_fingerprint_v2, max_len=500)}")
-        print(f"  normalized_text_hash={_fmt(normalized_text_hash)}")
-        print(f"  replay_identity_key={_fmt(replay_identity_key)}")
-        print(f"  canonical_payload_hash={_fmt(canonical_payload_hash)}")
-        print(f"  claim_hash={_fmt(claim_hash)}")
-        print(f"  payload_json={_fmt(payload_json, max_len=1500)}")
-        print(f"  canonical_payload_json={_fmt(canonical_payload_json, max_len=1500)}")
+        print(f"  extraction_event_fingerprint={fmt(extraction_fingerprint, max_len=500)}")
+        print(f"  extraction_event_fingerprint_v2={fmt(extraction_fingerprint_v2, max_len=500)}")
+        print(f"  normalized_text_hash={fmt(normalized_text_hash)}")
+        print(f"  replay_identity_key={fmt(replay_identity_key)}")
+        print(f"  canonical_payload_hash={fmt(canonical_payload_hash)}")
+        print(f"  claim_hash={fmt(claim_hash)}")
+        print(f"  payload_json={fmt(payload_json, max_len=1500)}")
+        print(f"  canonical_payload_json={fmt(canonical_payload_json, max_len=1500)}")
         print()
         print("routing_decision:")
         print(
-            f"  publish_priority={_fmt(publish_priority)} requires_evidence={_fmt(requires_evidence)} "
-            f"event_action={_fmt(event_action)} triage_action={_fmt(triage_action)}"
+            f"  publish_priority={fmt(publish_priority)} requires_evidence={fmt(requires_evidence)} "
+            f"event_action={fmt(event_action)} triage_action={fmt(triage_action)}"
         )
-        print(f"  triage_rules={_fmt(triage_rules, max_len=1000)}")
-        print(f"  flags={_fmt(flags)}")
+        print(f"  triage_rules={fmt(triage_rules, max_len=1000)}")
+        print(f"  flags={fmt(flags)}")
         print()
         print("event_link:")
         print(
-            f"  event_id={_fmt(event_id)} event_fingerprint={_fmt(event_fingerprint, max_len=500)} "
-            f"event_last_updated_at={_fmt(event_last_updated_at)}"
+            f"  event_id={fmt(event_id)} event_fingerprint={fmt(event_fingerprint, max_len=500)} "
+            f"event_last_updated_at={fmt(event_last_updated_at)}"
         )
 
 
@@ -7,6 +7,7 @@ from dotenv import load_dotenv
 
 from ..db import Base, engine
 from .. import models  # noqa: F401
+from ..schema_capabilities import invalidate_schema_capabilities
 
 
 logging.basicConfig(level=logging.INFO)
@@ -26,6 +27,7 @@ def main() -> None:
     logger.warning("reset_dev_schema starting")
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
+    invalidate_schema_capabilities(engine)
     logger.warning("reset_dev_schema complete")
 
 
@@ -27,6 +27,21 @@ def main() -> None:
     parser.add_argument("--start", required=True, help="ISO-8601 UTC start timestamp.")
     parser.add_argument("--end", required=True, help="ISO-8601 UTC end timestamp.")
     parser.add_argument("--topic", required=False, default=None, help="Optional manual topic override.")
+    parser.add_argument(
+        "--refresh-research",
+        action="store_true",
+        help="Bypass cached external research for this run (the fresh result replaces the cache entry).",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Generate a new memo even when an artifact with the same input hash already exists.",
+    )
+    parser.add_argument(
+        "--redeliver",
+        action="store_true",
+        help="When an existing artifact is reused, deliver it again.",
+    )
     args = parser.parse_args()
 
     start_time = _parse_iso_datetime(args.start)
@@ -43,17 +58,21 @@ def main() -> None:
             end_time=end_time,
             topic=args.topic,
             settings=settings,
+            refresh_research=args.refresh_research,
+            force=args.force,
+            redeliver=args.redeliver,
         )
         db.commit()
 
         logger.info(
-            "opportunity_memo_summary run_id=%s status=%s selected_topic=%s topic_score=%s artifact_id=%s delivery_status=%s validation_errors=%s message=%s",
+            "opportunity_memo_summary run_id=%s status=%s selected_topic=%s topic_score=%s artifact_id=%s delivery_status=%s reused_artifact=%s validation_errors=%s message=%s",
             result.run_id,
             result.status,
             result.selected_topic,
             result.topic_score,
             result.artifact_id,
             result.delivery_status,
+            result.reused_artifact,
             result.validation_errors,
             result.message,
         )
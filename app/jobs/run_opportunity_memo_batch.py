@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import argparse
+import logging
+from datetime import datetime, timezone
+
+from dotenv import load_dotenv
+
+from ..config import get_settings
+from ..contexts.opportunity_memo import OPPORTUNITY_TOPICS
+from ..db import init_db
+from ..workflows.opportunity_memo_batch import MemoBatchSummary, run_opportunity_memo_batch
+from .table_output import print_table
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger("civicquant.opportunity_memo")
+
+STAGES = ("topic_selection", "input_pack", "research", "writer", "validation", "persist", "delivery")
+
+
+def _parse_iso_datetime(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _parse_window(value: str) -> tuple[datetime, datetime]:
+    start, sep, end = value.partition("/")
+    if not sep:
+        raise argparse.ArgumentTypeError("--window must be <start-iso>/<end-iso>")
+    try:
+        return _parse_iso_datetime(start), _parse_iso_datetime(end)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from exc
+
+
+def _print_summary(summary: MemoBatchSummary) -> None:
+    headers = [
+        "window_start",
+        "window_end",
+        "topic",
+        "status",
+        "selected",
+        "score",
+        "artifact",
+        "reused",
+        "duplicate_of",
+        "delivery",
+        *[f"{stage}_ms" for stage in STAGES],
+    ]
+    rows = []
+    for row in summary.rows:
+        result = row.result
+        rows.append(
+            [
+                row.window_start_utc,
+                row.window_end_utc,
+                row.requested_topic or "auto",
+                result.status if result is not None else f"error: {row.error}",
+                result.selected_topic if result is not None else None,
+                result.topic_score if result is not None else None,
+                result.artifact_id if result is not None else None,
+                result.reused_artifact if result is not None else None,
+                row.duplicate_of,
+                result.delivery_status if result is not None else None,
+                *[row.stage_timings_ms.get(stage) for stage in STAGES],
+            ]
+        )
+    print_table(headers, rows)
+    print(
+        f"snapshot_load_ms={summary.snapshot_load_ms} selection_ms={summary.selection_ms} "
+        f"llm_stages_ms={summary.llm_stages_ms}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run opportunity memos for several windows and topics.")
+    parser.add_argument(
+        "--window",
+        action="append",
+        required=True,
+        type=_parse_window,
+        help="ISO-8601 UTC window as <start>/<end>; repeat for several windows.",
+    )
+    topic_group = parser.add_mutually_exclusive_group()
+    topic_group.add_argument(
+        "--topic",
+        action="append",
+        choices=OPPORTUNITY_TOPICS,
+        help="Topic to run in every window; repeat for several. Default: auto-select per window.",
+    )
+    topic_group.add_argument("--all-topics", action="store_true", help="Run every opportunity topic in every window.")
+    parser.add_argument("--process-workers", type=int, default=None, help="Processes for ranking/driver selection.")
+    parser.add_argument("--llm-concurrency", type=int, default=None, help="Runs in research/writer stages at once.")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Generate new memos even when an artifact with the same input hash already exists.",
+    )
+    args = parser.parse_args()
+
+    if args.all_topics:
+        topics: list[str | None] = list(OPPORTUNITY_TOPICS)
+    elif args.topic:
+        topics = list(dict.fromkeys(args.topic))
+    else:
+        topics = [None]
+
+    load_dotenv()
+    settings = get_settings()
+    init_db()
+
+    summary = run_opportunity_memo_batch(
+        windows=args.window,
+        topics=topics,
+        settings=settings,
+        process_workers=args.process_workers,
+        llm_concurrency=args.llm_concurrency,
+        force=args.force,
+    )
+    _print_summary(summary)
+
+
+if __name__ == "__main__":
+    main()
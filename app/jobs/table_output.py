@@ -0,0 +1,41 @@
+"""Plain-text table output shared by the inspection / batch jobs."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from typing import Any
+
+
+def fmt(value: Any, max_len: int = 120) -> str:
+    if value is None:
+        return "-"
+    if isinstance(value, datetime):
+        return value.isoformat(timespec="seconds")
+    if isinstance(value, float):
+        text = f"{value:.3f}"
+    elif isinstance(value, (list, dict)):
+        text = json.dumps(value, ensure_ascii=True)
+    else:
+        text = str(value)
+    if len(text) > max_len:
+        return f"{text[: max_len - 3]}..."
+    return text
+
+
+def print_table(headers: list[str], rows: list[list[Any]]) -> None:
+    if not rows:
+        print("No rows found.")
+        return
+
+    widths = [len(h) for h in headers]
+    for row in rows:
+        for i, value in enumerate(row):
+            widths[i] = max(widths[i], len(fmt(value)))
+
+    header_line = " | ".join(h.ljust(widths[i]) for i, h in enumerate(headers))
+    divider_line = "-+-".join("-" * widths[i] for i in range(len(headers)))
+    print(header_line)
+    print(divider_line)
+    for row in rows:
+        print(" | ".join(fmt(value).ljust(widths[i]) for i, value in enumerate(row)))
@@ -2,20 +2,37 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
-from .db import init_db
+from .config import get_settings
+from .db import SessionLocal, dispose_async_engine, init_db
 from .logging_utils import configure_logging
 from .routers.admin import router as admin_router
 from .routers.admin_theme import router as admin_theme_router
 from .routers.feed import router as feed_router
 from .routers.ingest import router as ingest_router
 from .schemas import HealthResponse
+from .workflows.phase2_queue import Phase2QueueConsumer, get_phase2_work_queue, phase2_queue_consumer_enabled
+from .workflows.telegram_outbox import TelegramOutboxWorker
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     configure_logging()
     init_db()
+    settings = get_settings()
+    consumer: Phase2QueueConsumer | None = None
+    if phase2_queue_consumer_enabled(settings):
+        consumer = Phase2QueueConsumer(get_phase2_work_queue(), SessionLocal, settings)
+        consumer.start()
+    outbox_worker: TelegramOutboxWorker | None = None
+    if settings.telegram_outbox_enabled:
+        outbox_worker = TelegramOutboxWorker(SessionLocal, settings)
+        outbox_worker.start()
     yield
+    if outbox_worker is not None:
+        outbox_worker.stop(timeout=settings.telegram_outbox_poll_seconds + 5)
+    if consumer is not None:
+        consumer.stop(timeout=settings.phase2_queue_idle_wait_seconds + 5)
+    await dispose_async_engine()
 
 
 def create_app() -> FastAPI:
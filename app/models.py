@@ -3,6 +3,7 @@ from datetime import datetime
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy import (
     JSON,
+    BigInteger,
     Boolean,
     Column,
     DateTime,
@@ -198,6 +199,104 @@ class EventMessage(Base):
     raw_message = relationship("RawMessage", back_populates="event_links")
 
 
+class FeedEvent(Base):
+    """Read model behind `/api/feed/events`.
+
+    One row per feed-eligible event (event_time set, known topic, non-blank
+    summary), maintained on event upsert. Rows hold the already-trimmed
+    summary and rounded impact so feed pages are plain index range scans.
+    """
+
+    __tablename__ = "feed_events"
+
+    event_id = Column(Integer, ForeignKey("events.id", ondelete="CASCADE"), primary_key=True)
+    topic = Column(String(64), nullable=False)
+    event_time = Column(DateTime, nullable=False)
+    summary = Column(Text, nullable=False)
+    impact_score = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+
+Index(
+    "ix_feed_events_topic_time_id",
+    FeedEvent.topic,
+    FeedEvent.event_time.desc(),
+    FeedEvent.event_id.desc(),
+)
+Index("ix_feed_events_time_id", FeedEvent.event_time.desc(), FeedEvent.event_id.desc())
+
+
+class FeedState(Base):
+    """Single-row feed version, bumped in the same transaction as any `feed_events` change.
+
+    Feed ETags and the in-process first-page cache key on `version`, so a
+    conditional request costs one primary-key lookup.
+    """
+
+    __tablename__ = "feed_state"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+
+class TopicHourlyRollup(Base):
+    """Per topic x UTC hour aggregates over `events`, maintained on event upsert.
+
+    `impact_max` is recomputed from `events` for the bucket only when the
+    current maximum leaves it. Band counts follow `triage_engine.impact_band`.
+    """
+
+    __tablename__ = "topic_hourly_rollups"
+    __table_args__ = (
+        UniqueConstraint("topic", "hour_start_utc", name="uq_topic_hourly_rollups_topic_hour"),
+        Index("ix_topic_hourly_rollups_hour_topic", "hour_start_utc", "topic"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    topic = Column(String(64), nullable=False)
+    hour_start_utc = Column(DateTime, nullable=False)
+    event_count = Column(Integer, nullable=False, default=0)
+    impact_sum = Column(Float, nullable=False, default=0.0)
+    impact_max = Column(Float, nullable=True)
+    breaking_count = Column(Integer, nullable=False, default=0)
+    band_low_count = Column(Integer, nullable=False, default=0)
+    band_medium_count = Column(Integer, nullable=False, default=0)
+    band_high_count = Column(Integer, nullable=False, default=0)
+    band_critical_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+
+class EventSimilaritySignature(Base):
+    """MinHash signature over an event's summary shingles, maintained on event upsert.
+
+    See `app/contexts/events/similarity_index.py`; `minhash_json` holds
+    `NUM_PERMUTATIONS` integers.
+    """
+
+    __tablename__ = "event_similarity_signatures"
+
+    event_id = Column(Integer, ForeignKey("events.id", ondelete="CASCADE"), primary_key=True)
+    shingle_count = Column(Integer, nullable=False)
+    minhash_json = Column(JSONB_COMPAT, nullable=False)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+
+class EventSimilarityBand(Base):
+    """One LSH band key per (event, band); events sharing a key are duplicate candidates."""
+
+    __tablename__ = "event_similarity_bands"
+    __table_args__ = (
+        UniqueConstraint("event_id", "band_index", name="uq_event_similarity_bands_event_band"),
+        Index("ix_event_similarity_bands_key_event", "band_key", "event_id"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    event_id = Column(Integer, ForeignKey("events.id", ondelete="CASCADE"), nullable=False)
+    band_index = Column(Integer, nullable=False)
+    band_key = Column(BigInteger, nullable=False)
+
+
 class EventTag(Base):
     __tablename__ = "event_tags"
     __table_args__ = (
@@ -210,12 +309,25 @@ class EventTag(Base):
         ),
         Index("ix_event_tags_type_value_event", "tag_type", "tag_value", "event_id"),
         Index("ix_event_tags_event_id", "event_id"),
+        Index(
+            "ix_event_tags_lookup_cover",
+            "tag_type",
+            "tag_value_norm",
+            "event_time",
+            "impact_score",
+            "event_id",
+        ),
     )
 
     id = Column(Integer, primary_key=True)
     event_id = Column(Integer, ForeignKey("events.id", ondelete="CASCADE"), nullable=False)
     tag_type = Column(String(64), nullable=False)
     tag_value = Column(String(255), nullable=False)
+    # Lookup copies: lowercase value plus the owning event's time/impact, rewritten
+    # with the rows on every event sync so admin queries never join `events`.
+    tag_value_norm = Column(String(255), nullable=True)
+    event_time = Column(DateTime, nullable=True)
+    impact_score = Column(Float, nullable=True)
     tag_source = Column(String(16), nullable=False)
     confidence = Column(Float, nullable=True)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
@@ -241,6 +353,31 @@ class EventRelation(Base):
         Index("ix_event_relations_subject_lookup", "subject_type", "subject_value", "relation_type"),
         Index("ix_event_relations_object_lookup", "object_type", "object_value", "relation_type"),
         Index("ix_event_relations_event_id", "event_id"),
+        Index(
+            "ix_event_relations_type_time_cover",
+            "relation_type",
+            "event_time",
+            "impact_score",
+            "event_id",
+        ),
+        Index(
+            "ix_event_relations_subject_norm_cover",
+            "relation_type",
+            "subject_type",
+            "subject_value_norm",
+            "event_time",
+            "impact_score",
+            "event_id",
+        ),
+        Index(
+            "ix_event_relations_object_norm_cover",
+            "relation_type",
+            "object_type",
+            "object_value_norm",
+            "event_time",
+            "impact_score",
+            "event_id",
+        ),
     )
 
     id = Column(Integer, primary_key=True)
@@ -250,6 +387,11 @@ class EventRelation(Base):
     relation_type = Column(String(64), nullable=False)
     object_type = Column(String(64), nullable=False)
     object_value = Column(String(255), nullable=False)
+    # Lookup copies, maintained like `EventTag.tag_value_norm`/`event_time`/`impact_score`.
+    subject_value_norm = Column(String(255), nullable=True)
+    object_value_norm = Column(String(255), nullable=True)
+    event_time = Column(DateTime, nullable=True)
+    impact_score = Column(Float, nullable=True)
     relation_source = Column(String(16), nullable=False)
     inference_level = Column(Integer, nullable=False)
     confidence = Column(Float, nullable=True)
@@ -286,6 +428,8 @@ class DigestArtifact(Base):
     `input_hash` is a stable identity derived from source digest inputs.
     It allows dedupe across reruns even when synthesized canonical text varies.
     `canonical_hash` remains the hash of rendered canonical text.
+    `digest_json` stores the validated digest structure so reruns with the
+    same `input_hash` can skip synthesis entirely.
     """
 
     __tablename__ = "digest_artifacts"
@@ -296,6 +440,7 @@ class DigestArtifact(Base):
     canonical_text = Column(Text, nullable=False)
     canonical_hash = Column(String(128), nullable=False, unique=True, index=True)
     input_hash = Column(String(128), nullable=True, unique=True, index=True)
+    digest_json = Column(JSON, nullable=True)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
 
     published_posts = relationship("PublishedPost", back_populates="artifact")
@@ -325,6 +470,10 @@ class PublishedPost(Base):
     content_hash = Column(String(128), nullable=False, index=True)
     last_error = Column(Text, nullable=True)
     external_ref = Column(String(255), nullable=True)
+    # Telegram message ids of the chunks already accepted for `content`; a resend starts after them.
+    sent_chunk_refs = Column(JSON, nullable=True)
+    # When the current `sending` claim was taken; a claim older than the lease may be taken over.
+    claimed_at = Column(DateTime, nullable=True)
 
     event = relationship("Event", back_populates="published_posts")
     artifact = relationship("DigestArtifact", back_populates="published_posts")
@@ -604,6 +753,7 @@ class OpportunityMemoRun(Base):
     error_message = Column(Text, nullable=True)
     selection_diagnostics_json = Column(JSONB_COMPAT, nullable=False, default=dict)
     validation_errors_json = Column(JSONB_COMPAT, nullable=False, default=list)
+    stage_timings_json = Column(JSONB_COMPAT, nullable=True)
     started_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     completed_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
@@ -664,6 +814,26 @@ class OpportunityMemoInputEvent(Base):
     artifact = relationship("OpportunityMemoArtifact", back_populates="input_events")
 
 
+class EventOpportunityTopic(Base):
+    """Persisted `map_event_to_topic` result for an event.
+
+    Written when phase2 syncs an event's tags/relations. Rows whose
+    `mapping_version` differs from `TOPIC_MAPPING_VERSION` are stale and are
+    recomputed on read (and in bulk by `adopt_opportunity_memo_schema`).
+    """
+
+    __tablename__ = "event_opportunity_topics"
+    __table_args__ = (
+        Index("ix_event_opportunity_topics_topic_version", "topic", "mapping_version"),
+    )
+
+    event_id = Column(Integer, ForeignKey("events.id", ondelete="CASCADE"), primary_key=True)
+    topic = Column(String(32), nullable=True)
+    mapping_version = Column(String(32), nullable=False)
+    diagnostics_json = Column(JSONB_COMPAT, nullable=False, default=dict)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+
 class OpportunityMemoExternalSource(Base):
     __tablename__ = "opportunity_memo_external_sources"
     __table_args__ = (
@@ -686,6 +856,58 @@ class OpportunityMemoExternalSource(Base):
     artifact = relationship("OpportunityMemoArtifact", back_populates="external_sources")
 
 
+class OpportunityResearchCacheEntry(Base):
+    """Cached external research result keyed by provider, model and research plan."""
+
+    __tablename__ = "opportunity_research_cache_entries"
+
+    id = Column(Integer, primary_key=True)
+    cache_key = Column(String(64), nullable=False, unique=True)
+    provider_name = Column(String(64), nullable=False)
+    model_name = Column(String(128), nullable=True)
+    topic = Column(String(32), nullable=False)
+    primary_driver_key = Column(String(64), nullable=False)
+    retrieval_diagnostics_json = Column(JSONB_COMPAT, nullable=False, default=dict)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    expires_at = Column(DateTime, nullable=False, index=True)
+
+    sources = relationship(
+        "OpportunityResearchCacheSource",
+        back_populates="entry",
+        cascade="all, delete-orphan",
+        order_by="OpportunityResearchCacheSource.position_index",
+    )
+
+
+class OpportunityResearchCacheSource(Base):
+    """Normalized source of a cached research result (same shape as `opportunity_memo_external_sources`)."""
+
+    __tablename__ = "opportunity_research_cache_sources"
+    __table_args__ = (
+        UniqueConstraint("entry_id", "position_index", name="uq_opportunity_research_cache_sources_entry_position"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    entry_id = Column(
+        Integer,
+        ForeignKey("opportunity_research_cache_entries.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    position_index = Column(Integer, nullable=False, default=0)
+    source_id = Column(String(64), nullable=False)
+    source_type = Column(String(32), nullable=False)
+    title = Column(Text, nullable=False)
+    publisher = Column(String(255), nullable=True)
+    retrieved_at = Column(DateTime, nullable=False)
+    query = Column(Text, nullable=False)
+    summary = Column(Text, nullable=False)
+    claim_support_tags = Column(JSONB_COMPAT, nullable=False, default=list)
+    url = Column(Text, nullable=True)
+
+    entry = relationship("OpportunityResearchCacheEntry", back_populates="sources")
+
+
 class OpportunityMemoDelivery(Base):
     __tablename__ = "opportunity_memo_deliveries"
     __table_args__ = (
@@ -695,6 +917,8 @@ class OpportunityMemoDelivery(Base):
 
     id = Column(Integer, primary_key=True)
     artifact_id = Column(Integer, ForeignKey("opportunity_memo_artifacts.id", ondelete="CASCADE"), nullable=False, index=True)
+    # Run whose delivery attempt the row currently carries (a reusing run's redelivery, or the artifact's own run).
+    run_id = Column(Integer, ForeignKey("opportunity_memo_runs.id", ondelete="SET NULL"), nullable=True, index=True)
     destination = Column(String(64), nullable=False)
     status = Column(String(32), nullable=False, default="failed")
     attempted_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
@@ -703,6 +927,11 @@ class OpportunityMemoDelivery(Base):
     content_hash = Column(String(128), nullable=False, index=True)
     external_ref = Column(String(255), nullable=True)
     last_error = Column(Text, nullable=True)
+    # Telegram message ids of the chunks already accepted for `content`; a resend starts after them.
+    sent_chunk_refs = Column(JSON, nullable=True)
+    # When the current `sending` claim was taken; a claim older than the lease may be taken over.
+    claimed_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
 
     artifact = relationship("OpportunityMemoArtifact", back_populates="deliveries")
+    run = relationship("OpportunityMemoRun")
@@ -6,12 +6,14 @@ from fastapi import APIRouter, Depends, Header, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from ..config import get_settings
+from ..contexts.events.topic_rollups import RollupBucket, query_topic_rollups
 from ..contexts.events.structured_query import (
     query_events_by_relation,
     query_events_by_tag,
     serialize_query_results,
 )
 from ..db import get_db
+from ..digest.preview import build_digest_preview
 from ..workflows.phase2_pipeline import process_phase2_batch
 
 
@@ -44,6 +46,46 @@ def trigger_phase2_extractions(
     }
 
 
+@router.get("/digest/preview")
+def preview_digest(
+    hours: int | None = Query(default=None, ge=1),
+    destination: str | None = Query(default=None),
+    db: Session = Depends(get_db),
+    x_admin_token: str | None = Header(default=None),
+) -> dict[str, object]:
+    settings = get_settings()
+    _require_admin_token(x_admin_token)
+    window_hours = hours or settings.vip_digest_hours
+    if window_hours > settings.digest_rolling_retention_hours:
+        raise HTTPException(
+            status_code=400,
+            detail=f"hours must be <= {settings.digest_rolling_retention_hours}",
+        )
+    preview, cached = build_digest_preview(
+        db,
+        hours=window_hours,
+        destination=destination,
+        settings=settings,
+    )
+    return {**preview.as_dict(), "cached": cached}
+
+
+@router.get("/analytics/topic-rollups")
+def topic_rollups_endpoint(
+    start_time: datetime = Query(...),
+    end_time: datetime = Query(...),
+    topic: str | None = Query(default=None),
+    bucket: RollupBucket = Query(default="hour"),
+    db: Session = Depends(get_db),
+    x_admin_token: str | None = Header(default=None),
+) -> dict[str, object]:
+    _require_admin_token(x_admin_token)
+    try:
+        return query_topic_rollups(db, start_time=start_time, end_time=end_time, topic=topic, bucket=bucket)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
 @router.get("/query/events/by-tag")
 def query_events_by_tag_endpoint(
     tag_type: str = Query(...),
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
+from ..config import get_settings
 from ..db import get_db
 from ..schemas import FeedEventsResponse, Topic
-from ..contexts.feed.feed_query import list_feed_events
+from ..contexts.feed.feed_cache import etag_matches, feed_etag, get_feed_page_cache
+from ..contexts.feed.feed_query import decode_feed_cursor, list_feed_events, list_feed_events_after
+from ..contexts.feed.read_model import get_feed_version
+from ..contexts.feed.stream import feed_event_stream, get_feed_hub
 
 
 router = APIRouter(prefix="/api/feed", tags=["feed"])
@@ -13,13 +19,79 @@ router = APIRouter(prefix="/api/feed", tags=["feed"])
 
 @router.get("/events", response_model=FeedEventsResponse)
 def get_feed_events(
+    request: Request,
     limit: int = Query(default=30, ge=1, le=100),
     cursor: str | None = Query(default=None),
     topic: Topic | None = Query(default=None),
     db: Session = Depends(get_db),
-) -> FeedEventsResponse:
+) -> Response:
+    if cursor is not None:
+        try:
+            decode_feed_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="invalid cursor")
+
+    version = get_feed_version(db)
+    etag = feed_etag(version=version, limit=limit, cursor=cursor, topic=topic)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    cache = get_feed_page_cache()
+    body = cache.get(version=version, topic=topic, limit=limit) if cursor is None else None
+    if body is None:
+        page = list_feed_events(db=db, limit=limit, cursor=cursor, topic=topic)
+        body = page.model_dump_json().encode("utf-8")
+        if cursor is None:
+            cache.put(version=version, topic=topic, limit=limit, body=body)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@router.get("/stream")
+async def stream_feed_events(
+    request: Request,
+    cursor: str | None = Query(default=None),
+    topic: Topic | None = Query(default=None),
+    db: Session = Depends(get_db),
+) -> StreamingResponse:
+    """Server-sent `feed_event` messages as events are created or updated."""
+
+    resume = cursor or request.headers.get("last-event-id")
+    if resume is not None:
+        try:
+            decode_feed_cursor(resume)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="invalid cursor")
+
+    settings = get_settings()
+    replay_limit = settings.feed_stream_replay_limit
+    # Subscribe before reading the replay so nothing committed in between is missed.
+    subscription = get_feed_hub().subscribe(topic=topic)
     try:
-        return list_feed_events(db=db, limit=limit, cursor=cursor, topic=topic)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="invalid cursor")
+        replay = (
+            await run_in_threadpool(
+                list_feed_events_after,
+                db,
+                cursor=resume,
+                topic=topic,
+                limit=replay_limit + 1,
+            )
+            if resume is not None
+            else []
+        )
+    except Exception:
+        subscription.close()
+        raise
 
+    return StreamingResponse(
+        feed_event_stream(
+            subscription,
+            replay=replay[:replay_limit],
+            replay_backlog=subscription.backlog(),
+            replay_truncated=len(replay) > replay_limit,
+            heartbeat_seconds=settings.feed_stream_heartbeat_seconds,
+            is_disconnected=request.is_disconnected,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -3,13 +3,18 @@ from __future__ import annotations
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException, Request
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..db import get_db
+from ..config import get_settings
+from ..db import get_async_db
 from ..logging_utils import new_request_id
 from ..schemas import IngestResponse, SourceIngestPayload, TelegramIngestPayload
-from ..contexts.ingest.normalization import normalize_message_text
-from ..contexts.ingest.ingest_pipeline import process_ingest_payload, process_source_ingest_payload
+from ..contexts.ingest.normalization import has_breaking_marker, normalize_message_text
+from ..contexts.ingest.ingest_pipeline import (
+    process_ingest_payload_async,
+    process_source_ingest_payload_async,
+)
+from ..workflows.phase2_queue import get_phase2_work_queue, phase2_queue_consumer_enabled
 
 
 logger = logging.getLogger("civicquant.ingest")
@@ -25,10 +30,10 @@ def _build_response(result: dict[str, object]) -> IngestResponse:
     )
 
 
-def _process_ingest_with_logging(
+async def _process_ingest_with_logging(
     *,
     request_id: str,
-    db: Session,
+    db: AsyncSession,
     source_stream_id: str,
     source_message_id: str,
     raw_text: str,
@@ -36,8 +41,8 @@ def _process_ingest_with_logging(
 ) -> IngestResponse:
     normalized = normalize_message_text(raw_text)
     try:
-        result = process_fn(db=db, normalized_text=normalized)
-        db.commit()
+        result = await process_fn(db=db, normalized_text=normalized)
+        await db.commit()
         logger.info(
             "ingest_ok request_id=%s source_stream_id=%s source_message_id=%s raw_message_id=%s status=%s event_id=%s",
             request_id,
@@ -47,9 +52,8 @@ def _process_ingest_with_logging(
             result["status"],
             result.get("event_id"),
         )
-        return _build_response(result)
     except Exception as e:  # noqa: BLE001
-        db.rollback()
+        await db.rollback()
         logger.exception(
             "ingest_failed request_id=%s source_stream_id=%s source_message_id=%s error=%s",
             request_id,
@@ -59,21 +63,38 @@ def _process_ingest_with_logging(
         )
         raise HTTPException(status_code=500, detail="ingest failed")
 
+    # The row is committed; the queue is only a latency hint, so a failure here
+    # is logged and left to the phase2 fallback scan.
+    if result["status"] == "created" and phase2_queue_consumer_enabled(get_settings()):
+        try:
+            get_phase2_work_queue().enqueue(
+                int(result["raw_message_id"]),
+                breaking=has_breaking_marker(raw_text),
+            )
+        except Exception as e:  # noqa: BLE001
+            logger.exception(
+                "phase2_enqueue_failed request_id=%s raw_message_id=%s error=%s",
+                request_id,
+                result["raw_message_id"],
+                type(e).__name__,
+            )
+    return _build_response(result)
+
 
 @router.post("/ingest/telegram", response_model=IngestResponse)
-def ingest_telegram(
+async def ingest_telegram(
     payload: TelegramIngestPayload,
     request: Request,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> IngestResponse:
     request_id = request.headers.get("x-request-id") or new_request_id()
-    return _process_ingest_with_logging(
+    return await _process_ingest_with_logging(
         request_id=request_id,
         db=db,
         source_stream_id=payload.source_channel_id,
         source_message_id=payload.telegram_message_id,
         raw_text=payload.raw_text,
-        process_fn=lambda *, db, normalized_text: process_ingest_payload(
+        process_fn=lambda *, db, normalized_text: process_ingest_payload_async(
             db=db,
             payload=payload,
             normalized_text=normalized_text,
@@ -82,19 +103,19 @@ def ingest_telegram(
 
 
 @router.post("/ingest/source", response_model=IngestResponse)
-def ingest_source(
+async def ingest_source(
     payload: SourceIngestPayload,
     request: Request,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> IngestResponse:
     request_id = request.headers.get("x-request-id") or new_request_id()
-    return _process_ingest_with_logging(
+    return await _process_ingest_with_logging(
         request_id=request_id,
         db=db,
         source_stream_id=payload.source_stream_id,
         source_message_id=payload.source_message_id,
         raw_text=payload.raw_text,
-        process_fn=lambda *, db, normalized_text: process_source_ingest_payload(
+        process_fn=lambda *, db, normalized_text: process_source_ingest_payload_async(
             db=db,
             payload=payload,
             normalized_text=normalized_text,
@@ -0,0 +1,83 @@
+"""Cached schema capability probes for optional/additive schema pieces.
+
+Older databases may predate columns/tables that the adopt jobs add
+(`adopt_stability_contracts`, `adopt_structured_event_schema`,
+`adopt_theme_batch_schema`, `adopt_opportunity_memo_schema`). Code paths that
+must stay compatible with such databases ask this registry instead of running
+their own `inspect()` calls. Each engine is probed once; the cache is dropped
+by `invalidate_schema_capabilities`, which the adopt jobs and `init_db` call
+after changing the schema.
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from typing import Iterable
+
+from sqlalchemy import inspect
+from sqlalchemy.engine import Connection, Engine
+
+
+class SchemaCapabilities:
+    """Probe results for one engine. Columns are probed lazily, once per table."""
+
+    def __init__(self, engine: Engine) -> None:
+        self._engine = engine
+        self._lock = threading.Lock()
+        self._tables: frozenset[str] | None = None
+        self._columns: dict[str, frozenset[str]] = {}
+
+    def tables(self) -> frozenset[str]:
+        with self._lock:
+            if self._tables is None:
+                self._tables = frozenset(inspect(self._engine).get_table_names())
+            return self._tables
+
+    def columns(self, table: str) -> frozenset[str]:
+        if table not in self.tables():
+            return frozenset()
+        with self._lock:
+            cached = self._columns.get(table)
+            if cached is None:
+                cached = frozenset(
+                    str(column.get("name")) for column in inspect(self._engine).get_columns(table)
+                )
+                self._columns[table] = cached
+            return cached
+
+    def has_table(self, table: str) -> bool:
+        return table in self.tables()
+
+    def has_column(self, table: str, column: str) -> bool:
+        return column in self.columns(table)
+
+    def missing_tables(self, expected: Iterable[str]) -> list[str]:
+        return sorted(set(expected) - self.tables())
+
+
+_registry_lock = threading.Lock()
+_registry: "weakref.WeakKeyDictionary[Engine, SchemaCapabilities]" = weakref.WeakKeyDictionary()
+
+
+def _engine_for(bind: Engine | Connection) -> Engine:
+    return bind.engine if isinstance(bind, Connection) else bind
+
+
+def get_schema_capabilities(bind: Engine | Connection) -> SchemaCapabilities:
+    engine = _engine_for(bind)
+    with _registry_lock:
+        capabilities = _registry.get(engine)
+        if capabilities is None:
+            capabilities = SchemaCapabilities(engine)
+            _registry[engine] = capabilities
+        return capabilities
+
+
+def invalidate_schema_capabilities(bind: Engine | Connection | None = None) -> None:
+    """Drop cached probes for `bind` (or every engine when omitted)."""
+    with _registry_lock:
+        if bind is None:
+            _registry.clear()
+        else:
+            _registry.pop(_engine_for(bind), None)
@@ -0,0 +1,239 @@
+"""Multi-window, multi-topic opportunity memo batches.
+
+A batch loads event snapshots once for all windows, evaluates every
+(window, topic) combination's ranking, driver selection and input pack in a
+process pool (pure CPU work over the snapshots; one task per window, so a
+window's working set is shipped to a worker once), then runs the research /
+writer / validation / delivery stages of `run_opportunity_memo` on a thread
+pool whose size is the global LLM concurrency cap. Each LLM-stage worker uses
+its own session.
+
+Selections are computed up front, so auto-selection in one window does not
+see memos produced by the same batch. Combinations that resolve to the same
+(window, selected topic, input hash) -- e.g. an explicit topic and the
+auto-selection that picks it -- run once; the other rows point at that row
+via `duplicate_of` instead of racing the same memo on two threads.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from ..config import Settings, get_settings
+from ..contexts.opportunity_memo import (
+    OPPORTUNITY_TOPICS,
+    MemoSelection,
+    MemoWorkingSet,
+    OpportunityMemoRunResult,
+    OpportunityMemoWriter,
+    OpportunityResearchProvider,
+    load_memo_working_sets,
+    select_memo_topic,
+)
+from ..db import SessionLocal
+from ..models import OpportunityMemoRun
+from .opportunity_memo_pipeline import memo_input_hash, recent_memo_topics, run_opportunity_memo, to_utc_naive
+
+
+logger = logging.getLogger("civicquant.opportunity_memo")
+
+
+@dataclass
+class MemoBatchRow:
+    window_start_utc: datetime
+    window_end_utc: datetime
+    requested_topic: str | None
+    result: OpportunityMemoRunResult | None = None
+    stage_timings_ms: dict[str, int] = field(default_factory=dict)
+    error: str | None = None
+    # Index of the row whose run this combination shares; its result is that row's result.
+    duplicate_of: int | None = None
+
+
+@dataclass
+class MemoBatchSummary:
+    rows: list[MemoBatchRow]
+    snapshot_load_ms: int
+    selection_ms: int
+    llm_stages_ms: int
+
+    def status_counts(self) -> dict[str, int]:
+        counts: dict[str, int] = {}
+        for row in self.rows:
+            if row.duplicate_of is not None:
+                status = "duplicate"
+            else:
+                status = row.result.status if row.result is not None else "error"
+            counts[status] = counts.get(status, 0) + 1
+        return counts
+
+
+def _elapsed_ms(started: float) -> int:
+    return int((time.perf_counter() - started) * 1000)
+
+
+def _select_window_topics(
+    working_set: MemoWorkingSet,
+    topics: list[str | None],
+    **kwargs: Any,
+) -> list[MemoSelection]:
+    return [select_memo_topic(working_set, topic=topic, **kwargs) for topic in topics]
+
+
+def run_opportunity_memo_batch(
+    *,
+    windows: list[tuple[datetime, datetime]],
+    topics: list[str | None],
+    settings: Settings | None = None,
+    session_factory: Callable[[], Session] = SessionLocal,
+    process_workers: int | None = None,
+    llm_concurrency: int | None = None,
+    research_provider: OpportunityResearchProvider | None = None,
+    memo_writer: OpportunityMemoWriter | None = None,
+    force: bool = False,
+) -> MemoBatchSummary:
+    """Run one memo per (window, topic); a `None` topic auto-selects within its window.
+
+    `process_workers` <= 1 evaluates selections in this process; otherwise each
+    window's selections run as one task in a process pool.
+    """
+
+    settings = settings or get_settings()
+    unsupported = sorted({topic for topic in topics if topic is not None and topic not in OPPORTUNITY_TOPICS})
+    if unsupported:
+        raise ValueError(f"unsupported topics {','.join(unsupported)}. allowed topics={','.join(OPPORTUNITY_TOPICS)}")
+    utc_windows = [(to_utc_naive(start), to_utc_naive(end)) for start, end in windows]
+    for start, end in utc_windows:
+        if start >= end:
+            raise ValueError("start_time must be earlier than end_time")
+    workers = settings.opportunity_memo_batch_process_workers if process_workers is None else process_workers
+    llm_workers = max(
+        1,
+        settings.opportunity_memo_batch_llm_concurrency if llm_concurrency is None else llm_concurrency,
+    )
+
+    started = time.perf_counter()
+    with session_factory() as db:
+        working_sets = load_memo_working_sets(db, windows=utc_windows)
+        recent_topics = [recent_memo_topics(db, start_time=start, end_time=end) for start, end in utc_windows]
+    snapshot_load_ms = _elapsed_ms(started)
+
+    selection_kwargs = {
+        "topic_universe": list(OPPORTUNITY_TOPICS),
+        "topic_score_threshold": settings.opportunity_memo_topic_score_threshold,
+    }
+
+    started = time.perf_counter()
+    if workers <= 1:
+        per_window = [
+            _select_window_topics(working_set, topics, recent_memo_topics=recent, **selection_kwargs)
+            for working_set, recent in zip(working_sets, recent_topics)
+        ]
+    else:
+        # One task per window, so each window's working set is pickled to a worker once, not once per topic.
+        with ProcessPoolExecutor(max_workers=min(workers, len(working_sets)) or 1) as pool:
+            futures = [
+                pool.submit(_select_window_topics, working_set, topics, recent_memo_topics=recent, **selection_kwargs)
+                for working_set, recent in zip(working_sets, recent_topics)
+            ]
+            per_window = [future.result() for future in futures]
+    selections = [selection for window_selections in per_window for selection in window_selections]
+    selection_ms = _elapsed_ms(started)
+
+    def _run_llm_stages(selection: MemoSelection) -> MemoBatchRow:
+        row = MemoBatchRow(
+            window_start_utc=selection.start_time,
+            window_end_utc=selection.end_time,
+            requested_topic=selection.requested_topic,
+        )
+        with session_factory() as db:
+            try:
+                row.result = run_opportunity_memo(
+                    db,
+                    start_time=selection.start_time,
+                    end_time=selection.end_time,
+                    topic=selection.requested_topic,
+                    settings=settings,
+                    research_provider=research_provider,
+                    memo_writer=memo_writer,
+                    force=force,
+                    selection=selection,
+                )
+                db.commit()
+            except Exception as exc:  # noqa: BLE001
+                db.rollback()
+                row.error = str(exc)[:800]
+                logger.exception(
+                    "opportunity_memo_batch_run_failed window_start=%s window_end=%s topic=%s",
+                    selection.start_time.isoformat(),
+                    selection.end_time.isoformat(),
+                    selection.requested_topic,
+                )
+                return row
+            run = db.get(OpportunityMemoRun, row.result.run_id)
+            row.stage_timings_ms = dict((run.stage_timings_json if run is not None else None) or {})
+        return row
+
+    # First row per (window, selected topic, input hash); no-topic selections have no hash and always run.
+    duplicate_of: list[int | None] = []
+    first_by_key: dict[tuple[datetime, datetime, str, str], int] = {}
+    for position, selection in enumerate(selections):
+        input_hash = memo_input_hash(selection, settings)
+        if input_hash is None or selection.selected_topic is None:
+            duplicate_of.append(None)
+            continue
+        key = (selection.start_time, selection.end_time, selection.selected_topic, input_hash)
+        duplicate_of.append(first_by_key.get(key))
+        first_by_key.setdefault(key, position)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=llm_workers, thread_name_prefix="memo-batch") as executor:
+        row_futures: dict[int, Future[MemoBatchRow]] = {
+            position: executor.submit(_run_llm_stages, selection)
+            for position, selection in enumerate(selections)
+            if duplicate_of[position] is None
+        }
+        rows: list[MemoBatchRow] = []
+        for position, selection in enumerate(selections):
+            original = duplicate_of[position]
+            if original is None:
+                rows.append(row_futures[position].result())
+                continue
+            shared = row_futures[original].result()
+            rows.append(
+                MemoBatchRow(
+                    window_start_utc=selection.start_time,
+                    window_end_utc=selection.end_time,
+                    requested_topic=selection.requested_topic,
+                    result=shared.result,
+                    error=shared.error,
+                    duplicate_of=original,
+                )
+            )
+    summary = MemoBatchSummary(
+        rows=rows,
+        snapshot_load_ms=snapshot_load_ms,
+        selection_ms=selection_ms,
+        llm_stages_ms=_elapsed_ms(started),
+    )
+
+    logger.info(
+        "opportunity_memo_batch_done windows=%s topics=%s runs=%s duplicates=%s statuses=%s snapshot_load_ms=%s selection_ms=%s llm_stages_ms=%s",
+        len(utc_windows),
+        len(topics),
+        len(row_futures),
+        len(rows) - len(row_futures),
+        ",".join(f"{status}:{count}" for status, count in sorted(summary.status_counts().items())),
+        summary.snapshot_load_ms,
+        summary.selection_ms,
+        summary.llm_stages_ms,
+    )
+    return summary
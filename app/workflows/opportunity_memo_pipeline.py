@@ -2,28 +2,34 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import time
 import uuid
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, object_session
 
 from ..config import Settings, get_settings
 from ..contexts.opportunity_memo import (
     OPPORTUNITY_TOPICS,
+    ExternalEvidencePack,
+    MemoSelection,
     OpenAiOpportunityMemoWriter,
     OpenAiOpportunityResearchProvider,
+    OpportunityMemoInputPack,
     OpportunityMemoRunResult,
+    OpportunityMemoStructuredArtifact,
     OpportunityMemoWriter,
     OpportunityMemoWriterError,
     OpportunityResearchError,
+    OpportunityResearchPlan,
     OpportunityResearchProvider,
-    build_opportunity_memo_input_pack,
     build_research_plan,
     canonical_hash_for_opportunity_memo,
     input_hash_for_opportunity_memo,
-    rank_topic_candidates,
+    load_memo_working_set,
     render_opportunity_memo_markdown,
     render_opportunity_memo_telegram_html,
+    select_memo_topic,
     validate_opportunity_memo,
 )
 from ..contexts.opportunity_memo.constants import (
@@ -36,7 +42,14 @@ from ..contexts.opportunity_memo.constants import (
     RUN_STATUS_RUNNING,
     RUN_STATUS_VALIDATION_FAILED,
 )
-from ..digest.adapters.telegram import send_telegram_text
+from ..contexts.opportunity_memo.research_cache import (
+    load_cached_research,
+    research_cache_key,
+    research_is_partial,
+    store_research,
+)
+from ..digest.adapters.base import PublishProgress
+from ..digest.adapters.telegram import OUTBOX_STATUS_QUEUED, send_telegram_text
 from ..models import (
     OpportunityMemoArtifact,
     OpportunityMemoDelivery,
@@ -48,8 +61,14 @@ from ..models import (
 
 logger = logging.getLogger("civicquant.opportunity_memo")
 
+# Artifacts that passed validation and reached delivery; a run with the same input hash reuses them.
+# A `delivery_failed` artifact is reused and sent again by the reusing run (see `_reuse_artifact`).
+_REUSABLE_ARTIFACT_STATUSES = ("delivered", "delivery_queued", "delivery_failed")
+# Owned by the outbox drainer; a redelivery must not re-queue or resend them.
+_IN_FLIGHT_DELIVERY_STATUSES = (OUTBOX_STATUS_QUEUED, "sending")
+
 
-def _to_utc_naive(value: datetime) -> datetime:
+def to_utc_naive(value: datetime) -> datetime:
     if value.tzinfo is None:
         return value
     return value.astimezone(timezone.utc).replace(tzinfo=None)
@@ -59,7 +78,7 @@ def _content_hash(value: str) -> str:
     return hashlib.sha256(value.encode("utf-8")).hexdigest()
 
 
-def _recent_memo_topics(
+def recent_memo_topics(
     db: Session,
     *,
     start_time: datetime,
@@ -97,10 +116,33 @@ def _generation_settings(settings: Settings) -> dict[str, object]:
     }
 
 
+def memo_input_hash(selection: MemoSelection, settings: Settings) -> str | None:
+    """Input hash a run of `selection` is reused by; None when nothing was selected."""
+
+    input_pack = selection.input_pack
+    if input_pack is None or selection.selected_topic is None:
+        return None
+    selected_primary_driver_payload = (
+        input_pack.selected_primary_driver.model_dump(mode="json")
+        if input_pack.selected_primary_driver is not None
+        else {}
+    )
+    return input_hash_for_opportunity_memo(
+        window_start_utc=selection.start_time,
+        window_end_utc=selection.end_time,
+        selected_topic=selection.selected_topic,
+        selected_event_ids=input_pack.selected_event_ids,
+        selected_primary_driver=selected_primary_driver_payload,
+        generation_settings=_generation_settings(settings),
+    )
+
+
 def _default_research_provider(settings: Settings) -> OpportunityResearchProvider:
     return OpenAiOpportunityResearchProvider(
         timeout_seconds=settings.opportunity_memo_openai_timeout_seconds,
         max_retries=settings.opportunity_memo_openai_max_retries,
+        max_concurrency=settings.opportunity_memo_research_max_concurrency,
+        deadline_seconds=settings.opportunity_memo_research_deadline_seconds,
     )
 
 
@@ -108,9 +150,234 @@ def _default_writer(settings: Settings) -> OpportunityMemoWriter:
     return OpenAiOpportunityMemoWriter(
         timeout_seconds=settings.opportunity_memo_openai_timeout_seconds,
         max_retries=settings.opportunity_memo_openai_max_retries,
+        max_concurrency=settings.opportunity_memo_writer_max_concurrency,
     )
 
 
+class _StageTimer:
+    """Milliseconds per pipeline stage, measured lap to lap (repeated stages add up)."""
+
+    def __init__(self) -> None:
+        self.timings_ms: dict[str, int] = {}
+        self._lap_started = time.perf_counter()
+
+    def _add(self, stage: str, elapsed_ms: int) -> None:
+        self.timings_ms[stage] = self.timings_ms.get(stage, 0) + elapsed_ms
+
+    def record(self, timings_ms: dict[str, int]) -> None:
+        """Add stages measured elsewhere and restart the current lap."""
+
+        for stage, elapsed_ms in timings_ms.items():
+            self._add(stage, elapsed_ms)
+        self._lap_started = time.perf_counter()
+
+    def lap(self, stage: str) -> None:
+        now = time.perf_counter()
+        self._add(stage, int((now - self._lap_started) * 1000))
+        self._lap_started = now
+
+
+def apply_memo_delivery_outcome(
+    delivery: OpportunityMemoDelivery,
+    *,
+    run: OpportunityMemoRun,
+    artifact: OpportunityMemoArtifact,
+    external_ref: str | None,
+    error: str | None,
+) -> str:
+    """Record a Telegram send result on the delivery and on the run that requested it.
+
+    The artifact's status only follows its own run's delivery; a reusing run's
+    redelivery is recorded on that run.
+    """
+
+    owns_artifact = artifact.run_id == run.id
+    delivery.attempted_at = datetime.utcnow()
+    if error is None:
+        delivery.status = "published"
+        delivery.published_at = datetime.utcnow()
+        delivery.last_error = None
+        delivery.external_ref = external_ref
+        run.status = RUN_STATUS_COMPLETED
+        if owns_artifact:
+            artifact.status = "delivered"
+        return "published"
+
+    delivery.status = "failed"
+    delivery.published_at = None
+    delivery.last_error = error[:1000]
+    delivery.external_ref = None
+    run.status = RUN_STATUS_DELIVERY_FAILED
+    if owns_artifact:
+        artifact.status = "delivery_failed"
+    return "failed"
+
+
+def _dispatch_delivery(
+    *,
+    delivery: OpportunityMemoDelivery,
+    run: OpportunityMemoRun,
+    artifact: OpportunityMemoArtifact,
+    payload: str,
+    settings: Settings,
+) -> str:
+    delivery.run_id = run.id
+    if settings.telegram_outbox_enabled:
+        # Sent by `drain_telegram_outbox`; generation does not wait on Telegram.
+        delivery.status = OUTBOX_STATUS_QUEUED
+        run.status = RUN_STATUS_COMPLETED
+        if artifact.run_id == run.id:
+            artifact.status = "delivery_queued"
+        return OUTBOX_STATUS_QUEUED
+    return _deliver_memo_now(delivery=delivery, run=run, artifact=artifact, payload=payload, settings=settings)
+
+
+def _find_reusable_artifact(db: Session, *, input_hash: str) -> OpportunityMemoArtifact | None:
+    return (
+        db.query(OpportunityMemoArtifact)
+        .filter(
+            OpportunityMemoArtifact.input_hash == input_hash,
+            OpportunityMemoArtifact.status.in_(_REUSABLE_ARTIFACT_STATUSES),
+        )
+        .order_by(OpportunityMemoArtifact.id.desc())
+        .first()
+    )
+
+
+def _reuse_artifact(
+    db: Session,
+    *,
+    run: OpportunityMemoRun,
+    artifact: OpportunityMemoArtifact,
+    redeliver: bool,
+    settings: Settings,
+) -> str | None:
+    """Complete `run` with an existing artifact; returns the resulting delivery status.
+
+    The artifact is sent again when `redeliver` is set or when it was never
+    delivered (no delivery row, or a failed one). The attempt is recorded on
+    `run`; the artifact and its original run keep their own status.
+    """
+
+    run.selection_diagnostics_json = {
+        **(run.selection_diagnostics_json or {}),
+        "reused_artifact_id": artifact.id,
+        "reused_run_id": artifact.run_id,
+    }
+    run.status = RUN_STATUS_COMPLETED
+    # One delivery row per artifact and destination; a redelivery resends through it
+    # and points it at the run that asked (`delivery.run_id`).
+    delivery = (
+        db.query(OpportunityMemoDelivery)
+        .filter(
+            OpportunityMemoDelivery.artifact_id == artifact.id,
+            OpportunityMemoDelivery.destination == MEMO_DESTINATION_TELEGRAM,
+        )
+        .one_or_none()
+    )
+    if not redeliver and delivery is not None and delivery.status != "failed":
+        return delivery.status
+    if delivery is not None and delivery.status in _IN_FLIGHT_DELIVERY_STATUSES:
+        logger.info(
+            "opportunity_memo_redeliver_skipped_in_flight run_id=%s artifact_id=%s delivery_status=%s",
+            run.id,
+            artifact.id,
+            delivery.status,
+        )
+        return delivery.status
+
+    memo = OpportunityMemoStructuredArtifact.model_validate(artifact.memo_json)
+    telegram_payload = render_opportunity_memo_telegram_html(
+        memo=memo,
+        topic=artifact.topic,
+        window_start_utc=artifact.window_start_utc,
+        window_end_utc=artifact.window_end_utc,
+    )
+    if delivery is None:
+        delivery = OpportunityMemoDelivery(
+            artifact_id=artifact.id,
+            destination=MEMO_DESTINATION_TELEGRAM,
+            status="failed",
+            attempted_at=datetime.utcnow(),
+        )
+        db.add(delivery)
+    content_hash = _content_hash(telegram_payload)
+    if delivery.status == "published" or delivery.content_hash != content_hash:
+        # A fresh send: chunk progress only resumes an interrupted send of the same content.
+        delivery.sent_chunk_refs = None
+    delivery.content = telegram_payload
+    delivery.content_hash = content_hash
+    db.flush()
+    db.commit()
+    return _dispatch_delivery(delivery=delivery, run=run, artifact=artifact, payload=telegram_payload, settings=settings)
+
+
+def _deliver_memo_now(
+    *,
+    delivery: OpportunityMemoDelivery,
+    run: OpportunityMemoRun,
+    artifact: OpportunityMemoArtifact,
+    payload: str,
+    settings: Settings,
+) -> str:
+    db = object_session(delivery)
+
+    def persist(refs: list[str]) -> None:
+        delivery.sent_chunk_refs = refs
+        if db is not None:
+            db.commit()
+
+    progress = PublishProgress(sent_refs=list(delivery.sent_chunk_refs or ()), on_record=persist)
+    try:
+        external_ref = send_telegram_text(payload, settings=settings, progress=progress)
+    except Exception as exc:  # noqa: BLE001
+        return apply_memo_delivery_outcome(delivery, run=run, artifact=artifact, external_ref=None, error=str(exc))
+    return apply_memo_delivery_outcome(delivery, run=run, artifact=artifact, external_ref=external_ref, error=None)
+
+
+def _retrieve_research(
+    db: Session,
+    *,
+    provider: OpportunityResearchProvider,
+    input_pack: OpportunityMemoInputPack,
+    plan: OpportunityResearchPlan,
+    settings: Settings,
+    refresh: bool,
+) -> ExternalEvidencePack:
+    ttl_seconds = settings.opportunity_memo_research_cache_ttl_seconds
+    if ttl_seconds <= 0:
+        return provider.retrieve(input_pack=input_pack, plan=plan, settings=settings)
+
+    model_name = settings.opportunity_memo_research_model or settings.openai_model
+    cache_key = research_cache_key(plan=plan, provider_name=provider.name, model_name=model_name)
+    if not refresh:
+        cached = load_cached_research(db, cache_key=cache_key)
+        if cached is not None:
+            logger.info("opportunity_research_cache_hit cache_key=%s topic=%s", cache_key, plan.topic)
+            return cached
+
+    external_pack = provider.retrieve(input_pack=input_pack, plan=plan, settings=settings)
+    cache_status = "refreshed" if refresh else "miss"
+    if research_is_partial(external_pack):
+        # Some queries timed out or failed; caching would pin the gap for the whole TTL.
+        cache_status = "not_cached_partial"
+        logger.info("opportunity_research_not_cached_partial cache_key=%s topic=%s", cache_key, plan.topic)
+    else:
+        store_research(
+            db,
+            cache_key=cache_key,
+            plan=plan,
+            pack=external_pack,
+            model_name=model_name,
+            ttl_seconds=ttl_seconds,
+        )
+    external_pack.retrieval_diagnostics = {
+        **external_pack.retrieval_diagnostics,
+        "research_cache": {"status": cache_status, "cache_key": cache_key},
+    }
+    return external_pack
+
+
 def run_opportunity_memo(
     db: Session,
     *,
@@ -120,10 +387,24 @@ def run_opportunity_memo(
     settings: Settings | None = None,
     research_provider: OpportunityResearchProvider | None = None,
     memo_writer: OpportunityMemoWriter | None = None,
+    refresh_research: bool = False,
+    force: bool = False,
+    redeliver: bool = False,
+    selection: MemoSelection | None = None,
 ) -> OpportunityMemoRunResult:
+    """Select a topic, build the input pack, research, write, validate, persist and deliver one memo.
+
+    Unless `force` is set, a run whose input hash (window, topic, selected
+    events, primary driver and generation settings) matches an already
+    delivered artifact completes with that artifact and makes no LLM calls;
+    `redeliver` sends the reused artifact again. A precomputed `selection`
+    (see `select_memo_topic`) replaces topic ranking and input-pack building.
+    """
+
     settings = settings or get_settings()
-    start_utc = _to_utc_naive(start_time)
-    end_utc = _to_utc_naive(end_time)
+    timer = _StageTimer()
+    start_utc = to_utc_naive(start_time)
+    end_utc = to_utc_naive(end_time)
     if start_utc >= end_utc:
         raise ValueError("start_time must be earlier than end_time")
 
@@ -156,72 +437,54 @@ def run_opportunity_memo(
             validation_errors=run.validation_errors_json,
         )
 
-    recent_topics = _recent_memo_topics(db, start_time=start_utc, end_time=end_utc)
-    topic_universe = [topic] if topic is not None else list(OPPORTUNITY_TOPICS)
-    ranked_topics = rank_topic_candidates(
-        db,
-        start_time=start_utc,
-        end_time=end_utc,
-        topic_universe=topic_universe,
-        limit=max(1, len(topic_universe)),
-        recent_memo_topics=recent_topics,
-    )
-
-    selected_topic = topic
-    selected_topic_score = 0.0
-    selection_reason = "manual_topic_override" if topic is not None else "auto_selection_threshold_passed"
-    selected_topic_breakdown: dict[str, float] = {
-        "normalized_event_count": 0.0,
-        "normalized_weighted_impact": 0.0,
-        "normalized_novelty": 0.0,
-        "normalized_coherence": 0.0,
-        "normalized_actionability": 0.0,
-    }
-
-    if topic is None:
-        if not ranked_topics or ranked_topics[0].topic_score < settings.opportunity_memo_topic_score_threshold:
-            run.status = RUN_STATUS_NO_TOPIC_FOUND
-            run.error_message = "no memo-worthy topic found"
-            run.selection_diagnostics_json = {
-                "threshold": settings.opportunity_memo_topic_score_threshold,
-                "ranked_topics": [row.model_dump(mode="json") for row in ranked_topics],
-            }
-            run.completed_at = datetime.utcnow()
-            run.updated_at = datetime.utcnow()
-            db.flush()
-            logger.info(
-                "opportunity_memo_no_topic run_id=%s window_start=%s window_end=%s",
-                run.id,
-                start_utc.isoformat(),
-                end_utc.isoformat(),
-            )
-            return OpportunityMemoRunResult(
-                run_id=run.id,
-                status=run.status,
-                selected_topic=None,
-                topic_score=None,
-                message=run.error_message,
-            )
-
-        selected_topic = ranked_topics[0].topic
-        selected_topic_score = ranked_topics[0].topic_score
-        selected_topic_breakdown = ranked_topics[0].breakdown.model_dump(mode="json")
-    else:
-        if ranked_topics:
-            selected_topic_score = ranked_topics[0].topic_score
-            selected_topic_breakdown = ranked_topics[0].breakdown.model_dump(mode="json")
-
-    assert selected_topic is not None
+    if selection is None:
+        working_set = load_memo_working_set(db, start_time=start_utc, end_time=end_utc)
+        recent_topics = recent_memo_topics(db, start_time=start_utc, end_time=end_utc)
+        timer.lap("topic_selection")
+        selection = select_memo_topic(
+            working_set,
+            topic=topic,
+            topic_universe=list(OPPORTUNITY_TOPICS),
+            recent_memo_topics=recent_topics,
+            topic_score_threshold=settings.opportunity_memo_topic_score_threshold,
+        )
+    elif (selection.start_time, selection.end_time, selection.requested_topic) != (start_utc, end_utc, topic):
+        raise ValueError("selection does not match the requested memo window/topic")
+    # Ranking and the input pack may have been computed elsewhere (batch worker); keep their timings.
+    timer.record(selection.timings_ms)
+    ranked_topics = selection.ranked_topics
+
+    if selection.input_pack is None:
+        run.status = RUN_STATUS_NO_TOPIC_FOUND
+        run.error_message = "no memo-worthy topic found"
+        run.selection_diagnostics_json = {
+            "threshold": settings.opportunity_memo_topic_score_threshold,
+            "ranked_topics": [row.model_dump(mode="json") for row in ranked_topics],
+        }
+        run.stage_timings_json = dict(timer.timings_ms)
+        run.completed_at = datetime.utcnow()
+        run.updated_at = datetime.utcnow()
+        db.flush()
+        logger.info(
+            "opportunity_memo_no_topic run_id=%s window_start=%s window_end=%s",
+            run.id,
+            start_utc.isoformat(),
+            end_utc.isoformat(),
+        )
+        return OpportunityMemoRunResult(
+            run_id=run.id,
+            status=run.status,
+            selected_topic=None,
+            topic_score=None,
+            message=run.error_message,
+        )
 
-    input_pack, topic_events = build_opportunity_memo_input_pack(
-        db,
-        start_time=start_utc,
-        end_time=end_utc,
-        topic=selected_topic,
-        topic_score=selected_topic_score,
-        selection_reason=selection_reason,
-        topic_breakdown=selected_topic_breakdown,
-    )
+    selected_topic = selection.selected_topic
+    selected_topic_score = selection.topic_score
+    input_pack = selection.input_pack
+    topic_events = selection.topic_events
+    if selected_topic is None:
+        raise ValueError("memo selection has an input pack but no selected topic")
 
     run.selected_topic = selected_topic
     run.topic_score = float(selected_topic_score)
@@ -239,17 +502,59 @@ def run_opportunity_memo(
     run.updated_at = datetime.utcnow()
     db.flush()
 
+    input_hash = memo_input_hash(selection, settings)
+    timer.lap("input_pack")
+
+    reusable_artifact = None if force else _find_reusable_artifact(db, input_hash=input_hash)
+    if reusable_artifact is not None:
+        delivery_status = _reuse_artifact(
+            db,
+            run=run,
+            artifact=reusable_artifact,
+            redeliver=redeliver,
+            settings=settings,
+        )
+        timer.lap("delivery")
+        run.stage_timings_json = dict(timer.timings_ms)
+        run.completed_at = datetime.utcnow()
+        run.updated_at = datetime.utcnow()
+        db.flush()
+        logger.info(
+            "opportunity_memo_run_reused run_id=%s topic=%s input_hash=%s artifact_id=%s redeliver=%s delivery_status=%s",
+            run.id,
+            selected_topic,
+            input_hash,
+            reusable_artifact.id,
+            redeliver,
+            delivery_status,
+        )
+        return OpportunityMemoRunResult(
+            run_id=run.id,
+            status=run.status,
+            selected_topic=selected_topic,
+            topic_score=selected_topic_score,
+            artifact_id=reusable_artifact.id,
+            delivery_status=delivery_status,
+            message=f"reused artifact {reusable_artifact.id} from run {reusable_artifact.run_id} (identical input hash)",
+            reused_artifact=True,
+        )
+
     provider = research_provider or _default_research_provider(settings)
     writer = memo_writer or _default_writer(settings)
 
     try:
         research_plan = build_research_plan(input_pack)
-        external_pack = provider.retrieve(
+        external_pack = _retrieve_research(
+            db,
+            provider=provider,
             input_pack=input_pack,
             plan=research_plan,
             settings=settings,
+            refresh=refresh_research,
         )
     except OpportunityResearchError as exc:
+        timer.lap("research")
+        run.stage_timings_json = dict(timer.timings_ms)
         run.status = RUN_STATUS_VALIDATION_FAILED
         run.error_message = str(exc)
         run.validation_errors_json = [
@@ -267,6 +572,8 @@ def run_opportunity_memo(
             validation_errors=run.validation_errors_json,
         )
 
+    timer.lap("research")
+
     if settings.opportunity_memo_external_source_limit > 0:
         external_pack.sources = external_pack.sources[: settings.opportunity_memo_external_source_limit]
 
@@ -277,6 +584,8 @@ def run_opportunity_memo(
             settings=settings,
         )
     except OpportunityMemoWriterError as exc:
+        timer.lap("writer")
+        run.stage_timings_json = dict(timer.timings_ms)
         run.status = RUN_STATUS_VALIDATION_FAILED
         run.error_message = str(exc)
         run.validation_errors_json = [
@@ -294,6 +603,8 @@ def run_opportunity_memo(
             validation_errors=run.validation_errors_json,
         )
 
+    timer.lap("writer")
+
     validation = validate_opportunity_memo(
         memo=memo,
         input_pack=input_pack,
@@ -302,7 +613,9 @@ def run_opportunity_memo(
         min_external_sources=settings.opportunity_memo_min_external_sources,
         topic_selection_threshold=settings.opportunity_memo_topic_score_threshold,
     )
+    timer.lap("validation")
     if not validation.ok:
+        run.stage_timings_json = dict(timer.timings_ms)
         run.status = RUN_STATUS_VALIDATION_FAILED
         run.error_message = "; ".join(issue.message for issue in validation.errors)
         run.validation_errors_json = [issue.model_dump(mode="json") for issue in validation.errors]
@@ -318,20 +631,6 @@ def run_opportunity_memo(
             validation_errors=run.validation_errors_json,
         )
 
-    generation_settings = _generation_settings(settings)
-    selected_primary_driver_payload = (
-        input_pack.selected_primary_driver.model_dump(mode="json")
-        if input_pack.selected_primary_driver is not None
-        else {}
-    )
-    input_hash = input_hash_for_opportunity_memo(
-        window_start_utc=start_utc,
-        window_end_utc=end_utc,
-        selected_topic=selected_topic,
-        selected_event_ids=input_pack.selected_event_ids,
-        selected_primary_driver=selected_primary_driver_payload,
-        generation_settings=generation_settings,
-    )
     canonical_hash = canonical_hash_for_opportunity_memo(memo=memo)
     canonical_text = render_opportunity_memo_markdown(
         memo=memo,
@@ -416,38 +715,29 @@ def run_opportunity_memo(
 
     # Persist artifact + source links before any delivery attempt.
     db.commit()
+    timer.lap("persist")
 
-    try:
-        external_ref = send_telegram_text(telegram_payload, settings=settings)
-        delivery.status = "published"
-        delivery.published_at = datetime.utcnow()
-        delivery.last_error = None
-        delivery.external_ref = external_ref
-        run.status = RUN_STATUS_COMPLETED
-        artifact.status = "delivered"
-        delivery_status = "published"
-    except Exception as exc:  # noqa: BLE001
-        delivery.status = "failed"
-        delivery.published_at = None
-        delivery.last_error = str(exc)[:1000]
-        delivery.external_ref = None
-        run.status = RUN_STATUS_DELIVERY_FAILED
-        artifact.status = "delivery_failed"
-        delivery_status = "failed"
+    delivery_status = _dispatch_delivery(
+        delivery=delivery, run=run, artifact=artifact, payload=telegram_payload, settings=settings
+    )
 
+    timer.lap("delivery")
+    run.stage_timings_json = dict(timer.timings_ms)
     run.completed_at = datetime.utcnow()
     run.updated_at = datetime.utcnow()
     db.flush()
     db.commit()
 
     logger.info(
-        "opportunity_memo_run_done run_id=%s status=%s topic=%s topic_score=%.4f artifact_id=%s delivery_status=%s",
+        "opportunity_memo_run_done run_id=%s status=%s topic=%s topic_score=%.4f artifact_id=%s "
+        "delivery_status=%s stage_timings_ms=%s",
         run.id,
         run.status,
         selected_topic,
         selected_topic_score,
         artifact.id,
         delivery_status,
+        ",".join(f"{stage}:{elapsed}" for stage, elapsed in timer.timings_ms.items()),
     )
     return OpportunityMemoRunResult(
         run_id=run.id,
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import uuid
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
@@ -17,6 +18,7 @@ from ..contexts.extraction.canonicalization import CANONICALIZER_VERSION
 from ..contexts.extraction.extraction_llm_client import OpenAiExtractionClient, ProviderError
 from ..contexts.extraction.extraction_validation import ExtractionValidationError
 from ..contexts.themes.evidence import persist_theme_matches_for_event
+from ..contexts.opportunity_memo.topic_store import sync_event_opportunity_topic
 from ..contexts.extraction.processing import (
     OPENAI_EXTRACTOR_NAME,
     materialize_extraction_for_raw_message,
@@ -41,6 +43,7 @@ class RunSummary:
     completed: int = 0
     failed: int = 0
     skipped: int = 0
+    lock_busy: bool = False
 
 
 def ensure_processing_state(db: Session, raw_message_id: int) -> MessageProcessingState:
@@ -53,26 +56,43 @@ def ensure_processing_state(db: Session, raw_message_id: int) -> MessageProcessi
     return state
 
 
+def _eligible_for_extraction(now: datetime):
+    return or_(
+        MessageProcessingState.id.is_(None),
+        MessageProcessingState.status.in_(["pending", "failed"]),
+        (MessageProcessingState.status == "in_progress")
+        & (MessageProcessingState.lease_expires_at.is_not(None))
+        & (MessageProcessingState.lease_expires_at <= now),
+    )
+
+
 def get_eligible_messages_for_extraction(db: Session, *, batch_size: int) -> list[RawMessage]:
     now = datetime.utcnow()
     return (
         db.query(RawMessage)
         .outerjoin(MessageProcessingState, MessageProcessingState.raw_message_id == RawMessage.id)
-        .filter(
-            or_(
-                MessageProcessingState.id.is_(None),
-                MessageProcessingState.status.in_(["pending", "failed"]),
-                (MessageProcessingState.status == "in_progress")
-                & (MessageProcessingState.lease_expires_at.is_not(None))
-                & (MessageProcessingState.lease_expires_at <= now),
-            )
-        )
+        .filter(_eligible_for_extraction(now))
         .order_by(RawMessage.message_timestamp_utc.desc(), RawMessage.id.desc())
         .limit(batch_size)
         .all()
     )
 
 
+def get_eligible_messages_by_id(db: Session, *, raw_message_ids: Sequence[int]) -> list[RawMessage]:
+    """Eligible rows among `raw_message_ids`, returned in the order given."""
+    if not raw_message_ids:
+        return []
+    now = datetime.utcnow()
+    rows = (
+        db.query(RawMessage)
+        .outerjoin(MessageProcessingState, MessageProcessingState.raw_message_id == RawMessage.id)
+        .filter(RawMessage.id.in_(list(raw_message_ids)), _eligible_for_extraction(now))
+        .all()
+    )
+    by_id = {row.id: row for row in rows}
+    return [by_id[raw_id] for raw_id in dict.fromkeys(raw_message_ids) if raw_id in by_id]
+
+
 def _acquire_lock(db: Session, *, run_id: str, lock_seconds: int) -> bool:
     now = datetime.utcnow()
     lock = db.query(ProcessingLock).filter_by(lock_name="phase2_extraction").one_or_none()
@@ -102,6 +122,38 @@ def process_phase2_batch(
     force_reprocess: bool = False,
 ) -> RunSummary:
     settings = settings or get_settings()
+    return _run_phase2(
+        db,
+        settings,
+        force_reprocess=force_reprocess,
+        select_messages=lambda: get_eligible_messages_for_extraction(db, batch_size=settings.phase2_batch_size),
+    )
+
+
+def process_phase2_messages(
+    db: Session,
+    raw_message_ids: Sequence[int],
+    settings: Settings | None = None,
+    *,
+    force_reprocess: bool = False,
+) -> RunSummary:
+    """Run phase2 over specific queued raw messages instead of the DB scan."""
+    settings = settings or get_settings()
+    return _run_phase2(
+        db,
+        settings,
+        force_reprocess=force_reprocess,
+        select_messages=lambda: get_eligible_messages_by_id(db, raw_message_ids=raw_message_ids),
+    )
+
+
+def _run_phase2(
+    db: Session,
+    settings: Settings,
+    *,
+    force_reprocess: bool,
+    select_messages: Callable[[], list[RawMessage]],
+) -> RunSummary:
     effective_force_reprocess = bool(force_reprocess or settings.phase2_force_reprocess)
     run_id = str(uuid.uuid4())
     summary = RunSummary(processing_run_id=run_id)
@@ -109,6 +161,7 @@ def process_phase2_batch(
 
     if not _acquire_lock(db, run_id=run_id, lock_seconds=settings.phase2_scheduler_lock_seconds):
         logger.info("phase2_lock_busy processing_run_id=%s", run_id)
+        summary.lock_busy = True
         return summary
 
     try:
@@ -131,7 +184,7 @@ def process_phase2_batch(
             max_retries=settings.openai_max_retries,
         )
 
-        eligible = get_eligible_messages_for_extraction(db, batch_size=settings.phase2_batch_size)
+        eligible = select_messages()
         summary.selected = len(eligible)
         for raw in eligible:
             state = ensure_processing_state(db, raw.id)
@@ -187,6 +240,7 @@ def process_phase2_batch(
                         event_id=event_id,
                         extraction=processed.extraction_model,
                     )
+                    sync_event_opportunity_topic(db, event_id=event_id)
                     event_row = db.query(Event).filter_by(id=event_id).one_or_none()
                     if event_row is not None:
                         persist_theme_matches_for_event(
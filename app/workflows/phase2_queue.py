@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections.abc import Callable
+
+from sqlalchemy.orm import Session
+
+from ..config import Settings, get_settings
+from .phase2_pipeline import RunSummary, process_phase2_batch, process_phase2_messages
+
+
+logger = logging.getLogger("civicquant.phase2")
+
+PRIORITY_BREAKING = 0
+PRIORITY_NORMAL = 1
+
+
+class Phase2WorkQueue:
+    """
+    Bounded, de-duplicating priority queue of raw_message_ids awaiting phase2.
+
+    Breaking bulletins drain first; FIFO within a priority. The queue is a
+    latency optimization only: anything dropped (full queue, process restart)
+    is still picked up by the phase2 DB scan.
+    """
+
+    def __init__(self, max_size: int = 10_000) -> None:
+        self._max_size = max_size
+        self._heap: list[tuple[int, int, int]] = []
+        self._queued: set[int] = set()
+        self._sequence = itertools.count()
+        self._cond = threading.Condition()
+
+    def __len__(self) -> int:
+        with self._cond:
+            return len(self._heap)
+
+    def enqueue(self, raw_message_id: int, *, breaking: bool = False) -> bool:
+        priority = PRIORITY_BREAKING if breaking else PRIORITY_NORMAL
+        with self._cond:
+            if raw_message_id in self._queued:
+                return False
+            if len(self._heap) >= self._max_size:
+                logger.warning("phase2_queue_full raw_message_id=%s max_size=%s", raw_message_id, self._max_size)
+                return False
+            heapq.heappush(self._heap, (priority, next(self._sequence), raw_message_id))
+            self._queued.add(raw_message_id)
+            self._cond.notify()
+            return True
+
+    def drain(self, max_items: int, *, timeout: float | None = None) -> list[int]:
+        """Pop up to `max_items` ids in priority order, waiting up to `timeout` for the first."""
+        with self._cond:
+            if not self._heap and timeout:
+                self._cond.wait(timeout)
+            out: list[int] = []
+            while self._heap and len(out) < max_items:
+                _, _, raw_message_id = heapq.heappop(self._heap)
+                self._queued.discard(raw_message_id)
+                out.append(raw_message_id)
+            return out
+
+    def requeue_front(self, raw_message_ids: list[int]) -> None:
+        """Put drained ids back ahead of everything else (e.g. phase2 lock was busy)."""
+        with self._cond:
+            for raw_message_id in raw_message_ids:
+                if raw_message_id in self._queued:
+                    continue
+                heapq.heappush(self._heap, (PRIORITY_BREAKING - 1, next(self._sequence), raw_message_id))
+                self._queued.add(raw_message_id)
+            self._cond.notify()
+
+
+def phase2_queue_consumer_enabled(settings: Settings) -> bool:
+    """The API only runs a consumer (and so only enqueues) when phase2 itself is enabled."""
+
+    return settings.phase2_queue_enabled and settings.phase2_extraction_enabled
+
+
+_queue_lock = threading.Lock()
+_work_queue: Phase2WorkQueue | None = None
+
+
+def get_phase2_work_queue() -> Phase2WorkQueue:
+    global _work_queue
+    with _queue_lock:
+        if _work_queue is None:
+            _work_queue = Phase2WorkQueue(max_size=get_settings().phase2_queue_max_size)
+        return _work_queue
+
+
+class Phase2QueueConsumer:
+    """
+    Long-running phase2 worker fed by `Phase2WorkQueue`.
+
+    Queued ids are processed as soon as they arrive. Every
+    `phase2_queue_fallback_scan_seconds` the consumer also runs
+    `process_phase2_batch`, whether or not the queue has work, so rows the queue
+    never sees (failed retries, expired leases, backfill, other API processes,
+    dropped enqueues) cannot starve behind sustained ingest.
+    """
+
+    def __init__(
+        self,
+        work_queue: Phase2WorkQueue,
+        session_factory: Callable[[], Session],
+        settings: Settings | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._queue = work_queue
+        self._session_factory = session_factory
+        self._settings = settings or get_settings()
+        self._clock = clock
+        self._last_scan_at: float | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def run_once(self) -> RunSummary | None:
+        settings = self._settings
+        now = self._clock()
+        if self._last_scan_at is None or now - self._last_scan_at >= settings.phase2_queue_fallback_scan_seconds:
+            self._last_scan_at = now
+            return self._run(
+                lambda db: process_phase2_batch(db, settings, force_reprocess=settings.phase2_force_reprocess)
+            )
+
+        raw_message_ids = self._queue.drain(
+            settings.phase2_batch_size,
+            timeout=settings.phase2_queue_idle_wait_seconds,
+        )
+        if not raw_message_ids:
+            return None
+        summary = self._run(
+            lambda db: process_phase2_messages(
+                db,
+                raw_message_ids,
+                settings,
+                force_reprocess=settings.phase2_force_reprocess,
+            )
+        )
+        if summary is not None and summary.lock_busy:
+            self._queue.requeue_front(raw_message_ids)
+        return summary
+
+    def _run(self, fn: Callable[[Session], RunSummary]) -> RunSummary | None:
+        with self._session_factory() as db:
+            try:
+                summary = fn(db)
+                db.commit()
+                return summary
+            except Exception as exc:  # noqa: BLE001
+                db.rollback()
+                logger.exception("phase2_queue_run_failed reason=%s", type(exc).__name__)
+                return None
+
+    def _loop(self) -> None:
+        logger.info("phase2_queue_consumer_started")
+        while not self._stop.is_set():
+            summary = self.run_once()
+            if summary is not None and summary.lock_busy:
+                self._stop.wait(self._settings.phase2_queue_idle_wait_seconds)
+        logger.info("phase2_queue_consumer_stopped")
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="phase2-queue-consumer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
@@ -0,0 +1,302 @@
+"""Background Telegram outbox.
+
+With `TELEGRAM_OUTBOX_ENABLED`, digest and opportunity-memo generation only
+write their delivery rows (`published_posts` / `opportunity_memo_deliveries`)
+with status `queued`. This module sends those rows through the shared
+Telegram transport and records the outcome, so generation never waits on
+Telegram (rate limits, 429 backoff, chunked sends).
+
+Rows are claimed with a conditional `queued -> sending` update that stamps
+`claimed_at`, so two drainers never send the same row. A row of either kind
+still `sending` after `delivery_claim_lease_seconds` (its drainer died) is
+claimed again, and the outcome is only written while the claim still holds.
+
+Each accepted Telegram chunk is committed to the row's `sent_chunk_refs`, so
+any resend starts at the first unsent chunk. Digest rows follow the publish
+stage's rules: a failure that leaves chunks on the channel is `partial`
+(resumed by the next `run_digest`), and an error that does not prove
+non-delivery is `unknown` rather than `failed`.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+
+from ..config import Settings, get_settings
+from ..contexts.opportunity_memo.constants import MEMO_DESTINATION_TELEGRAM
+from ..digest.adapters.base import PublishNotDelivered, PublishProgress
+from ..digest.adapters.telegram import OUTBOX_STATUS_QUEUED, send_telegram_text
+from ..digest.dedupe import mark_events_published
+from ..models import DigestArtifact, OpportunityMemoDelivery, PublishedPost
+from .opportunity_memo_pipeline import apply_memo_delivery_outcome
+
+
+logger = logging.getLogger("civicquant.publisher.telegram")
+
+OUTBOX_STATUS_SENDING = "sending"
+DIGEST_TELEGRAM_DESTINATION = "vip_telegram"
+
+SendFn = Callable[..., str | None]
+
+
+@dataclass
+class OutboxSummary:
+    digest_published: int = 0
+    digest_failed: int = 0
+    memo_published: int = 0
+    memo_failed: int = 0
+
+    @property
+    def processed(self) -> int:
+        return self.digest_published + self.digest_failed + self.memo_published + self.memo_failed
+
+
+def _claimable(model, *, stale_before: datetime):
+    return or_(
+        model.status == OUTBOX_STATUS_QUEUED,
+        and_(
+            model.status == OUTBOX_STATUS_SENDING,
+            or_(model.claimed_at.is_(None), model.claimed_at < stale_before),
+        ),
+    )
+
+
+def _claimable_ids(db: Session, model, *, destination: str, stale_before: datetime, limit: int) -> list[int]:
+    return [
+        row_id
+        for (row_id,) in db.query(model.id)
+        .filter(model.destination == destination, _claimable(model, stale_before=stale_before))
+        .order_by(model.id.asc())
+        .limit(limit)
+        .all()
+    ]
+
+
+def _claim(db: Session, model, row_id: int, *, stale_before: datetime) -> datetime | None:
+    """Take the row (`queued`, or `sending` past its lease); returns the claim stamp, or None if taken."""
+
+    claimed_at = datetime.utcnow()
+    claimed = (
+        db.query(model)
+        .filter(model.id == row_id, _claimable(model, stale_before=stale_before))
+        .update({model.status: OUTBOX_STATUS_SENDING, model.claimed_at: claimed_at}, synchronize_session=False)
+    )
+    db.commit()
+    return claimed_at if claimed == 1 else None
+
+
+def _release(db: Session, model, row_id: int, *, claimed_at: datetime) -> bool:
+    """Clear this drainer's claim; False if another drainer took the row over. Caller commits."""
+
+    released = (
+        db.query(model)
+        .filter(
+            model.id == row_id,
+            model.status == OUTBOX_STATUS_SENDING,
+            model.claimed_at == claimed_at,
+        )
+        .update({model.claimed_at: None}, synchronize_session=False)
+    )
+    return released == 1
+
+
+def _lost_claim(db: Session, *, kind: str, row_id: int) -> None:
+    db.rollback()
+    logger.warning("telegram_outbox_claim_lost kind=%s row_id=%s", kind, row_id)
+
+
+def _row_progress(db: Session, row) -> PublishProgress:
+    def persist(refs: list[str]) -> None:
+        row.sent_chunk_refs = refs
+        db.commit()
+
+    return PublishProgress(sent_refs=list(row.sent_chunk_refs or ()), on_record=persist)
+
+
+def _send(
+    send: SendFn, payload: str, settings: Settings, progress: PublishProgress
+) -> tuple[str | None, Exception | None]:
+    try:
+        return send(payload, settings=settings, progress=progress), None
+    except Exception as exc:  # noqa: BLE001
+        return None, exc
+
+
+def _digest_failure_status(error: Exception, progress: PublishProgress) -> str:
+    if not isinstance(error, PublishNotDelivered):
+        return "unknown"
+    return "partial" if progress.sent_refs else "failed"
+
+
+def _drain_digest_posts(
+    db: Session,
+    *,
+    settings: Settings,
+    send: SendFn,
+    limit: int,
+    stale_before: datetime,
+    summary: OutboxSummary,
+) -> None:
+    row_ids = _claimable_ids(
+        db, PublishedPost, destination=DIGEST_TELEGRAM_DESTINATION, stale_before=stale_before, limit=limit
+    )
+    for row_id in row_ids:
+        claimed_at = _claim(db, PublishedPost, row_id, stale_before=stale_before)
+        if claimed_at is None:
+            continue
+        post = db.get(PublishedPost, row_id)
+        db.refresh(post)
+        progress = _row_progress(db, post)
+        external_ref, error = _send(send, post.content, settings, progress)
+        if not _release(db, PublishedPost, row_id, claimed_at=claimed_at):
+            _lost_claim(db, kind="digest", row_id=row_id)
+            continue
+        post.claimed_at = None
+        post.last_attempted_at = datetime.utcnow()
+        if error is None:
+            post.status = "published"
+            post.published_at = datetime.utcnow()
+            post.external_ref = external_ref
+            post.last_error = None
+            artifact = db.get(DigestArtifact, post.artifact_id)
+            covered = (artifact.digest_json or {}).get("covered_event_ids") if artifact is not None else None
+            if covered is None:
+                logger.warning("telegram_outbox_missing_coverage artifact_id=%s", post.artifact_id)
+            else:
+                mark_events_published(db, event_ids=[int(event_id) for event_id in covered], destination=post.destination)
+            summary.digest_published += 1
+        else:
+            post.status = _digest_failure_status(error, progress)
+            post.published_at = None
+            post.external_ref = None
+            post.last_error = f"{type(error).__name__}: {error}"[:1000]
+            summary.digest_failed += 1
+        db.commit()
+        logger.info(
+            "telegram_outbox_sent kind=digest row_id=%s artifact_id=%s status=%s",
+            row_id,
+            post.artifact_id,
+            post.status,
+        )
+
+
+def _drain_memo_deliveries(
+    db: Session,
+    *,
+    settings: Settings,
+    send: SendFn,
+    limit: int,
+    stale_before: datetime,
+    summary: OutboxSummary,
+) -> None:
+    row_ids = _claimable_ids(
+        db, OpportunityMemoDelivery, destination=MEMO_DESTINATION_TELEGRAM, stale_before=stale_before, limit=limit
+    )
+    for row_id in row_ids:
+        claimed_at = _claim(db, OpportunityMemoDelivery, row_id, stale_before=stale_before)
+        if claimed_at is None:
+            continue
+        delivery = db.get(OpportunityMemoDelivery, row_id)
+        db.refresh(delivery)
+        external_ref, error = _send(send, delivery.content, settings, _row_progress(db, delivery))
+        if not _release(db, OpportunityMemoDelivery, row_id, claimed_at=claimed_at):
+            _lost_claim(db, kind="memo", row_id=row_id)
+            continue
+        delivery.claimed_at = None
+        artifact = delivery.artifact
+        run = delivery.run or artifact.run
+        status = apply_memo_delivery_outcome(
+            delivery,
+            run=run,
+            artifact=artifact,
+            external_ref=external_ref,
+            error=str(error) if error is not None else None,
+        )
+        run.updated_at = datetime.utcnow()
+        if status == "published":
+            summary.memo_published += 1
+        else:
+            summary.memo_failed += 1
+        db.commit()
+        logger.info(
+            "telegram_outbox_sent kind=memo row_id=%s artifact_id=%s status=%s",
+            row_id,
+            artifact.id,
+            status,
+        )
+
+
+def drain_telegram_outbox(
+    db: Session,
+    settings: Settings | None = None,
+    *,
+    send: SendFn | None = None,
+    limit: int | None = None,
+) -> OutboxSummary:
+    """Send queued (or lease-expired `sending`) digest posts, then memo deliveries. Commits per row."""
+
+    current = settings or get_settings()
+    send_fn = send or send_telegram_text
+    batch = limit or current.telegram_outbox_batch_size
+    stale_before = datetime.utcnow() - timedelta(seconds=current.delivery_claim_lease_seconds)
+    summary = OutboxSummary()
+    _drain_digest_posts(db, settings=current, send=send_fn, limit=batch, stale_before=stale_before, summary=summary)
+    _drain_memo_deliveries(
+        db, settings=current, send=send_fn, limit=batch, stale_before=stale_before, summary=summary
+    )
+    if summary.processed:
+        logger.info(
+            "telegram_outbox_drained digest_published=%s digest_failed=%s memo_published=%s memo_failed=%s",
+            summary.digest_published,
+            summary.digest_failed,
+            summary.memo_published,
+            summary.memo_failed,
+        )
+    return summary
+
+
+class TelegramOutboxWorker:
+    """Polls the outbox every `telegram_outbox_poll_seconds` on a daemon thread."""
+
+    def __init__(self, session_factory: Callable[[], Session], settings: Settings | None = None) -> None:
+        self._session_factory = session_factory
+        self._settings = settings or get_settings()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def run_once(self) -> OutboxSummary | None:
+        with self._session_factory() as db:
+            try:
+                return drain_telegram_outbox(db, self._settings)
+            except Exception as exc:  # noqa: BLE001
+                db.rollback()
+                logger.exception("telegram_outbox_drain_failed reason=%s", type(exc).__name__)
+                return None
+
+    def _loop(self) -> None:
+        logger.info("telegram_outbox_worker_started")
+        while not self._stop.is_set():
+            summary = self.run_once()
+            if summary is None or summary.processed == 0:
+                self._stop.wait(self._settings.telegram_outbox_poll_seconds)
+        logger.info("telegram_outbox_worker_stopped")
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="telegram-outbox", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import datetime as dt
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.digest.preview import DigestPreviewCache
+from app.digest.rolling_state import RollingDigestState
+
+
+_FROZEN_NOW = dt.datetime.utcnow().replace(second=30, microsecond=0)
+
+
+class _FrozenDatetime(dt.datetime):
+    @classmethod
+    def utcnow(cls):
+        return _FROZEN_NOW
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def preview_client(monkeypatch):
+    os.environ["PHASE2_ADMIN_TOKEN"] = "secret-admin"
+    from app.config import get_settings
+
+    get_settings.cache_clear()
+
+    from app.db import Base, get_db
+    from app.main import create_app
+    from app.models import DigestArtifact, Event, PublishedPost
+
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+        future=True,
+    )
+    SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
+    Base.metadata.create_all(bind=engine)
+
+    state = RollingDigestState(min_impact_exclusive=35.0)
+    clock = _Clock()
+    cache = DigestPreviewCache(ttl_seconds=30, max_entries=8, clock=clock)
+    monkeypatch.setattr("app.digest.preview.get_rolling_digest_state", lambda **_: state)
+    monkeypatch.setattr("app.digest.preview.get_digest_preview_cache", lambda *_: cache)
+    # Keep every request inside one minute-aligned preview window.
+    monkeypatch.setattr("app.digest.preview.datetime", _FrozenDatetime)
+
+    def override_get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = create_app()
+    app.dependency_overrides[get_db] = override_get_db
+    client = TestClient(app)
+
+    try:
+        yield client, SessionLocal, clock, state, (DigestArtifact, Event, PublishedPost)
+    finally:
+        app.dependency_overrides.clear()
+        client.close()
+        engine.dispose()
+
+
+def test_digest_preview_requires_auth(preview_client):
+    client, *_ = preview_client
+    assert client.get("/admin/digest/preview").status_code == 401
+
+
+def test_digest_preview_is_read_only_and_memoized(preview_client, monkeypatch):
+    client, SessionLocal, clock, state, (DigestArtifact, Event, PublishedPost) = preview_client
+    headers = {"x-admin-token": "secret-admin"}
+    now = _FROZEN_NOW
+
+    with SessionLocal() as db:
+        db.add_all(
+            [
+                Event(
+                    event_fingerprint="preview-1",
+                    topic="fx",
+                    summary_1_sentence="Yen slides past 150",
+                    impact_score=70.0,
+                    event_time=now,
+                    last_updated_at=now - dt.timedelta(minutes=30),
+                ),
+                Event(
+                    event_fingerprint="preview-2",
+                    topic="rates",
+                    summary_1_sentence="Bund yields rise",
+                    impact_score=60.0,
+                    event_time=now,
+                    last_updated_at=now - dt.timedelta(minutes=20),
+                    is_published_telegram=True,
+                ),
+            ]
+        )
+        db.commit()
+
+    first = client.get("/admin/digest/preview", params={"hours": 4}, headers=headers)
+    assert first.status_code == 200
+    body = first.json()
+    assert body["cached"] is False
+    assert body["source_event_count"] == 2
+    assert "Yen slides past 150" in body["canonical_text"]
+    assert body["hours"] == 4
+
+    syncs: list[object] = []
+    original_sync = state.sync
+    monkeypatch.setattr(state, "sync", lambda *args, **kwargs: syncs.append(1) or original_sync(*args, **kwargs))
+
+    second = client.get("/admin/digest/preview", params={"hours": 4}, headers=headers)
+    assert second.json()["cached"] is True
+    assert second.json()["input_hash"] == body["input_hash"]
+    assert syncs == []
+
+    telegram = client.get(
+        "/admin/digest/preview", params={"hours": 4, "destination": "vip_telegram"}, headers=headers
+    ).json()
+    assert telegram["source_event_count"] == 1
+    assert "Bund yields rise" not in telegram["canonical_text"]
+
+    # Published by another process (run_digest job): the state's sync never sees it.
+    with SessionLocal() as db:
+        db.query(Event).filter(Event.event_fingerprint == "preview-1").update({"is_published_telegram": True})
+        db.commit()
+    clock.now += 31
+    telegram = client.get(
+        "/admin/digest/preview", params={"hours": 4, "destination": "vip_telegram"}, headers=headers
+    ).json()
+    assert telegram["source_event_count"] == 0
+
+    with SessionLocal() as db:
+        db.add(
+            Event(
+                event_fingerprint="preview-3",
+                topic="equities",
+                summary_1_sentence="Chipmakers rally",
+                impact_score=80.0,
+                event_time=now,
+                last_updated_at=now - dt.timedelta(minutes=10),
+            )
+        )
+        db.commit()
+
+    clock.now += 31
+    refreshed = client.get("/admin/digest/preview", params={"hours": 4}, headers=headers).json()
+    assert refreshed["cached"] is False
+    assert refreshed["source_event_count"] == 3
+    assert "Chipmakers rally" in refreshed["canonical_text"]
+    assert syncs
+
+    with SessionLocal() as db:
+        assert db.query(DigestArtifact).count() == 0
+        assert db.query(PublishedPost).count() == 0
+        assert db.query(Event).filter(Event.is_published_telegram.is_(True)).count() == 2
+
+
+def test_digest_preview_rejects_windows_beyond_rolling_retention(preview_client):
+    client, *_ = preview_client
+    response = client.get("/admin/digest/preview", params={"hours": 48}, headers={"x-admin-token": "secret-admin"})
+    assert response.status_code == 400
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from tools.db_mcp_server import McpServer
+from tools.db_mcp_service import CivicquantDbMcpService, ServiceError
+
+
+class _FakeService:
+    def __init__(self) -> None:
+        self.fast_written = threading.Event()
+        self.release = threading.Event()
+        self.calls: list[str] = []
+
+    def call_tool(self, name: str, arguments: dict) -> dict:
+        self.calls.append(name)
+        if name == "slow":
+            # Finishes only after the later fast request has been answered.
+            assert self.fast_written.wait(timeout=5)
+            return {"ok": True, "tool": name}
+        if name in {"hang", "sleepy"}:
+            self.release.wait(timeout=5)
+            return {"ok": True, "tool": name}
+        if name == "broken":
+            raise ServiceError(code="not_found", message="missing")
+        return {"ok": True, "tool": name}
+
+
+def _line(payload: dict) -> bytes:
+    return (json.dumps(payload) + "\n").encode("utf-8")
+
+
+def _call(request_id: int, name: str) -> bytes:
+    return _line({"jsonrpc": "2.0", "id": request_id, "method": "tools/call", "params": {"name": name}})
+
+
+def test_mcp_server_answers_tool_calls_as_they_complete():
+    service = _FakeService()
+    written: list[dict] = []
+
+    def _write(payload: dict) -> None:
+        written.append(payload)
+        if payload.get("id") == 2:
+            service.fast_written.set()
+        if payload.get("id") == 4:
+            service.release.set()
+
+    lines = iter(
+        [
+            _line({"jsonrpc": "2.0", "id": 0, "method": "tools/list"}),
+            _call(1, "slow"),
+            _call(2, "fast"),
+            _call(3, "hang"),
+            _line({"jsonrpc": "2.0", "method": "notifications/cancelled", "params": {"requestId": 3}}),
+            _call(4, "sleepy"),
+            _call(5, "broken"),
+            b"\n",
+            b"",
+        ]
+    )
+    server = McpServer(service, write=_write, max_workers=4, tool_timeouts={"sleepy": 0.05})
+    asyncio.run(server.run(lambda: next(lines)))
+
+    by_id = {payload["id"]: payload for payload in written}
+    order = [payload["id"] for payload in written]
+    assert order.index(2) < order.index(1)
+    assert by_id[1]["result"]["structuredContent"] == {"ok": True, "tool": "slow"}
+    assert 3 not in by_id
+    assert by_id[4]["result"]["isError"] is True
+    assert by_id[4]["result"]["structuredContent"]["error"]["code"] == "tool_timeout"
+    assert by_id[5]["result"]["structuredContent"]["error"]["code"] == "not_found"
+    assert "tools" in by_id[0]["result"]
+    assert sorted(by_id) == [0, 1, 2, 4, 5]
+
+
+def test_mcp_readonly_sql_enforces_statement_timeout_on_sqlite():
+    db_path = "./test_civicquant_mcp_timeout.db"
+    if os.path.exists(db_path):
+        os.remove(db_path)
+    service = CivicquantDbMcpService(database_url=f"sqlite+pysqlite:///{db_path}")
+    try:
+        started = time.monotonic()
+        with pytest.raises(ServiceError) as excinfo:
+            service.run_readonly_sql(
+                query=(
+                    "WITH RECURSIVE n(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM n) "
+                    "SELECT COUNT(*) AS c FROM n"
+                ),
+                statement_timeout_seconds=0.2,
+            )
+        assert excinfo.value.code == "statement_timeout"
+        assert time.monotonic() - started < 5
+
+        result = service.run_readonly_sql(query="SELECT 1 AS one")
+        assert result["rows"] == [{"one": 1}]
+    finally:
+        service.engine.dispose()
+        if os.path.exists(db_path):
+            os.remove(db_path)
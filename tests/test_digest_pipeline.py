@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import json
 import os
+import random
+import threading
+import time
 from datetime import datetime, timedelta
 from unittest.mock import patch
 
@@ -10,15 +13,17 @@ from sqlalchemy.orm import sessionmaker
 
 from app.config import Settings
 from app.db import Base
-from app.digest.adapters.base import PublishResult
+from app.digest.adapters.base import PublishNotDelivered, PublishResult
 from app.digest.builder import (
     build_deterministic_digest,
     build_source_digest_events,
     pre_dedupe_source_events,
 )
 from app.digest.orchestrator import run_digest
-from app.digest.query import get_events_for_window
-from app.digest.types import DigestWindow
+from app.digest.query import get_events_for_window, select_digest_window
+from app.digest.rolling_state import RollingDigestState
+from app.digest.synthesis_cache import DigestSynthesisCache
+from app.digest.types import DigestWindow, SourceDigestEvent
 from app.models import DigestArtifact, Event, PublishedPost
 
 
@@ -97,7 +102,7 @@ class CapturingAdapter:
         self.last_canonical_text = canonical_text
         return canonical_text
 
-    def publish(self, payload: str) -> PublishResult:  # noqa: ARG002
+    def publish(self, payload: str, *, progress=None) -> PublishResult:  # noqa: ARG002
         self.publish_calls += 1
         return PublishResult(status="published", external_ref="ok")
 
@@ -505,7 +510,8 @@ def test_artifact_dedupe_is_stable_for_identical_source_input():
                     digest_llm_client=client,
                 )
 
-            assert client.calls == 2
+            # Second run has the same input hash, so synthesis is skipped entirely.
+            assert client.calls == 1
             assert adapter.publish_calls == 1
             assert db.query(DigestArtifact).count() == 1
             artifact = db.query(DigestArtifact).one()
@@ -532,7 +538,7 @@ def test_orchestrator_persists_artifact_before_publish_attempt():
         def render_payload(self, digest, canonical_text):  # noqa: ANN001
             return canonical_text
 
-        def publish(self, payload: str) -> PublishResult:  # noqa: ARG002
+        def publish(self, payload: str, *, progress=None) -> PublishResult:  # noqa: ARG002
             with self.session_factory() as verify_db:
                 assert verify_db.query(DigestArtifact).count() >= 1
             return PublishResult(status="published", external_ref="probe-ok")
@@ -610,3 +616,526 @@ def test_orchestrator_filters_out_events_with_impact_25_or_lower():
         engine.dispose()
         if os.path.exists(db_path):
             os.remove(db_path)
+
+
+def test_window_selection_filters_unpublished_per_destination_in_memory():
+    db_path = "./test_civicquant_digest_window_selection.db"
+    SessionLocal, engine = _session_factory(db_path)
+
+    try:
+        with SessionLocal() as db:
+            now = datetime(2026, 1, 9, 0, 0, 0)
+            sent_tg = _seed_event(
+                db,
+                fingerprint="w-tg",
+                topic="fx",
+                summary="Already on telegram",
+                impact=60.0,
+                updated_at=now - timedelta(minutes=5),
+            )
+            sent_tg.is_published_telegram = True
+            fresh = _seed_event(
+                db,
+                fingerprint="w-fresh",
+                topic="rates",
+                summary="Fresh everywhere",
+                impact=70.0,
+                updated_at=now - timedelta(minutes=4),
+            )
+            db.commit()
+
+            selection = select_digest_window(db, now - timedelta(hours=4), now, min_impact_exclusive=35.0)
+            assert [row.event_id for row in selection.unpublished_for("vip_telegram")] == [fresh.id]
+            assert {row.event_id for row in selection.unpublished_for("x")} == {sent_tg.id, fresh.id}
+            assert selection.unpublished_for("probe_destination") == selection.source_events
+
+            first = CapturingAdapter(destination="probe_a")
+            second = CapturingAdapter(destination="probe_b")
+            settings = _digest_settings(digest_llm_enabled=False)
+            with patch("app.digest.orchestrator.get_settings", return_value=settings), patch(
+                "app.digest.orchestrator.pre_dedupe_source_events",
+                wraps=pre_dedupe_source_events,
+            ) as source_groups:
+                out = run_digest(db, window_hours=4, now_utc=now, adapters=[first, second])
+
+            assert source_groups.call_count == 1
+            assert [row["status"] for row in out["publications"]] == ["published", "published"]
+            assert first.last_canonical_text == second.last_canonical_text
+    finally:
+        engine.dispose()
+        if os.path.exists(db_path):
+            os.remove(db_path)
+
+
+def test_unchanged_input_hash_reuses_persisted_digest_without_synthesis():
+    db_path = "./test_civicquant_digest_synthesis_cache.db"
+    SessionLocal, engine = _session_factory(db_path)
+
+    try:
+        with SessionLocal() as db:
+            now = datetime(2026, 1, 10, 0, 0, 0)
+            event = _seed_event(
+                db,
+                fingerprint="cache-1",
+                topic="fx",
+                summary="Reported intervention headline",
+                impact=60.0,
+                updated_at=now - timedelta(minutes=6),
+                claim_hash="cache-claim-1",
+            )
+            db.commit()
+
+            payload = {
+                "top_developments": [
+                    {"text": "Officials reportedly flagged intervention.", "source_event_ids": [event.id]}
+                ],
+                "sections": [],
+                "excluded_event_ids": [],
+            }
+            client = FakeDigestClient([json.dumps(payload)])
+            settings = _digest_settings(digest_llm_enabled=True, digest_top_developments_limit=1)
+
+            with patch("app.digest.orchestrator.get_settings", return_value=settings):
+                first = run_digest(
+                    db,
+                    window_hours=4,
+                    now_utc=now,
+                    adapters=[CapturingAdapter(destination="probe_a")],
+                    digest_llm_client=client,
+                    synthesis_cache=DigestSynthesisCache(),
+                )
+                # Disabled process-local cache: the digest must come from digest_artifacts.digest_json.
+                second_adapter = CapturingAdapter(destination="probe_b")
+                with patch("app.digest.orchestrator.synthesize_digest") as synthesize:
+                    second = run_digest(
+                        db,
+                        window_hours=4,
+                        now_utc=now,
+                        adapters=[second_adapter],
+                        digest_llm_client=client,
+                        synthesis_cache=DigestSynthesisCache(max_entries=0),
+                    )
+
+            assert client.calls == 1
+            synthesize.assert_not_called()
+            assert first["artifact_id"] == second["artifact_id"]
+            artifact = db.query(DigestArtifact).one()
+            assert artifact.digest_json["covered_event_ids"] == [event.id]
+            assert second_adapter.last_canonical_text == artifact.canonical_text
+            assert second_adapter.last_digest.top_developments[0].text == "Officials reportedly flagged intervention."
+            assert second["publications"][0]["status"] == "published"
+    finally:
+        engine.dispose()
+        if os.path.exists(db_path):
+            os.remove(db_path)
+
+
+def test_rolling_state_groups_match_full_rebuild_under_churn():
+    rng = random.Random(32)
+    base = datetime(2026, 1, 10, 0, 0, 0)
+    state = RollingDigestState(min_impact_exclusive=35.0)
+    live: dict[int, SourceDigestEvent] = {}
+
+    def random_event(event_id: int) -> SourceDigestEvent:
+        return SourceDigestEvent(
+            event_id=event_id,
+            topic_raw=rng.choice(["fx", "rates"]),
+            topic_label=rng.choice(["FX", "Rates"]),
+            summary_1_sentence=rng.choice(["Yen slides", "yen slides!", "Bund yields rise", f"Story {event_id}"]),
+            impact_score=rng.choice([None, 20.0, 50.0, 70.0]),
+            last_updated_at=base + timedelta(minutes=rng.randint(0, 240)),
+            event_fingerprint=rng.choice([None, "fp-a", "fp-b", f"fp-{event_id}"]),
+            claim_hash=rng.choice([None, "claim-a", "claim-b", f"claim-{event_id}"]),
+        )
+
+    for _ in range(400):
+        event_id = rng.randint(1, 60)
+        if rng.random() < 0.2:
+            state.discard(event_id)
+            live.pop(event_id, None)
+        else:
+            event = random_event(event_id)
+            state.apply(event)
+            if event.impact_score is not None and event.impact_score > 35.0:
+                live[event_id] = event
+            else:
+                live.pop(event_id, None)
+
+        events = sorted(live.values(), key=lambda row: row.event_id)
+        subset = [row for row in events if rng.random() < 0.7]
+        assert state.source_groups(events) == pre_dedupe_source_events(events)
+        assert state.source_groups(subset) == pre_dedupe_source_events(subset)
+
+    assert len(state) == len(live)
+
+
+def test_rolling_state_source_groups_keeps_newer_synced_event_over_stale_row():
+    base = datetime(2026, 1, 10, 0, 0, 0)
+
+    def event(event_id: int, *, summary: str, fingerprint: str, updated_at: datetime) -> SourceDigestEvent:
+        return SourceDigestEvent(
+            event_id=event_id,
+            topic_raw="fx",
+            topic_label="FX",
+            summary_1_sentence=summary,
+            impact_score=60.0,
+            last_updated_at=updated_at,
+            event_fingerprint=fingerprint,
+            claim_hash=None,
+        )
+
+    state = RollingDigestState(min_impact_exclusive=35.0)
+    newer = event(1, summary="Yen slides further", fingerprint="fp-new", updated_at=base + timedelta(minutes=30))
+    other = event(2, summary="Yen slides further", fingerprint="fp-other", updated_at=base)
+    state.apply(newer)
+    state.apply(other)
+
+    # A row the caller read before the newer version was synced must not replace it.
+    stale = event(1, summary="Yen slides", fingerprint="fp-old", updated_at=base)
+    groups = state.source_groups([stale, other])
+    assert groups == pre_dedupe_source_events([newer, other])
+    assert state.window_events(base, base + timedelta(hours=1)) == (newer, other)
+
+    refreshed = event(1, summary="Bund yields rise", fingerprint="fp-new", updated_at=base + timedelta(minutes=45))
+    assert state.source_groups([refreshed, other]) == pre_dedupe_source_events([refreshed, other])
+
+
+def test_rolling_state_sync_applies_upserts_and_expires_old_events():
+    db_path = "./test_civicquant_digest_rolling_state.db"
+    SessionLocal, engine = _session_factory(db_path)
+
+    try:
+        with SessionLocal() as db:
+            now = datetime(2026, 1, 10, 12, 0, 0)
+            old = _seed_event(
+                db, fingerprint="old", topic="fx", summary="Old story", impact=60.0,
+                updated_at=now - timedelta(hours=5),
+            )
+            first = _seed_event(
+                db, fingerprint="fp-1", topic="fx", summary="Yen slides", impact=60.0,
+                updated_at=now - timedelta(hours=3),
+            )
+            low = _seed_event(
+                db, fingerprint="low", topic="fx", summary="Minor note", impact=10.0,
+                updated_at=now - timedelta(hours=1),
+            )
+            db.commit()
+
+            state = RollingDigestState(retention=timedelta(hours=4), min_impact_exclusive=35.0)
+            state.sync(db, now_utc=now)
+            assert len(state) == 1
+            events = state.window_events(now - timedelta(hours=4), now)
+            assert events == select_digest_window(
+                db, now - timedelta(hours=4), now, min_impact_exclusive=35.0
+            ).source_events
+
+            second = _seed_event(
+                db, fingerprint="fp-1", topic="fx", summary="Yen slides further", impact=70.0,
+                updated_at=now - timedelta(minutes=30),
+            )
+            low.impact_score = 80.0
+            low.last_updated_at = now - timedelta(minutes=20)
+            db.commit()
+
+            later = now + timedelta(hours=1, minutes=30)
+            assert state.sync(db, now_utc=later) == 2
+            window = state.window_events(later - timedelta(hours=4), later)
+            assert window == select_digest_window(
+                db, later - timedelta(hours=4), later, min_impact_exclusive=35.0
+            ).source_events
+            assert {row.event_id for row in window} == {second.id, low.id}
+            groups = state.source_groups(window)
+            assert groups == pre_dedupe_source_events(window)
+            assert old.id not in {event_id for group in groups for event_id in group.source_event_ids}
+            assert first.id not in {row.event_id for row in window}
+    finally:
+        engine.dispose()
+        if os.path.exists(db_path):
+            os.remove(db_path)
+
+
+class _SlowAdapter(CapturingAdapter):
+    def __init__(
+        self,
+        destination: str,
+        *,
+        delay: float,
+        failures: int = 0,
+        error: Exception | None = None,
+        **budget,
+    ) -> None:
+        super().__init__(destination=destination)
+        self.delay = delay
+        self.failures = failures
+        self.error = error or PublishNotDelivered("connection refused", retryable=True)
+        self.threads: set[str] = set()
+        for name, value in budget.items():
+            setattr(self, name, value)
+
+    def publish(self, payload: str, *, progress=None) -> PublishResult:  # noqa: ARG002
+        self.threads.add(threading.current_thread().name)
+        time.sleep(self.delay)
+        self.publish_calls += 1
+        if self.publish_calls <= self.failures:
+            raise self.error
+        return PublishResult(status="published", external_ref=f"{self.destination}-ref")
+
+
+def test_publish_stage_runs_destinations_concurrently_with_per_adapter_budgets():
+    db_path = "./test_civicquant_digest_concurrent_publish.db"
+    SessionLocal, engine = _session_factory(db_path)
+
+    try:
+        with SessionLocal() as db:
+            now = datetime(2026, 1, 11, 0, 0, 0)
+            event = _seed_event(
+                db,
+                fingerprint="c-1",
+                topic="fx",
+                summary="Yen slides",
+                impact=70.0,
+                updated_at=now - timedelta(minutes=5),
+            )
+            db.commit()
+
+            slow_a = _SlowAdapter("probe_a", delay=0.3)
+            slow_b = _SlowAdapter("vip_telegram", delay=0.3)
+            flaky = _SlowAdapter("probe_flaky", delay=0.0, failures=1)
+            ambiguous = _SlowAdapter("probe_ambiguous", delay=0.0, failures=1, error=TimeoutError("read timed out"))
+            hung = _SlowAdapter("probe_hung", delay=1.0, publish_timeout_seconds=0.2, publish_max_retries=0)
+            settings = _digest_settings(
+                digest_publish_timeout_seconds=5.0,
+                digest_publish_max_retries=1,
+                digest_publish_retry_backoff_seconds=0.0,
+            )
+
+            started = time.monotonic()
+            with patch("app.digest.orchestrator.get_settings", return_value=settings):
+                out = run_digest(
+                    db,
+                    window_hours=4,
+                    now_utc=now,
+                    adapters=[slow_a, slow_b, flaky, ambiguous, hung],
+                )
+            elapsed = time.monotonic() - started
+
+            assert elapsed < 0.9
+            assert [row["status"] for row in out["publications"]] == [
+                "published",
+                "published",
+                "published",
+                "unknown",
+                "unknown",
+            ]
+            assert flaky.publish_calls == 2
+            # A send that may have reached the destination is never retried.
+            assert ambiguous.publish_calls == 1
+            assert slow_a.threads.isdisjoint(slow_b.threads)
+
+            rows = {row.destination: row for row in db.query(PublishedPost).all()}
+            assert rows["probe_a"].external_ref == "probe_a-ref"
+            assert rows["probe_flaky"].status == "published"
+            assert rows["probe_ambiguous"].status == "unknown"
+            assert rows["probe_hung"].status == "unknown"
+            assert "delivery unknown" in rows["probe_hung"].last_error
+            db.refresh(event)
+            assert event.is_published_telegram is True
+
+            # The hung call finishes after its deadline and reconciles its own row.
+            hung_row_id = rows["probe_hung"].id
+            deadline = time.monotonic() + 5
+            while time.monotonic() < deadline:
+                db.expire_all()
+                if db.get(PublishedPost, hung_row_id).status != "unknown":
+                    break
+                time.sleep(0.05)
+            hung_row = db.get(PublishedPost, hung_row_id)
+            assert hung_row.status == "published"
+            assert hung_row.external_ref == "probe_hung-ref"
+
+            # Unknown rows hold their events back: a rerun neither resends nor re-covers them.
+            with patch("app.digest.orchestrator.get_settings", return_value=settings):
+                rerun = run_digest(
+                    db,
+                    window_hours=4,
+                    now_utc=now + timedelta(minutes=1),
+                    adapters=[ambiguous],
+                )
+            assert rerun["publications"] == [{"destination": "probe_ambiguous", "status": "skipped_no_events"}]
+            assert ambiguous.publish_calls == 1
+    finally:
+        engine.dispose()
+        if os.path.exists(db_path):
+            os.remove(db_path)
+
+
+class _TwoPartAdapter(CapturingAdapter):
+    """Sends two parts; the first attempt loses the second part to a refused connection."""
+
+    def __init__(self) -> None:
+        super().__init__(destination="vip_telegram")
+        self.resumed_from: list[list[str]] = []
+
+    def publish(self, payload: str, *, progress=None) -> PublishResult:  # noqa: ARG002
+        self.publish_calls += 1
+        self.resumed_from.append(list(progress.sent_refs))
+        if not progress.sent_refs:
+            progress.record("part-1")
+        if self.publish_calls == 1:
+            raise PublishNotDelivered("connection refused", retryable=False)
+        progress.record("part-2")
+        return PublishResult(status="published", external_ref=",".join(progress.sent_refs))
+
+
+def test_partial_publish_is_held_back_and_resumed_from_the_first_unsent_part():
+    db_path = "./test_civicquant_digest_partial_publish.db"
+    SessionLocal, engine = _session_factory(db_path)
+
+    try:
+        with SessionLocal() as db:
+            now = datetime(2026, 1, 11, 0, 0, 0)
+            event = _seed_event(
+                db,
+                fingerprint="p-1",
+                topic="fx",
+                summary="Yen slides",
+                impact=70.0,
+                updated_at=now - timedelta(minutes=5),
+            )
+            db.commit()
+            adapter = _TwoPartAdapter()
+            settings = _digest_settings(digest_publish_max_retries=0)
+
+            with patch("app.digest.orchestrator.get_settings", return_value=settings):
+                first = run_digest(
+                    db,
+                    window_hours=4,
+                    now_utc=now,
+                    adapters=[adapter],
+                )
+            assert first["publications"] == [{"destination": "vip_telegram", "status": "partial"}]
+            row = db.query(PublishedPost).one()
+            db.refresh(row)
+            assert row.sent_chunk_refs == ["part-1"]
+            db.refresh(event)
+            assert not event.is_published_telegram
+
+            _seed_event(
+                db,
+                fingerprint="p-2",
+                topic="fx",
+                summary="Won slides",
+                impact=70.0,
+                updated_at=now,
+            )
+            db.commit()
+            with patch("app.digest.orchestrator.get_settings", return_value=settings):
+                second = run_digest(
+                    db,
+                    window_hours=4,
+                    now_utc=now + timedelta(minutes=1),
+                    adapters=[adapter],
+                )
+
+            assert second["publications"] == [
+                {"destination": "vip_telegram", "status": "published", "resumed_artifact_id": row.artifact_id}
+            ]
+            assert adapter.resumed_from == [[], ["part-1"]]
+            db.refresh(row)
+            assert row.status == "published"
+            assert row.external_ref == "part-1,part-2"
+            assert db.query(PublishedPost).count() == 1
+            db.refresh(event)
+            assert event.is_published_telegram is True
+    finally:
+        engine.dispose()
+        if os.path.exists(db_path):
+            os.remove(db_path)
+
+
+class _QueueingAdapter(CapturingAdapter):
+    def __init__(self, destination: str, *, on_publish=None) -> None:  # noqa: ANN001
+        super().__init__(destination=destination)
+        self.on_publish = on_publish
+
+    def publish(self, payload: str, *, progress=None) -> PublishResult:  # noqa: ARG002
+        self.publish_calls += 1
+        if self.on_publish is not None:
+            self.on_publish()
+        return PublishResult(status="queued")
+
+
+def test_run_digest_claims_rows_and_never_overwrites_a_row_it_no_longer_holds():
+    db_path = "./test_civicquant_digest_publish_claims.db"
+    SessionLocal, engine = _session_factory(db_path)
+
+    def take_over() -> None:
+        with SessionLocal() as other:
+            other.query(PublishedPost).filter(PublishedPost.destination == "probe_taken").update(
+                {PublishedPost.claimed_at: datetime(2030, 1, 1)}
+            )
+            other.commit()
+
+    try:
+        with SessionLocal() as db:
+            now = datetime(2026, 1, 11, 0, 0, 0)
+            _seed_event(
+                db,
+                fingerprint="claim-1",
+                topic="fx",
+                summary="Yen slides",
+                impact=70.0,
+                updated_at=now - timedelta(minutes=5),
+            )
+            db.commit()
+            queueing = _QueueingAdapter("probe_queue")
+            taken = _QueueingAdapter("probe_taken", on_publish=take_over)
+            settings = _digest_settings()
+
+            with patch("app.digest.orchestrator.get_settings", return_value=settings):
+                out = run_digest(
+                    db,
+                    window_hours=4,
+                    now_utc=now,
+                    adapters=[queueing, taken],
+                )
+
+            assert [row["status"] for row in out["publications"]] == ["queued", "claim_lost"]
+            rows = {row.destination: row for row in db.query(PublishedPost).all()}
+            assert rows["probe_queue"].status == "queued"
+            assert rows["probe_queue"].claimed_at is None
+            # Another sender took the row over mid-publish; its claim stands.
+            assert rows["probe_taken"].status == "sending"
+            assert rows["probe_taken"].claimed_at == datetime(2030, 1, 1)
+
+            # Queued and freshly claimed rows hold their events; a rerun sends nothing new.
+            with patch("app.digest.orchestrator.get_settings", return_value=settings):
+                rerun = run_digest(
+                    db,
+                    window_hours=4,
+                    now_utc=now + timedelta(minutes=1),
+                    adapters=[queueing, taken],
+                )
+            assert [row["status"] for row in rerun["publications"]] == ["skipped_no_events", "skipped_no_events"]
+
+            # A `sending` row whose claim outlived the lease is resumed.
+            rows["probe_taken"].claimed_at = datetime.utcnow() - timedelta(
+                seconds=settings.delivery_claim_lease_seconds + 1
+            )
+            db.commit()
+            taken.on_publish = None
+            with patch("app.digest.orchestrator.get_settings", return_value=settings):
+                resumed = run_digest(
+                    db,
+                    window_hours=4,
+                    now_utc=now + timedelta(minutes=2),
+                    adapters=[taken],
+                )
+            assert resumed["publications"] == [
+                {"destination": "probe_taken", "status": "queued", "resumed_artifact_id": rows["probe_taken"].artifact_id}
+            ]
+            assert taken.publish_calls == 2
+    finally:
+        engine.dispose()
+        if os.path.exists(db_path):
+            os.remove(db_path)
@@ -6,12 +6,13 @@ import os
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine, inspect
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool
 
 
 @pytest.fixture(scope="module")
-def client():
+def client(tmp_path_factory):
     os.environ["PHASE2_EXTRACTION_ENABLED"] = "true"
     os.environ["OPENAI_API_KEY"] = "test-key"
     os.environ["PHASE2_ADMIN_TOKEN"] = "secret-admin"
@@ -20,17 +21,20 @@ def client():
 
     get_settings.cache_clear()
 
-    from app.db import Base, get_db
+    from app.db import Base, get_async_db, get_db
     from app.main import create_app
     import app.db as db_module
 
+    # File-backed so the sync (phase2/admin) and async (ingest) engines share one database.
+    db_path = tmp_path_factory.mktemp("e2e") / "civicquant.db"
     engine = create_engine(
-        "sqlite+pysqlite:///:memory:",
+        f"sqlite+pysqlite:///{db_path}",
         connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
         future=True,
     )
     testing_session_local = sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}", poolclass=NullPool, future=True)
+    testing_async_session_local = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
 
     Base.metadata.create_all(bind=engine)
 
@@ -44,8 +48,13 @@ def client():
         finally:
             db.close()
 
+    async def override_get_async_db():
+        async with testing_async_session_local() as db:
+            yield db
+
     app = create_app()
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
     client = TestClient(app)
 
     try:
@@ -97,6 +106,65 @@ def test_ingest_creates_rows_and_is_idempotent(client: TestClient):
     assert body2["raw_message_id"] == body["raw_message_id"]
 
 
+def test_async_ingest_concurrent_duplicates_share_one_raw_row(client: TestClient):
+    import asyncio
+
+    import httpx
+
+    async def _burst() -> list[httpx.Response]:
+        transport = httpx.ASGITransport(app=client.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as async_client:
+            return await asyncio.gather(
+                *(
+                    async_client.post("/ingest/telegram", json=_payload("c-burst", "m-burst", "OPEC cuts output"))
+                    for _ in range(6)
+                )
+            )
+
+    responses = asyncio.run(_burst())
+    assert all(r.status_code == 200 for r in responses)
+    bodies = [r.json() for r in responses]
+    assert sorted(body["status"] for body in bodies).count("created") == 1
+    assert len({body["raw_message_id"] for body in bodies}) == 1
+
+
+def test_ingest_enqueues_created_rows_for_phase2_queue(monkeypatch, client: TestClient):
+    from app.config import get_settings
+    from app.workflows import phase2_queue
+
+    queue = phase2_queue.Phase2WorkQueue()
+    monkeypatch.setattr(phase2_queue, "_work_queue", queue)
+    monkeypatch.setenv("PHASE2_QUEUE_ENABLED", "true")
+    monkeypatch.setenv("PHASE2_EXTRACTION_ENABLED", "false")
+    get_settings.cache_clear()
+    try:
+        # Without phase2 extraction no consumer runs, so nothing is enqueued.
+        client.post("/ingest/telegram", json=_payload("c-queue", "q0", "Fed minutes due"))
+        assert len(queue) == 0
+
+        monkeypatch.setenv("PHASE2_EXTRACTION_ENABLED", "true")
+        get_settings.cache_clear()
+        first = client.post("/ingest/telegram", json=_payload("c-queue", "q1", "ECB holds rates")).json()
+        breaking = client.post("/ingest/telegram", json=_payload("c-queue", "q2", "🚨 BREAKING: OPEC CUTS")).json()
+        client.post("/ingest/telegram", json=_payload("c-queue", "q1", "ECB holds rates"))
+    finally:
+        monkeypatch.undo()
+        get_settings.cache_clear()
+
+    assert queue.drain(10) == [breaking["raw_message_id"], first["raw_message_id"]]
+
+
+def test_async_database_url_maps_sync_drivers():
+    from app.db import to_async_database_url
+
+    assert to_async_database_url("sqlite+pysqlite:///./civicquant_dev.db") == "sqlite+aiosqlite:///./civicquant_dev.db"
+    assert (
+        to_async_database_url("postgresql+psycopg2://u:p@db:5432/civicquant")
+        == "postgresql+asyncpg://u:p@db:5432/civicquant"
+    )
+    assert to_async_database_url("postgresql+asyncpg://u:p@db/civicquant") == "postgresql+asyncpg://u:p@db/civicquant"
+
+
 def test_source_ingest_creates_rows_and_is_idempotent(client: TestClient):
     r = client.post(
         "/ingest/source",
@@ -188,7 +256,18 @@ def test_phase2_processes_message_and_is_idempotent(monkeypatch, client: TestCli
     assert r2.status_code == 200
 
     from app.db import SessionLocal
-    from app.models import EntityMention, EventMessage, EventRelation, EventTag, Extraction, MessageProcessingState, RawMessage, RoutingDecision
+    from app.contexts.opportunity_memo.topic_mapping import TOPIC_MAPPING_VERSION
+    from app.models import (
+        EntityMention,
+        EventMessage,
+        EventOpportunityTopic,
+        EventRelation,
+        EventTag,
+        Extraction,
+        MessageProcessingState,
+        RawMessage,
+        RoutingDecision,
+    )
 
     with SessionLocal() as db:
         raw = db.query(RawMessage).filter(RawMessage.telegram_message_id == "m2").one()
@@ -249,6 +328,9 @@ def test_phase2_processes_message_and_is_idempotent(monkeypatch, client: TestCli
         directionality_tags = db.query(EventTag).filter_by(event_id=event_link.event_id, tag_type="directionality").all()
         assert directionality_tags
         assert all(tag.tag_source == "inferred" for tag in directionality_tags)
+        topic_mapping = db.get(EventOpportunityTopic, event_link.event_id)
+        assert topic_mapping is not None
+        assert topic_mapping.mapping_version == TOPIC_MAPPING_VERSION
         mentions = db.query(EntityMention).filter(EntityMention.raw_message_id == raw.id).all()
         assert mentions
         assert any(m.entity_type == "country" and m.entity_value == "United States" for m in mentions)
@@ -110,9 +110,19 @@ def _session_local_for_path(db_path: str):
 
 
 def _reset_pipeline_tables(db) -> None:
-    from app.models import EntityMention, Event, EventMessage, Extraction, MessageProcessingState, RawMessage, RoutingDecision
+    from app.models import (
+        EntityMention,
+        Event,
+        EventMessage,
+        Extraction,
+        FeedEvent,
+        MessageProcessingState,
+        RawMessage,
+        RoutingDecision,
+    )
 
     db.query(EntityMention).delete()
+    db.query(FeedEvent).delete()
     db.query(EventMessage).delete()
     db.query(RoutingDecision).delete()
     db.query(MessageProcessingState).delete()
@@ -126,7 +136,7 @@ def test_event_upsert_links_repetitive_and_updates_summary():
     db_path = "./test_civicquant_events.db"
     if os.path.exists(db_path):
         os.remove(db_path)
-    from app.models import Event, EventMessage
+    from app.models import Event, EventMessage, FeedEvent
     from app.contexts.events.event_manager import upsert_event
 
     SessionLocal = _session_local_for_path(db_path)
@@ -175,6 +185,10 @@ def test_event_upsert_links_repetitive_and_updates_summary():
         assert float(event.impact_score or 0.0) == 65.0
         links = db.query(EventMessage).filter_by(event_id=r1.event_id).all()
         assert len(links) == 2
+        feed_row = db.get(FeedEvent, r1.event_id)
+        assert feed_row.summary == "Officials report strike; details disputed."
+        assert feed_row.impact_score == 65
+        assert feed_row.event_time == event.event_time
 
 
 def test_event_upsert_soft_merges_related_context_within_window():
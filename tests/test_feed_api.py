@@ -16,6 +16,7 @@ _EVENT_COUNTER = itertools.count(1)
 
 @pytest.fixture
 def client_and_session():
+    from app.contexts.feed.feed_cache import get_feed_page_cache
     from app.db import Base, get_db
     from app.main import create_app
     from app.models import Event
@@ -29,6 +30,7 @@ def client_and_session():
     testing_session_local = sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
 
     Base.metadata.create_all(bind=engine)
+    get_feed_page_cache().clear()
 
     def override_get_db():
         db = testing_session_local()
@@ -57,6 +59,8 @@ def _insert_event(
     summary: str | None,
     topic: str = "macro_econ",
 ) -> int:
+    from app.contexts.feed.read_model import sync_feed_event
+
     idx = next(_EVENT_COUNTER)
     with session_factory() as db:
         event = event_model(
@@ -70,6 +74,8 @@ def _insert_event(
             last_updated_at=event_time or dt.datetime(2026, 3, 1, 0, 0, 0),
         )
         db.add(event)
+        db.flush()
+        sync_feed_event(db, event)
         db.commit()
         db.refresh(event)
         return event.id
@@ -205,3 +211,112 @@ def test_feed_invalid_cursor_returns_400(client_and_session):
     assert response.status_code == 400
     assert response.json()["detail"] == "invalid cursor"
 
+
+
+def test_feed_read_model_tracks_event_updates_and_rebuild(client_and_session):
+    from app.contexts.feed.read_model import rebuild_feed_events, sync_feed_event
+    from app.models import FeedEvent
+
+    client, session_factory, event_model = client_and_session
+    kept_id = _insert_event(session_factory, event_model, event_time=dt.datetime(2026, 3, 2, 9, 0, 0), summary="kept")
+    dropped_id = _insert_event(
+        session_factory, event_model, event_time=dt.datetime(2026, 3, 2, 8, 0, 0), summary="  padded  "
+    )
+
+    with session_factory() as db:
+        assert db.get(FeedEvent, dropped_id).summary == "padded"
+        event = db.get(event_model, dropped_id)
+        event.summary_1_sentence = "   "
+        assert sync_feed_event(db, event) is False
+        kept = db.get(event_model, kept_id)
+        kept.impact_score = 81.6
+        assert sync_feed_event(db, kept) is True
+        db.commit()
+
+    payload = client.get("/api/feed/events").json()
+    assert [(item["id"], item["impact_score"]) for item in payload["items"]] == [(kept_id, 82)]
+
+    with session_factory() as db:
+        db.query(FeedEvent).delete()
+        db.commit()
+        assert rebuild_feed_events(db) == 1
+        db.commit()
+    assert [item["id"] for item in client.get("/api/feed/events").json()["items"]] == [kept_id]
+
+
+def test_feed_pages_are_index_range_scans(client_and_session):
+    from sqlalchemy import text
+
+    client, session_factory, _ = client_and_session
+    cursor_time = "2026-03-01 20:00:00.000000"
+    with session_factory() as db:
+        unfiltered = db.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT * FROM feed_events "
+                "WHERE (event_time, event_id) < (:t, :i) ORDER BY event_time DESC, event_id DESC LIMIT 21"
+            ),
+            {"t": cursor_time, "i": 10},
+        ).all()
+        by_topic = db.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT * FROM feed_events WHERE topic = :topic "
+                "AND (event_time, event_id) < (:t, :i) ORDER BY event_time DESC, event_id DESC LIMIT 21"
+            ),
+            {"topic": "fx", "t": cursor_time, "i": 10},
+        ).all()
+
+    unfiltered_plan = " ".join(str(row[-1]) for row in unfiltered)
+    topic_plan = " ".join(str(row[-1]) for row in by_topic)
+    assert "ix_feed_events_time_id" in unfiltered_plan
+    assert "ix_feed_events_topic_time_id" in topic_plan
+    assert "TEMP B-TREE" not in unfiltered_plan + topic_plan
+
+
+def test_feed_etag_304_and_first_page_cache_invalidated_by_writes(client_and_session, monkeypatch):
+    import app.routers.feed as feed_router
+    from app.contexts.feed.read_model import remove_feed_event
+
+    client, session_factory, event_model = client_and_session
+    first_id = _insert_event(session_factory, event_model, event_time=dt.datetime(2026, 3, 3, 9, 0, 0), summary="first")
+
+    queries: list[object] = []
+    original = feed_router.list_feed_events
+    monkeypatch.setattr(
+        feed_router, "list_feed_events", lambda **kwargs: queries.append(kwargs) or original(**kwargs)
+    )
+
+    initial = client.get("/api/feed/events")
+    etag = initial.headers["etag"]
+    assert initial.status_code == 200
+    assert etag.startswith('"') and etag.endswith('"')
+    assert len(queries) == 1
+
+    not_modified = client.get("/api/feed/events", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == etag
+    assert not_modified.content == b""
+
+    cached = client.get("/api/feed/events")
+    assert cached.json() == initial.json()
+    assert len(queries) == 1
+
+    other_params = client.get("/api/feed/events", params={"topic": "fx"})
+    assert other_params.headers["etag"] != etag
+    assert len(queries) == 2
+
+    second_id = _insert_event(session_factory, event_model, event_time=dt.datetime(2026, 3, 3, 10, 0, 0), summary="second")
+
+    refreshed = client.get("/api/feed/events", headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.headers["etag"] != etag
+    assert [item["id"] for item in refreshed.json()["items"]] == [second_id, first_id]
+    assert len(queries) == 3
+
+    with session_factory() as db:
+        assert remove_feed_event(db, second_id) is True
+        assert remove_feed_event(db, second_id) is False
+        db.commit()
+
+    after_removal = client.get("/api/feed/events", headers={"If-None-Match": refreshed.headers["etag"]})
+    assert after_removal.status_code == 200
+    assert [item["id"] for item in after_removal.json()["items"]] == [first_id]
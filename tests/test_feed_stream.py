@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import asyncio
+import datetime as dt
+import threading
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.contexts.feed.feed_query import encode_feed_cursor, feed_item
+from app.contexts.feed.read_model import sync_feed_event
+from app.contexts.feed.stream import FeedHub, feed_event_stream
+from app.db import Base
+from app.models import Event
+
+
+def _session_factory():
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+        future=True,
+    )
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
+
+
+def _add_event(db, *, topic: str, summary: str, event_time: dt.datetime) -> Event:
+    event = Event(
+        event_fingerprint=f"stream-{summary}",
+        topic=topic,
+        summary_1_sentence=summary,
+        impact_score=55.0,
+        event_time=event_time,
+        last_updated_at=event_time,
+    )
+    db.add(event)
+    db.flush()
+    sync_feed_event(db, event)
+    return event
+
+
+def test_committed_feed_changes_fan_out_by_topic_and_rollbacks_are_dropped(monkeypatch):
+    hub = FeedHub(queue_size=8)
+    monkeypatch.setattr("app.contexts.feed.stream.get_feed_hub", lambda *_: hub)
+    SessionLocal = _session_factory()
+    event_time = dt.datetime(2026, 3, 4, 12, 0, 0)
+
+    async def scenario():
+        fx_only = hub.subscribe(topic="fx")
+        everything = hub.subscribe()
+
+        def write() -> None:
+            with SessionLocal() as db:
+                _add_event(db, topic="rates", summary="rolled back", event_time=event_time)
+                db.rollback()
+                _add_event(db, topic="rates", summary="Bunds rally", event_time=event_time)
+                fx = _add_event(db, topic="fx", summary="Yen slides", event_time=event_time)
+                db.commit()
+                fx.summary_1_sentence = "Yen slides further"
+                sync_feed_event(db, fx)
+                db.commit()
+
+        # Writers run on other threads (phase2 workers); delivery hops onto the loop.
+        writer = threading.Thread(target=write)
+        writer.start()
+        await asyncio.get_running_loop().run_in_executor(None, writer.join)
+
+        fx_messages = [await asyncio.wait_for(fx_only.get(), 1) for _ in range(2)]
+        all_messages = [await asyncio.wait_for(everything.get(), 1) for _ in range(3)]
+        assert fx_only._queue.empty() and everything._queue.empty()
+        fx_only.close()
+        everything.close()
+        return fx_messages, all_messages
+
+    fx_messages, all_messages = asyncio.run(scenario())
+
+    assert [item.summary for item, _ in fx_messages] == ["Yen slides", "Yen slides further"]
+    assert sorted(item.summary for item, _ in all_messages) == ["Bunds rally", "Yen slides", "Yen slides further"]
+    item, cursor = fx_messages[0]
+    assert cursor == encode_feed_cursor(event_time=event_time, event_id=item.id)
+    assert hub.subscriber_count() == 0
+
+
+def test_stream_replays_after_cursor_skips_duplicates_and_resets_laggards():
+    hub = FeedHub(queue_size=2)
+    t0 = dt.datetime(2026, 3, 4, 12, 0, 0)
+    replayed = feed_item(event_id=7, topic="fx", event_time=t0, summary="replayed", impact_score=50)
+    replay = [(replayed, encode_feed_cursor(event_time=t0, event_id=7))]
+
+    async def connected() -> bool:
+        return False
+
+    async def scenario():
+        subscription = hub.subscribe(topic="fx")
+        hub.publish(replay)
+        live = feed_item(event_id=8, topic="fx", event_time=t0, summary="live", impact_score=60)
+        hub.publish([(live, encode_feed_cursor(event_time=t0, event_id=8))])
+        await asyncio.sleep(0)
+        stream = feed_event_stream(
+            subscription,
+            replay=replay,
+            replay_backlog=subscription.backlog(),
+            heartbeat_seconds=0.01,
+            is_disconnected=connected,
+        )
+        chunks = [await stream.__anext__() for _ in range(2)]
+        # After the replay, an update to a replayed item is live news, not a duplicate.
+        hub.publish([(replayed.model_copy(update={"summary": "replayed, revised"}), replay[0][1])])
+        chunks += [await stream.__anext__() for _ in range(2)]
+
+        for event_id in range(20, 24):
+            hub.publish([(live.model_copy(update={"id": event_id}), f"c{event_id}")])
+        await asyncio.sleep(0)
+        tail = [chunk async for chunk in stream]
+        return chunks, tail
+
+    chunks, tail = asyncio.run(scenario())
+
+    assert chunks[0].startswith(f"id: {replay[0][1]}\nevent: feed_event\n")
+    assert '"summary":"replayed"' in chunks[0]
+    assert '"summary":"live"' in chunks[1]
+    assert '"summary":"replayed, revised"' in chunks[2]
+    assert chunks[3] == ": keep-alive\n\n"
+    assert tail[-1] == "event: reset\ndata: {}\n\n"
+    assert len(tail) == 3
+    assert hub.subscriber_count() == 0
+
+
+def test_stream_resets_when_replay_exceeds_limit():
+    hub = FeedHub(queue_size=2)
+    t0 = dt.datetime(2026, 3, 4, 12, 0, 0)
+    replay = [
+        (feed_item(event_id=event_id, topic="fx", event_time=t0, summary="old", impact_score=50), f"c{event_id}")
+        for event_id in range(3)
+    ]
+
+    async def connected() -> bool:
+        return False
+
+    async def scenario():
+        subscription = hub.subscribe(topic="fx")
+        stream = feed_event_stream(
+            subscription,
+            replay=replay,
+            replay_backlog=0,
+            replay_truncated=True,
+            heartbeat_seconds=0.01,
+            is_disconnected=connected,
+        )
+        return [chunk async for chunk in stream]
+
+    assert asyncio.run(scenario()) == ["event: reset\ndata: {}\n\n"]
+    assert hub.subscriber_count() == 0
+
+
+def test_stream_rejects_invalid_resume_token():
+    from app.main import create_app
+
+    client = TestClient(create_app())
+    response = client.get("/api/feed/stream", headers={"Last-Event-ID": "not-a-cursor"})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "invalid cursor"
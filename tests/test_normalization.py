@@ -1,4 +1,15 @@
-from app.contexts.ingest.normalization import normalize_message_text
+import random
+import re
+
+from app.contexts.ingest.normalization import (
+    NORMALIZATION_RULES,
+    RULE_COLLAPSE_WHITESPACE,
+    RULE_STRIP_WIRE_NOISE,
+    NormalizationStats,
+    has_breaking_marker,
+    normalize_many,
+    normalize_message_text,
+)
 
 
 def test_normalization_cleans_wire_markers_and_suffixes():
@@ -14,3 +25,86 @@ def test_normalization_is_deterministic_and_preserves_uncertainty_language():
     assert first == second
     assert "NEITHER IRAN NOR THE U.S. HAVE CONFIRMED." in first
 
+
+
+def _legacy_normalize_message_text(raw_text: str) -> str:
+    # Sequential six-pass implementation kept as the differential reference.
+    ws_re = re.compile(r"\s+")
+    leading_marker_re = re.compile(
+        r"^(?:(?:\*+\s*)?(?:⚠️|🚨|BREAKING:?|ALERT:?|URGENT:?|\[BREAKING\])\s*)+",
+        flags=re.IGNORECASE,
+    )
+    dateline_re = re.compile(
+        r"^[A-Z][A-Z .'-]{1,40}\s*\((?:AP|REUTERS|AFP|BLOOMBERG)\)\s*[—:-]\s*",
+        flags=re.IGNORECASE,
+    )
+    source_suffix_re = re.compile(r"\s*[-–—]\s*(?:AP|REUTERS|AFP|AXIOS|BLOOMBERG)\s*$", flags=re.IGNORECASE)
+    punct_repeat_re = re.compile(r"([!?.,:;])\1+")
+
+    if raw_text is None:
+        return ""
+    text = raw_text.strip()
+    text = ws_re.sub(" ", text)
+    text = leading_marker_re.sub("", text)
+    text = dateline_re.sub("", text)
+    text = source_suffix_re.sub("", text)
+    text = punct_repeat_re.sub(r"\1", text)
+    text = ws_re.sub(" ", text).strip()
+    return text
+
+
+_CORPUS_TOKENS = [
+    "🚨", "⚠️", "BREAKING", "breaking:", "ALERT:", "URGENT", "[BREAKING]", "*", "**",
+    " ", "  ", "\t", "\n", " ", " ", "\x1c", "\u0085",
+    "PARIS", "(AP)", "(Reuters)", "-", "—", "–", ":", "::", "..", "...", "!!", "?", ",,", ";;",
+    "U.S.", "Fed", "25bp", "2.5%", "AP", "REUTERS", "AXIOS", "O'BRIEN", "x",
+]
+
+
+def _corpus() -> list[str]:
+    fixed = [
+        "",
+        "   ",
+        "🚨 BREAKING: JERUSALEM (AP) - U.S. OFFICIAL SAYS STRIKE STARTED - REUTERS",
+        "  *ALERT*  NEITHER IRAN NOR THE U.S. HAVE CONFIRMED.   ",
+        "BREAKING - AP",
+        "PARIS (AFP) - AP",
+        "ALERT:: OIL JUMPS!!! 5%...",
+        "[BREAKING] 🚨 WASHINGTON.. (Bloomberg) — Fed holds rates — Axios",
+        "x - - AP",
+        "URGENT\n\n\tECB CUTS 25BP;; EUR/USD 1.0850,, - BLOOMBERG",
+    ]
+    rng = random.Random(20260315)
+    generated = [
+        "".join(rng.choice(_CORPUS_TOKENS) + rng.choice(["", " "]) for _ in range(rng.randint(0, 12)))
+        for _ in range(5000)
+    ]
+    return fixed + generated
+
+
+def test_normalization_matches_legacy_sequential_passes_over_corpus():
+    corpus = _corpus()
+    for raw in corpus:
+        assert normalize_message_text(raw) == _legacy_normalize_message_text(raw), repr(raw)
+    assert normalize_many(corpus) == [_legacy_normalize_message_text(raw) for raw in corpus]
+
+
+def test_normalize_many_reports_per_rule_counters():
+    stats = NormalizationStats()
+    out = normalize_many(["🚨 BREAKING:  OIL  JUMPS!!", None, "plain"], stats=stats)
+
+    assert out == ["OIL JUMPS!", "", "plain"]
+    assert stats.texts == 3
+    assert set(stats.rule_elapsed_ns) == set(NORMALIZATION_RULES)
+    assert stats.rule_hits[RULE_COLLAPSE_WHITESPACE] == 1
+    assert stats.rule_hits[RULE_STRIP_WIRE_NOISE] == 2
+    assert stats.as_log_fields()["texts"] == 3
+
+
+def test_has_breaking_marker_detects_leading_wire_markers_only():
+    assert has_breaking_marker("🚨 OIL JUMPS")
+    assert has_breaking_marker("  *BREAKING: FED HIKES")
+    assert has_breaking_marker("[BREAKING] ECB CUTS")
+    assert not has_breaking_marker("FED SAYS BREAKING POINT NEAR")
+    assert not has_breaking_marker("")
+    assert not has_breaking_marker(None)
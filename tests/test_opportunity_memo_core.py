@@ -1,13 +1,21 @@
 from __future__ import annotations
 
 import json
+import threading
 from datetime import datetime, timedelta
 
+import httpx
+import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
-from app.contexts.opportunity_memo import build_opportunity_memo_input_pack, rank_topic_candidates
+from app.contexts.opportunity_memo import (
+    build_opportunity_memo_input_pack,
+    load_event_snapshots,
+    load_memo_working_set,
+    rank_topic_candidates,
+)
 from app.contexts.opportunity_memo.contracts import (
     ExternalEvidencePack,
     ExternalEvidenceSource,
@@ -16,15 +24,26 @@ from app.contexts.opportunity_memo.contracts import (
 )
 from app.contexts.opportunity_memo.ranking import rank_topic_opportunities
 from app.contexts.opportunity_memo.renderer import render_opportunity_memo_telegram_html
-from app.contexts.opportunity_memo.research import _normalize_sources
-from app.contexts.opportunity_memo.topic_mapping import map_event_to_topic
+from app.contexts.opportunity_memo.research import (
+    OpenAiOpportunityResearchProvider,
+    OpportunityResearchError,
+    _normalize_sources,
+    build_research_plan,
+)
+from app.contexts.opportunity_memo.topic_mapping import TOPIC_MAPPING_VERSION, map_event_to_topic
+from app.contexts.opportunity_memo.topic_store import (
+    refresh_event_opportunity_topics,
+    sync_event_opportunity_topic,
+)
 from app.contexts.opportunity_memo.validator import validate_opportunity_memo
 from app.contexts.opportunity_memo.writer import (
+    OpenAiOpportunityMemoWriter,
     _coerce_writer_payload,
     _harden_payload_with_deterministic_guards,
 )
+from app.config import Settings
 from app.db import Base
-from app.models import Event, EventRelation, EventTag, Extraction, RawMessage
+from app.models import Event, EventOpportunityTopic, EventRelation, EventTag, Extraction, RawMessage
 
 
 def _session_factory():
@@ -399,6 +418,99 @@ def test_external_evidence_normalization_contract_shape():
     assert normalized[0].query == "fallback_query_1"
 
 
+def _research_transport(*, slow_query: str | None, release: threading.Event, calls: list[tuple[str, str]]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        tool_type = body["tools"][0]["type"]
+        query = json.loads(body["input"][1]["content"][0]["text"])["queries"][0]
+        calls.append((query, tool_type))
+        if tool_type == "web_search_preview":
+            return httpx.Response(400, text="tool not supported")
+        if query == slow_query:
+            release.wait(timeout=5)
+        sources = [
+            {
+                "source_id": "src_01",
+                "source_type": "web",
+                "title": f"Result for {query[:12]}",
+                "summary": "Storage fell 3.4% week-over-week.",
+                "url": f"https://example.com/{abs(hash(query))}",
+            },
+            {
+                "source_id": "src_02",
+                "source_type": "web",
+                "title": "Shared report",
+                "summary": "Spread widened 14%.",
+                "url": "https://example.com/shared/",
+            },
+        ]
+        text = json.dumps({"sources": sources})
+        return httpx.Response(200, json={"id": "resp", "model": "gpt-test", "output_text": text})
+
+    return _ClosingMockTransport(handler)
+
+
+class _ClosingMockTransport(httpx.MockTransport):
+    def __init__(self, handler) -> None:  # noqa: ANN001
+        super().__init__(handler)
+        self.closed = threading.Event()
+
+    def close(self) -> None:
+        self.closed.set()
+
+
+def test_research_provider_fans_out_queries_and_returns_partial_results_at_deadline():
+    pack = _base_input_pack()
+    plan = build_research_plan(pack)
+    settings = Settings(openai_api_key="test-key", openai_model="gpt-test")
+    release = threading.Event()
+    calls: list[tuple[str, str]] = []
+    transport = _research_transport(slow_query=plan.queries[-1], release=release, calls=calls)
+    provider = OpenAiOpportunityResearchProvider(
+        timeout_seconds=5.0,
+        max_retries=0,
+        max_concurrency=len(plan.queries),
+        deadline_seconds=0.5,
+        transport=transport,
+    )
+    try:
+        evidence = provider.retrieve(input_pack=pack, plan=plan, settings=settings)
+        # The abandoned call still holds the shared client; it is closed once that call returns.
+        assert not transport.closed.is_set()
+    finally:
+        release.set()
+    assert transport.closed.wait(timeout=5)
+
+    diagnostics = evidence.retrieval_diagnostics
+    assert diagnostics["query_count"] == len(plan.queries)
+    assert diagnostics["answered_query_count"] == len(plan.queries) - 1
+    assert diagnostics["timed_out_queries"] == [plan.queries[-1]]
+    # One unique source per answered query plus the shared one, renumbered.
+    assert len(evidence.sources) == len(plan.queries)
+    assert [source.source_id for source in evidence.sources] == [
+        f"src_{idx:02d}" for idx in range(1, len(plan.queries) + 1)
+    ]
+    assert sum(1 for source in evidence.sources if source.title == "Shared report") == 1
+    assert {tool for _query, tool in calls} == {"web_search_preview", "web_search"}
+    assert all(row["tool_type"] in {None, "web_search"} for row in diagnostics["queries"])
+
+
+def test_research_provider_fails_only_when_no_query_answers():
+    pack = _base_input_pack()
+    plan = build_research_plan(pack)
+    provider = OpenAiOpportunityResearchProvider(
+        timeout_seconds=1.0,
+        max_retries=0,
+        transport=httpx.MockTransport(lambda request: httpx.Response(500, text="upstream down")),
+    )
+    with pytest.raises(OpportunityResearchError):
+        provider.retrieve(
+            input_pack=pack,
+            plan=plan,
+            settings=Settings(openai_api_key="test-key", openai_model="gpt-test"),
+        )
+
+
 def test_writer_payload_coercion_supports_section_wrapped_format():
     payload = {
         "title": "Gas Memo",
@@ -539,6 +651,76 @@ def test_writer_hardening_backfills_traceability_and_strengthens_weak_sections()
     assert "watchpoints[1]" in keys
 
 
+def test_writer_completes_missing_fields_concurrently_and_keeps_each_requests_own_fields():
+    repair_draft = {
+        "title": "Natural gas storage draw",
+        "core_thesis_one_liner": "Draft thesis.",
+        "opportunity_target": "Henry Hub prompt-vs-deferred spread.",
+        "market_setup": "Draft setup.",
+        "background": "Draft background.",
+        "primary_driver": "Draft driver.",
+        "supporting_developments": ["Draft development one", "Draft development two"],
+        "why_now": "Draft timing.",
+        "why_this_is_an_opportunity": "Draft framing.",
+        "trade_expression": "Draft expression.",
+        "quantified_evidence_points": ["Storage fell 3.4% week-over-week", "Spread widened 14%"],
+        "invalidation_triggers": ["Draft trigger one", "Draft trigger two"],
+        "confidence_level": "medium",
+        "traceability": {
+            "paragraph_sources": [
+                {"paragraph_key": "market_setup", "internal_event_ids": [3], "external_source_ids": ["src_01"]}
+            ]
+        },
+    }
+    both_requests_in_flight = threading.Barrier(2, timeout=5)
+    completion_requests: list[list[str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        prompt = json.loads(json.loads(request.content)["input"][1]["content"][0]["text"])
+        mode = prompt["writer_mode"]
+        if mode == "initial":
+            return httpx.Response(200, json={"id": "r1", "output_text": "not json"})
+        if mode == "schema_repair":
+            return httpx.Response(200, json={"id": "r2", "output_text": json.dumps(repair_draft)})
+        fields = prompt["missing_fields"]
+        completion_requests.append(fields)
+        both_requests_in_flight.wait()
+        answer = {
+            "market_setup": f"Overwritten by the {fields[0]} request.",
+            "risks": ["Storage injections resume faster than expected", "Mild weather cuts demand by 5%"],
+            "watchpoints": ["Weekly storage report versus the five-year average", "LNG feedgas nominations"],
+            "conclusion": "The spread stays mispriced while the storage deficit persists.",
+            "traceability": {
+                "paragraph_sources": [
+                    {"paragraph_key": "market_setup", "internal_event_ids": [2], "external_source_ids": ["src_02"]},
+                    {"paragraph_key": f"{fields[0]}[0]", "internal_event_ids": [2], "external_source_ids": ["src_02"]},
+                ]
+            },
+        }
+        return httpx.Response(200, json={"id": "r3", "output_text": json.dumps(answer)})
+
+    writer = OpenAiOpportunityMemoWriter(
+        timeout_seconds=5.0,
+        max_retries=0,
+        max_concurrency=2,
+        transport=httpx.MockTransport(handler),
+    )
+    memo = writer.write(
+        input_pack=_base_input_pack(),
+        external_evidence=_external_pack(),
+        settings=Settings(openai_api_key="test-key", openai_model="gpt-test"),
+    )
+
+    assert sorted(completion_requests) == [["conclusion", "watchpoints"], ["risks"]]
+    assert memo.market_setup == "Draft setup."
+    assert memo.conclusion == "The spread stays mispriced while the storage deficit persists."
+    assert memo.risks[0] == "Storage injections resume faster than expected"
+    sources = {row.paragraph_key: row for row in memo.traceability.paragraph_sources}
+    assert sources["market_setup"].internal_event_ids == [3]
+    assert "risks[0]" in sources
+    assert "conclusion[0]" in sources
+
+
 def test_topic_ranking_is_deterministic_and_honors_topic_universe():
     SessionLocal, engine = _session_factory()
     try:
@@ -642,6 +824,143 @@ def test_input_builder_returns_stats_and_fact_candidates():
         engine.dispose()
 
 
+def test_memo_working_set_serves_ranking_and_input_pack_from_one_load():
+    SessionLocal, engine = _session_factory()
+    try:
+        now = datetime.utcnow().replace(microsecond=0)
+        with SessionLocal() as db:
+            for msg_id, hours_ago in (("w1", 2), ("w2", 1), ("p1", 8)):
+                _seed_event(
+                    db,
+                    msg_id=msg_id,
+                    event_time=now - timedelta(hours=hours_ago),
+                    summary="Natural gas supply disruption persists.",
+                    impact_score=80.0,
+                    raw_text="raw noise",
+                    payload_topic="commodities",
+                    payload_keywords=["natural gas", "supply disruption"],
+                    tags=[("commodities", "Natural Gas")],
+                    relations=[("curtails", "Qatar", "Natural Gas")],
+                )
+            db.commit()
+
+            start_time = now - timedelta(hours=6)
+            working_set = load_memo_working_set(db, start_time=start_time, end_time=now)
+            assert len(working_set.current_events) == 2
+            assert len(working_set.prior_events) == 1
+
+            shared = rank_topic_candidates(
+                db,
+                start_time=start_time,
+                end_time=now,
+                topic_universe=["natural_gas", "oil"],
+                limit=2,
+                recent_memo_topics=set(),
+                working_set=working_set,
+            )
+            standalone = rank_topic_candidates(
+                db,
+                start_time=start_time,
+                end_time=now,
+                topic_universe=["natural_gas", "oil"],
+                limit=2,
+                recent_memo_topics=set(),
+            )
+            assert [row.model_dump() for row in shared] == [row.model_dump() for row in standalone]
+
+            pack_kwargs = {
+                "start_time": start_time,
+                "end_time": now,
+                "topic": "natural_gas",
+                "topic_score": 0.9,
+                "selection_reason": "test",
+                "topic_breakdown": {"normalized_event_count": 1.0},
+            }
+            shared_pack, _rows = build_opportunity_memo_input_pack(db, working_set=working_set, **pack_kwargs)
+            standalone_pack, _rows = build_opportunity_memo_input_pack(db, **pack_kwargs)
+            assert shared_pack.model_dump() == standalone_pack.model_dump()
+            assert len(shared_pack.selected_event_ids) == 2
+
+            with pytest.raises(ValueError):
+                build_opportunity_memo_input_pack(
+                    db, working_set=working_set, **{**pack_kwargs, "end_time": now + timedelta(hours=1)}
+                )
+    finally:
+        engine.dispose()
+
+
+def test_persisted_topic_mappings_are_reused_and_refreshed_when_stale():
+    SessionLocal, engine = _session_factory()
+    try:
+        now = datetime.utcnow().replace(microsecond=0)
+        with SessionLocal() as db:
+            gas = _seed_event(
+                db,
+                msg_id="m1",
+                event_time=now - timedelta(hours=2),
+                summary="Natural gas supply disruption persists.",
+                impact_score=80.0,
+                raw_text="raw noise",
+                payload_topic="commodities",
+                payload_keywords=["natural gas"],
+                tags=[("commodities", "Natural Gas")],
+                relations=[],
+            )
+            crude = _seed_event(
+                db,
+                msg_id="m2",
+                event_time=now - timedelta(hours=1),
+                summary="Crude exports fall.",
+                impact_score=70.0,
+                raw_text="raw noise",
+                payload_topic="commodities",
+                payload_keywords=["crude"],
+                tags=[("commodities", "Brent Crude")],
+                relations=[],
+            )
+            db.commit()
+
+            assert refresh_event_opportunity_topics(db) == 2
+            assert refresh_event_opportunity_topics(db) == 0
+            db.commit()
+            stored = db.get(EventOpportunityTopic, gas.id)
+            assert stored.topic == "natural_gas"
+            assert stored.mapping_version == TOPIC_MAPPING_VERSION
+            assert stored.diagnostics_json["source_layer"] == "event_tags"
+
+            window = {"start_time": now - timedelta(hours=6), "end_time": now}
+            # Current rows are trusted as stored; the topic filter narrows the scan.
+            stored.topic = "shipping"
+            db.commit()
+            assert [row["id"] for row in load_event_snapshots(db, topic="shipping", **window)] == [gas.id]
+            assert [row["id"] for row in load_event_snapshots(db, topic="oil", **window)] == [crude.id]
+
+            # Stale rows are ignored on read and recomputed by the refresh.
+            stored.mapping_version = "r0-stale"
+            db.commit()
+            assert [row["id"] for row in load_event_snapshots(db, topic="natural_gas", **window)] == [gas.id]
+            assert load_event_snapshots(db, topic="shipping", **window) == []
+            assert refresh_event_opportunity_topics(db) == 1
+            db.commit()
+            assert db.get(EventOpportunityTopic, gas.id).topic == "natural_gas"
+
+            db.query(EventTag).filter(EventTag.event_id == crude.id).delete()
+            db.add(
+                EventTag(
+                    event_id=crude.id,
+                    tag_type="commodities",
+                    tag_value="Urea",
+                    tag_source="observed",
+                    confidence=0.9,
+                )
+            )
+            assert sync_event_opportunity_topic(db, event_id=crude.id) == "fertilizers"
+            db.commit()
+            assert db.get(EventOpportunityTopic, crude.id).topic == "fertilizers"
+    finally:
+        engine.dispose()
+
+
 def test_validator_enforces_quality_and_traceability_rules():
     memo = _valid_memo()
     input_pack = _base_input_pack()
@@ -4,11 +4,12 @@ import os
 from datetime import datetime, timedelta
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
+from app.contexts.events.similarity_index import rebuild_similarity_index, sync_event_similarity
 from app.db import Base
-from app.models import Event, EventRelation, EventTag, Extraction, RawMessage
+from app.models import Event, EventMessage, EventRelation, EventTag, Extraction, RawMessage
 from tools.db_mcp_contracts import TOOL_DEFINITIONS
 from tools.db_mcp_service import CivicquantDbMcpService, ServiceError
 
@@ -168,6 +169,121 @@ def test_mcp_opportunity_tools_return_expected_shapes():
             os.remove(db_path)
 
 
+def test_mcp_lineage_tools_reuse_pooled_connections_and_cached_statements():
+    db_path = "./test_civicquant_mcp_lineage.db"
+    if os.path.exists(db_path):
+        os.remove(db_path)
+
+    engine = create_engine(f"sqlite+pysqlite:///{db_path}", future=True)
+    SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
+    Base.metadata.create_all(bind=engine)
+
+    now = datetime.utcnow().replace(microsecond=0)
+    service = None
+    try:
+        with SessionLocal() as db:
+            _seed_event(db, now=now)
+            event_row = db.query(Event).one()
+            raw = db.query(RawMessage).one()
+            db.add(EventMessage(event_id=event_row.id, raw_message_id=raw.id))
+            db.commit()
+            event_id, raw_message_id = event_row.id, raw.id
+
+        service = CivicquantDbMcpService(database_url=f"sqlite+pysqlite:///{db_path}")
+        statements: list[str] = []
+        connects: list[object] = []
+        event.listen(service.engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        event.listen(service.engine, "connect", lambda *args: connects.append(args[0]))
+
+        lineage = service.call_tool("get_event_lineage", {"event_id": event_id})
+        assert lineage["lineage_count"] == 1
+        assert lineage["lineage_total_count"] == 1
+        assert lineage["lineage_truncated"] is False
+        assert "lineage_total_count" not in lineage["event"]
+        assert lineage["lineage_messages"][0]["raw_message"]["id"] == raw_message_id
+        assert len(statements) == 2
+
+        comparison = service.call_tool("compare_extraction_to_event", {"raw_message_id": raw_message_id})
+        assert comparison["event_ids"] == [event_id]
+        assert comparison["comparison"]["match_count"] >= 1
+
+        cached_statements = len(service._statements)
+        for _ in range(5):
+            service.call_tool("get_event_lineage", {"event_id": event_id})
+            service.call_tool("compare_extraction_to_event", {"raw_message_id": raw_message_id})
+        assert len(service._statements) == cached_statements
+        assert len(connects) == 1
+    finally:
+        if service is not None:
+            service.engine.dispose()
+        engine.dispose()
+        if os.path.exists(db_path):
+            os.remove(db_path)
+
+
+def test_mcp_duplicate_candidates_use_time_bounded_similarity_index():
+    db_path = "./test_civicquant_mcp_duplicates.db"
+    if os.path.exists(db_path):
+        os.remove(db_path)
+
+    engine = create_engine(f"sqlite+pysqlite:///{db_path}", future=True)
+    SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
+    Base.metadata.create_all(bind=engine)
+
+    now = datetime.utcnow().replace(microsecond=0)
+    summary = "Qatar LNG terminal outage cuts natural gas exports to Europe this week."
+
+    def _event(fingerprint: str, text_value: str, age: timedelta) -> Event:
+        return Event(
+            event_fingerprint=fingerprint,
+            event_identity_fingerprint_v2=fingerprint,
+            topic="commodities",
+            summary_1_sentence=text_value,
+            impact_score=70.0,
+            is_breaking=False,
+            event_time=now - age,
+            last_updated_at=now - age,
+        )
+
+    service = None
+    try:
+        with SessionLocal() as db:
+            base = _event("dup-base", summary, timedelta(hours=1))
+            near = _event(
+                "dup-near",
+                "Qatar LNG terminal outage cuts natural gas exports to Europe this week; prices jump sharply.",
+                timedelta(hours=12),
+            )
+            too_old = _event("dup-old", summary, timedelta(days=200))
+            unrelated = _event("dup-other", "Copper smelter strike in Chile enters its second week.", timedelta(hours=2))
+            db.add_all([base, near, too_old, unrelated])
+            db.flush()
+            assert rebuild_similarity_index(db) == 4
+            base.summary_1_sentence = summary + " Prices jump."
+            sync_event_similarity(db, base)
+            db.commit()
+            base_id, near_id, old_id = base.id, near.id, too_old.id
+
+        service = CivicquantDbMcpService(database_url=f"sqlite+pysqlite:///{db_path}")
+        result = service.call_tool("find_duplicate_candidate_events", {"event_id": base_id})
+
+        assert result["candidate_source"] == "similarity_index"
+        assert result["search_window_days"] == 90
+        candidate_ids = [row["event_id"] for row in result["candidates"]]
+        assert candidate_ids == [near_id]
+        assert old_id not in candidate_ids
+        assert result["candidate_scan_count"] == 1
+        near_row = result["candidates"][0]
+        assert near_row["signals"]["summary_jaccard"] >= 0.7
+        assert "summary_jaccard_ge_0_70" in near_row["reason_codes"]
+    finally:
+        if service is not None:
+            service.engine.dispose()
+        engine.dispose()
+        if os.path.exists(db_path):
+            os.remove(db_path)
+
+
 def test_mcp_readonly_sql_guard_still_rejects_mutating_sql():
     service = CivicquantDbMcpService(database_url="sqlite+pysqlite:///./civicquant_dev.db")
     with pytest.raises(ServiceError):
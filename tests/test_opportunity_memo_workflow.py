@@ -23,9 +23,12 @@ from app.models import (
     OpportunityMemoExternalSource,
     OpportunityMemoInputEvent,
     OpportunityMemoRun,
+    OpportunityResearchCacheEntry,
+    OpportunityResearchCacheSource,
     RawMessage,
 )
 from app.workflows import opportunity_memo_pipeline
+from app.workflows.opportunity_memo_batch import run_opportunity_memo_batch
 from app.workflows.opportunity_memo_pipeline import run_opportunity_memo
 
 
@@ -284,7 +287,13 @@ def test_workflow_persists_updated_artifact_and_records_successful_delivery(monk
             _seed_natural_gas_events(db, now=now)
             db.commit()
 
-        monkeypatch.setattr(opportunity_memo_pipeline, "send_telegram_text", lambda payload, settings=None: "msg-123")
+        sent_payloads: list[str] = []
+
+        def _send(payload, **_):  # noqa: ANN001, ARG001
+            sent_payloads.append(payload)
+            return "msg-123"
+
+        monkeypatch.setattr(opportunity_memo_pipeline, "send_telegram_text", _send)
         with SessionLocal() as db:
             result = run_opportunity_memo(
                 db,
@@ -313,6 +322,58 @@ def test_workflow_persists_updated_artifact_and_records_successful_delivery(monk
             delivery = db.query(OpportunityMemoDelivery).one()
             assert delivery.status == "published"
             assert delivery.external_ref == "msg-123"
+            first_run = db.query(OpportunityMemoRun).one()
+            assert list(first_run.stage_timings_json) == [
+                "topic_selection",
+                "input_pack",
+                "research",
+                "writer",
+                "validation",
+                "persist",
+                "delivery",
+            ]
+            assert all(elapsed >= 0 for elapsed in first_run.stage_timings_json.values())
+
+            # Identical inputs: the delivered artifact is reused without research or writer calls.
+            provider = _CountingResearchProvider()
+            reused = run_opportunity_memo(
+                db,
+                start_time=now - timedelta(hours=6),
+                end_time=now,
+                topic="natural_gas",
+                settings=_settings(),
+                research_provider=provider,
+                memo_writer=_GenericWriter(),
+            )
+            db.commit()
+            assert reused.status == "completed"
+            assert reused.reused_artifact is True
+            assert reused.artifact_id == artifact.id
+            assert reused.delivery_status == "published"
+            assert provider.calls == 0
+            assert db.query(OpportunityMemoArtifact).count() == 1
+            assert db.query(OpportunityMemoDelivery).count() == 1
+            reused_run = db.get(OpportunityMemoRun, reused.run_id)
+            assert reused_run.selection_diagnostics_json["reused_artifact_id"] == artifact.id
+
+            redelivered = run_opportunity_memo(
+                db,
+                start_time=now - timedelta(hours=6),
+                end_time=now,
+                topic="natural_gas",
+                settings=_settings(),
+                research_provider=provider,
+                memo_writer=_GenericWriter(),
+                redeliver=True,
+            )
+            db.commit()
+            assert redelivered.reused_artifact is True
+            assert redelivered.delivery_status == "published"
+            assert provider.calls == 0
+            assert sent_payloads == [delivery.content, delivery.content]
+            db.refresh(delivery)
+            assert delivery.run_id == redelivered.run_id
+            assert db.get(OpportunityMemoRun, redelivered.run_id).status == "completed"
 
             second = run_opportunity_memo(
                 db,
@@ -322,9 +383,11 @@ def test_workflow_persists_updated_artifact_and_records_successful_delivery(monk
                 settings=_settings(),
                 research_provider=_FakeResearchProvider(),
                 memo_writer=_SharpWriter(),
+                force=True,
             )
             db.commit()
             assert second.status == "completed"
+            assert second.reused_artifact is False
             artifacts = db.query(OpportunityMemoArtifact).order_by(OpportunityMemoArtifact.id.asc()).all()
             assert len(artifacts) == 2
             assert artifacts[1].input_hash == first_input_hash
@@ -341,7 +404,7 @@ def test_workflow_records_delivery_failure_without_losing_artifact(monkeypatch):
             _seed_natural_gas_events(db, now=now)
             db.commit()
 
-        def _raise_delivery(payload, settings=None):  # noqa: ANN001, ARG001
+        def _raise_delivery(payload, **_):  # noqa: ANN001, ARG001
             raise RuntimeError("telegram down")
 
         monkeypatch.setattr(opportunity_memo_pipeline, "send_telegram_text", _raise_delivery)
@@ -362,6 +425,81 @@ def test_workflow_records_delivery_failure_without_losing_artifact(monkeypatch):
             delivery = db.query(OpportunityMemoDelivery).one()
             assert delivery.status == "failed"
             assert "telegram down" in (delivery.last_error or "")
+
+            # A rerun reuses the undelivered artifact and sends it again, recording the attempt on itself.
+            monkeypatch.setattr(opportunity_memo_pipeline, "send_telegram_text", lambda payload, **_: "msg-5")
+            provider = _CountingResearchProvider()
+            retried = run_opportunity_memo(
+                db,
+                start_time=now - timedelta(hours=6),
+                end_time=now,
+                topic="natural_gas",
+                settings=_settings(),
+                research_provider=provider,
+                memo_writer=_GenericWriter(),
+            )
+            db.commit()
+
+            assert retried.reused_artifact is True
+            assert retried.status == "completed"
+            assert retried.delivery_status == "published"
+            assert provider.calls == 0
+            db.refresh(delivery)
+            assert delivery.status == "published"
+            assert delivery.run_id == retried.run_id
+            assert db.get(OpportunityMemoRun, result.run_id).status == "delivery_failed"
+            assert db.query(OpportunityMemoArtifact).one().status == "delivery_failed"
+    finally:
+        engine.dispose()
+
+
+def test_workflow_queues_delivery_for_outbox_and_drain_completes_it(monkeypatch):
+    from app.workflows.telegram_outbox import drain_telegram_outbox
+
+    SessionLocal, engine = _session_factory()
+    try:
+        now = datetime.utcnow().replace(microsecond=0)
+        with SessionLocal() as db:
+            _seed_natural_gas_events(db, now=now)
+            db.commit()
+
+        def _unexpected_send(payload, **_):  # noqa: ANN001, ARG001
+            raise AssertionError("memo generation must not send when the outbox is enabled")
+
+        monkeypatch.setattr(opportunity_memo_pipeline, "send_telegram_text", _unexpected_send)
+        settings = _settings().model_copy(update={"telegram_outbox_enabled": True})
+        with SessionLocal() as db:
+            result = run_opportunity_memo(
+                db,
+                start_time=now - timedelta(hours=6),
+                end_time=now,
+                topic="natural_gas",
+                settings=settings,
+                research_provider=_FakeResearchProvider(),
+                memo_writer=_SharpWriter(),
+            )
+            db.commit()
+
+            assert result.status == "completed"
+            assert result.delivery_status == "queued"
+            assert db.query(OpportunityMemoDelivery).one().status == "queued"
+
+            # A drainer that claimed the row and died: untouched until its lease expires.
+            stuck = db.query(OpportunityMemoDelivery).one()
+            stuck.status = "sending"
+            stuck.claimed_at = datetime.utcnow()
+            db.commit()
+            assert drain_telegram_outbox(db, settings, send=_unexpected_send).processed == 0
+            stuck.claimed_at = datetime.utcnow() - timedelta(seconds=settings.delivery_claim_lease_seconds + 1)
+            db.commit()
+
+            summary = drain_telegram_outbox(db, settings, send=lambda payload, **_: "msg-77")
+            assert summary.memo_published == 1
+            delivery = db.query(OpportunityMemoDelivery).one()
+            assert delivery.status == "published"
+            assert delivery.external_ref == "msg-77"
+            assert delivery.claimed_at is None
+            assert db.query(OpportunityMemoArtifact).one().status == "delivered"
     finally:
         engine.dispose()
 
@@ -370,7 +508,7 @@ def test_workflow_auto_path_and_no_topic_found_path(monkeypatch):
     SessionLocal, engine = _session_factory()
     try:
         now = datetime.utcnow().replace(microsecond=0)
-        monkeypatch.setattr(opportunity_memo_pipeline, "send_telegram_text", lambda payload, settings=None: "ok")
+        monkeypatch.setattr(opportunity_memo_pipeline, "send_telegram_text", lambda payload, **_: "ok")
 
         with SessionLocal() as db:
             _seed_natural_gas_events(db, now=now)
@@ -409,7 +547,7 @@ def test_workflow_fails_validation_for_generic_memo_output(monkeypatch):
     SessionLocal, engine = _session_factory()
     try:
         now = datetime.utcnow().replace(microsecond=0)
-        monkeypatch.setattr(opportunity_memo_pipeline, "send_telegram_text", lambda payload, settings=None: "ok")
+        monkeypatch.setattr(opportunity_memo_pipeline, "send_telegram_text", lambda payload, **_: "ok")
 
         with SessionLocal() as db:
             _seed_natural_gas_events(db, now=now)
@@ -432,3 +570,136 @@ def test_workflow_fails_validation_for_generic_memo_output(monkeypatch):
             assert any(row.get("code") in {"generic_opportunity_target", "insufficient_quantified_evidence"} for row in run.validation_errors_json)
     finally:
         engine.dispose()
+
+
+class _CountingResearchProvider(_FakeResearchProvider):
+    def __init__(self) -> None:
+        self.calls = 0
+        self.timed_out_queries: list[str] = []
+
+    def retrieve(self, *, input_pack, plan, settings):  # noqa: ANN001
+        self.calls += 1
+        pack = super().retrieve(input_pack=input_pack, plan=plan, settings=settings)
+        if self.timed_out_queries:
+            pack.retrieval_diagnostics = {**pack.retrieval_diagnostics, "timed_out_queries": self.timed_out_queries}
+        return pack
+
+
+def test_workflow_serves_repeat_research_from_cache_until_refreshed_or_expired(monkeypatch):
+    SessionLocal, engine = _session_factory()
+    try:
+        now = datetime.utcnow().replace(microsecond=0)
+        monkeypatch.setattr(opportunity_memo_pipeline, "send_telegram_text", lambda payload, **_: "ok")
+        provider = _CountingResearchProvider()
+
+        with SessionLocal() as db:
+            _seed_natural_gas_events(db, now=now)
+            db.commit()
+
+            def _run(**kwargs):
+                result = run_opportunity_memo(
+                    db,
+                    start_time=now - timedelta(hours=6),
+                    end_time=now,
+                    topic="natural_gas",
+                    settings=kwargs.pop("settings", _settings()),
+                    research_provider=provider,
+                    memo_writer=_SharpWriter(),
+                    # Bypass input-hash reuse so every run reaches the research stage.
+                    force=True,
+                    **kwargs,
+                )
+                db.commit()
+                assert result.status == "completed"
+                return result
+
+            _run()
+            _run()
+            assert provider.calls == 1
+            artifacts = db.query(OpportunityMemoArtifact).order_by(OpportunityMemoArtifact.id.asc()).all()
+            assert artifacts[0].canonical_hash == artifacts[1].canonical_hash
+            sources = db.query(OpportunityMemoExternalSource).filter_by(artifact_id=artifacts[1].id).all()
+            assert sorted(row.source_id for row in sources) == ["src_01", "src_02", "src_03"]
+
+            _run(refresh_research=True)
+            assert provider.calls == 2
+            assert db.query(OpportunityResearchCacheEntry).count() == 1
+
+            _run(settings=_settings().model_copy(update={"opportunity_memo_research_cache_ttl_seconds": 0}))
+            assert provider.calls == 3
+
+            entry = db.query(OpportunityResearchCacheEntry).one()
+            entry.expires_at = datetime.utcnow() - timedelta(seconds=1)
+            db.commit()
+            _run()
+            assert provider.calls == 4
+            assert db.query(OpportunityResearchCacheEntry).count() == 1
+            assert db.query(OpportunityResearchCacheSource).count() == 3
+
+            # A pack with timed-out queries is used for the run but not cached.
+            db.query(OpportunityResearchCacheEntry).delete()
+            db.commit()
+            provider.timed_out_queries = ["natural gas storage"]
+            _run()
+            _run()
+            assert provider.calls == 6
+            assert db.query(OpportunityResearchCacheEntry).count() == 0
+    finally:
+        engine.dispose()
+
+
+def test_batch_runs_every_window_topic_combination_from_shared_selection(monkeypatch):
+    SessionLocal, engine = _session_factory()
+    try:
+        now = datetime.utcnow().replace(microsecond=0)
+        monkeypatch.setattr(opportunity_memo_pipeline, "send_telegram_text", lambda payload, **_: "ok")
+        with SessionLocal() as db:
+            _seed_natural_gas_events(db, now=now)
+            db.commit()
+
+        provider = _CountingResearchProvider()
+        summary = run_opportunity_memo_batch(
+            windows=[(now - timedelta(hours=6), now), (now + timedelta(hours=1), now + timedelta(hours=2))],
+            topics=["natural_gas", None],
+            settings=_settings(),
+            session_factory=SessionLocal,
+            process_workers=2,
+            llm_concurrency=1,
+            research_provider=provider,
+            memo_writer=_SharpWriter(),
+        )
+
+        outcomes = [
+            (row.window_start_utc > now, row.requested_topic, row.result.status, row.duplicate_of)
+            for row in summary.rows
+        ]
+        assert outcomes == [
+            (False, "natural_gas", "completed", None),
+            # Auto-selection resolves to natural_gas with identical inputs: runs once, shares row 0's result.
+            (False, None, "completed", 0),
+            (True, "natural_gas", "validation_failed", None),
+            (True, None, "no_topic_found", None),
+        ]
+        assert summary.rows[1].result is summary.rows[0].result
+        assert summary.status_counts() == {
+            "completed": 1,
+            "duplicate": 1,
+            "validation_failed": 1,
+            "no_topic_found": 1,
+        }
+        assert provider.calls == 2
+        completed = summary.rows[0]
+        assert set(completed.stage_timings_ms) == {
+            "topic_selection",
+            "input_pack",
+            "research",
+            "writer",
+            "validation",
+            "persist",
+            "delivery",
+        }
+        with SessionLocal() as db:
+            assert db.query(OpportunityMemoRun).count() == 3
+            assert db.query(OpportunityMemoArtifact).count() == 1
+    finally:
+        engine.dispose()
@@ -5,8 +5,9 @@ import os
 
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool
 
 
 def _payload(channel_id: str, msg_id: str, text: str) -> dict:
@@ -21,7 +22,7 @@ def _payload(channel_id: str, msg_id: str, text: str) -> dict:
     }
 
 
-def test_phase2_reuses_extraction_across_distinct_raw_messages(monkeypatch):
+def test_phase2_reuses_extraction_across_distinct_raw_messages(monkeypatch, tmp_path):
     os.environ["PHASE2_EXTRACTION_ENABLED"] = "true"
     os.environ["OPENAI_API_KEY"] = "test-key"
     os.environ["PHASE2_ADMIN_TOKEN"] = "secret-admin"
@@ -32,19 +33,21 @@ def test_phase2_reuses_extraction_across_distinct_raw_messages(monkeypatch):
 
     get_settings.cache_clear()
 
-    from app.db import Base, get_db
+    from app.db import Base, get_async_db, get_db
     from app.main import create_app
     from app.models import Extraction, RawMessage
     from app.contexts.extraction import extraction_llm_client
     import app.db as db_module
 
+    db_path = tmp_path / "civicquant.db"
     engine = create_engine(
-        "sqlite+pysqlite:///:memory:",
+        f"sqlite+pysqlite:///{db_path}",
         connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
         future=True,
     )
     testing_session_local = sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}", poolclass=NullPool, future=True)
+    testing_async_session_local = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
     Base.metadata.create_all(bind=engine)
 
     original_session_local = db_module.SessionLocal
@@ -57,8 +60,13 @@ def test_phase2_reuses_extraction_across_distinct_raw_messages(monkeypatch):
         finally:
             db.close()
 
+    async def override_get_async_db():
+        async with testing_async_session_local() as db:
+            yield db
+
     app = create_app()
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
     client = TestClient(app)
 
     calls = {"count": 0}
@@ -45,3 +45,120 @@ def test_selector_handles_pending_failed_and_expired_in_progress():
         ids = [r.telegram_message_id for r in eligible if r.source_channel_id == "b"]
         assert ids == ["13", "12", "11"]
 
+
+
+def test_selector_by_id_keeps_queue_order_and_skips_ineligible():
+    from app.db import Base
+    from app.models import MessageProcessingState, RawMessage
+    from app.workflows.phase2_pipeline import get_eligible_messages_by_id
+
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
+
+    with SessionLocal() as db:
+        now = datetime.utcnow()
+        rows = [
+            RawMessage(source_channel_id="q", telegram_message_id=str(i), message_timestamp_utc=now, raw_text="x", normalized_text="x")
+            for i in range(3)
+        ]
+        db.add_all(rows)
+        db.flush()
+        db.add_all(
+            [
+                MessageProcessingState(raw_message_id=rows[0].id, status="pending", attempt_count=0),
+                MessageProcessingState(raw_message_id=rows[1].id, status="completed", attempt_count=1),
+                MessageProcessingState(raw_message_id=rows[2].id, status="pending", attempt_count=0),
+            ]
+        )
+        db.commit()
+
+        eligible = get_eligible_messages_by_id(db, raw_message_ids=[rows[2].id, rows[1].id, rows[0].id, 9999])
+        assert [r.id for r in eligible] == [rows[2].id, rows[0].id]
+        assert get_eligible_messages_by_id(db, raw_message_ids=[]) == []
+
+
+def test_phase2_work_queue_prioritizes_breaking_and_dedupes():
+    from app.workflows.phase2_queue import Phase2WorkQueue
+
+    queue = Phase2WorkQueue(max_size=4)
+    assert queue.enqueue(1)
+    assert queue.enqueue(2)
+    assert queue.enqueue(3, breaking=True)
+    assert not queue.enqueue(2)
+    assert queue.enqueue(4)
+    assert not queue.enqueue(5)
+
+    assert queue.drain(2) == [3, 1]
+    queue.requeue_front([3])
+    assert queue.drain(10) == [3, 2, 4]
+    assert queue.drain(10, timeout=0.01) == []
+
+
+def test_phase2_queue_consumer_interleaves_queue_with_periodic_scan(monkeypatch):
+    from app.config import Settings
+    from app.workflows import phase2_queue
+    from app.workflows.phase2_pipeline import RunSummary
+
+    calls: list[tuple[str, object]] = []
+    busy = {"value": True}
+
+    def fake_messages(db, raw_message_ids, settings, *, force_reprocess):
+        calls.append(("queue", list(raw_message_ids)))
+        return RunSummary(processing_run_id="q", selected=len(raw_message_ids), lock_busy=busy["value"])
+
+    def fake_batch(db, settings, *, force_reprocess):
+        calls.append(("scan", None))
+        return RunSummary(processing_run_id="s")
+
+    class _Session:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def commit(self):
+            pass
+
+        def rollback(self):
+            pass
+
+    monkeypatch.setattr(phase2_queue, "process_phase2_messages", fake_messages)
+    monkeypatch.setattr(phase2_queue, "process_phase2_batch", fake_batch)
+
+    clock = {"now": 100.0}
+    settings = Settings(
+        phase2_batch_size=5,
+        phase2_queue_idle_wait_seconds=0.0,
+        phase2_queue_fallback_scan_seconds=60,
+    )
+    queue = phase2_queue.Phase2WorkQueue()
+    consumer = phase2_queue.Phase2QueueConsumer(queue, _Session, settings, clock=lambda: clock["now"])
+
+    consumer.run_once()
+    assert calls == [("scan", None)]
+
+    queue.enqueue(7)
+    queue.enqueue(8, breaking=True)
+    consumer.run_once()
+    assert calls[-1] == ("queue", [8, 7])
+    assert len(queue) == 2  # lock busy -> requeued
+
+    busy["value"] = False
+    consumer.run_once()
+    assert calls[-1] == ("queue", [8, 7])
+    assert len(queue) == 0
+
+    clock["now"] += 30
+    assert consumer.run_once() is None
+
+    # The scan runs once the interval elapses even while the queue keeps filling.
+    queue.enqueue(9)
+    clock["now"] += 31
+    consumer.run_once()
+    assert calls[-1] == ("scan", None)
+    assert len(queue) == 1
+    consumer.run_once()
+    assert calls[-1] == ("queue", [9])
+    assert calls.count(("scan", None)) == 2
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app.digest.artifact_store import _supports_input_hash
+from app.schema_capabilities import get_schema_capabilities, invalidate_schema_capabilities
+
+
+def test_capabilities_are_cached_per_engine_until_invalidated():
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE digest_artifacts (id INTEGER PRIMARY KEY, canonical_hash VARCHAR(64))"))
+
+    session_local = sessionmaker(bind=engine, future=True)
+    with session_local() as db:
+        assert _supports_input_hash(db) is False
+
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE digest_artifacts ADD COLUMN input_hash VARCHAR(64)"))
+
+    capabilities = get_schema_capabilities(engine)
+    assert capabilities is get_schema_capabilities(engine)
+    assert capabilities.has_column("digest_artifacts", "input_hash") is False
+
+    invalidate_schema_capabilities(engine)
+    with session_local() as db:
+        assert _supports_input_hash(db) is True
+    assert get_schema_capabilities(engine).missing_tables(["digest_artifacts", "theme_runs"]) == ["theme_runs"]
+    assert get_schema_capabilities(engine).has_column("theme_runs", "id") is False
+    engine.dispose()
@@ -0,0 +1,112 @@
+"""EXPLAIN harness for the admin structured queries.
+
+Runs against in-memory SQLite always, and against Postgres when
+`CIVICQUANT_TEST_POSTGRES_URL` points at a scratch database.
+"""
+
+from __future__ import annotations
+
+import os
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.contexts.events.structured_query import relation_lookup_query, tag_lookup_query
+from app.db import Base
+
+
+_WINDOW = {"start_time": datetime(2026, 3, 1), "end_time": datetime(2026, 3, 8)}
+
+_CASES = {
+    "tag": (
+        lambda db: tag_lookup_query(db, tag_type="countries", tag_value="Iran", min_impact=40.0, **_WINDOW),
+        "ix_event_tags_lookup_cover",
+    ),
+    "tag_with_directionality": (
+        lambda db: tag_lookup_query(
+            db, tag_type="commodities", tag_value="oil", directionality="stress", **_WINDOW
+        ),
+        "ix_event_tags_lookup_cover",
+    ),
+    "relation": (
+        lambda db: relation_lookup_query(db, relation_type="restricts_export_of", **_WINDOW),
+        "ix_event_relations_type_time_cover",
+    ),
+    "relation_subject": (
+        lambda db: relation_lookup_query(
+            db,
+            relation_type="restricts_export_of",
+            subject_type="country",
+            subject_value="Iran",
+            **_WINDOW,
+        ),
+        "ix_event_relations_subject_norm_cover",
+    ),
+    "relation_object": (
+        lambda db: relation_lookup_query(
+            db,
+            relation_type="restricts_export_of",
+            object_type="commodity",
+            object_value="Oil",
+            **_WINDOW,
+        ),
+        "ix_event_relations_object_norm_cover",
+    ),
+}
+
+
+def _engines():
+    yield "sqlite", create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+        future=True,
+    )
+    postgres_url = os.getenv("CIVICQUANT_TEST_POSTGRES_URL")
+    if postgres_url:
+        yield "postgresql", create_engine(postgres_url, future=True)
+
+
+@pytest.fixture(params=["sqlite", "postgresql"])
+def plan_session(request):
+    engines = dict(_engines())
+    if request.param not in engines:
+        pytest.skip("set CIVICQUANT_TEST_POSTGRES_URL to run Postgres query-plan checks")
+    engine = engines[request.param]
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
+    db = SessionLocal()
+    try:
+        yield request.param, db
+    finally:
+        db.close()
+        if request.param == "postgresql":
+            Base.metadata.drop_all(bind=engine)
+        engine.dispose()
+
+
+def _plan(db, dialect: str, query) -> str:
+    sql = str(query.statement.compile(dialect=db.get_bind().dialect, compile_kwargs={"literal_binds": True}))
+    if dialect == "sqlite":
+        return "\n".join(str(row[-1]) for row in db.execute(text(f"EXPLAIN QUERY PLAN {sql}")))
+    # Empty tables make sequential scans cheapest; ask whether an index path exists at all.
+    db.execute(text("SET LOCAL enable_seqscan = off"))
+    return "\n".join(str(row[0]) for row in db.execute(text(f"EXPLAIN {sql}")))
+
+
+@pytest.mark.parametrize("case", sorted(_CASES))
+def test_structured_admin_queries_use_lookup_indexes(plan_session, case):
+    dialect, db = plan_session
+    build, expected_index = _CASES[case]
+
+    plan = _plan(db, dialect, build(db))
+
+    assert expected_index in plan, plan
+    assert "events" not in plan.replace("event_tags", "").replace("event_relations", ""), plan
+    if dialect == "sqlite":
+        assert "SCAN event_" not in plan, plan
+    else:
+        assert "Seq Scan" not in plan, plan
@@ -0,0 +1,364 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import httpx
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.config import Settings
+from app.db import Base
+from app.digest.adapters.base import PublishNotDelivered, PublishProgress
+from app.digest.adapters.telegram import TelegramDigestAdapter
+from app.digest.adapters.telegram_transport import (
+    TelegramDeliveryService,
+    TelegramRateLimited,
+    TokenBucket,
+    split_telegram_message,
+)
+from app.digest.orchestrator import run_digest
+from app.digest.synthesis_cache import DigestSynthesisCache
+from app.models import Event, PublishedPost
+from app.workflows.telegram_outbox import drain_telegram_outbox
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _settings(**overrides) -> Settings:
+    base = {
+        "tg_bot_token": "token",
+        "tg_vip_chat_id": "chat-1",
+        "telegram_chat_messages_per_minute": 60.0,
+        "telegram_chat_burst": 2,
+        "telegram_max_rate_limit_retries": 2,
+    }
+    base.update(overrides)
+    return Settings(**base)
+
+
+def test_split_keeps_chunks_under_limit_and_balances_html_tags():
+    lines = ["<b>News Digest</b>", ""]
+    lines += [f"- item {index} &amp; context {'x' * (index % 90)}" for index in range(400)]
+    text = "<i>" + "\n".join(lines) + "</i>"
+
+    chunks = split_telegram_message(text, limit=1000)
+
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 1000 for chunk in chunks)
+    for chunk in chunks:
+        assert chunk.startswith("<i>") and chunk.endswith("</i>")
+        assert chunk.count("<b>") == chunk.count("</b>")
+        assert not re.search(r"&[a-z]*$", chunk.removesuffix("</i>"))
+    joined = "".join(chunk.removeprefix("<i>").removesuffix("</i>") for chunk in chunks)
+    assert joined.replace("\n", "") == text.removeprefix("<i>").removesuffix("</i>").replace("\n", "")
+
+
+def test_split_hard_cuts_unbroken_text_without_cutting_entities():
+    text = "a" * 5000 + "&amp;" + "b" * 5000
+
+    chunks = split_telegram_message(text)
+
+    assert all(len(chunk) <= 4096 for chunk in chunks)
+    assert "".join(chunks) == text
+    assert any("&amp;" in chunk for chunk in chunks)
+
+
+def test_token_bucket_waits_once_burst_is_spent():
+    clock = _FakeClock()
+    bucket = TokenBucket(rate=1.0, capacity=2, clock=clock, sleep=clock.sleep)
+
+    waits = [bucket.acquire() for _ in range(4)]
+
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2] == 1.0
+    assert clock.sleeps == [1.0, 1.0]
+
+
+def test_delivery_service_reuses_client_splits_and_honours_retry_after():
+    requests: list[dict] = []
+    responses = iter(
+        [
+            httpx.Response(429, json={"ok": False, "parameters": {"retry_after": 3}}),
+            httpx.Response(200, json={"ok": True, "result": {"message_id": 11}}),
+            httpx.Response(200, json={"ok": True, "result": {"message_id": 12}}),
+        ]
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(json.loads(request.content))
+        return next(responses)
+
+    clock = _FakeClock()
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    service = TelegramDeliveryService(_settings(), client=client, sleep=clock.sleep, clock=clock)
+
+    ids = service.send_text("line\n" * 1200, chat_id="chat-1")
+
+    assert ids == ["11", "12"]
+    assert len(requests) == 3
+    assert requests[0]["text"] == requests[1]["text"]
+    assert all(len(body["text"]) <= 4096 for body in requests)
+    assert 3.0 in clock.sleeps
+
+
+def test_token_bucket_hands_back_the_token_instead_of_sleeping_past_the_deadline():
+    clock = _FakeClock()
+    bucket = TokenBucket(rate=1.0, capacity=1, clock=clock, sleep=clock.sleep)
+
+    assert bucket.acquire(deadline=0.5) == 0.0
+    assert bucket.acquire(deadline=0.5) is None
+    assert clock.sleeps == []
+    assert bucket.acquire(deadline=2.0) == 1.0
+
+
+def test_delivery_service_resumes_after_recorded_chunks():
+    requests: list[str] = []
+    responses = iter(
+        [
+            httpx.Response(200, json={"ok": True, "result": {"message_id": 21}}),
+            httpx.Response(503, json={"ok": False}),
+            httpx.Response(200, json={"ok": True, "result": {"message_id": 22}}),
+        ]
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(json.loads(request.content)["text"])
+        return next(responses)
+
+    clock = _FakeClock()
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    service = TelegramDeliveryService(_settings(), client=client, sleep=clock.sleep, clock=clock)
+    recorded: list[list[str]] = []
+    progress = PublishProgress(on_record=recorded.append)
+    text = "line\n" * 1200
+
+    try:
+        service.send_text(text, chat_id="chat-1", progress=progress)
+    except PublishNotDelivered as exc:
+        assert exc.retryable is True
+    else:  # pragma: no cover
+        raise AssertionError("expected PublishNotDelivered")
+    assert recorded == [["21"]]
+
+    ids = service.send_text(text, chat_id="chat-1", progress=progress)
+
+    assert ids == ["21", "22"]
+    assert progress.sent_refs == ["21", "22"]
+    assert len(requests) == 3
+    assert requests[1] == requests[2] != requests[0]
+
+
+def test_delivery_service_gives_up_after_rate_limit_budget():
+    client = httpx.Client(
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(429, headers={"Retry-After": "2"}, json={"ok": False})
+        )
+    )
+    clock = _FakeClock()
+    service = TelegramDeliveryService(_settings(), client=client, sleep=clock.sleep, clock=clock)
+
+    try:
+        service.send_text("hello", chat_id="chat-1")
+    except TelegramRateLimited as exc:
+        assert exc.retry_after == 2.0
+    else:  # pragma: no cover
+        raise AssertionError("expected TelegramRateLimited")
+    assert clock.sleeps == [2.0, 2.0]
+
+
+def test_delivery_service_only_reports_not_delivered_when_telegram_cannot_have_the_message():
+    def service_for(handler) -> TelegramDeliveryService:
+        clock = _FakeClock()
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        return TelegramDeliveryService(_settings(), client=client, sleep=clock.sleep, clock=clock)
+
+    def refused(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("connection refused", request=request)
+
+    def read_timeout(request: httpx.Request) -> httpx.Response:
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    cases = [
+        (refused, True),
+        (lambda request: httpx.Response(502, json={"ok": False}), True),
+        (lambda request: httpx.Response(400, json={"ok": False}), False),
+    ]
+    for handler, retryable in cases:
+        try:
+            service_for(handler).send_text("hello", chat_id="chat-1")
+        except PublishNotDelivered as exc:
+            assert exc.retryable is retryable
+        else:  # pragma: no cover
+            raise AssertionError("expected PublishNotDelivered")
+
+    # Written but unanswered: Telegram may have posted it, so it is not "not delivered".
+    try:
+        service_for(read_timeout).send_text("hello", chat_id="chat-1")
+    except httpx.ReadTimeout:
+        pass
+    else:  # pragma: no cover
+        raise AssertionError("expected ReadTimeout")
+
+    # A later chunk failing after earlier chunks were posted is not "not delivered" either.
+    responses = iter([httpx.Response(200, json={"ok": True, "result": {"message_id": 1}}), httpx.Response(503)])
+    try:
+        service_for(lambda request: next(responses)).send_text("line\n" * 1200, chat_id="chat-1")
+    except PublishNotDelivered:  # pragma: no cover
+        raise AssertionError("partial delivery must not be retryable")
+    except RuntimeError as exc:
+        assert "after chunk 1/2" in str(exc)
+
+
+def test_outbox_defers_digest_send_and_drain_marks_events_published():
+    db_path = "./test_civicquant_telegram_outbox.db"
+    if os.path.exists(db_path):
+        os.remove(db_path)
+    engine = create_engine(f"sqlite+pysqlite:///{db_path}", future=True)
+    SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
+    Base.metadata.create_all(bind=engine)
+
+    try:
+        with SessionLocal() as db:
+            now = datetime(2026, 1, 12, 0, 0, 0)
+            event = Event(
+                event_fingerprint="outbox-1",
+                topic="fx",
+                summary_1_sentence="Yen slides",
+                impact_score=70.0,
+                event_time=now,
+                last_updated_at=now - timedelta(minutes=5),
+            )
+            db.add(event)
+            db.commit()
+
+            settings = _settings(telegram_outbox_enabled=True, digest_llm_enabled=False)
+            with patch("app.digest.orchestrator.get_settings", return_value=settings), patch(
+                "app.digest.adapters.telegram.send_telegram_text"
+            ) as direct_send:
+                out = run_digest(
+                    db,
+                    window_hours=4,
+                    now_utc=now,
+                    adapters=[TelegramDigestAdapter(settings=settings)],
+                    synthesis_cache=DigestSynthesisCache(),
+                )
+
+            direct_send.assert_not_called()
+            assert out["publications"] == [{"destination": "vip_telegram", "status": "queued"}]
+            db.refresh(event)
+            assert not event.is_published_telegram
+
+            sent: list[str] = []
+            summary = drain_telegram_outbox(
+                db, settings, send=lambda payload, **_: sent.append(payload) or "msg-9"
+            )
+            assert summary.digest_published == 1
+            assert len(sent) == 1 and "Yen slides" in sent[0]
+            post = db.query(PublishedPost).one()
+            assert post.status == "published"
+            assert post.external_ref == "msg-9"
+            db.refresh(event)
+            assert event.is_published_telegram is True
+
+            assert drain_telegram_outbox(db, settings, send=lambda payload, **_: "again").processed == 0
+
+            # The drainer only records an outcome while its claim holds.
+            post.status = "queued"
+            db.commit()
+
+            def taken_over(payload, *, settings=None, progress=None):  # noqa: ANN001, ARG001
+                with SessionLocal() as other:
+                    other.query(PublishedPost).update({PublishedPost.claimed_at: datetime(2030, 1, 1)})
+                    other.commit()
+                return "msg-10"
+
+            assert drain_telegram_outbox(db, settings, send=taken_over).processed == 0
+            db.refresh(post)
+            assert post.status == "sending"
+            assert post.external_ref == "msg-9"
+    finally:
+        engine.dispose()
+        if os.path.exists(db_path):
+            os.remove(db_path)
+
+
+def test_outbox_drain_keeps_chunk_progress_and_resumes_partial_digest():
+    db_path = "./test_civicquant_telegram_outbox_partial.db"
+    if os.path.exists(db_path):
+        os.remove(db_path)
+    engine = create_engine(f"sqlite+pysqlite:///{db_path}", future=True)
+    SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
+    Base.metadata.create_all(bind=engine)
+
+    def enqueue(db, settings: Settings, now: datetime) -> dict:
+        with patch("app.digest.orchestrator.get_settings", return_value=settings):
+            return run_digest(
+                db,
+                window_hours=4,
+                now_utc=now,
+                adapters=[TelegramDigestAdapter(settings=settings)],
+                synthesis_cache=DigestSynthesisCache(),
+            )
+
+    def send_first_part_then_refuse(payload, *, settings=None, progress=None):  # noqa: ANN001, ARG001
+        progress.record("m1")
+        raise PublishNotDelivered("connection refused", retryable=True)
+
+    resumed_from: list[list[str]] = []
+
+    def send_rest(payload, *, settings=None, progress=None):  # noqa: ANN001, ARG001
+        resumed_from.append(list(progress.sent_refs))
+        progress.record("m2")
+        return "m2"
+
+    try:
+        with SessionLocal() as db:
+            now = datetime(2026, 1, 12, 0, 0, 0)
+            event = Event(
+                event_fingerprint="outbox-partial-1",
+                topic="fx",
+                summary_1_sentence="Yen slides",
+                impact_score=70.0,
+                event_time=now,
+                last_updated_at=now - timedelta(minutes=5),
+            )
+            db.add(event)
+            db.commit()
+            settings = _settings(telegram_outbox_enabled=True, digest_llm_enabled=False)
+
+            enqueue(db, settings, now)
+            drain_telegram_outbox(db, settings, send=send_first_part_then_refuse)
+            post = db.query(PublishedPost).one()
+            assert post.status == "partial"
+            assert post.sent_chunk_refs == ["m1"]
+
+            requeued = enqueue(db, settings, now + timedelta(minutes=1))
+            assert requeued["publications"][0]["status"] == "queued"
+            summary = drain_telegram_outbox(db, settings, send=send_rest)
+
+            assert summary.digest_published == 1
+            assert resumed_from == [["m1"]]
+            db.refresh(post)
+            assert post.status == "published"
+            assert post.sent_chunk_refs == ["m1", "m2"]
+            db.refresh(event)
+            assert event.is_published_telegram is True
+    finally:
+        engine.dispose()
+        if os.path.exists(db_path):
+            os.remove(db_path)
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import datetime as dt
+import os
+import random
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.contexts.events.topic_rollups import (
+    apply_event_rollup,
+    event_rollup_contribution,
+    query_topic_rollups,
+    rebuild_topic_rollups,
+)
+from app.db import Base
+from app.models import Event, TopicHourlyRollup
+
+
+_COLUMNS = (
+    "event_count",
+    "breaking_count",
+    "band_low_count",
+    "band_medium_count",
+    "band_high_count",
+    "band_critical_count",
+)
+
+
+def _session_factory():
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+        future=True,
+    )
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
+
+
+def _snapshot(db) -> dict:
+    return {
+        (row.topic, row.hour_start_utc): (
+            tuple(getattr(row, name) for name in _COLUMNS),
+            round(row.impact_sum, 6),
+            row.impact_max,
+        )
+        for row in db.query(TopicHourlyRollup).filter(TopicHourlyRollup.event_count > 0).all()
+    }
+
+
+def test_incremental_rollups_match_full_rebuild_under_churn():
+    SessionLocal = _session_factory()
+    rng = random.Random(39)
+    base = dt.datetime(2026, 3, 5, 0, 0, 0)
+    topics = ["fx", "rates", "energy"]
+
+    with SessionLocal() as db:
+        events: list[Event] = []
+        for step in range(300):
+            if events and rng.random() < 0.5:
+                event = rng.choice(events)
+                before = event_rollup_contribution(event)
+                event.impact_score = float(rng.choice([30, 55, 60, 72, 90, rng.uniform(0, 100)]))
+                event.is_breaking = rng.random() < 0.3
+                if rng.random() < 0.3:
+                    event.topic = rng.choice(topics)
+                if rng.random() < 0.3:
+                    event.event_time = base + dt.timedelta(minutes=rng.randrange(0, 6 * 60))
+                apply_event_rollup(db, before=before, after=event_rollup_contribution(event))
+            else:
+                event = Event(
+                    event_fingerprint=f"rollup-{step}",
+                    topic=rng.choice(topics),
+                    summary_1_sentence=f"event {step}",
+                    impact_score=float(rng.choice([30, 55, 70, 85, rng.uniform(0, 100)])),
+                    is_breaking=rng.random() < 0.3,
+                    event_time=base + dt.timedelta(minutes=rng.randrange(0, 6 * 60)),
+                    last_updated_at=base,
+                )
+                db.add(event)
+                db.flush()
+                events.append(event)
+                apply_event_rollup(db, before=None, after=event_rollup_contribution(event))
+        db.commit()
+
+        incremental = _snapshot(db)
+        rebuild_topic_rollups(db)
+        db.commit()
+        assert incremental == _snapshot(db)
+
+        out = query_topic_rollups(db, start_time=base, end_time=base + dt.timedelta(hours=6), bucket="day")
+        assert sum(topic["event_count"] for topic in out["topics"]) == len(events)
+        for topic in out["topics"]:
+            assert len(topic["series"]) == 1
+            assert sum(topic["score_bands"].values()) == topic["event_count"]
+
+
+def test_topic_rollups_admin_endpoint():
+    os.environ["PHASE2_ADMIN_TOKEN"] = "secret-admin"
+    from app.config import get_settings
+
+    get_settings.cache_clear()
+    from app.db import get_db
+    from app.main import create_app
+
+    SessionLocal = _session_factory()
+    hour = dt.datetime(2026, 3, 5, 10, 0, 0)
+    with SessionLocal() as db:
+        for index, (minutes, impact, breaking) in enumerate([(5, 40.0, False), (50, 90.0, True), (70, 60.0, False)]):
+            event = Event(
+                event_fingerprint=f"rollup-api-{index}",
+                topic="fx",
+                summary_1_sentence="fx move",
+                impact_score=impact,
+                is_breaking=breaking,
+                event_time=hour + dt.timedelta(minutes=minutes),
+                last_updated_at=hour,
+            )
+            db.add(event)
+            db.flush()
+            apply_event_rollup(db, before=None, after=event_rollup_contribution(event))
+        db.commit()
+
+    def override_get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = create_app()
+    app.dependency_overrides[get_db] = override_get_db
+    client = TestClient(app)
+    params = {"start_time": "2026-03-05T10:00:00", "end_time": "2026-03-05T12:00:00"}
+
+    assert client.get("/admin/analytics/topic-rollups", params=params).status_code == 401
+    response = client.get("/admin/analytics/topic-rollups", params=params, headers={"x-admin-token": "secret-admin"})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["rollup_rows"] == 2
+    (fx,) = body["topics"]
+    assert fx["event_count"] == 3
+    assert fx["impact_max"] == 90.0
+    assert fx["impact_avg"] == round(190.0 / 3, 4)
+    assert fx["breaking_count"] == 1
+    assert fx["score_bands"] == {"low": 1, "medium": 1, "high": 0, "critical": 1}
+    assert [point["event_count"] for point in fx["series"]] == [2, 1]
+
+    invalid = client.get(
+        "/admin/analytics/topic-rollups",
+        params={"start_time": params["end_time"], "end_time": params["start_time"]},
+        headers={"x-admin-token": "secret-admin"},
+    )
+    assert invalid.status_code == 400
+
+    # One offset-aware and one naive bound: the aware one is converted to naive UTC (11:00+01:00 == 10:00Z).
+    mixed = client.get(
+        "/admin/analytics/topic-rollups",
+        params={"start_time": "2026-03-05T11:00:00+01:00", "end_time": "2026-03-05T12:00:00"},
+        headers={"x-admin-token": "secret-admin"},
+    )
+    assert mixed.status_code == 200
+    assert mixed.json()["start_time"] == "2026-03-05T10:00:00"
+    assert mixed.json()["rollup_rows"] == 2
+    mixed_invalid = client.get(
+        "/admin/analytics/topic-rollups",
+        params={"start_time": "2026-03-05T12:00:00Z", "end_time": "2026-03-05T10:00:00"},
+        headers={"x-admin-token": "secret-admin"},
+    )
+    assert mixed_invalid.status_code == 400
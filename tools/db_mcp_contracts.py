@@ -15,6 +15,32 @@ READONLY_SQL_DEFAULT_MAX_ROWS = 100
 READONLY_SQL_HARD_MAX_ROWS = 500
 LINEAGE_MAX_MESSAGES = 100
 
+# The stdio server runs tool calls on a worker pool sized to the DB pool
+# (DB_POOL_SIZE + DB_POOL_MAX_OVERFLOW) and answers each as it completes.
+SERVER_MAX_WORKERS = 8
+# Tool timeouts stay under the client's `tool_timeout_sec` (.codex/config.toml)
+# so callers get a structured timeout error instead of a dropped request.
+DEFAULT_TOOL_TIMEOUT_SECONDS = 25.0
+TOOL_TIMEOUT_SECONDS: dict[str, float] = {
+    "run_readonly_sql": 20.0,
+}
+# Enforced by the database (postgres statement_timeout / sqlite progress
+# handler), below the run_readonly_sql tool timeout so the query stops first.
+READONLY_SQL_STATEMENT_TIMEOUT_SECONDS = 15.0
+
+# The server process keeps one engine for its lifetime; investigations issue
+# many small lookups, so connections are pooled rather than opened per call.
+DB_POOL_SIZE = 4
+DB_POOL_MAX_OVERFLOW = 4
+DB_POOL_RECYCLE_SECONDS = 1800
+
+# find_duplicate_candidate_events: similarity-index lookups are bounded to
+# +/- this many days around the base event; the recent-events fallback (no
+# index tables) scans the latest DUPLICATE_FALLBACK_SCAN_LIMIT events.
+DUPLICATE_SEARCH_WINDOW_DAYS = 90
+DUPLICATE_CANDIDATE_SCAN_LIMIT = 500
+DUPLICATE_FALLBACK_SCAN_LIMIT = 250
+
 
 def _id_schema(field_name: str) -> dict[str, Any]:
     return {
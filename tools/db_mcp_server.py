@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import sys
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -11,10 +14,13 @@ if __package__ in {None, ""}:
         sys.path.insert(0, str(repo_root))
 
 from tools.db_mcp_contracts import (  # noqa: E402
+    DEFAULT_TOOL_TIMEOUT_SECONDS,
+    SERVER_MAX_WORKERS,
     SERVER_NAME,
     SERVER_PROTOCOL_VERSION,
     SERVER_VERSION,
     TOOL_DEFINITIONS,
+    TOOL_TIMEOUT_SECONDS,
 )
 from tools.db_mcp_service import CivicquantDbMcpService, ServiceError  # noqa: E402
 
@@ -31,14 +37,10 @@ def _log(message: str) -> None:
     print(f"[{SERVER_NAME}] {message}", file=sys.stderr, flush=True)
 
 
-def _read_message() -> dict[str, Any] | None:
+def _parse_message(line: bytes) -> dict[str, Any] | None:
     """
-    MCP stdio uses one JSON-RPC message per line.
+    MCP stdio uses one JSON-RPC message per line; blank lines are skipped.
     """
-    line = sys.stdin.buffer.readline()
-    if line == b"":
-        return None
-
     raw = line.decode("utf-8", errors="replace").strip()
     if not raw:
         return None
@@ -74,10 +76,22 @@ def _jsonrpc_error(*, id_value: Any, error: JsonRpcError) -> dict[str, Any]:
     return {"jsonrpc": "2.0", "id": id_value, "error": payload}
 
 
-def _handle_request(
-    message: dict[str, Any],
-    service: CivicquantDbMcpService,
-) -> dict[str, Any] | None:
+def _tool_result(payload: dict[str, Any], *, is_error: bool = False) -> dict[str, Any]:
+    result: dict[str, Any] = {
+        "content": [
+            {
+                "type": "text",
+                "text": json.dumps(payload, ensure_ascii=True),
+            }
+        ],
+        "structuredContent": payload,
+    }
+    if is_error:
+        result = {"isError": True, **result}
+    return result
+
+
+def _validated_params(message: dict[str, Any]) -> tuple[str, dict[str, Any]]:
     if message.get("jsonrpc") != "2.0":
         raise JsonRpcError(code=-32600, message="Unsupported JSON-RPC version.")
 
@@ -85,12 +99,29 @@ def _handle_request(
     if not isinstance(method, str):
         raise JsonRpcError(code=-32600, message="Missing method.")
 
-    request_id = message.get("id")
     params = message.get("params")
     if params is None:
         params = {}
     if not isinstance(params, dict):
         raise JsonRpcError(code=-32602, message="Params must be an object.")
+    return method, params
+
+
+def _tool_call(params: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+    tool_name = params.get("name")
+    if not isinstance(tool_name, str) or not tool_name.strip():
+        raise JsonRpcError(code=-32602, message="tools/call requires a valid tool name.")
+
+    arguments = params.get("arguments")
+    if arguments is None:
+        arguments = {}
+    if not isinstance(arguments, dict):
+        raise JsonRpcError(code=-32602, message="tools/call arguments must be an object.")
+    return tool_name.strip(), arguments
+
+
+def _handle_request(method: str, params: dict[str, Any], request_id: Any) -> dict[str, Any] | None:
+    """Methods answered inline on the event loop (everything except tools/call)."""
 
     if method == "notifications/initialized":
         _log("Received notifications/initialized")
@@ -121,96 +152,173 @@ def _handle_request(
         _log("Received tools/list")
         return _jsonrpc_result(id_value=request_id, result={"tools": TOOL_DEFINITIONS})
 
-    if method == "tools/call":
-        tool_name = params.get("name")
-        if not isinstance(tool_name, str) or not tool_name.strip():
-            raise JsonRpcError(code=-32602, message="tools/call requires a valid tool name.")
-
-        arguments = params.get("arguments")
-        if arguments is None:
-            arguments = {}
-        if not isinstance(arguments, dict):
-            raise JsonRpcError(code=-32602, message="tools/call arguments must be an object.")
-
-        normalized_tool_name = tool_name.strip()
-        _log(f"Received tools/call for {normalized_tool_name}")
-
-        try:
-            payload = service.call_tool(normalized_tool_name, arguments)
-            result = {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": json.dumps(payload, ensure_ascii=True),
-                    }
-                ],
-                "structuredContent": payload,
-            }
-            return _jsonrpc_result(id_value=request_id, result=result)
-        except ServiceError as exc:
-            payload = {"ok": False, "error": exc.to_dict()}
-            result = {
-                "isError": True,
-                "content": [
-                    {
-                        "type": "text",
-                        "text": json.dumps(payload, ensure_ascii=True),
-                    }
-                ],
-                "structuredContent": payload,
-            }
-            return _jsonrpc_result(id_value=request_id, result=result)
-
     raise JsonRpcError(code=-32601, message=f"Method not found: {method}")
 
 
-def main() -> None:
-    _log("Starting MCP server")
-    service = CivicquantDbMcpService()
-    _log("Service initialized")
+class McpServer:
+    """
+    Asyncio stdio loop: tool calls run on a worker thread pool and each response
+    is written as soon as its call completes, so a slow tool does not block the
+    requests queued behind it. Responses carry the request id, so clients match
+    them regardless of order.
+
+    A `notifications/cancelled` for an in-flight request drops its response.
+    Worker threads cannot be interrupted, so a cancelled or timed-out call keeps
+    its worker until the service returns; `run_readonly_sql` is additionally
+    bounded by a database-side statement timeout.
+    """
 
-    while True:
-        message: dict[str, Any] | None = None
+    def __init__(
+        self,
+        service: CivicquantDbMcpService,
+        *,
+        write: Callable[[dict[str, Any]], None] = _write_message,
+        max_workers: int = SERVER_MAX_WORKERS,
+        default_timeout_seconds: float = DEFAULT_TOOL_TIMEOUT_SECONDS,
+        tool_timeouts: dict[str, float] | None = None,
+    ) -> None:
+        self._service = service
+        self._write = write
+        self._max_workers = max(1, max_workers)
+        self._default_timeout_seconds = default_timeout_seconds
+        self._tool_timeouts = dict(TOOL_TIMEOUT_SECONDS if tool_timeouts is None else tool_timeouts)
+        self._in_flight: dict[Any, asyncio.Task[None]] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def run(self, read_line: Callable[[], bytes] | None = None) -> None:
+        read_line = read_line or sys.stdin.buffer.readline
+        loop = asyncio.get_running_loop()
+        # Blocking stdin reads get their own thread so they never wait on a busy tool pool.
+        reader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mcp-stdin")
+        workers = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="mcp-tool")
         try:
-            message = _read_message()
-        except JsonRpcError as exc:
-            _log(f"Read error: {exc.message}")
-            _write_message(_jsonrpc_error(id_value=None, error=exc))
-            continue
-        except Exception as exc:  # noqa: BLE001
-            _log(f"Unexpected read error: {type(exc).__name__}: {exc}")
-            _write_message(
-                _jsonrpc_error(
-                    id_value=None,
-                    error=JsonRpcError(
-                        code=-32000,
-                        message=f"Internal server error: {type(exc).__name__}",
-                    ),
-                )
-            )
-            continue
-
-        if message is None:
-            _log("EOF received, shutting down")
-            break
-
+            while True:
+                line = await loop.run_in_executor(reader, read_line)
+                if line == b"":
+                    _log("EOF received, shutting down")
+                    break
+                try:
+                    message = _parse_message(line)
+                except JsonRpcError as exc:
+                    _log(f"Read error: {exc.message}")
+                    self._write(_jsonrpc_error(id_value=None, error=exc))
+                    continue
+                if message is not None:
+                    self._dispatch(message, workers=workers)
+
+            if self._tasks:
+                await asyncio.gather(*self._tasks, return_exceptions=True)
+        finally:
+            reader.shutdown(wait=False)
+            workers.shutdown(wait=False)
+
+    def _dispatch(self, message: dict[str, Any], *, workers: ThreadPoolExecutor) -> None:
+        has_id = "id" in message
+        request_id = message.get("id")
         try:
-            response = _handle_request(message, service)
-            if response is not None and "id" in message:
-                _write_message(response)
+            method, params = _validated_params(message)
+            if method == "notifications/cancelled":
+                self._cancel(params.get("requestId"), reason=params.get("reason"))
+                return
+            if method == "tools/call":
+                tool_name, arguments = _tool_call(params)
+                task = asyncio.get_running_loop().create_task(
+                    self._call_tool(
+                        tool_name,
+                        arguments,
+                        request_id=request_id,
+                        has_id=has_id,
+                        workers=workers,
+                    )
+                )
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+                if has_id:
+                    self._in_flight[request_id] = task
+                return
+            response = _handle_request(method, params, request_id)
+            if response is not None and has_id:
+                self._write(response)
         except JsonRpcError as exc:
             _log(f"JSON-RPC error: {exc.message}")
-            if "id" in message:
-                _write_message(_jsonrpc_error(id_value=message.get("id"), error=exc))
+            if has_id:
+                self._write(_jsonrpc_error(id_value=request_id, error=exc))
         except Exception as exc:  # noqa: BLE001
             _log(f"Unhandled error: {type(exc).__name__}: {exc}")
-            if "id" in message:
+            if has_id:
                 error = JsonRpcError(
                     code=-32000,
                     message=f"Internal server error: {type(exc).__name__}",
                 )
-                _write_message(_jsonrpc_error(id_value=message.get("id"), error=error))
+                self._write(_jsonrpc_error(id_value=request_id, error=error))
+
+    def _cancel(self, request_id: Any, *, reason: Any) -> None:
+        task = self._in_flight.pop(request_id, None) if isinstance(request_id, (str, int)) else None
+        if task is None:
+            _log(f"Ignoring cancellation for unknown request id={request_id}")
+            return
+        _log(f"Cancelling request id={request_id} reason={reason}")
+        task.cancel()
+
+    async def _call_tool(
+        self,
+        tool_name: str,
+        arguments: dict[str, Any],
+        *,
+        request_id: Any,
+        has_id: bool,
+        workers: ThreadPoolExecutor,
+    ) -> None:
+        _log(f"Received tools/call for {tool_name} id={request_id}")
+        timeout = self._tool_timeouts.get(tool_name, self._default_timeout_seconds)
+        loop = asyncio.get_running_loop()
+        response: dict[str, Any]
+        try:
+            payload = await asyncio.wait_for(
+                loop.run_in_executor(workers, self._service.call_tool, tool_name, arguments),
+                timeout=timeout,
+            )
+            response = _jsonrpc_result(id_value=request_id, result=_tool_result(payload))
+        except asyncio.CancelledError:
+            _log(f"Cancelled tools/call for {tool_name} id={request_id}")
+            return
+        except asyncio.TimeoutError:
+            _log(f"Timed out tools/call for {tool_name} id={request_id} after {timeout:g}s")
+            payload = {
+                "ok": False,
+                "error": {
+                    "code": "tool_timeout",
+                    "message": f"Tool '{tool_name}' did not finish within {timeout:g}s.",
+                },
+            }
+            response = _jsonrpc_result(id_value=request_id, result=_tool_result(payload, is_error=True))
+        except ServiceError as exc:
+            payload = {"ok": False, "error": exc.to_dict()}
+            response = _jsonrpc_result(id_value=request_id, result=_tool_result(payload, is_error=True))
+        except Exception as exc:  # noqa: BLE001
+            _log(f"Unhandled error: {type(exc).__name__}: {exc}")
+            error = JsonRpcError(
+                code=-32000,
+                message=f"Internal server error: {type(exc).__name__}",
+            )
+            response = _jsonrpc_error(id_value=request_id, error=error)
+        finally:
+            if has_id and self._in_flight.get(request_id) is asyncio.current_task():
+                del self._in_flight[request_id]
+
+        if has_id:
+            self._write(response)
+
+
+def main() -> None:
+    _log("Starting MCP server")
+    service = CivicquantDbMcpService()
+    _log("Service initialized")
+    try:
+        asyncio.run(McpServer(service).run())
+    finally:
+        service.engine.dispose()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
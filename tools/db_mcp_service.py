@@ -3,36 +3,46 @@ from __future__ import annotations
 import json
 import os
 import re
-from collections.abc import Mapping
+import time
+from collections.abc import Iterator, Mapping
 from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import date, datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
-from difflib import SequenceMatcher
 from typing import Any
 
 from dotenv import load_dotenv
-from sqlalchemy import bindparam, create_engine, text
+from sqlalchemy import DateTime, TextClause, bindparam, create_engine, event, text
 from sqlalchemy.engine import Connection, Engine, RowMapping, make_url
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session as OrmSession
 
 from app.config import get_settings
+from app.contexts.events.similarity_index import band_keys, estimate_jaccard, minhash_signature, summary_shingles
 from app.contexts.opportunity_memo import OPPORTUNITY_TOPICS
 from app.contexts.opportunity_memo.input_builder import (
     build_opportunity_memo_input_pack,
     load_event_snapshots,
+    load_memo_working_set,
     rank_topic_candidates,
     topic_timeline,
 )
+from app.schema_capabilities import get_schema_capabilities
 
 from .db_mcp_contracts import (
     APP_DB_URL_ENV_VAR,
+    DB_POOL_MAX_OVERFLOW,
+    DB_POOL_RECYCLE_SECONDS,
+    DB_POOL_SIZE,
     DB_URL_ENV_VAR,
     DEFAULT_DATABASE_URL,
+    DUPLICATE_CANDIDATE_SCAN_LIMIT,
+    DUPLICATE_FALLBACK_SCAN_LIMIT,
+    DUPLICATE_SEARCH_WINDOW_DAYS,
     LINEAGE_MAX_MESSAGES,
     READONLY_SQL_DEFAULT_MAX_ROWS,
     READONLY_SQL_HARD_MAX_ROWS,
+    READONLY_SQL_STATEMENT_TIMEOUT_SECONDS,
 )
 
 
@@ -42,8 +52,75 @@ _MUTATING_SQL_RE = re.compile(
 )
 _SELECT_INTO_RE = re.compile(r"\bselect\b[\s\S]*\binto\b", re.IGNORECASE)
 
-
-@dataclass(frozen=True)
+_EXTRACTIONS_BY_ID_SQL = text(
+    """
+    SELECT id, canonical_payload_json, payload_json
+    FROM extractions
+    WHERE id IN :extraction_ids
+    """
+).bindparams(bindparam("extraction_ids", expanding=True))
+
+_SIMILARITY_INDEX_TABLES = ("event_similarity_signatures", "event_similarity_bands")
+
+# Events sharing an LSH band key or an exact identity/claim/payload hash with the
+# base event, within the search window. `{topic_clause}` keeps the same-topic
+# restriction of the recent-events fallback.
+_INDEXED_DUPLICATE_CANDIDATES_SQL = """
+    SELECT
+        e.id,
+        e.topic,
+        e.summary_1_sentence,
+        e.event_time,
+        e.event_identity_fingerprint_v2,
+        e.claim_hash,
+        e.canonical_payload_hash,
+        e.latest_extraction_id,
+        e.last_updated_at,
+        s.minhash_json
+    FROM events AS e
+    LEFT JOIN event_similarity_signatures AS s ON s.event_id = e.id
+    WHERE e.id IN (
+        SELECT b.event_id FROM event_similarity_bands AS b WHERE b.band_key IN :band_keys
+        UNION
+        SELECT id FROM events WHERE event_identity_fingerprint_v2 = :identity_fingerprint
+        UNION
+        SELECT id FROM events WHERE claim_hash = :claim_hash
+        UNION
+        SELECT id FROM events WHERE canonical_payload_hash = :canonical_payload_hash
+    )
+    AND e.id != :base_event_id
+    AND e.event_time >= :window_start
+    AND e.event_time <= :window_end
+    {topic_clause}
+    ORDER BY e.last_updated_at DESC, e.id DESC
+    LIMIT :scan_limit
+"""
+
+
+def _indexed_duplicate_candidates_statement(topic_clause: str) -> TextClause:
+    return text(_INDEXED_DUPLICATE_CANDIDATES_SQL.format(topic_clause=topic_clause)).bindparams(
+        bindparam("band_keys", expanding=True),
+        bindparam("window_start", type_=DateTime()),
+        bindparam("window_end", type_=DateTime()),
+    )
+
+
+_INDEXED_DUPLICATES_SAME_TOPIC_SQL = _indexed_duplicate_candidates_statement("AND e.topic = :base_topic")
+_INDEXED_DUPLICATES_ANY_TOPIC_SQL = _indexed_duplicate_candidates_statement("")
+
+
+def _set_session_read_only(dbapi_connection: Any, _connection_record: Any) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("SET SESSION CHARACTERISTICS AS TRANSACTION READ ONLY")
+    finally:
+        cursor.close()
+    dbapi_connection.commit()
+
+
+# Not frozen: exceptions raised through a context manager get `__traceback__`
+# assigned, which a frozen dataclass rejects.
+@dataclass(eq=False)
 class ServiceError(Exception):
     code: str
     message: str
@@ -57,12 +134,25 @@ class ServiceError(Exception):
 
 
 class CivicquantDbMcpService:
-    def __init__(self, database_url: str | None = None) -> None:
+    def __init__(
+        self,
+        database_url: str | None = None,
+        *,
+        pool_size: int = DB_POOL_SIZE,
+        max_overflow: int = DB_POOL_MAX_OVERFLOW,
+    ) -> None:
         load_dotenv()
         self.database_url = self._resolve_database_url(database_url=database_url)
         self._masked_database_url = self._mask_database_url(self.database_url)
         self._database_backend = make_url(self.database_url).get_backend_name().lower()
-        self.engine = self._create_engine(database_url=self.database_url)
+        # The tool set issues a fixed group of queries; each is wrapped in a
+        # `text()` construct once so SQLAlchemy's compiled cache keys stay hot.
+        self._statements: dict[str, TextClause] = {}
+        self.engine = self._create_engine(
+            database_url=self.database_url,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+        )
 
     def call_tool(self, name: str, arguments: dict[str, Any]) -> dict[str, Any]:
         if name == "get_event":
@@ -312,7 +402,12 @@ class CivicquantDbMcpService:
                     claim_hash,
                     canonical_payload_hash,
                     latest_extraction_id,
-                    last_updated_at
+                    last_updated_at,
+                    (
+                        SELECT COUNT(*)
+                        FROM event_messages AS em
+                        WHERE em.event_id = events.id
+                    ) AS lineage_total_count
                 FROM events
                 WHERE id = :event_id
                 """,
@@ -321,12 +416,6 @@ class CivicquantDbMcpService:
             if event_row is None:
                 raise ServiceError(code="not_found", message=f"Event {event_id} was not found.")
 
-            total_messages = self._fetchone(
-                conn,
-                "SELECT COUNT(*) AS c FROM event_messages WHERE event_id = :event_id",
-                {"event_id": event_id},
-            )
-
             lineage_rows = self._fetchall(
                 conn,
                 """
@@ -421,11 +510,12 @@ class CivicquantDbMcpService:
                 }
             )
 
-        total_count = int(total_messages["c"]) if total_messages is not None else len(messages)
+        event_payload = self._row_to_dict(event_row)
+        total_count = int(event_payload.pop("lineage_total_count") or 0)
         return self._jsonify_payload({
             "ok": True,
             "database_url": self._masked_database_url,
-            "event": self._row_to_dict(event_row),
+            "event": event_payload,
             "lineage_messages": messages,
             "lineage_count": len(messages),
             "lineage_total_count": total_count,
@@ -579,7 +669,29 @@ class CivicquantDbMcpService:
             if base_event is None:
                 raise ServiceError(code="not_found", message=f"Event {event_id} was not found.")
 
-            candidate_rows = self._fetch_duplicate_candidates(conn=conn, base_event=base_event)
+            base_time = self._parse_datetime(base_event["event_time"])
+            use_index = base_time is not None and self._has_similarity_index()
+            base_signature = None
+            if use_index:
+                signature_row = self._fetchone(
+                    conn,
+                    "SELECT minhash_json FROM event_similarity_signatures WHERE event_id = :event_id",
+                    {"event_id": event_id},
+                )
+                if signature_row is not None:
+                    base_signature = self._signature_from_json(signature_row["minhash_json"])
+            if base_signature is None:
+                base_signature = minhash_signature(summary_shingles(base_event["summary_1_sentence"]))
+
+            if use_index:
+                candidate_rows = self._fetch_indexed_duplicate_candidates(
+                    conn=conn,
+                    base_event=base_event,
+                    base_time=base_time,
+                    base_signature=base_signature,
+                )
+            else:
+                candidate_rows = self._fetch_duplicate_candidates(conn=conn, base_event=base_event)
             extraction_by_id = self._fetch_extractions_for_candidates(conn=conn, candidate_rows=candidate_rows)
             base_latest_extraction = extraction_by_id.get(base_event["latest_extraction_id"])
             if base_latest_extraction is None and isinstance(base_event["latest_extraction_id"], int):
@@ -594,8 +706,6 @@ class CivicquantDbMcpService:
         base_keywords = self._keywords(base_payload)
 
         window_hours = 6 if bool(base_event["is_breaking"]) else 24
-        base_time = self._parse_datetime(base_event["event_time"])
-        base_summary = self._normalized_text(base_event["summary_1_sentence"])
 
         scored: list[dict[str, Any]] = []
         for candidate in candidate_rows:
@@ -621,7 +731,7 @@ class CivicquantDbMcpService:
                 and base_event["canonical_payload_hash"] == candidate["canonical_payload_hash"]
             )
 
-            summary_ratio = self._summary_ratio(base_summary, self._normalized_text(candidate["summary_1_sentence"]))
+            summary_jaccard = estimate_jaccard(base_signature, self._candidate_signature(candidate))
             shared_entities = len(base_entities & candidate_entities)
             shared_keywords = len(base_keywords & candidate_keywords)
 
@@ -644,12 +754,12 @@ class CivicquantDbMcpService:
             if same_payload_hash:
                 score += 4
                 reasons.append("same_canonical_payload_hash")
-            if summary_ratio >= 0.90:
+            if summary_jaccard >= 0.70:
                 score += 2
-                reasons.append("summary_similarity_ge_0_90")
-            elif summary_ratio >= 0.80:
+                reasons.append("summary_jaccard_ge_0_70")
+            elif summary_jaccard >= 0.50:
                 score += 1
-                reasons.append("summary_similarity_ge_0_80")
+                reasons.append("summary_jaccard_ge_0_50")
             if shared_entities >= 2:
                 score += 2
                 reasons.append("shared_entities_ge_2")
@@ -686,7 +796,7 @@ class CivicquantDbMcpService:
                         "same_event_identity_fingerprint_v2": same_identity,
                         "same_claim_hash": same_claim_hash,
                         "same_canonical_payload_hash": same_payload_hash,
-                        "summary_similarity_ratio": round(summary_ratio, 3),
+                        "summary_jaccard": round(summary_jaccard, 3),
                         "shared_entity_count": shared_entities,
                         "shared_keyword_count": shared_keywords,
                         "hours_apart": round(hours_apart, 3) if hours_apart is not None else None,
@@ -710,6 +820,8 @@ class CivicquantDbMcpService:
             "database_url": self._masked_database_url,
             "base_event_id": event_id,
             "window_hours": window_hours,
+            "candidate_source": "similarity_index" if use_index else "recent_events",
+            "search_window_days": DUPLICATE_SEARCH_WINDOW_DAYS if use_index else None,
             "candidate_scan_count": len(candidate_rows),
             "candidate_match_count": len(top_candidates),
             "candidates": top_candidates,
@@ -759,6 +871,7 @@ class CivicquantDbMcpService:
             raise ServiceError(code="invalid_arguments", message="'start_time' must be earlier than 'end_time'.")
 
         with self._session() as db:
+            working_set = load_memo_working_set(db, start_time=start_time, end_time=end_time)
             ranked = rank_topic_candidates(
                 db,
                 start_time=start_time,
@@ -766,6 +879,7 @@ class CivicquantDbMcpService:
                 topic_universe=[topic],
                 limit=1,
                 recent_memo_topics=set(),
+                working_set=working_set,
             )
             topic_score = float(ranked[0].topic_score) if ranked else 0.0
             topic_breakdown = (
@@ -787,6 +901,7 @@ class CivicquantDbMcpService:
                 topic_score=topic_score,
                 selection_reason="mcp_build_input",
                 topic_breakdown=topic_breakdown,
+                working_set=working_set,
             )
 
         return self._jsonify_payload(
@@ -809,7 +924,7 @@ class CivicquantDbMcpService:
             raise ServiceError(code="invalid_arguments", message="'start_time' must be earlier than 'end_time'.")
 
         with self._session() as db:
-            snapshots = load_event_snapshots(db, start_time=start_time, end_time=end_time)
+            snapshots = load_event_snapshots(db, start_time=start_time, end_time=end_time, topic=topic)
             timeline = topic_timeline(
                 snapshots=snapshots,
                 topic=topic,
@@ -840,6 +955,7 @@ class CivicquantDbMcpService:
             raise ServiceError(code="invalid_arguments", message="'start_time' must be earlier than 'end_time'.")
 
         with self._session() as db:
+            working_set = load_memo_working_set(db, start_time=start_time, end_time=end_time)
             ranked = rank_topic_candidates(
                 db,
                 start_time=start_time,
@@ -847,6 +963,7 @@ class CivicquantDbMcpService:
                 topic_universe=[topic],
                 limit=1,
                 recent_memo_topics=set(),
+                working_set=working_set,
             )
             topic_score = float(ranked[0].topic_score) if ranked else 0.0
             topic_breakdown = (
@@ -868,6 +985,7 @@ class CivicquantDbMcpService:
                 topic_score=topic_score,
                 selection_reason="mcp_driver_pack",
                 topic_breakdown=topic_breakdown,
+                working_set=working_set,
             )
 
         return self._jsonify_payload(
@@ -887,16 +1005,29 @@ class CivicquantDbMcpService:
             }
         )
 
-    def run_readonly_sql(self, *, query: str, max_rows: int = READONLY_SQL_DEFAULT_MAX_ROWS) -> dict[str, Any]:
+    def run_readonly_sql(
+        self,
+        *,
+        query: str,
+        max_rows: int = READONLY_SQL_DEFAULT_MAX_ROWS,
+        statement_timeout_seconds: float = READONLY_SQL_STATEMENT_TIMEOUT_SECONDS,
+    ) -> dict[str, Any]:
         safe_query = self._validate_readonly_sql(query=query)
         row_cap = max(1, min(max_rows, READONLY_SQL_HARD_MAX_ROWS))
 
         with self._connect() as conn:
+            started = time.monotonic()
             try:
-                result = conn.execute(text(safe_query))
-                rows = result.mappings().fetchmany(row_cap + 1)
-                columns = list(result.keys())
+                with self._statement_timeout(conn, seconds=statement_timeout_seconds):
+                    result = conn.execute(text(safe_query))
+                    rows = result.mappings().fetchmany(row_cap + 1)
+                    columns = list(result.keys())
             except SQLAlchemyError as exc:
+                if time.monotonic() - started >= statement_timeout_seconds:
+                    raise ServiceError(
+                        code="statement_timeout",
+                        message=f"Query exceeded the {statement_timeout_seconds:g}s statement timeout.",
+                    ) from exc
                 raise ServiceError(
                     code="sql_error",
                     message=f"Database query failed: {exc}",
@@ -927,20 +1058,29 @@ class CivicquantDbMcpService:
             return settings.database_url.strip()
         return DEFAULT_DATABASE_URL
 
-    def _create_engine(self, *, database_url: str) -> Engine:
+    def _create_engine(self, *, database_url: str, pool_size: int, max_overflow: int) -> Engine:
         connect_args: dict[str, Any] = {}
+        kwargs: dict[str, Any] = {"future": True, "pool_pre_ping": True}
         backend = make_url(database_url).get_backend_name().lower()
         if backend in {"postgres", "postgresql"}:
             # Defense in depth: keep every transaction read-only on postgres.
             connect_args["options"] = "-c default_transaction_read_only=on"
-        return create_engine(database_url, future=True, pool_pre_ping=True, connect_args=connect_args)
+        if backend != "sqlite":
+            kwargs["pool_size"] = max(1, pool_size)
+            kwargs["max_overflow"] = max(0, max_overflow)
+            kwargs["pool_recycle"] = DB_POOL_RECYCLE_SECONDS
+        engine = create_engine(database_url, connect_args=connect_args, **kwargs)
+        if backend in {"postgres", "postgresql"}:
+            # Pooled connections outlive a single tool call, so the read-only
+            # session default is set once per physical connection instead of
+            # issuing SET TRANSACTION READ ONLY on every checkout.
+            event.listen(engine, "connect", _set_session_read_only)
+        return engine
 
     @contextmanager
     def _connect(self) -> Connection:
         try:
             with self.engine.connect() as conn:
-                if self._database_backend in {"postgres", "postgresql"}:
-                    conn.execute(text("SET TRANSACTION READ ONLY"))
                 yield conn
         except SQLAlchemyError as exc:
             raise ServiceError(
@@ -952,19 +1092,47 @@ class CivicquantDbMcpService:
                 },
             ) from exc
 
+    @contextmanager
+    def _statement_timeout(self, conn: Connection, *, seconds: float) -> Iterator[None]:
+        if self._database_backend in {"postgres", "postgresql"}:
+            # SET LOCAL lasts until the read-only transaction ends with the checkout.
+            conn.execute(text(f"SET LOCAL statement_timeout = {max(1, int(seconds * 1000))}"))
+            yield
+            return
+        if self._database_backend != "sqlite":
+            yield
+            return
+
+        # SQLite has no statement timeout; the progress handler aborts the
+        # running statement (OperationalError: interrupted) past the deadline.
+        deadline = time.monotonic() + seconds
+        dbapi_connection = conn.connection.driver_connection
+        dbapi_connection.set_progress_handler(lambda: int(time.monotonic() > deadline), 1000)
+        try:
+            yield
+        finally:
+            dbapi_connection.set_progress_handler(None, 0)
+
     @contextmanager
     def _session(self) -> OrmSession:
         with self._connect() as conn:
             with OrmSession(bind=conn, future=True) as db:
                 yield db
 
+    def _statement(self, query: str) -> TextClause:
+        statement = self._statements.get(query)
+        if statement is None:
+            statement = text(query)
+            self._statements[query] = statement
+        return statement
+
     def _fetchone(
         self,
         conn: Connection,
         query: str,
         params: dict[str, Any] | None = None,
     ) -> RowMapping | None:
-        return conn.execute(text(query), params or {}).mappings().first()
+        return conn.execute(self._statement(query), params or {}).mappings().first()
 
     def _fetchall(
         self,
@@ -972,7 +1140,7 @@ class CivicquantDbMcpService:
         query: str,
         params: dict[str, Any] | None = None,
     ) -> list[RowMapping]:
-        return list(conn.execute(text(query), params or {}).mappings().all())
+        return list(conn.execute(self._statement(query), params or {}).mappings().all())
 
     def _mask_database_url(self, database_url: str) -> str:
         try:
@@ -1211,9 +1379,13 @@ class CivicquantDbMcpService:
                 FROM events
                 WHERE id != :base_event_id AND topic = :base_topic
                 ORDER BY last_updated_at DESC, id DESC
-                LIMIT 250
+                LIMIT :scan_limit
                 """,
-                {"base_event_id": base_event["id"], "base_topic": base_event["topic"]},
+                {
+                    "base_event_id": base_event["id"],
+                    "base_topic": base_event["topic"],
+                    "scan_limit": DUPLICATE_FALLBACK_SCAN_LIMIT,
+                },
             )
 
         return self._fetchall(
@@ -1232,11 +1404,52 @@ class CivicquantDbMcpService:
             FROM events
             WHERE id != :base_event_id
             ORDER BY last_updated_at DESC, id DESC
-            LIMIT 250
+            LIMIT :scan_limit
             """,
-            {"base_event_id": base_event["id"]},
+            {"base_event_id": base_event["id"], "scan_limit": DUPLICATE_FALLBACK_SCAN_LIMIT},
         )
 
+    def _has_similarity_index(self) -> bool:
+        return not get_schema_capabilities(self.engine).missing_tables(_SIMILARITY_INDEX_TABLES)
+
+    def _fetch_indexed_duplicate_candidates(
+        self,
+        *,
+        conn: Connection,
+        base_event: Mapping[str, Any],
+        base_time: datetime,
+        base_signature: tuple[int, ...] | None,
+    ) -> list[RowMapping]:
+        window = timedelta(days=DUPLICATE_SEARCH_WINDOW_DAYS)
+        params: dict[str, Any] = {
+            "band_keys": band_keys(base_signature) if base_signature is not None else [],
+            "identity_fingerprint": base_event["event_identity_fingerprint_v2"],
+            "claim_hash": base_event["claim_hash"],
+            "canonical_payload_hash": base_event["canonical_payload_hash"],
+            "base_event_id": base_event["id"],
+            "window_start": base_time.replace(tzinfo=None) - window,
+            "window_end": base_time.replace(tzinfo=None) + window,
+            "scan_limit": DUPLICATE_CANDIDATE_SCAN_LIMIT,
+        }
+        if base_event["topic"]:
+            statement = _INDEXED_DUPLICATES_SAME_TOPIC_SQL
+            params["base_topic"] = base_event["topic"]
+        else:
+            statement = _INDEXED_DUPLICATES_ANY_TOPIC_SQL
+        return list(conn.execute(statement, params).mappings().all())
+
+    def _signature_from_json(self, value: Any) -> tuple[int, ...] | None:
+        parsed = self._try_parse_json(value)
+        if not isinstance(parsed, list) or not parsed:
+            return None
+        return tuple(int(item) for item in parsed)
+
+    def _candidate_signature(self, candidate: Mapping[str, Any]) -> tuple[int, ...] | None:
+        stored = self._signature_from_json(candidate["minhash_json"]) if "minhash_json" in candidate else None
+        if stored is not None:
+            return stored
+        return minhash_signature(summary_shingles(candidate["summary_1_sentence"]))
+
     def _fetch_extractions_for_candidates(
         self, *, conn: Connection, candidate_rows: list[RowMapping]
     ) -> dict[int, RowMapping]:
@@ -1249,14 +1462,7 @@ class CivicquantDbMcpService:
         if not extraction_ids:
             return {}
 
-        statement = text(
-            """
-            SELECT id, canonical_payload_json, payload_json
-            FROM extractions
-            WHERE id IN :extraction_ids
-            """
-        ).bindparams(bindparam("extraction_ids", expanding=True))
-        rows = conn.execute(statement, {"extraction_ids": sorted(extraction_ids)}).mappings().all()
+        rows = conn.execute(_EXTRACTIONS_BY_ID_SQL, {"extraction_ids": sorted(extraction_ids)}).mappings().all()
         return {int(row["id"]): row for row in rows}
 
     def _entity_signature(self, payload: dict[str, Any]) -> set[str]:
@@ -1287,16 +1493,6 @@ class CivicquantDbMcpService:
                     keywords.add(cleaned)
         return keywords
 
-    def _normalized_text(self, value: Any) -> str:
-        if not isinstance(value, str):
-            return ""
-        return " ".join(value.lower().strip().split())
-
-    def _summary_ratio(self, left: str, right: str) -> float:
-        if not left or not right:
-            return 0.0
-        return SequenceMatcher(a=left, b=right).ratio()
-
     def _parse_datetime(self, value: Any) -> datetime | None:
         if isinstance(value, datetime):
             return value